@@ -1,6 +1,6 @@
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import click
 
@@ -19,13 +19,17 @@ from robotcode.robot.diagnostics.data_cache import (
 
 from ..config import AnalyzeConfig
 
+if TYPE_CHECKING:
+    from robotcode.robot.diagnostics.cache_bundle import BundleSectionStats
+
 _SECTION_NAMES = {s.name.lower(): s for s in CacheSection}
 
 
-def _resolve_cache(
+def _resolve_cache_base(
     app: Application,
     paths: Tuple[Path, ...],
-) -> Tuple[Path, Optional[SqliteDataCache]]:
+) -> Tuple[Path, Path]:
+    """Returns the root folder of the project and the base path of its cache."""
     config_files, root_folder, _ = get_config_files(
         paths,
         app.config.config_files,
@@ -45,7 +49,14 @@ def _resolve_cache(
         if analyzer_config.cache is not None and analyzer_config.cache.cache_dir is not None:
             cache_base_path = Path(analyzer_config.cache.cache_dir)
 
-    cache_base_path = resolve_cache_base_path(cache_base_path)
+    return root_folder or Path.cwd(), resolve_cache_base_path(cache_base_path)
+
+
+def _resolve_cache(
+    app: Application,
+    paths: Tuple[Path, ...],
+) -> Tuple[Path, Optional[SqliteDataCache]]:
+    _, cache_base_path = _resolve_cache_base(app, paths)
 
     cache_dir = build_cache_dir(cache_base_path)
 
@@ -81,6 +92,10 @@ def _format_bytes(n: int) -> str:
     return f"{n / (1024 * 1024):.1f} MB"
 
 
+def _format_ratio(ratio: Optional[float]) -> str:
+    return f"{ratio:.0%}" if ratio is not None else "—"
+
+
 def _display_name(entry_name: str) -> str:
     # Namespace entry names contain a newline separating source path and
     # document type; keep the table/line output single-line.
@@ -109,8 +124,8 @@ def cache_group() -> None:
     """\
     Manage the RobotCode analysis cache.
 
-    Provides subcommands to inspect, list, and clear cached data
-    (library docs, variables, resources, namespaces).
+    Provides subcommands to inspect, list, clear, export and import cached
+    data (library docs, variables, resources, namespaces, dependencies).
     """
 
 
@@ -144,7 +159,9 @@ def cache_info(app: Application, paths: Tuple[Path, ...]) -> None:
     Show cache statistics.
 
     Displays the cache directory, database size, app version, and
-    per-section entry counts with timestamps.
+    per-section entry counts with timestamps, size budgets, hit ratios,
+    the bytes served from the cache instead of being recomputed and the
+    number of evicted entries.
     """
     cache_dir, db = _resolve_cache(app, paths)
 
@@ -160,20 +177,36 @@ def cache_info(app: Application, paths: Tuple[Path, ...]) -> None:
         section_data = []
         total_entries = 0
         total_bytes = 0
+        total_lookups = 0
+        total_hits = 0
+        total_saved = 0
         for section in CacheSection:
             stats = db.get_section_stats(section)
             total_entries += stats.entry_count
             total_bytes += stats.total_blob_bytes
+            total_lookups += stats.lookups
+            total_hits += stats.hits
+            total_saved += stats.bytes_saved
             section_data.append(
                 {
                     "section": section.name.lower(),
                     "entries": stats.entry_count,
                     "size": stats.total_blob_bytes,
                     "size_formatted": _format_bytes(stats.total_blob_bytes) if stats.entry_count else "—",
+                    "budget": stats.budget,
+                    "lookups": stats.lookups,
+                    "hits": stats.hits,
+                    "hit_ratio": stats.hit_ratio,
+                    "bytes_saved": stats.bytes_saved,
+                    "bytes_saved_formatted": _format_bytes(stats.bytes_saved),
+                    "hit_ratio_formatted": _format_ratio(stats.hit_ratio),
+                    "evictions": stats.evictions,
+                    "evicted_bytes": stats.evicted_bytes,
                     "created": stats.oldest_created or None,
                     "modified": stats.newest_modified or None,
                 }
             )
+        total_ratio = min(total_hits / total_lookups, 1.0) if total_lookups else None
 
         if app.config.output_format is None or app.config.output_format == OutputFormat.TEXT:
             if app.colored and app.has_rich:
@@ -182,31 +215,42 @@ def cache_info(app: Application, paths: Tuple[Path, ...]) -> None:
                     f"- **Database:** {db_path.name} ({_format_bytes(db_size)})",
                     f"- **Version:** {db.app_version or '(unknown)'}",
                     "",
-                    "| Section | Entries | Size | Created | Modified |",
-                    "|---|---:|---:|---|---|",
+                    "| Section | Entries | Size | Hit ratio | Saved | Evicted | Created | Modified |",
+                    "|---|---:|---:|---:|---:|---:|---|---|",
                 ]
                 for s in section_data:
                     lines.append(
                         f"| {s['section']} | {s['entries']} | {s['size_formatted']}"
+                        f" | {s['hit_ratio_formatted']} | {s['bytes_saved_formatted']} | {s['evictions']}"
                         f" | {s['created'] or '—'} | {s['modified'] or '—'} |"
                     )
-                lines.append(f"| **Total** | **{total_entries}** | **{_format_bytes(total_bytes)}** | | |")
+                lines.append(
+                    f"| **Total** | **{total_entries}** | **{_format_bytes(total_bytes)}**"
+                    f" | **{_format_ratio(total_ratio)}** | **{_format_bytes(total_saved)}** | | | |"
+                )
                 app.echo_as_markdown("\n".join(lines))
             else:
                 app.echo(f"  Directory:  {cache_dir}")
                 app.echo(f"  Database:   {db_path.name}  ({_format_bytes(db_size)})")
                 app.echo(f"  Version:    {db.app_version or '(unknown)'}")
                 app.echo("")
-                header = f"  {'Section':<12} {'Entries':>7}  {'Size':>10}  {'Created':19}  {'Modified':19}"
+                header = (
+                    f"  {'Section':<13} {'Entries':>7}  {'Size':>10}  {'Hits':>5}  {'Saved':>10}  {'Evicted':>7}"
+                    f"  {'Created':19}  {'Modified':19}"
+                )
                 app.echo(header)
                 app.echo(f"  {'─' * (len(header) - 2)}")
                 for s in section_data:
                     app.echo(
-                        f"  {s['section']:<12} {s['entries']:>7}  {s['size_formatted']:>10}"
-                        f"  {(s['created'] or '—'):19}  {(s['modified'] or '—'):19}"
+                        f"  {s['section']:<13} {s['entries']:>7}  {s['size_formatted']:>10}"
+                        f"  {s['hit_ratio_formatted']:>5}  {s['bytes_saved_formatted']:>10}"
+                        f"  {s['evictions']:>7}  {(s['created'] or '—'):19}  {(s['modified'] or '—'):19}"
                     )
                 app.echo(f"  {'─' * (len(header) - 2)}")
-                app.echo(f"  {'Total':<12} {total_entries:>7}  {_format_bytes(total_bytes):>10}")
+                app.echo(
+                    f"  {'Total':<13} {total_entries:>7}  {_format_bytes(total_bytes):>10}"
+                    f"  {_format_ratio(total_ratio):>5}  {_format_bytes(total_saved):>10}"
+                )
         else:
             app.print_data(
                 {
@@ -215,10 +259,13 @@ def cache_info(app: Application, paths: Tuple[Path, ...]) -> None:
                     "database_size": db_size,
                     "version": db.app_version or "",
                     "sections": [
-                        {k: v for k, v in s.items() if k != "size_formatted" and v is not None} for s in section_data
+                        {k: v for k, v in s.items() if not k.endswith("_formatted") and v is not None}
+                        for s in section_data
                     ],
                     "total_entries": total_entries,
                     "total_size": total_bytes,
+                    "total_hit_ratio": total_ratio,
+                    "total_bytes_saved": total_saved,
                 }
             )
     finally:
@@ -232,7 +279,10 @@ def cache_info(app: Application, paths: Tuple[Path, ...]) -> None:
     "sections",
     multiple=True,
     metavar="SECTION",
-    help="Filter by section (library, variables, resource, namespace). Can be specified multiple times.",
+    help=(
+        "Filter by section (library, variables, resource, namespace, dependencies, project_index, lint)."
+        " Can be specified multiple times."
+    ),
 )
 @click.option(
     "-p",
@@ -333,7 +383,10 @@ def cache_list(app: Application, sections: Tuple[str, ...], patterns: Tuple[str,
     "sections",
     multiple=True,
     metavar="SECTION",
-    help="Clear only specific sections (library, variables, resource, namespace). Can be specified multiple times.",
+    help=(
+        "Clear only specific sections (library, variables, resource, namespace, dependencies, project_index, lint)."
+        " Can be specified multiple times."
+    ),
 )
 @click.argument(
     "paths", nargs=-1, type=click.Path(exists=True, dir_okay=True, file_okay=True, readable=True, path_type=Path)
@@ -373,26 +426,7 @@ def _resolve_cache_root(
     app: Application,
     paths: Tuple[Path, ...],
 ) -> Path:
-    config_files, root_folder, _ = get_config_files(
-        paths,
-        app.config.config_files,
-        root_folder=app.config.root,
-        no_vcs=app.config.no_vcs,
-        verbose_callback=app.verbose,
-    )
-
-    robot_config = load_robot_config_from_path(
-        *config_files, extra_tools={"robotcode-analyze": AnalyzeConfig}, verbose_callback=app.verbose
-    )
-
-    analyzer_config = robot_config.tool.get("robotcode-analyze", None) if robot_config.tool is not None else None
-
-    cache_base_path = root_folder or Path.cwd()
-    if analyzer_config is not None and isinstance(analyzer_config, AnalyzeConfig):
-        if analyzer_config.cache is not None and analyzer_config.cache.cache_dir is not None:
-            cache_base_path = Path(analyzer_config.cache.cache_dir)
-
-    cache_base_path = resolve_cache_base_path(cache_base_path)
+    _, cache_base_path = _resolve_cache_base(app, paths)
 
     return cache_base_path / CACHE_DIR_NAME
 
@@ -434,3 +468,105 @@ def cache_prune(app: Application, force: bool, paths: Tuple[Path, ...]) -> None:
 
     shutil.rmtree(cache_root)
     app.echo(f"Removed {cache_root}")
+
+
+def _echo_bundle_stats(app: Application, stats: List["BundleSectionStats"], action: str) -> None:
+    if app.config.output_format is None or app.config.output_format == OutputFormat.TEXT:
+        for s in stats:
+            details = ", ".join(
+                f"{count} {label}"
+                for count, label in (
+                    (s.outdated, "outdated"),
+                    (s.not_portable, "not portable"),
+                    (s.unchanged, "unchanged"),
+                )
+                if count
+            )
+            app.echo(
+                f"{action} {s.entries} entries of {s.section.name.lower()}" + (f" ({details})." if details else ".")
+            )
+        app.echo(f"{action} {sum(s.entries for s in stats)} entries total.")
+    else:
+        app.print_data(
+            {
+                "sections": [
+                    {
+                        "section": s.section.name.lower(),
+                        "entries": s.entries,
+                        "outdated": s.outdated,
+                        "not_portable": s.not_portable,
+                        "unchanged": s.unchanged,
+                    }
+                    for s in stats
+                ],
+                "total_entries": sum(s.entries for s in stats),
+            }
+        )
+
+
+@cache_group.command(name="export")
+@click.argument("bundle", type=click.Path(dir_okay=False, writable=True, path_type=Path))
+@click.argument(
+    "paths", nargs=-1, type=click.Path(exists=True, dir_okay=True, file_okay=True, readable=True, path_type=Path)
+)
+@pass_application
+def cache_export(app: Application, bundle: Path, paths: Tuple[Path, ...]) -> None:
+    """\
+    Export the analysis cache to a portable bundle.
+
+    Writes the library, variables, resource and namespace entries to BUNDLE, a
+    compressed archive that can be imported with `cache import` on another
+    machine or into a checkout in another directory. Entries of files that
+    changed since they were cached and entries that depend on files outside
+    the project and the Python installation are skipped.
+    """
+    from robotcode.robot.diagnostics.cache_bundle import export_cache_bundle
+
+    from ..__version__ import __version__
+
+    root_folder, cache_base_path = _resolve_cache_base(app, paths)
+    cache_dir = build_cache_dir(cache_base_path)
+
+    if not (cache_dir / "cache.db").exists():
+        app.echo("No cache database found.")
+        return
+
+    db = SqliteDataCache(cache_dir, app_version=__version__)
+    try:
+        stats = export_cache_bundle(db, bundle, root_folder)
+    finally:
+        db.close()
+
+    _echo_bundle_stats(app, stats, "Exported")
+
+
+@cache_group.command(name="import")
+@click.argument("bundle", type=click.Path(exists=True, dir_okay=False, readable=True, path_type=Path))
+@click.argument(
+    "paths", nargs=-1, type=click.Path(exists=True, dir_okay=True, file_okay=True, readable=True, path_type=Path)
+)
+@pass_application
+def cache_import(app: Application, bundle: Path, paths: Tuple[Path, ...]) -> None:
+    """\
+    Import a bundle created with `cache export` into the analysis cache.
+
+    An entry is only imported if every file it was built from has the same
+    content as on the exporting machine, so an outdated bundle never leads to
+    wrong analysis results. The bundle must be created with the same
+    RobotCode, Python and Robot Framework versions.
+    """
+    from robotcode.robot.diagnostics.cache_bundle import CacheBundleError, import_cache_bundle
+
+    from ..__version__ import __version__
+
+    root_folder, cache_base_path = _resolve_cache_base(app, paths)
+    db = SqliteDataCache(build_cache_dir(cache_base_path), app_version=__version__)
+
+    try:
+        stats = import_cache_bundle(db, bundle, root_folder)
+    except CacheBundleError as e:
+        raise click.ClickException(str(e)) from e
+    finally:
+        db.close()
+
+    _echo_bundle_stats(app, stats, "Imported")
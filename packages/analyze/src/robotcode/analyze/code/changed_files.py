@@ -0,0 +1,54 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, List, Set
+
+from robotcode.core.utils.path import normalized_path
+
+
+class ChangedFilesError(Exception):
+    pass
+
+
+def _git(args: List[str], cwd: Path) -> str:
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, encoding="utf-8", check=False)
+    except OSError as e:
+        raise ChangedFilesError(f"Cannot run git: {e}") from e
+
+    if result.returncode != 0:
+        raise ChangedFilesError(
+            result.stderr.strip() or f"'git {' '.join(args)}' failed with exit code {result.returncode}"
+        )
+
+    return result.stdout
+
+
+def git_changed_files(rev: str, cwd: Path) -> List[Path]:
+    """Files that differ from the git revision ``rev``.
+
+    Contains committed, staged and unstaged changes, deleted files and untracked
+    files that are not ignored. Renames are reported as a deleted and an added file,
+    so documents importing the old name are affected, too.
+    """
+    top_level = Path(_git(["rev-parse", "--show-toplevel"], cwd).strip())
+
+    names = [
+        *_git(["diff", "--name-only", "--no-renames", "-z", rev, "--"], top_level).split("\0"),
+        *_git(["ls-files", "--others", "--exclude-standard", "-z"], top_level).split("\0"),
+    ]
+
+    return sorted({normalized_path(top_level / name) for name in names if name})
+
+
+def resolve_changed_files(files: Iterable[str], cwd: Path) -> List[Path]:
+    """Resolve the files given on the command line, ``-`` reads one file per line from stdin."""
+    result: Set[Path] = set()
+
+    for file in files:
+        if file == "-":
+            result.update(normalized_path(cwd / line.strip()) for line in sys.stdin if line.strip())
+        else:
+            result.add(normalized_path(cwd / file))
+
+    return sorted(result)
@@ -1,5 +1,6 @@
 import functools
 import hashlib
+import os
 import time
 from dataclasses import replace
 from enum import Flag
@@ -56,6 +57,7 @@ from ._sarif import (
 from ._sarif import (
     ToolComponent as SarifToolComponent,
 )
+from .changed_files import ChangedFilesError, git_changed_files, resolve_changed_files
 from .code_analyzer import CodeAnalyzer, DocumentDiagnosticReport, FolderDiagnosticReport
 
 SEVERITY_COLORS = {
@@ -405,6 +407,30 @@ def _validate_load_library_timeout(ctx: click.Context, param: click.Option, valu
     help="Enable or disable collection of unused keyword and unused variable diagnostics. "
     "Overrides the config file setting when specified.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=None,
+    metavar="N",
+    help="Analyze the documents in N processes. `0` uses one process per CPU. "
+    "The result is the same as in a single process run. Overrides the config file setting when specified.",
+)
+@click.option(
+    "--changed-since",
+    metavar="REV",
+    default=None,
+    help="Only analyze the documents affected by the files that changed since the git revision REV, "
+    "including uncommitted and untracked files. All other documents reuse the diagnostics from the namespace cache. "
+    "A document is affected if it is a changed file or imports one, directly or through other resources.",
+)
+@click.option(
+    "--changed-files",
+    metavar="FILE",
+    multiple=True,
+    help="Like `--changed-since`, but with an explicit list of changed files. Repeatable. "
+    "`-` reads one file per line from stdin.",
+)
 @click.option(
     "--cache-namespaces/--no-cache-namespaces",
     default=None,
@@ -463,6 +489,9 @@ def code(
     paths: Tuple[Path, ...],
     load_library_timeout: Optional[int],
     collect_unused: Optional[bool],
+    jobs: Optional[int],
+    changed_since: Optional[str],
+    changed_files: Tuple[str, ...],
     cache_namespaces: Optional[bool],
     show_tracebacks: bool,
     full_paths: bool,
@@ -577,6 +606,11 @@ def code(
                 analyzer_config.code = CodeConfig()
             analyzer_config.code.collect_unused = collect_unused
 
+        if jobs is not None:
+            if analyzer_config.code is None:
+                analyzer_config.code = CodeConfig()
+            analyzer_config.code.jobs = jobs
+
         if cache_namespaces is not None:
             if analyzer_config.cache is None:
                 analyzer_config.cache = CacheConfig()
@@ -598,8 +632,26 @@ def code(
                 else False
             ),
         )
+        jobs = analyzer_config.code.jobs if analyzer_config.code is not None else None
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+
+        changed: Optional[List[Path]] = None
+        if changed_since is not None or changed_files:
+            try:
+                changed = sorted(
+                    {
+                        *(git_changed_files(changed_since, root_folder or Path.cwd()) if changed_since else ()),
+                        *resolve_changed_files(changed_files, Path.cwd()),
+                    }
+                )
+            except ChangedFilesError as ex:
+                raise click.BadParameter(str(ex), param_hint="'--changed-since'") from ex
+
+            app.verbose(f"{len(changed)} changed files")
+
         try:
-            for e in analyzer.run(paths=paths, filter_patterns=filter_patterns):
+            for e in analyzer.run(paths=paths, filter_patterns=filter_patterns, jobs=jobs or 1, changed_files=changed):
                 result_collector.add_diagnostics_report(e)
         finally:
             result_collector.stop()
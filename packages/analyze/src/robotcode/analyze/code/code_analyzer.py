@@ -1,6 +1,9 @@
+import itertools
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from robotcode.core.ignore_spec import IgnoreSpec
 from robotcode.core.lsp.types import Diagnostic
@@ -8,7 +11,7 @@ from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.path import normalized_path, path_is_relative_to
 from robotcode.core.workspace import Workspace, WorkspaceFolder
-from robotcode.plugin import Application
+from robotcode.plugin import Application, CommonConfig
 from robotcode.robot.config.model import RobotBaseProfile
 from robotcode.robot.diagnostics.workspace_config import WorkspaceAnalysisConfig
 
@@ -85,7 +88,11 @@ class CodeAnalyzer(DiagnosticsContext):
         return self._dispatcher
 
     def run(
-        self, paths: Iterable[Path] = (), filter_patterns: Iterable[str] = ()
+        self,
+        paths: Iterable[Path] = (),
+        filter_patterns: Iterable[str] = (),
+        jobs: int = 1,
+        changed_files: Optional[Sequence[Path]] = None,
     ) -> Iterable[Union[DocumentDiagnosticReport, FolderDiagnosticReport]]:
         for folder in self.workspace.workspace_folders:
             self.app.verbose(f"Initialize folder {folder.uri.to_path()}")
@@ -104,38 +111,157 @@ class CodeAnalyzer(DiagnosticsContext):
 
             documents = self.collect_documents(folder, paths=paths, filter_patterns=filter_patterns)
 
-            with self.app.progressbar(documents, label="Analyzing Documents") as progressbar:
-                for document in progressbar:
-                    analyze_result = self.diagnostics.analyze_document(document)
-                    if analyze_result is not None:
-                        diagnostics = []
-                        for item in analyze_result:
-                            if item is None:
-                                continue
-                            elif isinstance(item, BaseException):
-                                self.app.error(f"Error analyzing {document.uri.to_path()}: {item}")
-                            else:
-                                diagnostics.extend(item)
-
-                        if diagnostics:
-                            yield DocumentDiagnosticReport(document, diagnostics)
-
-            with self.app.progressbar(documents, label="Collecting Diagnostics") as progressbar:
-                for document in progressbar:
-                    analyze_result = self.diagnostics.collect_diagnostics(document)
-                    diagnostics = []
-                    if analyze_result is not None:
-                        for item in analyze_result:
-                            if item is None:
-                                continue
-                            elif isinstance(item, BaseException):
-                                self.app.error(f"Error collecting diagnostics for {document.uri.to_path()}: {item}")
-                            else:
-                                diagnostics.extend(item)
-
-                    # Always yield, even when empty: the result collector uses this to count analyzed files.
+            if changed_files is not None:
+                unaffected = self._load_unaffected_documents(folder, documents, changed_files)
+                yield from unaffected
+
+                reused = {id(report.document) for report in unaffected}
+                documents = [d for d in documents if id(d) not in reused]
+
+            parallel = jobs > 1 and len(documents) > 1
+            if parallel and self.collect_unused and not self.analysis_config.cache.cache_namespaces:
+                # the workers can't pass their namespaces to this process through the cache, every document would be
+                # analyzed again for the unused checks
+                self.app.verbose("Unused keywords and variables need the namespace cache to analyze in parallel")
+                parallel = False
+
+            if parallel:
+                yield from self._run_parallel(documents, jobs)
+            else:
+                yield from self._analyze_documents(documents)
+                yield from self._collect_diagnostics(documents)
+
+            self.diagnostics.finalize_folder(folder)
+
+    def _load_unaffected_documents(
+        self, folder: WorkspaceFolder, documents: List[TextDocument], changed_files: Sequence[Path]
+    ) -> List[DocumentDiagnosticReport]:
+        """Reports with the cached diagnostics of the documents the changed files do not affect.
+
+        A document is affected if it is one of the changed files or depends on one of them, directly or
+        transitively. Documents without cached results are always analyzed.
+        """
+        if self.collect_unused:
+            self.app.verbose("Unused keywords and variables depend on all documents, analyze all documents")
+            return []
+
+        affected: Set[Path] = set()
+        for item in self.diagnostics.find_affected_documents(folder, list(changed_files)):
+            if item is None:
+                continue
+            if isinstance(item, BaseException):
+                self.app.error(f"Error resolving dependencies in {folder.uri.to_path()}: {item}")
+                return []
+            affected.update(item)
+
+        result: List[DocumentDiagnosticReport] = []
+        with self.app.progressbar(documents, label="Loading Cached Diagnostics") as progressbar:
+            for document in progressbar:
+                if normalized_path(document.uri.to_path()) in affected:
+                    continue
+
+                cached = self.diagnostics.load_cached_diagnostics(document)
+                if not cached or any(item is None or isinstance(item, BaseException) for item in cached):
+                    continue
+
+                result.append(
+                    DocumentDiagnosticReport(document, [d for item in cached if isinstance(item, list) for d in item])
+                )
+
+        self.app.verbose(
+            f"{len(documents) - len(result)} of {len(documents)} documents are affected by the changed files, "
+            "reuse the cached diagnostics of the others"
+        )
+
+        return result
+
+    def _analyze_documents(self, documents: List[TextDocument]) -> Iterator[DocumentDiagnosticReport]:
+        with self.app.progressbar(documents, label="Analyzing Documents") as progressbar:
+            for document in progressbar:
+                diagnostics, errors = _split_results(
+                    self.diagnostics.analyze_document(document), f"Error analyzing {document.uri.to_path()}"
+                )
+                for error in errors:
+                    self.app.error(error)
+
+                if diagnostics:
                     yield DocumentDiagnosticReport(document, diagnostics)
 
+    def _collect_diagnostics(self, documents: List[TextDocument]) -> Iterator[DocumentDiagnosticReport]:
+        with self.app.progressbar(documents, label="Collecting Diagnostics") as progressbar:
+            for document in progressbar:
+                diagnostics, errors = _split_results(
+                    self.diagnostics.collect_diagnostics(document),
+                    f"Error collecting diagnostics for {document.uri.to_path()}",
+                )
+                for error in errors:
+                    self.app.error(error)
+
+                # the text is not needed anymore, it is read again if a later step needs it
+                document.release_text()
+
+                # Always yield, even when empty: the result collector uses this to count analyzed files.
+                yield DocumentDiagnosticReport(document, diagnostics)
+
+    def _run_parallel(self, documents: List[TextDocument], jobs: int) -> Iterator[DocumentDiagnosticReport]:
+        """Analyze ``documents`` in ``jobs`` worker processes.
+
+        Workers share the on-disk cache with this process, so library docs and namespaces are built only once.
+        Reports are yielded in the same order as in a serial run.
+        """
+        jobs = min(jobs, len(documents))
+        batch_size = max(1, min(_MAX_BATCH_SIZE, len(documents) // (jobs * 4)))
+        batches = [
+            [str(d.uri.to_path()) for d in documents[i : i + batch_size]] for i in range(0, len(documents), batch_size)
+        ]
+
+        self.app.verbose(f"Analyze {len(documents)} documents in {jobs} processes")
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self.app.config, self.analysis_config, self.profile, self.root_folder),
+        ) as executor:
+            with self.app.progressbar(
+                itertools.chain.from_iterable(executor.map(_analyze_in_worker, batches)),
+                length=len(documents),
+                label="Analyzing Documents",
+            ) as progressbar:
+                results: List[_WorkerResult] = list(progressbar)
+
+        for document, result in zip(documents, results):
+            for error in result.analyze_errors:
+                self.app.error(error)
+
+            if result.analyze_diagnostics:
+                yield DocumentDiagnosticReport(document, result.analyze_diagnostics)
+
+        if not self.collect_unused:
+            for document, result in zip(documents, results):
+                for error in result.collect_errors:
+                    self.app.error(error)
+
+                yield DocumentDiagnosticReport(document, result.collect_diagnostics)
+            return
+
+        # Unused keywords and variables are only known when the references of all documents are merged into the
+        # project index of this process. Loading the namespaces the workers stored in the cache does that.
+        with self.app.progressbar(documents, label="Loading Namespaces") as progressbar:
+            for document in progressbar:
+                self.diagnostics.analyze_document(document)
+
+        with self.app.progressbar(documents, label="Collecting Diagnostics") as progressbar:
+            for document, result in zip(progressbar, results):
+                diagnostics, errors = _split_results(
+                    self.diagnostics.collect_project_diagnostics(document),
+                    f"Error collecting diagnostics for {document.uri.to_path()}",
+                )
+                for error in [*result.collect_errors, *errors]:
+                    self.app.error(error)
+
+                yield DocumentDiagnosticReport(document, [*result.collect_diagnostics, *diagnostics])
+
     def collect_documents(
         self, folder: WorkspaceFolder, paths: Iterable[Path] = (), filter_patterns: Iterable[str] = ()
     ) -> List[TextDocument]:
@@ -152,7 +278,7 @@ class CodeAnalyzer(DiagnosticsContext):
             for file in handler.collect_workspace_folder_files(folder):
                 file_counter += 1
                 try:
-                    document = self.workspace.documents.get_or_open_document(file)
+                    document = self.workspace.documents.get_or_open_document(file, lazy=True)
                     document_path = normalized_path(document.uri.to_path())
                     if full_paths and not any(path_is_relative_to(document_path, p) for p in full_paths):
                         continue
@@ -172,3 +298,67 @@ class CodeAnalyzer(DiagnosticsContext):
         self.app.verbose(f"Collected {len(documents)} files for analyzing in workspace folder '{folder.uri.to_path()}'")
 
         return documents
+
+
+_MAX_BATCH_SIZE = 32
+
+
+@dataclass
+class _WorkerResult:
+    analyze_diagnostics: List[Diagnostic]
+    analyze_errors: List[str]
+    collect_diagnostics: List[Diagnostic]
+    collect_errors: List[str]
+
+
+_worker_analyzer: Optional[CodeAnalyzer] = None
+
+
+def _split_results(
+    results: Optional[List[Union[List[Diagnostic], BaseException, None]]], error_prefix: str
+) -> Tuple[List[Diagnostic], List[str]]:
+    diagnostics: List[Diagnostic] = []
+    errors: List[str] = []
+
+    for item in results or ():
+        if item is None:
+            continue
+        if isinstance(item, BaseException):
+            errors.append(f"{error_prefix}: {item}")
+        else:
+            diagnostics.extend(item)
+
+    return diagnostics, errors
+
+
+def _initialize_worker(
+    config: CommonConfig, analysis_config: WorkspaceAnalysisConfig, robot_profile: RobotBaseProfile, root_folder: Path
+) -> None:
+    global _worker_analyzer
+
+    # several analyze workers already run in parallel, so one library import worker each is enough
+    if analysis_config.robot.library_workers is None:
+        analysis_config.robot.library_workers = 1
+
+    app = Application()
+    app.config = config
+
+    _worker_analyzer = CodeAnalyzer(app, analysis_config, robot_profile, root_folder, collect_unused=False)
+
+
+def _analyze_in_worker(paths: List[str]) -> List[_WorkerResult]:
+    assert _worker_analyzer is not None
+
+    result: List[_WorkerResult] = []
+    for path in paths:
+        document = _worker_analyzer.workspace.documents.get_or_open_document(Path(path), lazy=True)
+        analyze_diagnostics, analyze_errors = _split_results(
+            _worker_analyzer.diagnostics.analyze_document(document), f"Error analyzing {path}"
+        )
+        collect_diagnostics, collect_errors = _split_results(
+            _worker_analyzer.diagnostics.collect_diagnostics(document), f"Error collecting diagnostics for {path}"
+        )
+        document.release_text()
+        result.append(_WorkerResult(analyze_diagnostics, analyze_errors, collect_diagnostics, collect_errors))
+
+    return result
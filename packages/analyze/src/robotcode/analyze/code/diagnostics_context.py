@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from pathlib import Path
+from typing import List, Optional, Set, Union
 
 from robotcode.core.event import event
 from robotcode.core.language import language_id_filter
@@ -19,6 +20,20 @@ class DiagnosticHandlers:
     @event
     def document_collectors(sender, document: TextDocument) -> Optional[List[Diagnostic]]: ...
 
+    @event
+    def project_collectors(sender, document: TextDocument) -> Optional[List[Diagnostic]]: ...
+
+    @event
+    def folder_finalizers(sender, folder: WorkspaceFolder) -> None: ...
+
+    @event
+    def affected_documents_finders(
+        sender, folder: WorkspaceFolder, changed_files: List[Path]
+    ) -> Optional[Set[Path]]: ...
+
+    @event
+    def cached_diagnostics_loaders(sender, document: TextDocument) -> Optional[List[Diagnostic]]: ...
+
     def analyze_folder(self, folder: WorkspaceFolder) -> List[Union[List[Diagnostic], BaseException, None]]:
         return self.folder_analyzers(
             self,
@@ -34,7 +49,34 @@ class DiagnosticHandlers:
             return_exceptions=False,
         )
 
+    def finalize_folder(self, folder: WorkspaceFolder) -> None:
+        self.folder_finalizers(self, folder, return_exceptions=False)
+
+    def find_affected_documents(
+        self, folder: WorkspaceFolder, changed_files: List[Path]
+    ) -> List[Union[Set[Path], BaseException, None]]:
+        """Documents that must be analyzed again because they are or depend on one of the changed files."""
+        return self.affected_documents_finders(
+            self,
+            folder,
+            changed_files,
+            return_exceptions=False,
+        )
+
+    def load_cached_diagnostics(self, document: TextDocument) -> List[Union[List[Diagnostic], BaseException, None]]:
+        return self.cached_diagnostics_loaders(
+            self,
+            document,
+            callback_filter=language_id_filter(document),
+            return_exceptions=False,
+        )
+
     def collect_diagnostics(self, document: TextDocument) -> List[Union[List[Diagnostic], BaseException, None]]:
+        return [*self.collect_document_diagnostics(document), *self.collect_project_diagnostics(document)]
+
+    def collect_document_diagnostics(
+        self, document: TextDocument
+    ) -> List[Union[List[Diagnostic], BaseException, None]]:
         return self.document_collectors(
             self,
             document,
@@ -42,6 +84,15 @@ class DiagnosticHandlers:
             return_exceptions=False,
         )
 
+    def collect_project_diagnostics(self, document: TextDocument) -> List[Union[List[Diagnostic], BaseException, None]]:
+        """Collectors that need the references of all documents, like unused keywords and variables."""
+        return self.project_collectors(
+            self,
+            document,
+            callback_filter=language_id_filter(document),
+            return_exceptions=False,
+        )
+
 
 class DiagnosticsContext(ABC):
     @property
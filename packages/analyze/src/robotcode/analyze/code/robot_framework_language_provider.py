@@ -1,7 +1,7 @@
 import glob
 import sys
 from pathlib import Path
-from typing import Any, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from robot.utils import FileReader
 
@@ -12,7 +12,9 @@ from robotcode.core.language import LanguageDefinition, language_id
 from robotcode.core.lsp.types import Diagnostic, DiagnosticSeverity, DiagnosticTag
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
+from robotcode.core.utils.path import normalized_path
 from robotcode.core.workspace import WorkspaceFolder
+from robotcode.robot.diagnostics.dependency_graph import DependencyGraph
 from robotcode.robot.diagnostics.diagnostic_rules import is_variable_name_intentionally_unused
 from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
 from robotcode.robot.diagnostics.entities import (
@@ -53,14 +55,18 @@ class RobotFrameworkLanguageProvider(LanguageProvider):
             self.diagnostics_context.profile,
             self.diagnostics_context.analysis_config,
         )
+        self._dependency_graphs: Dict[Uri, DependencyGraph] = {}
 
         self.diagnostics_context.workspace.documents.on_read_document_text.add(self.on_read_document_text)
         self.diagnostics_context.diagnostics.folder_analyzers.add(self.analyze_folder)
         self.diagnostics_context.diagnostics.document_analyzers.add(self.analyze_document)
         self.diagnostics_context.diagnostics.document_collectors.add(self.collect_diagnostics)
+        self.diagnostics_context.diagnostics.folder_finalizers.add(self.finalize_folder)
+        self.diagnostics_context.diagnostics.affected_documents_finders.add(self.find_affected_documents)
+        self.diagnostics_context.diagnostics.cached_diagnostics_loaders.add(self.load_cached_diagnostics)
         if self.diagnostics_context.collect_unused:
-            self.diagnostics_context.diagnostics.document_collectors.add(self.collect_unused_keywords)
-            self.diagnostics_context.diagnostics.document_collectors.add(self.collect_unused_variables)
+            self.diagnostics_context.diagnostics.project_collectors.add(self.collect_unused_keywords)
+            self.diagnostics_context.diagnostics.project_collectors.add(self.collect_unused_variables)
 
     @property
     def document_cache(self) -> DocumentsCacheHelper:
@@ -117,6 +123,42 @@ class RobotFrameworkLanguageProvider(LanguageProvider):
 
         return imports_manager.diagnostics
 
+    def finalize_folder(self, sender: Any, folder: WorkspaceFolder) -> None:
+        imports_manager = self._document_cache.get_imports_manager_for_workspace_folder(folder)
+
+        # the process may exit without closing the cache, so write the collected access times and statistics now
+        imports_manager.data_cache.flush()
+
+        if self.verbose_callback is not None:
+            self.verbose_callback(f"Library import workers: {imports_manager.import_worker_stats}")
+            for name, stats in imports_manager.file_cache_stats.items():
+                self.verbose_callback(f"Cache for {name}: {stats}")
+
+    def find_affected_documents(
+        self, sender: Any, folder: WorkspaceFolder, changed_files: List[Path]
+    ) -> Optional[Set[Path]]:
+        graph = self._document_cache.get_dependency_graph(folder)
+        self._dependency_graphs[folder.uri] = graph
+
+        if self.verbose_callback is not None:
+            self.verbose_callback(f"Loaded dependency graph with {len(graph)} documents")
+
+        return {Path(p) for p in graph.affected_documents(str(f) for f in changed_files)}
+
+    def load_cached_diagnostics(self, sender: Any, document: TextDocument) -> Optional[List[Diagnostic]]:
+        folder = self.diagnostics_context.workspace.get_workspace_folder(document.uri)
+        graph = self._dependency_graphs.get(folder.uri) if folder is not None else None
+
+        # a document unknown to the dependency graph may depend on any of the changed files
+        if graph is None or str(normalized_path(document.uri.to_path())) not in graph:
+            return None
+
+        diagnostics = self._document_cache.get_cached_namespace_diagnostics(document)
+        if diagnostics is None:
+            return None
+
+        return self._document_cache.get_diagnostic_modifier(document).modify_diagnostics(diagnostics)
+
     def analyze_document(self, sender: Any, document: TextDocument) -> Optional[List[Diagnostic]]:
         namespace = self._document_cache.get_namespace(document)
 
@@ -227,6 +227,24 @@ class CacheConfig(BaseOptions):
         alias="cache-namespaces",
     )
 
+    max_size: Optional[int] = field(
+        description="""\
+            Maximum size of the cache database in megabytes.
+            Each cache section gets a share of this size. If a section grows beyond its share,
+            the least recently used entries are removed in the background.
+            Set this to `0` to disable the limit.
+            If you omit this key, RobotCode uses the internal default `1024`.
+
+            Examples:
+
+            ```toml
+            [tool.robotcode-analyze.cache]
+            max_size = 4096
+            ```
+        """,
+        alias="max-size",
+    )
+
 
 class ExitCodeMask(IntFlag):
     NONE = 0
@@ -296,6 +314,22 @@ class CodeConfig(BaseOptions):
         alias="collect-unused",
     )
 
+    jobs: Optional[int] = field(
+        description="""\
+            Specifies the number of processes used to analyze the documents.
+            The documents are distributed across the processes, which share the analysis cache.
+            The result is the same as in a single process run. `0` uses one process per CPU.
+            By default the documents are analyzed in a single process.
+
+            Examples:
+
+            ```toml
+            [tool.robotcode-analyze.code]
+            jobs = 8
+            ```
+        """,
+    )
+
 
 @dataclass
 class AnalyzeConfig(BaseOptions):
@@ -434,6 +468,44 @@ class AnalyzeConfig(BaseOptions):
         alias="load-library-timeout",
     )
 
+    library_workers: Optional[int] = field(
+        description="""\
+            Specifies the number of worker processes used to load (import) libraries and variable files
+            during analysis. Workers are started with Robot Framework and its standard libraries already
+            imported and are reused for several imports, so independent imports run concurrently and
+            do not pay the interpreter startup for every library.
+
+            If you omit this key, RobotCode uses half the number of CPUs, at most `4`.
+
+            Examples:
+
+            ```toml
+            [tool.robotcode-analyze]
+            library_workers = 8
+            ```
+        """,
+        alias="library-workers",
+    )
+
+    library_worker_max_imports: Optional[int] = field(
+        description="""\
+            Specifies after how many imports a library worker process is replaced by a fresh one.
+            Workers are also replaced if an import leaves state behind that cannot be cleaned up
+            (like native extension modules) and when a watched library or variables file changes.
+
+            Set this to `1` to load every library in its own fresh process.
+            If you omit this key, RobotCode uses the internal default `50`.
+
+            Examples:
+
+            ```toml
+            [tool.robotcode-analyze]
+            library_worker_max_imports = 1
+            ```
+        """,
+        alias="library-worker-max-imports",
+    )
+
     def to_workspace_analysis_config(self) -> WorkspaceAnalysisConfig:
         return WorkspaceAnalysisConfig(
             exclude_patterns=self.exclude_patterns or [],
@@ -445,6 +517,7 @@ class AnalyzeConfig(BaseOptions):
                     ignored_variables=self.cache.ignored_variables or [],
                     ignore_arguments_for_library=self.cache.ignore_arguments_for_library or [],
                     cache_namespaces=(self.cache.cache_namespaces if self.cache.cache_namespaces is not None else True),
+                    max_size=self.cache.max_size,
                 )
                 if self.cache is not None
                 else WorkspaceCacheConfig()
@@ -452,6 +525,8 @@ class AnalyzeConfig(BaseOptions):
             robot=AnalysisRobotConfig(
                 global_library_search_order=self.global_library_search_order or [],
                 load_library_timeout=self.load_library_timeout,
+                library_workers=self.library_workers,
+                library_worker_max_imports=self.library_worker_max_imports,
             ),
             modifiers=(
                 AnalysisDiagnosticModifiersConfig(
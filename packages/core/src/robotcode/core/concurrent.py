@@ -2,14 +2,20 @@ import contextlib
 import inspect
 import os
 import threading
+import time
+from collections import deque
 from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from enum import IntEnum
 from types import TracebackType
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Generic,
     Iterator,
+    Mapping,
     Optional,
     Protocol,
     Tuple,
@@ -215,21 +221,22 @@ def _remove_future_from_running_tasks(future: Task[Any]) -> None:
 _P = ParamSpec("_P")
 
 
+def _create_daemon_thread(target: Callable[..., Any], name: str, args: Tuple[Any, ...] = ()) -> threading.Thread:
+    thread = threading.Thread(target=target, args=args, name=name)
+    # TODO: don't set daemon=True because it can be deprecated in future pyhton versions
+    thread.daemon = True
+    return thread
+
+
 def _create_task_in_thread(
     callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
 ) -> Tuple[Task[_TResult], threading.Thread]:
     future: Task[_TResult] = Task()
     with _running_tasks_lock:
-        thread = threading.Thread(
-            target=_run_task_in_thread_handler,
-            args=(future, callable, args, kwargs),
-            name=str(callable),
-        )
+        thread = _create_daemon_thread(_run_task_in_thread_handler, str(callable), (future, callable, args, kwargs))
         _running_tasks[future] = thread
         future.add_done_callback(_remove_future_from_running_tasks)
 
-    # TODO: don't set daemon=True because it can be deprecated in future pyhton versions
-    thread.daemon = True
     return future, thread
 
 
@@ -254,3 +261,252 @@ def run_as_debugpy_hidden_task(callable: Callable[_P, _TResult], *args: _P.args,
     thread.start()
 
     return future
+
+
+class TaskPriority(IntEnum):
+    """Lanes of the `TaskScheduler`, lower values are started first."""
+
+    INTERACTIVE = 0
+    DIAGNOSTICS = 1
+    BACKGROUND = 2
+
+
+@dataclass
+class TaskLaneStats:
+    submitted: int = 0
+    started: int = 0
+    queued: int = 0
+    running: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.started if self.started else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"queued={self.queued}, running={self.running}, started={self.started},"
+            f" avg_wait={self.average_wait_time * 1000:.1f}ms, max_wait={self.max_wait_time * 1000:.1f}ms"
+        )
+
+
+@dataclass
+class TaskSchedulerStats:
+    workers: int = 0
+    idle_workers: int = 0
+    lanes: Dict[TaskPriority, TaskLaneStats] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return f"workers={self.workers}, idle={self.idle_workers}, " + ", ".join(
+            f"{p.name.lower()}: ({s})" for p, s in self.lanes.items()
+        )
+
+
+class _ScheduledTask:
+    __slots__ = ("args", "callable", "enqueued_at", "future", "kwargs", "priority")
+
+    def __init__(
+        self,
+        future: Task[Any],
+        callable: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        priority: TaskPriority,
+    ) -> None:
+        self.future = future
+        self.callable = callable
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+
+
+class TaskScheduler:
+    """Runs tasks in a bounded pool of threads, ordered by `TaskPriority`.
+
+    Worker threads are started on demand up to ``max_workers`` and stop after
+    ``idle_timeout`` seconds without work. Within a lane tasks are started in
+    submission order, a lane is only served if all lanes with higher priority
+    are empty. ``lane_limits`` caps the number of running tasks per lane, so
+    lower lanes always leave workers for interactive tasks.
+
+    Tasks can block on other tasks, so if the oldest task of a lane waits
+    longer than ``starvation_timeout`` seconds, the lane limit is ignored for
+    it and, if all workers are busy, an additional worker is started.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        lane_limits: Optional[Mapping[TaskPriority, int]] = None,
+        starvation_timeout: float = 2.0,
+        idle_timeout: float = 60.0,
+        name: str = "robotcode_task",
+    ) -> None:
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.lane_limits: Dict[TaskPriority, int] = {
+            TaskPriority.INTERACTIVE: self.max_workers,
+            TaskPriority.DIAGNOSTICS: max(1, self.max_workers - 2),
+            TaskPriority.BACKGROUND: max(1, self.max_workers // 2),
+        }
+        if lane_limits is not None:
+            self.lane_limits.update(lane_limits)
+        self.starvation_timeout = starvation_timeout
+        self.idle_timeout = idle_timeout
+        self.name = name
+
+        self._condition = threading.Condition(threading.Lock())
+        self._queues: Dict[TaskPriority, Deque[_ScheduledTask]] = {p: deque() for p in TaskPriority}
+        self._lanes: Dict[TaskPriority, TaskLaneStats] = {p: TaskLaneStats() for p in TaskPriority}
+        self._workers = 0
+        self._idle_workers = 0
+        self._worker_counter = 0
+        self._watchdog: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+
+    @property
+    def stats(self) -> TaskSchedulerStats:
+        with self._condition:
+            return TaskSchedulerStats(
+                self._workers,
+                self._idle_workers,
+                {
+                    p: TaskLaneStats(
+                        s.submitted, s.started, len(self._queues[p]), s.running, s.total_wait_time, s.max_wait_time
+                    )
+                    for p, s in self._lanes.items()
+                },
+            )
+
+    def submit(
+        self, priority: TaskPriority, callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
+    ) -> Task[_TResult]:
+        future: Task[_TResult] = Task()
+
+        with self._condition:
+            if self._shutdown_event.is_set():
+                raise RuntimeError("Cannot schedule new tasks after shutdown.")
+
+            self._queues[priority].append(_ScheduledTask(future, callable, args, kwargs, priority))
+            self._lanes[priority].submitted += 1
+
+            if self._idle_workers > 0:
+                self._condition.notify()
+            if sum(len(q) for q in self._queues.values()) > self._idle_workers and self._workers < self.max_workers:
+                self._start_worker()
+
+            if self._watchdog is None:
+                self._watchdog = _create_daemon_thread(self._watchdog_loop, f"{self.name}_watchdog")
+                self._watchdog.start()
+
+        return future
+
+    def shutdown(self) -> None:
+        """Stops the idle workers and the watchdog, queued tasks are still started."""
+        self._shutdown_event.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _start_worker(self) -> None:
+        self._workers += 1
+        self._worker_counter += 1
+
+        _create_daemon_thread(self._worker_loop, f"{self.name}_{self._worker_counter}").start()
+
+    def _next_task(self) -> Optional[_ScheduledTask]:
+        now = time.monotonic()
+
+        for priority, queue in self._queues.items():
+            if queue and (
+                self._lanes[priority].running < self.lane_limits[priority]
+                or now - queue[0].enqueued_at >= self.starvation_timeout
+            ):
+                task = queue.popleft()
+
+                lane = self._lanes[priority]
+                wait_time = now - task.enqueued_at
+                lane.started += 1
+                lane.running += 1
+                lane.total_wait_time += wait_time
+                lane.max_wait_time = max(lane.max_wait_time, wait_time)
+
+                return task
+
+        return None
+
+    def _worker_loop(self) -> None:
+        thread = threading.current_thread()
+        thread_name = thread.name
+
+        try:
+            while True:
+                with self._condition:
+                    task = self._next_task()
+                    while task is None:
+                        if self._shutdown_event.is_set() or self._workers > self.max_workers:
+                            self._workers -= 1
+                            return
+
+                        self._idle_workers += 1
+                        try:
+                            notified = self._condition.wait(self.idle_timeout)
+                        finally:
+                            self._idle_workers -= 1
+
+                        task = self._next_task()
+                        if task is None and not notified:
+                            self._workers -= 1
+                            return
+
+                thread.name = str(task.callable)
+                try:
+                    _run_task_in_thread_handler(task.future, task.callable, task.args, task.kwargs)
+                finally:
+                    thread.name = thread_name
+                    with self._condition:
+                        self._lanes[task.priority].running -= 1
+                        if self._idle_workers > 0 and any(self._queues.values()):
+                            self._condition.notify()
+        except BaseException:
+            with self._condition:
+                self._workers -= 1
+            raise
+
+    def _watchdog_loop(self) -> None:
+        while not self._shutdown_event.wait(self.starvation_timeout / 2):
+            with self._condition:
+                now = time.monotonic()
+                if not any(q and now - q[0].enqueued_at >= self.starvation_timeout for q in self._queues.values()):
+                    continue
+
+                if self._idle_workers > 0:
+                    self._condition.notify_all()
+                else:
+                    self._start_worker()
+
+
+_task_scheduler_lock = threading.Lock()
+_task_scheduler: Optional[TaskScheduler] = None
+
+
+def get_task_scheduler() -> TaskScheduler:
+    global _task_scheduler
+
+    if _task_scheduler is None:
+        with _task_scheduler_lock:
+            if _task_scheduler is None:
+                _task_scheduler = TaskScheduler()
+
+    return _task_scheduler
+
+
+def schedule_task(
+    priority: TaskPriority, callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
+) -> Task[_TResult]:
+    """Runs `callable` in the shared `TaskScheduler`.
+
+    Use this for short tasks, long running loops should use `run_as_task` to get a thread of their own.
+    """
+    return get_task_scheduler().submit(priority, callable, *args, **kwargs)
@@ -20,7 +20,7 @@ from .lsp.types import DocumentUri
 from .text_document import TextDocument
 from .uri import InvalidUriError, Uri
 from .utils.logging import LoggingDescriptor
-from .utils.path import DiskInfo, disk_info_from_stat
+from .utils.path import DiskInfo, disk_info_from_stat, probe_disk_info
 
 _STAT_VERIFY_MAX_RETRIES: Final = 3
 
@@ -113,7 +113,14 @@ class DocumentsManager:
         path: Union[str, "os.PathLike[Any]"],
         language_id: Optional[str] = None,
         version: Optional[int] = None,
+        *,
+        lazy: bool = False,
     ) -> TextDocument:
+        """Returns the already opened document for ``path`` or opens it.
+
+        A ``lazy`` opened document only stats the file, its text is read on the first access
+        and can be released again with :meth:`TextDocument.release_text`.
+        """
         uri = Uri.from_path(path).normalized()
 
         result = self.get(uri)
@@ -121,6 +128,18 @@ class DocumentsManager:
             return result
 
         try:
+            if lazy:
+                disk_info = probe_disk_info(path)
+                if disk_info is not None:
+                    return self._append_document(
+                        document_uri=DocumentUri(uri),
+                        language_id=language_id or self.detect_language_id(path),
+                        text=None,
+                        version=version,
+                        disk_info=disk_info,
+                        text_loader=self._create_text_loader(uri, language_id),
+                    )
+
             text, disk_info = self.read_document_text_with_disk_info(uri, language_id)
             return self._append_document(
                 document_uri=DocumentUri(uri),
@@ -134,6 +153,17 @@ class DocumentsManager:
         except BaseException as e:
             raise CantReadDocumentError(f"Error reading document '{path}': {e!s}") from e
 
+    def _create_text_loader(self, uri: Uri, language_id: Optional[str]) -> Callable[[], Tuple[str, Optional[DiskInfo]]]:
+        def load() -> Tuple[str, Optional[DiskInfo]]:
+            try:
+                return self.read_document_text_with_disk_info(uri, language_id)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                raise CantReadDocumentError(f"Error reading document '{uri.to_path()}': {e!s}") from e
+
+        return load
+
     @event
     def on_read_document_text(sender, uri: Uri) -> Optional[str]: ...
 
@@ -183,10 +213,11 @@ class DocumentsManager:
     def _create_document(
         self,
         document_uri: DocumentUri,
-        text: str,
+        text: Optional[str],
         language_id: Optional[str] = None,
         version: Optional[int] = None,
         disk_info: Optional[DiskInfo] = None,
+        text_loader: Optional[Callable[[], Tuple[str, Optional[DiskInfo]]]] = None,
     ) -> TextDocument:
         result = TextDocument(
             document_uri=document_uri,
@@ -194,6 +225,7 @@ class DocumentsManager:
             text=text,
             version=version,
             disk_info=disk_info,
+            text_loader=text_loader,
         )
 
         result.cache_invalidate.add(self._on_document_cache_invalidate)
@@ -205,9 +237,10 @@ class DocumentsManager:
         self,
         document_uri: DocumentUri,
         language_id: str,
-        text: str,
+        text: Optional[str],
         version: Optional[int] = None,
         disk_info: Optional[DiskInfo] = None,
+        text_loader: Optional[Callable[[], Tuple[str, Optional[DiskInfo]]]] = None,
     ) -> TextDocument:
         with self._lock:
             document = self._create_document(
@@ -216,6 +249,7 @@ class DocumentsManager:
                 text=text,
                 version=version,
                 disk_info=disk_info,
+                text_loader=text_loader,
             )
 
             self._documents[document_uri] = document
@@ -74,6 +74,22 @@ class IgnoreRule(NamedTuple):
         return False
 
 
+class _RuleGroup(NamedTuple):
+    negation: bool
+    base_path: PurePath
+    regex: "Optional[re.Pattern[str]]"
+    dir_regex: "Optional[re.Pattern[str]]"
+
+
+def _combine_regexes(rules: Iterable[IgnoreRule]) -> "Optional[re.Pattern[str]]":
+    patterns = [r.regex.pattern for r in rules]
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return re.compile(patterns[0])
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
 class IgnoreSpec(_HelperCache):
     def __init__(self, rules: Reversible[IgnoreRule]):
         self.rules = rules
@@ -81,8 +97,32 @@ class IgnoreSpec(_HelperCache):
 
         self._reversed_rules = list(reversed(rules))
 
+        # Consecutive rules with the same base path and negation are matched with one combined regex.
+        # The last matching rule decides, so the groups are checked in reverse order.
+        groups: List[_RuleGroup] = []
+        group: List[IgnoreRule] = []
+        for rule in self._reversed_rules:
+            if group and (rule.negation != group[0].negation or rule.base_path != group[0].base_path):
+                groups.append(self._create_group(group))
+                group = []
+            group.append(rule)
+        if group:
+            groups.append(self._create_group(group))
+        self._groups = groups
+
         self._relative_path_cache: Dict[Tuple[PurePath, PurePath], PurePath] = {}
         self._posix_path_cache: Dict[PurePath, str] = {}
+        self._relative_dir_cache: Dict[str, Tuple[Optional[str], ...]] = {}
+        self._dir_decision_cache: Dict[str, bool] = {}
+
+    @staticmethod
+    def _create_group(rules: List[IgnoreRule]) -> _RuleGroup:
+        return _RuleGroup(
+            rules[0].negation,
+            rules[0].base_path,
+            _combine_regexes(r for r in rules if not r.directory_only),
+            _combine_regexes(rules),
+        )
 
     def _relative_to_path(self, path: PurePath, base_path: PurePath) -> PurePath:
         key = (path, base_path)
@@ -102,19 +142,60 @@ class IgnoreSpec(_HelperCache):
         self._posix_path_cache[path] = result
         return result
 
-    def matches(self, path: "os.PathLike[str]") -> bool:
-        abs_path = Path(os.path.abspath(path))
-        pure_file_path = PurePath(abs_path)
-        is_dir = abs_path.is_dir()
+    def _relative_parents(self, parent: PurePath) -> Tuple[Optional[str], ...]:
+        result: List[Optional[str]] = []
+        for group in self._groups:
+            try:
+                result.append(parent.relative_to(group.base_path).as_posix())
+            except ValueError:
+                result.append(None)
+        return tuple(result)
 
-        if not self.negation:
-            return any(r.matches(pure_file_path, is_dir, self) for r in self.rules)
+    def matches(self, path: "os.PathLike[str]", is_dir: Optional[bool] = None) -> bool:
+        abs_path = os.path.abspath(path)
 
-        for rule in self._reversed_rules:
-            if rule.matches(pure_file_path, is_dir, self):
-                return not rule.negation
+        if is_dir is None:
+            is_dir = os.path.isdir(abs_path)
+
+        if is_dir:
+            decision = self._dir_decision_cache.get(abs_path)
+            if decision is not None:
+                return decision
+
+        # the paths relative to the base paths are only computed once per directory
+        parent, name = os.path.split(abs_path)
+        parents = self._relative_dir_cache.get(parent)
+        if parents is None:
+            parents = self._relative_dir_cache[parent] = self._relative_parents(PurePath(parent))
+
+        result = False
+        for group, parent_posix in zip(self._groups, parents):
+            regex = group.dir_regex if is_dir else group.regex
+            if regex is None:
+                continue
+
+            if not name or parent_posix is None:
+                # only the base path itself is relative to it if its parent is not
+                if PurePath(abs_path) != group.base_path:
+                    continue
+                rel_path = "."
+            elif parent_posix == ".":
+                rel_path = name
+            else:
+                rel_path = f"{parent_posix}/{name}"
 
-        return False
+            if group.negation and is_dir:
+                rel_path += "/"
+            if rel_path.startswith("./"):
+                rel_path = rel_path[2:]
+            if regex.search(rel_path):
+                result = not group.negation
+                break
+
+        if is_dir:
+            self._dir_decision_cache[abs_path] = result
+
+        return result
 
     def __add__(self, other: "IgnoreSpec") -> "IgnoreSpec":
         return IgnoreSpec(tuple(self.rules) + tuple(other.rules))
@@ -353,19 +434,26 @@ def _iter_files(
         spec = parent_spec
 
     if not path.is_dir():
-        if spec is not None and spec.matches(path):
+        if spec is not None and spec.matches(path, is_dir=False):
             return
         yield path
         return
 
-    for p in path.iterdir():
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    for entry in entries:
+        p = Path(entry.path)
+
         if not include_hidden and _is_hidden(p):
             continue
 
-        if spec is not None and spec.matches(p):
+        # ignored directories are pruned here and never listed
+        is_dir = entry.is_dir()
+        if spec is not None and spec.matches(p, is_dir=is_dir):
             continue
 
-        if p.is_dir():
+        if is_dir:
             yield from _iter_files(
                 p,
                 ignore_files=ignore_files,
@@ -374,5 +462,5 @@ def _iter_files(
                 verbose_callback=verbose_callback,
                 verbose_trace=verbose_trace,
             )
-        elif p.is_file():
+        elif entry.is_file():
             yield p
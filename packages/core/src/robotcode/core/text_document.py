@@ -1,7 +1,7 @@
+import bisect
 import collections
 import functools
 import inspect
-import io
 import weakref
 from contextlib import contextmanager
 from typing import (
@@ -12,6 +12,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -31,45 +32,53 @@ def is_multibyte_char(char: str) -> bool:
     return ord(char) > 0xFFFF
 
 
-def position_from_utf16(lines: List[str], position: Position) -> Position:
-    if position.line >= len(lines):
-        return position
+@functools.lru_cache(maxsize=1024)
+def has_multibyte_char(line: str) -> bool:
+    return any(is_multibyte_char(c) for c in line)
+
 
-    utf32_offset = 0
-    utf16_counter = 0
+@functools.lru_cache(maxsize=1024)
+def _utf16_offsets(line: str) -> Tuple[int, ...]:
+    """UTF-16 offset of every character of a line that contains multibyte characters.
 
-    for c in lines[position.line]:
-        utf16_counter += 2 if is_multibyte_char(c) else 1
+    The result has one more entry than the line has characters, the last entry is the UTF-16 length of the line.
+    """
+    result = [0]
+    counter = 0
+    for c in line:
+        counter += 2 if is_multibyte_char(c) else 1
+        result.append(counter)
+    return tuple(result)
 
-        if utf16_counter > position.character:
-            break
 
-        utf32_offset += 1
+def position_from_utf16(lines: List[str], position: Position) -> Position:
+    if position.line >= len(lines):
+        return position
 
-    return Position(line=position.line, character=utf32_offset)
+    line = lines[position.line]
 
+    if not has_multibyte_char(line):
+        return Position(line=position.line, character=max(0, min(position.character, len(line))))
 
-@functools.lru_cache(maxsize=1024)
-def has_multibyte_char(line: str) -> bool:
-    return any(is_multibyte_char(c) for c in line)
+    return Position(
+        line=position.line,
+        character=max(0, bisect.bisect_right(_utf16_offsets(line), position.character) - 1),
+    )
 
 
 def position_to_utf16(lines: List[str], position: Position) -> Position:
     if position.line >= len(lines):
         return position
 
-    if not has_multibyte_char(lines[position.line]):
-        return position
-
-    utf16_counter = 0
-
-    for i, c in enumerate(lines[position.line]):
-        if i >= position.character:
-            break
+    line = lines[position.line]
 
-        utf16_counter += 2 if is_multibyte_char(c) else 1
+    if not has_multibyte_char(line):
+        return position
 
-    return Position(line=position.line, character=utf16_counter)
+    return Position(
+        line=position.line,
+        character=_utf16_offsets(line)[max(0, min(position.character, len(line)))],
+    )
 
 
 def range_from_utf16(lines: List[str], range: Range) -> Range:
@@ -86,6 +95,10 @@ def range_to_utf16(lines: List[str], range: Range) -> Range:
     )
 
 
+# all characters str.splitlines() treats as line boundaries
+_LINE_BREAKS: Final = ("\n", "\r", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+
 class InvalidRangeError(Exception):
     pass
 
@@ -106,23 +119,32 @@ class TextDocument:
     def __init__(
         self,
         document_uri: DocumentUri,
-        text: str,
+        text: Optional[str],
         language_id: Optional[str] = None,
         version: Optional[int] = None,
         disk_info: Optional[DiskInfo] = None,
+        text_loader: Optional[Callable[[], Tuple[str, Optional[DiskInfo]]]] = None,
     ) -> None:
         super().__init__()
 
+        if text is None and text_loader is None:
+            raise ValueError("Either text or text_loader must be given.")
+
         self._lock = RLock(name=f"Document.lock '{document_uri}'", default_timeout=120)
         self.document_uri = document_uri
         self.uri = Uri(self.document_uri).normalized()
         self.language_id = language_id
         self._version = version
-        self._text = text
+        # the text is kept either as a whole string or as a list of lines, whichever was needed last,
+        # the other one is built lazily. Incremental changes are applied to the lines only.
+        # If both are None, the text is not loaded yet or was released and is read with the text loader.
+        self._text: Optional[str] = text
+        self._text_loader = text_loader
         self._orig_text = text
         self._orig_version = version
         self._disk_info = disk_info
         self._lines: Optional[List[str]] = None
+        self._lines_shared = False
         self._cache: Dict[weakref.ref[Any], CacheEntry] = collections.defaultdict(CacheEntry)
         self._data_lock = RLock(name=f"Document.data_lock '{document_uri}'", default_timeout=120)
         self._data: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
@@ -143,8 +165,68 @@ class TextDocument:
         return f"TextDocument(uri={self.uri!r}, language_id={self.language_id!r}, version={self._version!r})"
 
     def text(self) -> str:
+        self._load_text()
         with self._lock:
-            return self._text
+            return self.__get_text()
+
+    def __get_text(self) -> str:
+        if self._text is None:
+            if self._lines is None and self._text_loader is not None:
+                self.__load_text()
+            else:
+                self._text = "".join(self._lines or ())
+
+        assert self._text is not None
+        return self._text
+
+    @property
+    def is_text_loaded(self) -> bool:
+        return self._text is not None or self._lines is not None
+
+    def __load_text(self) -> bool:
+        assert self._text_loader is not None
+
+        text, disk_info = self._text_loader()
+        outdated = disk_info is None or disk_info != self._disk_info
+
+        self._text = self._orig_text = text
+        self._lines = None
+        self._disk_info = disk_info
+
+        return outdated
+
+    def _load_text(self) -> None:
+        if self.is_text_loaded or self._text_loader is None:
+            return
+
+        with self._lock:
+            outdated = not self.is_text_loaded and self.__load_text()
+
+        # the file changed since it was stat'ed or its text was released,
+        # everything derived from the previous state is outdated
+        if outdated:
+            self.invalidate_cache()
+
+    def release_text(self) -> bool:
+        """Drops the text of a document that is unchanged from the disk, it is read again on the next access.
+
+        Returns ``False`` if the text is kept, because the document is opened in an editor,
+        has unsaved changes or can't be read again.
+        """
+        with self._lock:
+            if (
+                self._text_loader is None
+                or self.opened_in_editor
+                or self._version is not None
+                or self._disk_info is None
+            ):
+                return False
+
+            self._text = self._orig_text = None
+            self._lines = None
+            self._lines_shared = False
+
+            return True
 
     @property
     def disk_info(self) -> Optional[DiskInfo]:
@@ -160,7 +242,8 @@ class TextDocument:
         self.apply_full_change(version, text, save=True)
 
     def revert(self, version: Optional[int]) -> bool:
-        if self._orig_text != self._text or self._orig_version != self._version:
+        text = self.text()
+        if self._orig_text != text or self._orig_version != self._version:
             self.apply_full_change(version or self._orig_version, self._orig_text)
             return True
         return False
@@ -168,7 +251,7 @@ class TextDocument:
     @_logger.call
     def apply_none_change(self) -> None:
         with self._cache_invalidating():
-            self._lines = None
+            pass
 
     @_logger.call
     def apply_full_change(
@@ -186,58 +269,76 @@ class TextDocument:
                 self._text = text
                 self._lines = None
             if save:
-                self._orig_text = self._text
+                self._orig_text = self.__get_text()
             if text is not None or save:
                 self._disk_info = disk_info
 
     @_logger.call
     def apply_incremental_change(self, version: Optional[int], range: Range, text: str) -> None:
+        self._load_text()
         with self._cache_invalidating():
-            try:
-                self._disk_info = None
-                if version is not None:
-                    self._version = version
+            self._disk_info = None
+            if version is not None:
+                self._version = version
 
-                if range.start > range.end:
-                    raise InvalidRangeError(f"Start position is greater then end position {range}.")
+            if range.start > range.end:
+                raise InvalidRangeError(f"Start position is greater then end position {range}.")
 
-                lines = self.__get_lines()
+            lines = self.__get_lines()
 
-                (start_line, start_col), (end_line, end_col) = range_from_utf16(lines, range)
+            (start_line, start_col), (end_line, end_col) = range_from_utf16(lines, range)
 
-                if start_line == len(lines):
-                    self._text = self._text + text
-                    return
+            if start_line > len(lines):
+                return
 
-                with io.StringIO() as new_text:
-                    for i, line in enumerate(lines):
-                        if i < start_line or i > end_line:
-                            new_text.write(line)
-                            continue
+            if start_line == len(lines):
+                # append to the end of the document
+                if lines:
+                    start_line -= 1
+                    start_col = len(lines[start_line])
+                end_line, end_col = start_line, start_col
 
-                        if i == start_line:
-                            new_text.write(line[:start_col])
-                            new_text.write(text)
+            first = start_line
+            last = min(end_line, len(lines) - 1)
 
-                        if i == end_line:
-                            new_text.write(line[end_col:])
+            if lines:
+                new_text = lines[start_line][:start_col] + text
+                if end_line < len(lines):
+                    new_text += lines[end_line][end_col:]
+            else:
+                new_text = text
 
-                    self._text = new_text.getvalue()
-            finally:
-                self._lines = None
+            # the changed text can join or split line breaks with the neighbouring lines, so they are split again
+            while last + 1 < len(lines) and (
+                not new_text.endswith(_LINE_BREAKS) or (new_text.endswith("\r") and lines[last + 1].startswith("\n"))
+            ):
+                last += 1
+                new_text += lines[last]
+            if first > 0 and lines[first - 1].endswith("\r") and new_text.startswith("\n"):
+                first -= 1
+                new_text = lines[first] + new_text
+
+            if self._lines_shared:
+                self._lines = lines = lines.copy()
+                self._lines_shared = False
+
+            lines[first : last + 1] = new_text.splitlines(True)
+            self._text = None
 
     def __get_lines(self) -> List[str]:
         if self._lines is None:
-            self._lines = self._text.splitlines(True)
+            self._lines = self.__get_text().splitlines(True)
+            self._lines_shared = False
 
         return self._lines
 
     def get_lines(self) -> List[str]:
+        self._load_text()
         with self._lock:
-            if self._lines is None:
-                return self.__get_lines()
-
-            return self._lines
+            result = self.__get_lines()
+            # the list is handed out, the next incremental change must not modify it in place
+            self._lines_shared = True
+            return result
 
     def get_text(self, r: Range) -> str:
         lines = self.get_lines()
@@ -393,6 +494,8 @@ class TextDocument:
             return self._data.get(key, default)
 
     def _clear(self) -> None:
+        if self._text is None and self._lines is not None:
+            self._text = "".join(self._lines)
         self._lines = None
         self._disk_info = None
         self._invalidate_data()
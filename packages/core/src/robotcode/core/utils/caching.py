@@ -1,6 +1,8 @@
-from collections import defaultdict
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from threading import RLock
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
 
 _T = TypeVar("_T")
 
@@ -11,49 +13,154 @@ def _freeze(v: Any) -> Any:
     return v
 
 
-class CacheEntry:
-    def __init__(self) -> None:
-        self.data: Any = None
-        self.has_data: bool = False
-        self.lock = RLock()
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}, expirations={self.expirations},"
+            f" hit_ratio={self.hit_ratio:.1%}"
+        )
+
+
+class _CacheEntry:
+    __slots__ = ("data", "expires_at", "size")
+
+    def __init__(self, data: Any, size: int, expires_at: Optional[float]) -> None:
+        self.data = data
+        self.size = size
+        self.expires_at = expires_at
 
 
 class SimpleLRUCache:
-    def __init__(self, max_items: Optional[int] = 128) -> None:
+    """Thread-safe memoizing cache with least-recently-used eviction.
+
+    Lookups, inserts and evictions are O(1). A hit moves the entry to the most
+    recently used end, when ``max_items`` or ``max_size`` are exceeded the least
+    recently used entries are evicted. With ``ttl`` (in seconds) entries expire
+    after that time. ``sizeof`` computes the size of a value for ``max_size``,
+    by default every value has the size 1. Values bigger than ``max_size`` are
+    computed but not cached.
+
+    Concurrent `get` calls for the same key compute the value only once, calls
+    for other keys are not blocked meanwhile.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = 128,
+        *,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        name: Optional[str] = None,
+    ) -> None:
         self.max_items = max_items
+        self.ttl = ttl
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.name = name
 
-        self._cache: Dict[Tuple[Any, ...], CacheEntry] = defaultdict(CacheEntry)
-        self._order: Optional[List[Tuple[Any, ...]]] = None
-        if self.max_items:
-            self._order = []
+        self.stats = CacheStats()
+
+        self._cache: "OrderedDict[Tuple[Any, ...], _CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._pending: Dict[Tuple[Any, ...], RLock] = {}
         self._lock = RLock()
 
-    def has(self, *args: Any, **kwargs: Any) -> bool:
-        key = self._make_key(*args, **kwargs)
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __str__(self) -> str:
+        return f"{self.name or type(self).__name__}: items={len(self._cache)}, size={self._size}, {self.stats}"
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _lookup(self, key: Tuple[Any, ...]) -> Optional[_CacheEntry]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            return None
+
+        self._cache.move_to_end(key)
+        return entry
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        entry = self._cache.pop(key)
+        self._size -= entry.size
+
+    def _store(self, key: Tuple[Any, ...], data: Any) -> None:
+        size = self.sizeof(data) if self.sizeof is not None else 1
+        if self.max_size is not None and size > self.max_size:
+            return
 
         if key in self._cache:
-            return self._cache[key].has_data
+            self._remove(key)
 
-        return False
+        self._cache[key] = _CacheEntry(data, size, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self._size += size
+
+        while self._cache and (
+            (self.max_items is not None and len(self._cache) > self.max_items)
+            or (self.max_size is not None and self._size > self.max_size)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.stats.evictions += 1
+
+    def has(self, *args: Any, **kwargs: Any) -> bool:
+        key = self._make_key(*args, **kwargs)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and (entry.expires_at is None or entry.expires_at > time.monotonic())
 
     def get(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
         key = self._make_key(*args, **kwargs)
 
-        entry = self._cache[key]
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self.stats.hits += 1
+                return cast(_T, entry.data)
+
+            pending = self._pending.setdefault(key, RLock())
+
+        with pending:
+            with self._lock:
+                # another thread may have computed the value while we waited
+                entry = self._lookup(key)
+                if entry is not None:
+                    self.stats.hits += 1
+                    return cast(_T, entry.data)
 
-        with entry.lock:
-            if not entry.has_data:
-                entry.data = func(*args, **kwargs)
-                entry.has_data = True
+                self.stats.misses += 1
 
-                if self._order is not None and self.max_items is not None:
-                    with self._lock:
-                        self._order.insert(0, key)
+            try:
+                data = func(*args, **kwargs)
 
-                        if len(self._order) > self.max_items:
-                            del self._cache[self._order.pop()]
+                with self._lock:
+                    self._store(key, data)
+            finally:
+                with self._lock:
+                    if self._pending.get(key) is pending:
+                        del self._pending[key]
 
-            return cast(_T, entry.data)
+            return data
 
     @staticmethod
     def _make_key(*args: Any, **kwargs: Any) -> Tuple[Any, ...]:
@@ -65,5 +172,4 @@ class SimpleLRUCache:
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            if self._order is not None:
-                self._order.clear()
+            self._size = 0
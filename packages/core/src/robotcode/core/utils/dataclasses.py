@@ -135,21 +135,39 @@ def get_dataclass_fields(t: Type[Any]) -> Tuple[dataclasses.Field, ...]:  # type
     return fields
 
 
+__json_encoders_cache: Dict[Type[Any], Optional[Callable[[Any], Dict[str, Any]]]] = {}
+
+
+def _compile_json_encoder(t: Type[Any]) -> Callable[[Any], Dict[str, Any]]:
+    lines = ["def encode(o):", "    result = {}"]
+
+    for field in get_dataclass_fields(t):
+        if not (field.init or field.metadata.get("force_json", False)) or field.metadata.get("nosave", False):
+            continue
+
+        name = encode_case_for_field_name(t, field)
+        lines.append(f"    v = o.{field.name}")
+        if field.default == dataclasses.MISSING:
+            lines.append(f"    result[{name!r}] = v")
+        else:
+            lines.append("    if v is not None:")
+            lines.append(f"        result[{name!r}] = v")
+
+    lines.append("    return result")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return cast(Callable[[Any], Dict[str, Any]], namespace["encode"])
+
+
 def _default(o: Any) -> Any:
-    if dataclasses.is_dataclass(o):
-        return {
-            name: value
-            for name, value, field in (
-                (
-                    encode_case_for_field_name(o, field),
-                    getattr(o, field.name),
-                    field,
-                )
-                for field in get_dataclass_fields(type(o))
-                if (field.init or field.metadata.get("force_json", False)) and not field.metadata.get("nosave", False)
-            )
-            if value is not None or field.default == dataclasses.MISSING
-        }
+    t = type(o)
+    encoder = __json_encoders_cache.get(t, __NOT_SET)
+    if encoder is __NOT_SET:
+        encoder = __json_encoders_cache[t] = _compile_json_encoder(t) if dataclasses.is_dataclass(t) else None
+
+    if encoder is not None:
+        return cast(Callable[[Any], Dict[str, Any]], encoder)(o)
     if isinstance(o, enum.Enum):
         return o.value
     if isinstance(o, Set):
@@ -158,6 +176,27 @@ def _default(o: Any) -> Any:
     raise TypeError(f"Cant' get default value for {type(o)} with value {o!r}")
 
 
+try:
+    import orjson
+
+    # orjson converts integers that don't fit in 64 bits to floats, leave these to `json`
+    _RE_LONG_NUMBER = re.compile(r"\d{19}")
+    _RE_LONG_NUMBER_BYTES = re.compile(rb"\d{19}")
+
+    def _json_loads(s: Union[str, bytes]) -> Any:
+        if (_RE_LONG_NUMBER.search(s) if isinstance(s, str) else _RE_LONG_NUMBER_BYTES.search(s)) is None:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than `json`, e.g. for NaN or lone surrogates
+                pass
+
+        return json.loads(s)
+
+except ImportError:
+    _json_loads = json.loads
+
+
 def as_json(obj: Any, indent: Optional[bool] = None, compact: Optional[bool] = None) -> str:
     return json.dumps(
         obj,
@@ -361,6 +400,229 @@ def __get_signature_keys_cached(t: Type[Any], signature: inspect.Signature) -> S
     return r
 
 
+def _get_from_dict_handler(t: Type[Any]) -> Optional[Callable[[Any, Type[Any], bool], Tuple[Any, bool]]]:
+    func = __from_dict_handlers_cache.get(t, __NOT_SET)
+    if func is __NOT_SET:
+        func = None
+        for h in __from_dict_handlers:
+            if h[0](t):
+                func = h[1]
+                break
+
+        __from_dict_handlers_cache[t] = func
+
+    return cast(Optional[Callable[[Any, Type[Any], bool], Tuple[Any, bool]]], func)
+
+
+_Converter = Callable[[Any, bool], Any]
+
+__converters_cache: Dict[Any, _Converter] = {}
+
+
+def _compile_dataclass_converter(t: Type[Any]) -> _Converter:
+    # decodes a dict to a dataclass like the generic `from_dict`, but the reflection is done only once
+    type_hints = _get_type_hints_cached(t)
+    signature = _get_signature_cached(t)
+    signature_keys = frozenset(signature.parameters.keys())
+    non_default_parameters = frozenset(
+        k for k, v in signature.parameters.items() if v.default == inspect.Parameter.empty
+    )
+    member_names: Dict[str, str] = {}
+    converters: Dict[str, _Converter] = {}
+
+    def convert_dataclass(value: Any, strict: bool) -> Any:
+        if not isinstance(value, dict):
+            return __NOT_SET
+
+        cased_value: Dict[str, Any] = {}
+        for k, v in value.items():
+            name = member_names.get(k)
+            if name is None:
+                name = _decode_case_for_member_name(t, k)  # type: ignore[arg-type]
+                if name in type_hints:
+                    member_names[k] = name
+            cased_value[name] = v
+
+        if not cased_value and non_default_parameters:
+            return __NOT_SET
+
+        if strict and any(k not in signature_keys for k in cased_value):
+            return __NOT_SET
+
+        if not non_default_parameters <= cased_value.keys():
+            return __NOT_SET
+
+        params: Dict[str, Any] = {}
+        for k, v in cased_value.items():
+            converter = converters.get(k)
+            if converter is None:
+                if k not in type_hints:
+                    continue
+                converter = converters[k] = _get_converter(type_hints[k])
+
+            try:
+                params[k] = converter(v, strict)
+            except NamedTypeError as e:
+                raise NamedTypeError(k + "." + e.name, e.message) from e
+            except TypeError as e:
+                raise NamedTypeError(k, str(e)) from e
+
+        try:
+            return t(**params)
+        except TypeError as ex:
+            raise TypeError(f"Can't initialize {t!r} with parameters {params!r}: {ex}") from ex
+
+    return convert_dataclass
+
+
+def _compile_union_converter(types: Tuple[Type[Any], ...]) -> _Converter:
+    # the handlers are tried in the same order as in the generic `from_dict`, if none of them accepts the value
+    # and there is only one dataclass the value could be matched to, that dataclass is decoded directly
+    handlers = [(t, h) for t, h in ((t, _get_from_dict_handler(t)) for t in types) if h is not None]
+
+    candidates = []
+    for t in types:
+        if t is NONETYPE or _get_origin_cached(t) is Literal:
+            continue
+        try:
+            _get_signature_cached(_get_origin_cached(t) or t)
+        except ValueError:
+            continue
+        candidates.append(t)
+
+    dataclass_converter = (
+        _compile_fast_converter(candidates[0])
+        if len(candidates) == 1 and _get_from_dict_handler(candidates[0]) is None
+        else None
+    )
+
+    def convert_union(value: Any, strict: bool) -> Any:
+        for t, h in handlers:
+            r, ok = h(value, t, strict)
+            if ok:
+                return r
+
+        if dataclass_converter is not None and type(value) is dict:
+            return dataclass_converter(value, strict)
+
+        return __NOT_SET
+
+    return convert_union
+
+
+def _compile_fast_converter(t: Type[Any]) -> Optional[_Converter]:
+    # Returns a converter for the common cases or `None`. The converter returns `__NOT_SET` if it can't
+    # handle the value, the value is then converted by the generic `from_dict`, which also creates the errors.
+    handler = _get_from_dict_handler(t)
+
+    if handler is __from_dict_handle_basic_types:
+
+        def convert_basic_type(value: Any, strict: bool) -> Any:
+            return value if type(value) is t else __NOT_SET
+
+        return convert_basic_type
+
+    if t is Any:
+        return lambda value, strict: value
+
+    origin = _get_origin_cached(t)
+    args = _get_args_cached(t)
+
+    if handler is __from_dict_handle_union:
+        return _compile_union_converter(args)
+
+    if handler is __from_dict_handle_literal:
+        return lambda value, strict: value if value in args else __NOT_SET
+
+    if handler is __from_dict_handle_enum:
+        members: Dict[Any, Any] = {}
+        for member in cast(Iterable[Any], t):
+            members.setdefault(member.value, member)
+
+        def convert_enum(value: Any, strict: bool) -> Any:
+            try:
+                return members.get(value, __NOT_SET)
+            except TypeError:
+                return __NOT_SET
+
+        return convert_enum
+
+    if handler is __from_dict_handle_sequence:
+        if origin is not list or len(args) != 1:
+            return None
+
+        item_converter = _get_converter(args[0])
+
+        def convert_list(value: Any, strict: bool) -> Any:
+            if type(value) is not list:
+                return __NOT_SET
+            return [item_converter(v, strict) for v in value]
+
+        return convert_list
+
+    if handler is __from_dict_handle_mapping:
+        if origin is not dict or len(args) != 2:
+            return None
+
+        value_converter = _get_converter(args[1])
+
+        def convert_dict(value: Any, strict: bool) -> Any:
+            if type(value) is not dict:
+                return __NOT_SET
+
+            result = {}
+            for n, v in value.items():
+                try:
+                    result[n] = value_converter(v, strict)
+                except NamedTypeError as e:
+                    raise NamedTypeError(n + "." + e.name, e.message) from e
+                except TypeError as e:
+                    raise NamedTypeError(n, str(e)) from e
+            return result
+
+        return convert_dict
+
+    if handler is None and origin is None and dataclasses.is_dataclass(t):
+        try:
+            return _compile_dataclass_converter(t)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            # e.g. unresolvable type hints, let the generic `from_dict` report it
+            return None
+
+    return None
+
+
+def _compile_converter(t: Type[Any]) -> _Converter:
+    fast = _compile_fast_converter(t)
+    types = (t,)
+
+    if fast is None:
+        return lambda value, strict: _from_dict_generic(value, types, strict)
+
+    def convert(value: Any, strict: bool) -> Any:
+        r = fast(value, strict)
+        if r is __NOT_SET:
+            return _from_dict_generic(value, types, strict)
+        return r
+
+    return convert
+
+
+def _get_converter(t: Type[Any]) -> _Converter:
+    """Returns a function that converts a value like `from_dict(value, t, strict=strict)`, compiled once per type."""
+    try:
+        r = __converters_cache.get(t)
+    except TypeError:
+        types = (t,)
+        return lambda value, strict: _from_dict_generic(value, types, strict)
+
+    if r is None:
+        r = __converters_cache[t] = _compile_converter(t)
+    return r
+
+
 def from_dict(
     value: Any,
     types: Union[Type[_T], Tuple[Type[_T], ...], None] = None,
@@ -371,31 +633,28 @@ def from_dict(
     if types is None:
         return cast(_T, value)
 
-    if not isinstance(types, tuple):
-        types = (types,)
-    if not types:
-        return cast(_T, value)
+    if isinstance(types, tuple):
+        if not types:
+            return cast(_T, value)
+        if len(types) > 1:
+            return cast(_T, _from_dict_generic(value, types, strict))
+        types = types[0]
 
-    for t in types:
-        func = __from_dict_handlers_cache.get(t, __NOT_SET)
-        if func is __NOT_SET:
-            func = None
-            for h in __from_dict_handlers:
-                if h[0](t):
-                    func = h[1]
-                    break
+    return cast(_T, _get_converter(types)(value, strict))
 
-            __from_dict_handlers_cache[t] = func
 
+def _from_dict_generic(value: Any, types: Tuple[Type[Any], ...], strict: bool) -> Any:
+    for t in types:
+        func = _get_from_dict_handler(t)
         if func is None:
             continue
 
-        r, ok = func(value, t, strict)  # type: ignore
+        r, ok = func(value, t, strict)
         if ok:
-            return cast(_T, r)
+            return r
 
     if isinstance(value, Mapping):
-        match_: Optional[Type[_T]] = None
+        match_: Optional[Type[Any]] = None
         match_same_keys: Optional[Set[str]] = None
         match_value: Optional[Dict[str, Any]] = None
         match_signature: Optional[inspect.Signature] = None
@@ -489,7 +748,7 @@ def from_json(
     *,
     strict: bool = False,
 ) -> _T:
-    return from_dict(json.loads(s), types, strict=strict)
+    return from_dict(_json_loads(s), types, strict=strict)
 
 
 def as_dict(value: Any, *, remove_defaults: bool = False, encode: bool = True) -> Dict[str, Any]:
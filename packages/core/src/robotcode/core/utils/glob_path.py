@@ -3,11 +3,13 @@ import os
 import re
 import sys
 from pathlib import Path, PurePath
-from typing import Any, Iterable, Iterator, Optional, Sequence, Union, cast
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Set, Union
+
+_GLOB_FLAGS = "(?ms)"
 
 
 def _glob_pattern_to_re(pattern: str) -> str:
-    result = "(?ms)^"
+    result = _GLOB_FLAGS + "^"
 
     in_group = False
 
@@ -99,6 +101,60 @@ class Pattern:
         return f"{type(self).__qualname__}(pattern={self.pattern!r}"
 
 
+class _CombinedPatterns:
+    def __init__(self, patterns: Iterable[Pattern]) -> None:
+        self.literals: Set[str] = set()
+        regexes: List[str] = []
+        for p in patterns:
+            if p.re_pattern is None:
+                self.literals.add(p.pattern)
+            else:
+                regexes.append(p.re_pattern.pattern[len(_GLOB_FLAGS) :])
+
+        self.re_pattern: Optional[re.Pattern[str]] = (
+            re.compile(_GLOB_FLAGS + "|".join(f"(?:{r})" for r in regexes)) if regexes else None
+        )
+
+    def matches(self, path: str) -> bool:
+        if path in self.literals:
+            return True
+        return self.re_pattern is not None and self.re_pattern.fullmatch(path) is not None
+
+
+class PatternSet:
+    """A list of patterns that is matched with a single combined regex.
+
+    `matches` gives the same result as checking every pattern one by one. If `is_dir` is given,
+    patterns ending with a `/` only match directories.
+    """
+
+    def __init__(self, patterns: Iterable[Union[Pattern, str]] = ()) -> None:
+        self.patterns = [p if isinstance(p, Pattern) else Pattern(p) for p in patterns]
+
+        self._all = _CombinedPatterns(self.patterns)
+        self._no_dirs = _CombinedPatterns(p for p in self.patterns if not p.only_dirs)
+
+    def matches(self, path: Union[PurePath, str, "os.PathLike[str]"], is_dir: Optional[bool] = None) -> bool:
+        if isinstance(path, PurePath):
+            path = path.as_posix()
+        else:
+            path = str(os.fspath(path))
+
+        return (self._no_dirs if is_dir is False else self._all).matches(path)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self.patterns)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(patterns={self.patterns!r})"
+
+
 def globmatches(pattern: str, path: Union[PurePath, str, "os.PathLike[Any]"]) -> bool:
     return Pattern(pattern).matches(path)
 
@@ -137,10 +193,8 @@ def iter_files(
 
     yield from _iter_files_recursive_re(
         path=path,
-        patterns=[] if patterns is None else [p if isinstance(p, Pattern) else Pattern(p) for p in patterns],
-        ignore_patterns=(
-            [] if ignore_patterns is None else [p if isinstance(p, Pattern) else Pattern(p) for p in ignore_patterns]
-        ),
+        patterns=PatternSet(() if patterns is None else patterns),
+        ignore_patterns=PatternSet(() if ignore_patterns is None else ignore_patterns),
         include_hidden=include_hidden,
         absolute=absolute,
         _base_path=path,
@@ -149,8 +203,8 @@ def iter_files(
 
 def _iter_files_recursive_re(
     path: PurePath,
-    patterns: Sequence[Pattern],
-    ignore_patterns: Sequence[Pattern],
+    patterns: PatternSet,
+    ignore_patterns: PatternSet,
     include_hidden: bool,
     absolute: bool,
     _base_path: PurePath,
@@ -162,12 +216,10 @@ def _iter_files_recursive_re(
                     continue
 
                 relative_path = (path / f.name).relative_to(_base_path)
+                is_dir = f.is_dir()
 
-                if not ignore_patterns or not any(
-                    p.matches(relative_path) and (not p.only_dirs or (p.only_dirs and f.is_dir()))
-                    for p in cast(Iterable[Pattern], ignore_patterns)
-                ):
-                    if f.is_dir():
+                if not ignore_patterns or not ignore_patterns.matches(relative_path, is_dir=is_dir):
+                    if is_dir:
                         yield from _iter_files_recursive_re(
                             PurePath(f),
                             patterns,
@@ -176,10 +228,7 @@ def _iter_files_recursive_re(
                             absolute=absolute,
                             _base_path=_base_path,
                         )
-                    if not patterns or any(
-                        p.matches(relative_path) and (not p.only_dirs or (p.only_dirs and f.is_dir()))
-                        for p in cast(Iterable[Pattern], patterns)
-                    ):
+                    if not patterns or patterns.matches(relative_path, is_dir=is_dir):
                         yield Path(f).absolute() if absolute else Path(f)
 
     except (OSError, PermissionError):
@@ -1,6 +1,5 @@
 import asyncio
 import inspect
-import json
 import threading
 import traceback
 from collections import OrderedDict
@@ -20,7 +19,7 @@ from typing import (
 )
 
 from robotcode.core.concurrent import Task
-from robotcode.core.utils.dataclasses import as_dict, as_json, from_dict
+from robotcode.core.utils.dataclasses import as_dict, as_json, from_dict, from_json
 from robotcode.core.utils.inspect import ensure_coroutine
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.jsonrpc2.protocol import (
@@ -131,7 +130,7 @@ class DebugAdapterProtocol(JsonRPCProtocolBase):
 
     def _handle_body(self, body: bytes, charset: str) -> None:
         try:
-            self._handle_messages(self._generate_json_rpc_messages_from_dict(json.loads(body.decode(charset))))
+            self._handle_messages(self._generate_json_rpc_messages_from_dict(from_json(body.decode(charset))))
         except (asyncio.CancelledError, SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
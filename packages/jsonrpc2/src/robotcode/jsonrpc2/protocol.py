@@ -3,8 +3,6 @@ from __future__ import annotations
 import asyncio
 import functools
 import inspect
-import json
-import re
 import threading
 import weakref
 from abc import ABC, abstractmethod
@@ -17,6 +15,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -33,9 +32,9 @@ from typing import (
 )
 
 from robotcode.core.async_tools import run_coroutine_in_thread
-from robotcode.core.concurrent import Task, run_as_task
+from robotcode.core.concurrent import Task, TaskPriority, schedule_task
 from robotcode.core.event import event
-from robotcode.core.utils.dataclasses import as_json, from_dict
+from robotcode.core.utils.dataclasses import as_json, from_dict, from_json
 from robotcode.core.utils.inspect import ensure_coroutine, iter_methods
 from robotcode.core.utils.logging import LoggingDescriptor
 
@@ -379,7 +378,10 @@ class JsonRPCProtocolBase(asyncio.Protocol, ABC):
     def __init__(self) -> None:
         self.read_transport: Optional[asyncio.ReadTransport] = None
         self.write_transport: Optional[asyncio.WriteTransport] = None
-        self._message_buf = b""
+        self._header_buf = bytearray()
+        self._body_buf: Optional[bytearray] = None
+        self._body_pos = 0
+        self._body_charset = self.CHARSET
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
@@ -412,39 +414,83 @@ class JsonRPCProtocolBase(asyncio.Protocol, ABC):
     CHARSET: Final = "utf-8"
     CONTENT_TYPE: Final = "application/vscode-jsonrpc"
 
-    MESSAGE_PATTERN: Final = re.compile(
-        rb"(?:[^\r\n]*\r\n)*"
-        rb"(Content-Length: ?(?P<length>\d+)\r\n)"
-        rb"((Content-Type: ?(?P<content_type>[^\r\n;]+)"
-        rb"(; *(charset=(?P<charset>[^\r\n]+))?)?\r\n)|(?:[^\r\n]+\r\n))?"
-        rb"\r\n(?P<body>.*)",
-        re.DOTALL,
-    )
+    HEADER_END: Final = b"\r\n\r\n"
 
-    DEFAULT_MESSAGE_LENGTH: Final = 1
+    def _parse_header(self, header: bytes) -> Tuple[Optional[int], str]:
+        length: Optional[int] = None
+        charset = self.CHARSET
 
-    def data_received(self, data: bytes) -> None:
-        while len(data):
-            # Append the incoming chunk to the message buffer
-            self._message_buf += data
-
-            # Look for the body of the message
-            found = self.MESSAGE_PATTERN.match(self._message_buf)
+        for line in header.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
 
-            body = found.group("body") if found else b""
-            length = int(found.group("length")) if found else self.DEFAULT_MESSAGE_LENGTH
+            if name == b"content-length":
+                try:
+                    length = int(value.strip())
+                except ValueError:
+                    length = None
+            elif name == b"content-type":
+                for param in value.split(b";")[1:]:
+                    key, _, param_value = param.partition(b"=")
+                    if key.strip().lower() == b"charset" and param_value.strip():
+                        charset = param_value.strip().decode("ascii")
 
-            charset = (
-                found.group("charset").decode("ascii") if found and found.group("charset") is not None else self.CHARSET
-            )
+        return length, charset
 
-            if len(body) < length:
-                return
-
-            body, data = body[:length], body[length:]
-            self._message_buf = b""
-
-            self._handle_body(body, charset)
+    def data_received(self, data: bytes) -> None:
+        # Incremental framing: the header is searched only in new data and parsed once,
+        # the body is copied chunk by chunk into a buffer allocated with the announced length.
+        # Messages that are completely contained in a chunk are sliced out without buffering.
+        size = len(data)
+        pos = 0
+
+        with memoryview(data) as view:
+            while pos < size:
+                if self._body_buf is None:
+                    buffered = len(self._header_buf)
+                    if buffered:
+                        self._header_buf += view[pos:]
+                        end = self._header_buf.find(self.HEADER_END, max(0, buffered - len(self.HEADER_END) + 1))
+                        if end < 0:
+                            return
+
+                        header = bytes(self._header_buf[:end])
+                        pos += end + len(self.HEADER_END) - buffered
+                        self._header_buf.clear()
+                    else:
+                        end = data.find(self.HEADER_END, pos)
+                        if end < 0:
+                            self._header_buf += view[pos:]
+                            return
+
+                        header = data[pos:end]
+                        pos = end + len(self.HEADER_END)
+
+                    length, charset = self._parse_header(header)
+                    if length is None or length < 0:
+                        # not a valid header, skip it and look for the next one
+                        continue
+
+                    if size - pos >= length:
+                        body = data[pos : pos + length]
+                        pos += length
+                        self._handle_body(body, charset)
+                        continue
+
+                    self._body_buf = bytearray(length)
+                    self._body_pos = 0
+                    self._body_charset = charset
+
+                count = min(len(self._body_buf) - self._body_pos, size - pos)
+                self._body_buf[self._body_pos : self._body_pos + count] = view[pos : pos + count]
+                self._body_pos += count
+                pos += count
+
+                if self._body_pos == len(self._body_buf):
+                    body = bytes(self._body_buf)
+                    self._body_buf = None
+                    self._body_pos = 0
+                    self._handle_body(body, self._body_charset)
 
     @abstractmethod
     def _handle_body(self, body: bytes, charset: str) -> None: ...
@@ -498,7 +544,7 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
 
             self._data_logger.trace(lambda: f"JSON Received: {b!r}")
 
-            self._handle_messages(self._generate_json_rpc_messages_from_dict(json.loads(b)))
+            self._handle_messages(self._generate_json_rpc_messages_from_dict(from_json(b)))
         except (asyncio.CancelledError, SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
@@ -542,21 +588,30 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
 
     @__logger.call
     def send_message(self, message: JsonRPCMessage) -> None:
-        message.jsonrpc = PROTOCOL_VERSION
+        self.send_messages([message])
+
+    def send_messages(self, messages: Iterable[JsonRPCMessage]) -> None:
+        """Send the messages with a single write to the transport."""
+        data: List[bytes] = []
+
+        for message in messages:
+            message.jsonrpc = PROTOCOL_VERSION
+
+            body = as_json(message, compact=True).encode(self.CHARSET)
 
-        body = as_json(message, compact=True).encode(self.CHARSET)
+            header = (
+                f"Content-Length: {len(body)}\r\nContent-Type: {self.CONTENT_TYPE}; charset={self.CHARSET}\r\n\r\n"
+            ).encode("ascii")
 
-        header = (
-            f"Content-Length: {len(body)}\r\nContent-Type: {self.CONTENT_TYPE}; charset={self.CHARSET}\r\n\r\n"
-        ).encode("ascii")
+            if self.write_transport is not None:
+                msg = header + body
 
-        if self.write_transport is not None:
-            msg = header + body
+                self._do_trace_message(message, msg)
 
-            self._do_trace_message(message, msg)
+                data.append(msg)
 
-            if self._loop:
-                self._loop.call_soon_threadsafe(self.write_transport.write, msg)
+        if data and self.write_transport is not None and self._loop:
+            self._loop.call_soon_threadsafe(self.write_transport.write, b"".join(data))
 
     def _do_trace_message(self, message: JsonRPCMessage, msg: bytes) -> None:
         self._data_logger.trace(lambda: f"JSON send: {msg.decode()!r}")
@@ -593,6 +648,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
     def send_notification(self, method: str, params: Any) -> None:
         self.send_message(JsonRPCNotification(method=method, params=params))
 
+    def send_notifications(self, method: str, params: Iterable[Any]) -> None:
+        self.send_messages([JsonRPCNotification(method=method, params=p) for p in params])
+
     @__logger.call(exception=True)
     async def handle_response(self, message: JsonRPCResponse) -> None:
         if message.id is None:
@@ -840,7 +898,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                             **params[1],
                         )
                     else:
-                        task = asyncio.wrap_future(run_as_task(e.method, *params[0], **params[1]))
+                        task = asyncio.wrap_future(
+                            schedule_task(TaskPriority.INTERACTIVE, e.method, *params[0], **params[1])
+                        )
                 else:
                     task = asyncio.create_task(e.method(*params[0], **params[1]), name=message.method)
 
@@ -938,7 +998,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                     if e.is_coroutine:
                         task = run_coroutine_in_thread(ensure_coroutine(e.method), *params[0], **params[1])
                     else:
-                        task = asyncio.wrap_future(run_as_task(e.method, *params[0], **params[1]))
+                        task = asyncio.wrap_future(
+                            schedule_task(TaskPriority.INTERACTIVE, e.method, *params[0], **params[1])
+                        )
                 else:
                     task = asyncio.create_task(e.method(*params[0], **params[1]), name=message.method)
 
@@ -1,6 +1,8 @@
 import concurrent.futures
 import functools
+import hashlib
 import itertools
+import os
 import time
 import uuid
 from concurrent.futures import CancelledError
@@ -8,9 +10,17 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from threading import Event, Timer
-from typing import TYPE_CHECKING, Any, Dict, Final, Iterator, List, Optional, Union, cast
-
-from robotcode.core.concurrent import Lock, RLock, Task, check_current_task_canceled, run_as_task
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Iterator, List, Optional, Set, Tuple, Union, cast
+
+from robotcode.core.concurrent import (
+    Lock,
+    RLock,
+    Task,
+    TaskPriority,
+    check_current_task_canceled,
+    run_as_task,
+    schedule_task,
+)
 from robotcode.core.event import event
 from robotcode.core.language import language_id_filter
 from robotcode.core.lsp.types import (
@@ -82,6 +92,72 @@ class DiagnosticsCollectType(Enum):
     SLOW = 1
 
 
+def _diagnostics_hash(diagnostics: List[Diagnostic]) -> bytes:
+    return hashlib.sha256(repr(diagnostics).encode("utf-8")).digest()
+
+
+_EMPTY_DIAGNOSTICS_HASH = _diagnostics_hash([])
+
+
+class DiagnosticsPublisher:
+    """Coalesces and batches the `textDocument/publishDiagnostics` notifications.
+
+    Only the latest diagnostics of a document are kept until the next flush, a flush sends the diagnostics of all
+    pending documents at once. Diagnostics equal to the last ones sent for a document are not sent again, empty
+    diagnostics are not sent for a document without diagnostics.
+    """
+
+    def __init__(self, send: Callable[[List[PublishDiagnosticsParams]], None], delay: float = 0.1) -> None:
+        self._send = send
+        self._delay = delay
+        self._lock = Lock()
+        self._pending: Dict[str, PublishDiagnosticsParams] = {}
+        self._published: Dict[str, bytes] = {}
+        self._timer: Optional[Timer] = None
+
+    def publish(self, params: PublishDiagnosticsParams) -> None:
+        with self._lock:
+            self._pending[params.uri] = params
+
+            if self._timer is None:
+                self._timer = Timer(self._delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+            to_send = []
+            for params in pending:
+                content_hash = _diagnostics_hash(params.diagnostics)
+                if self._published.get(params.uri, _EMPTY_DIAGNOSTICS_HASH) == content_hash:
+                    continue
+
+                if content_hash == _EMPTY_DIAGNOSTICS_HASH:
+                    self._published.pop(params.uri, None)
+                else:
+                    self._published[params.uri] = content_hash
+                to_send.append(params)
+
+            # sent under the lock, so the diagnostics of a document are never overtaken by older ones
+            if to_send:
+                self._send(to_send)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            self._pending.clear()
+
+
 class DiagnosticsProtocolPart(LanguageServerProtocolPart):
     _logger: Final = LoggingDescriptor()
 
@@ -117,8 +193,12 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
         self._current_diagnostics_task_lock = RLock()
         self._current_diagnostics_task: Optional[Task[Any]] = None
+        self._current_diagnostics_tasks: Dict[Task[Any], Tuple[TextDocument, float]] = {}
+        self._timed_out_diagnostics_tasks: Set[Task[Any]] = set()
         self._diagnostics_task_timeout = 300
 
+        self.publisher = DiagnosticsPublisher(self._send_diagnostics)
+
     def server_initialized(self, sender: Any) -> None:
         if not self.client_supports_pull:
             self.parent.documents.did_open.add(self.update_document_diagnostics)
@@ -166,6 +246,9 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
     @event
     def on_get_diagnostics_mode(sender: Any, uri: Uri) -> Optional[DiagnosticsMode]: ...
 
+    @event
+    def on_get_analysis_parallelism(sender: Any, uri: Uri) -> Optional[int]: ...
+
     @event
     def on_workspace_diagnostics_start(sender: Any) -> None: ...
 
@@ -258,7 +341,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
             )
 
     def _on_document_cache_invalidated(self, sender: Any, document: TextDocument) -> None:
-        run_as_task(self.__on_document_cache_invalidated, document)
+        schedule_task(TaskPriority.BACKGROUND, self.__on_document_cache_invalidated, document)
 
     def force_refresh_all(self, refresh: bool = True) -> None:
         for doc in self.parent.documents.documents:
@@ -279,7 +362,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
     @_logger.call
     def on_did_close(self, sender: Any, document: TextDocument, full_close: bool) -> None:
-        run_as_task(self._close_diagnostics_for_document, document, full_close)
+        schedule_task(TaskPriority.BACKGROUND, self._close_diagnostics_for_document, document, full_close)
 
     def _close_diagnostics_for_document(self, document: TextDocument, full_close: bool) -> None:
         if not full_close and self.get_diagnostics_mode(document.uri) == DiagnosticsMode.WORKSPACE:
@@ -295,9 +378,14 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
             self.publish_diagnostics(document, diagnostics=[])
 
     def cancel_workspace_diagnostics_task(self, sender: Any) -> None:
+        self.publisher.close()
+
         if self._current_diagnostics_task is not None and not self._current_diagnostics_task.done():
             self._current_diagnostics_task.cancel()
 
+        for task in list(self._current_diagnostics_tasks):
+            task.cancel()
+
         if self._workspace_diagnostics_task is not None and not self._workspace_diagnostics_task.done():
             self._workspace_diagnostics_task.cancel()
 
@@ -320,6 +408,80 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
             if self._current_diagnostics_task is not None and not self._current_diagnostics_task.done():
                 self._current_diagnostics_task.cancel()
 
+            for task in self._current_diagnostics_tasks:
+                task.cancel()
+
+    def _wait_for_analyse_tasks(self) -> Tuple[int, bool]:
+        """Waits until at least one of the running analyse tasks is done.
+
+        Tasks running longer than the timeout are cancelled, but still count as running until they are done.
+
+        Returns the number of finished tasks and if the workspace diagnostics loop should break.
+        """
+        done, _ = concurrent.futures.wait(
+            list(self._current_diagnostics_tasks), timeout=1, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+
+        finished = 0
+        breaked = False
+        now = time.monotonic()
+
+        with self._current_diagnostics_task_lock:
+            for task, (document, started) in list(self._current_diagnostics_tasks.items()):
+                if task not in done:
+                    if (
+                        now - started >= self._diagnostics_task_timeout
+                        and task not in self._timed_out_diagnostics_tasks
+                    ):
+                        self._logger.warning(
+                            lambda: f"Analyzing {document.uri} timed out after {self._diagnostics_task_timeout}s",
+                            context_name="workspace_diagnostics",
+                        )
+                        self._timed_out_diagnostics_tasks.add(task)
+                        task.cancel()
+                    continue
+
+                self._current_diagnostics_tasks.pop(task)
+                finished += 1
+
+                if task in self._timed_out_diagnostics_tasks:
+                    self._timed_out_diagnostics_tasks.discard(task)
+                    self._logger.debug(
+                        lambda: f"Analyzing {document.uri} stopped after timeout", context_name="workspace_diagnostics"
+                    )
+                    continue
+
+                try:
+                    task.result(0)
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except CancelledError:
+                    self._logger.debug(
+                        lambda: f"Analyzing {document.uri} cancelled", context_name="workspace_diagnostics"
+                    )
+                    breaked = True
+                except BaseException as e:
+                    ex = e
+                    self._logger.exception(
+                        lambda: f"Error in analyzing ${document.uri}: {ex}",
+                        exc_info=ex,
+                        context_name="workspace_diagnostics",
+                    )
+
+        return finished, breaked
+
+    def _cancel_analyse_tasks(self) -> None:
+        with self._current_diagnostics_task_lock:
+            tasks = list(self._current_diagnostics_tasks)
+            self._current_diagnostics_tasks.clear()
+            self._timed_out_diagnostics_tasks.clear()
+
+        for task in tasks:
+            task.cancel()
+
+        if tasks:
+            concurrent.futures.wait(tasks, timeout=self._diagnostics_task_timeout)
+
     def _analyse_document(self, document: TextDocument) -> List[Union[DiagnosticsResult, None, BaseException]]:
         return self.analyze(
             self,
@@ -368,6 +530,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                         self.on_workspace_diagnostics_break(self)
                         continue
 
+                    parallelism = self.get_analysis_parallelism()
+
                     with self.parent.window.progress(
                         "Analyze Workspace",
                         cancellable=False,
@@ -376,55 +540,47 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                         start=False,
                     ) as progress:
                         breaked = False
-                        for i, document in enumerate(documents):
-                            check_current_task_canceled()
-
-                            if breaked or self._break_diagnostics_loop_event.is_set():
-                                self._logger.debug(
-                                    "break workspace diagnostics loop 2", context_name="workspace_diagnostics"
-                                )
-                                breaked = True
-                                self.on_workspace_diagnostics_break(self)
-                                break
+                        finished = 0
+                        try:
+                            for i, document in enumerate(documents):
+                                check_current_task_canceled()
+
+                                while not breaked and len(self._current_diagnostics_tasks) >= parallelism:
+                                    done, breaked = self._wait_for_analyse_tasks()
+                                    finished += done
+
+                                if breaked or self._break_diagnostics_loop_event.is_set():
+                                    self._logger.debug(
+                                        "break workspace diagnostics loop 2", context_name="workspace_diagnostics"
+                                    )
+                                    breaked = True
+                                    self.on_workspace_diagnostics_break(self)
+                                    break
 
-                            done_something = True
+                                done_something = True
 
-                            analysis_mode = self.get_analysis_progress_mode(document.uri)
+                                analysis_mode = self.get_analysis_progress_mode(document.uri)
 
-                            if analysis_mode == AnalysisProgressMode.DETAILED:
-                                progress.begin()
-                                path = document.uri.to_path()
-                                folder = self.parent.workspace.get_workspace_folder(document.uri)
-                                name = path if folder is None else path.relative_to(folder.uri.to_path())
+                                if analysis_mode == AnalysisProgressMode.DETAILED:
+                                    progress.begin()
+                                    path = document.uri.to_path()
+                                    folder = self.parent.workspace.get_workspace_folder(document.uri)
+                                    name = path if folder is None else path.relative_to(folder.uri.to_path())
 
-                                progress.report(f"Analyze {i + 1}/{len(documents)}: {name}", current=i + 1)
-                            elif analysis_mode == AnalysisProgressMode.SIMPLE:
-                                progress.begin()
-                                progress.report(f"Analyze {i + 1}/{len(documents)}", current=i + 1)
+                                    progress.report(f"Analyze {i + 1}/{len(documents)}: {name}", current=finished + 1)
+                                elif analysis_mode == AnalysisProgressMode.SIMPLE:
+                                    progress.begin()
+                                    progress.report(f"Analyze {i + 1}/{len(documents)}", current=finished + 1)
 
-                            try:
                                 with self._current_diagnostics_task_lock:
-                                    self._current_diagnostics_task = run_as_task(self._analyse_document, document)
-                                self._current_diagnostics_task.result(self._diagnostics_task_timeout)
+                                    task = schedule_task(TaskPriority.DIAGNOSTICS, self._analyse_document, document)
+                                    self._current_diagnostics_tasks[task] = (document, time.monotonic())
 
-                            except (SystemExit, KeyboardInterrupt):
-                                raise
-
-                            except CancelledError:
-                                self._logger.debug(
-                                    lambda: f"Analyzing {document.uri} cancelled", context_name="workspace_diagnostics"
-                                )
-                                breaked = True
-                            except BaseException as e:
-                                ex = e
-                                self._logger.exception(
-                                    lambda: f"Error in analyzing ${document.uri}: {ex}",
-                                    exc_info=ex,
-                                    context_name="workspace_diagnostics",
-                                )
-                            finally:
-                                with self._current_diagnostics_task_lock:
-                                    self._current_diagnostics_task = None
+                            while not breaked and self._current_diagnostics_tasks:
+                                done, breaked = self._wait_for_analyse_tasks()
+                                finished += done
+                        finally:
+                            self._cancel_analyse_tasks()
 
                     if breaked or self._break_diagnostics_loop_event.is_set():
                         self._logger.debug("break workspace diagnostics loop 3", context_name="workspace_diagnostics")
@@ -522,6 +678,11 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                                 with self._current_diagnostics_task_lock:
                                     self._current_diagnostics_task = None
 
+                # analyzed documents that are not opened in an editor don't need to keep their text in memory,
+                # it is read again from disk when it is needed
+                for document in documents:
+                    document.release_text()
+
             except (SystemExit, KeyboardInterrupt, CancelledError):
                 raise
             except BaseException as e:
@@ -573,8 +734,14 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                         self._logger.exception(e)
 
                 data.version = document.version
-                data.future = run_as_task(
-                    self._get_diagnostics_for_document, document, data, debounce, send_diagnostics, collect_slow
+                data.future = schedule_task(
+                    TaskPriority.DIAGNOSTICS,
+                    self._get_diagnostics_for_document,
+                    document,
+                    data,
+                    debounce,
+                    send_diagnostics,
+                    collect_slow,
                 )
 
                 data.future.add_done_callback(functools.partial(self._diagnostics_task_done, document, data))
@@ -646,15 +813,17 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 data.entries.pop(k)
 
     def publish_diagnostics(self, document: TextDocument, diagnostics: List[Diagnostic]) -> None:
-        self.parent.send_notification(
-            "textDocument/publishDiagnostics",
+        self.publisher.publish(
             PublishDiagnosticsParams(
                 uri=document.document_uri,
                 version=document.version,
                 diagnostics=diagnostics,
-            ),
+            )
         )
 
+    def _send_diagnostics(self, params: List[PublishDiagnosticsParams]) -> None:
+        self.parent.send_notifications("textDocument/publishDiagnostics", params)
+
     def update_document_diagnostics(self, sender: Any, document: TextDocument) -> None:
         self.force_refresh_document(document, refresh=True)
 
@@ -731,6 +900,17 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
         return AnalysisProgressMode.OFF
 
+    def get_analysis_parallelism(self) -> int:
+        """Number of documents analyzed at the same time by the workspace diagnostics, at least 1."""
+        result = 1
+
+        for folder in self.parent.workspace.workspace_folders:
+            for e in self.on_get_analysis_parallelism(self, folder.uri):
+                if isinstance(e, int):
+                    result = max(result, e if e > 0 else os.cpu_count() or 1)
+
+        return result
+
     def get_diagnostics_mode(self, uri: Uri) -> DiagnosticsMode:
         for e in self.on_get_diagnostics_mode(self, uri):
             if e is not None:
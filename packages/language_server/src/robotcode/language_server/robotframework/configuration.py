@@ -59,6 +59,7 @@ class InlayHintsConfig(ConfigBase):
 class AnalysisConfig(ConfigBase):
     diagnostic_mode: DiagnosticsMode = DiagnosticsMode.OPENFILESONLY
     progress_mode: AnalysisProgressMode = AnalysisProgressMode.OFF
+    parallelism: int = 1
     references_code_lens: bool = False
     find_unused_references: bool = False
     cache: CacheConfig = field(default_factory=CacheConfig)
@@ -1,7 +1,7 @@
 import ast
 from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, cast
 
-from robotcode.core.concurrent import run_as_task
+from robotcode.core.concurrent import TaskPriority, schedule_task
 from robotcode.core.language import language_id
 from robotcode.core.lsp.types import CodeLens, Command
 from robotcode.core.text_document import TextDocument
@@ -96,7 +96,7 @@ class RobotCodeLensProtocolPart(RobotLanguageServerProtocolPart):
 
                     key = (document, kw_doc)
                     if key not in self._running_task:
-                        task = run_as_task(find_refs)
+                        task = schedule_task(TaskPriority.BACKGROUND, find_refs)
 
                         def done(task: Any) -> None:
                             if key in self._running_task:
@@ -30,9 +30,9 @@ class RobotDocumentHighlightProtocolPart(RobotLanguageServerProtocolPart):
     def collect(self, sender: Any, document: TextDocument, position: Position) -> Optional[List[DocumentHighlight]]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_variable_refs = namespace.variable_references
+        all_variable_refs = namespace.reference_index.variables_at(position)
         if all_variable_refs:
-            for var, var_refs in all_variable_refs.items():
+            for var, var_refs in all_variable_refs:
                 check_current_task_canceled()
 
                 if var_refs:
@@ -66,9 +66,9 @@ class RobotDocumentHighlightProtocolPart(RobotLanguageServerProtocolPart):
                             )
                         ]
 
-        all_kw_refs = namespace.keyword_references
+        all_kw_refs = namespace.reference_index.keywords_at(position)
         if all_kw_refs:
-            for kw, kw_refs in all_kw_refs.items():
+            for kw, kw_refs in all_kw_refs:
                 check_current_task_canceled()
 
                 if kw_refs:
@@ -1,5 +1,10 @@
+import bisect
+import difflib
 import os
-from typing import TYPE_CHECKING, Any, List, Optional
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
 from robotcode.core.language import language_id
 from robotcode.core.lsp.types import (
@@ -9,16 +14,161 @@ from robotcode.core.lsp.types import (
     Range,
     TextEdit,
 )
-from robotcode.core.text_document import TextDocument
+from robotcode.core.text_document import TextDocument, position_to_utf16
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.workspace import WorkspaceFolder
 
 from ..configuration import RoboCopConfig
 from .protocol_part import RobotLanguageServerProtocolPart
 
 if TYPE_CHECKING:
+    from robocop.formatter.runner import RobocopFormatter
+
     from ..protocol import RobotLanguageServerProtocol
 
 
+def _changed_line_edit(lines: List[str], line: int, new_line: str) -> TextEdit:
+    old_line = lines[line]
+
+    max_prefix = min(len(old_line), len(new_line))
+    prefix = 0
+    while prefix < max_prefix and old_line[prefix] == new_line[prefix]:
+        prefix += 1
+
+    max_suffix = max_prefix - prefix
+    suffix = 0
+    while suffix < max_suffix and old_line[-1 - suffix] == new_line[-1 - suffix]:
+        suffix += 1
+
+    return TextEdit(
+        range=Range(
+            start=position_to_utf16(lines, Position(line=line, character=prefix)),
+            end=position_to_utf16(lines, Position(line=line, character=len(old_line) - suffix)),
+        ),
+        new_text=new_line[prefix : len(new_line) - suffix],
+    )
+
+
+def _unique_line_anchors(lines: Sequence[str], new_lines: Sequence[str]) -> List[Tuple[int, int]]:
+    """Pairs of lines that occur exactly once in both documents, as long a sequence as possible in both orders."""
+    counts = Counter(lines)
+    new_counts = Counter(new_lines)
+    new_index = {line: j for j, line in enumerate(new_lines) if new_counts[line] == 1}
+
+    candidates = [(i, new_index[line]) for i, line in enumerate(lines) if counts[line] == 1 and line in new_index]
+
+    # longest increasing subsequence of the new line indexes
+    tails: List[int] = []
+    tail_indexes: List[int] = []
+    previous: List[int] = []
+    for index, (_, j) in enumerate(candidates):
+        position = bisect.bisect_left(tails, j)
+        if position == len(tails):
+            tails.append(j)
+            tail_indexes.append(index)
+        else:
+            tails[position] = j
+            tail_indexes[position] = index
+        previous.append(tail_indexes[position - 1] if position > 0 else -1)
+
+    result: List[Tuple[int, int]] = []
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index >= 0:
+        result.append(candidates[index])
+        index = previous[index]
+
+    return result[::-1]
+
+
+def _matching_lines(
+    lines: Sequence[str], new_lines: Sequence[str], start: int = 0, new_start: int = 0
+) -> Iterator[Tuple[int, int, int]]:
+    """Blocks of equal lines like ``difflib.SequenceMatcher.get_matching_blocks``, without the final dummy block.
+
+    This is a patience diff: the lines that are unique in both documents split them into smaller parts that are
+    compared the same way. Only parts without unique lines and with a different number of lines are compared with
+    a ``SequenceMatcher``. For whole documents with many repeated lines it is either very slow or finds only a few
+    big blocks.
+    """
+    anchors = _unique_line_anchors(lines, new_lines)
+
+    i0 = j0 = 0
+    for i, j in [*anchors, (len(lines), len(new_lines))]:
+        old_part, new_part = lines[i0:i], new_lines[j0:j]
+
+        # equal lines at the start and the end of a part are matched directly
+        prefix = 0
+        while prefix < min(len(old_part), len(new_part)) and old_part[prefix] == new_part[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < min(len(old_part), len(new_part)) - prefix and old_part[-1 - suffix] == new_part[-1 - suffix]:
+            suffix += 1
+
+        if prefix:
+            yield start + i0, new_start + j0, prefix
+
+        old_rest = old_part[prefix : len(old_part) - suffix]
+        new_rest = new_part[prefix : len(new_part) - suffix]
+        if old_rest and new_rest:
+            if not anchors and not prefix and not suffix:
+                # nothing is unique here, a formatter that keeps the number of lines changes them one by one
+                if len(old_rest) != len(new_rest):
+                    matcher = difflib.SequenceMatcher(None, old_rest, new_rest)
+                    for a, b, size in matcher.get_matching_blocks():
+                        if size:
+                            yield start + i0 + prefix + a, new_start + j0 + prefix + b, size
+            else:
+                yield from _matching_lines(old_rest, new_rest, start + i0 + prefix, new_start + j0 + prefix)
+
+        if suffix:
+            yield start + i - suffix, new_start + j - suffix, suffix
+
+        if i < len(lines):
+            yield start + i, new_start + j, 1
+
+        i0, j0 = i + 1, j + 1
+
+
+def _line_key(line: str) -> str:
+    return " ".join(line.split())
+
+
+def compute_text_edits(lines: List[str], new_text: str) -> List[TextEdit]:
+    """Computes the edits that change a document with the given ``lines`` to ``new_text``.
+
+    The lines are matched ignoring whitespace, because that is mostly what a formatter changes. Matched lines and
+    lines that are replaced one by one get an edit for the changed characters only, other changes replace whole
+    lines. Unchanged lines are not part of any edit.
+    """
+    new_lines = new_text.splitlines(True)
+
+    result: List[TextEdit] = []
+
+    def changed_lines(i: int, j: int, count: int) -> None:
+        result.extend(
+            _changed_line_edit(lines, i + k, new_lines[j + k]) for k in range(count) if lines[i + k] != new_lines[j + k]
+        )
+
+    i0 = j0 = 0
+    blocks = _matching_lines([_line_key(line) for line in lines], [_line_key(line) for line in new_lines])
+    for i, j, size in [*blocks, (len(lines), len(new_lines), 0)]:
+        if i - i0 == j - j0:
+            changed_lines(i0, j0, i - i0)
+        else:
+            result.append(
+                TextEdit(
+                    range=Range(start=Position(line=i0, character=0), end=Position(line=i, character=0)),
+                    new_text="".join(new_lines[j0:j]),
+                )
+            )
+
+        changed_lines(i, j, size)
+
+        i0, j0 = i + size, j + size
+
+    return result
+
+
 class RobotFormattingProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -37,6 +187,9 @@ class RobotFormattingProtocolPart(RobotLanguageServerProtocolPart):
         self.setting_and_variable_name_length = 14
         self.is_robocop_notification_shown = False
 
+        self._robocop_formatters: WeakKeyDictionary[WorkspaceFolder, "RobocopFormatter"] = WeakKeyDictionary()
+        self._robocop_formatter_lock = threading.RLock()
+
     def get_robocop_config(self, document: TextDocument) -> RoboCopConfig:
         folder = self.parent.workspace.get_workspace_folder(document.uri)
         if folder is None:
@@ -44,6 +197,17 @@ class RobotFormattingProtocolPart(RobotLanguageServerProtocolPart):
 
         return self.parent.workspace.get_configuration(RoboCopConfig, folder.uri)
 
+    def get_formatter(self, workspace_folder: WorkspaceFolder) -> "RobocopFormatter":
+        from robocop.formatter.runner import RobocopFormatter
+
+        formatter = self._robocop_formatters.get(workspace_folder, None)
+
+        if formatter is None:
+            # the formatter loads and configures the formatters of every configuration only once
+            formatter = RobocopFormatter(self.parent.robocop_helper.get_config_manager(workspace_folder))
+            self._robocop_formatters[workspace_folder] = formatter
+        return formatter
+
     @language_id("robotframework")
     @_logger.call
     def format(
@@ -70,47 +234,42 @@ class RobotFormattingProtocolPart(RobotLanguageServerProtocolPart):
         range: Optional[Range] = None,
         **further_options: Any,
     ) -> Optional[List[TextEdit]]:
-        from robocop.formatter.runner import RobocopFormatter
-
         workspace_folder = self.parent.workspace.get_workspace_folder(document.uri)
         if workspace_folder is None:
             return None
 
-        config_manager = self.parent.robocop_helper.get_config_manager(workspace_folder)
-
         source = document.uri.to_path()
-        config = config_manager.get_config_for_source_file(document.uri.to_path())
+        model = self.parent.documents_cache.get_uncached_model(document)
 
-        if range is not None:
-            config.formatter.start_line = range.start.line + 1
-            config.formatter.end_line = range.end.line + 1
+        config_manager = self.parent.robocop_helper.get_config_manager(workspace_folder)
 
-        # TODO: not cached, we load all formatters everytime - but it's small cost
-        runner = RobocopFormatter(config_manager)
-        runner.config = config
+        with self._robocop_formatter_lock:
+            runner = self.get_formatter(workspace_folder)
+            config = config_manager.get_config_for_source_file(source)
 
-        model = self.parent.documents_cache.get_uncached_model(document)
-        if self.parent.robocop_helper.robocop_version >= (8, 0):
-            from robocop.source_file import SourceFile
+            # the config is shared with other documents, the range must not stay in it
+            start_line, end_line = config.formatter.start_line, config.formatter.end_line
+            if range is not None:
+                config.formatter.start_line = range.start.line + 1
+                config.formatter.end_line = range.end.line + 1
 
-            # overwrite _model to stop Robocop from loading it
-            source_file = SourceFile(path=source, config=config, _model=model)
-            _, _, new, _ = runner.format_until_stable(source_file)
-        else:
-            _, _, new, _ = runner.format_until_stable(model)
+            runner.config = config
+            try:
+                if self.parent.robocop_helper.robocop_version >= (8, 0):
+                    from robocop.source_file import SourceFile
+
+                    # overwrite _model to stop Robocop from loading it
+                    source_file = SourceFile(path=source, config=config, _model=model)
+                    _, _, new, _ = runner.format_until_stable(source_file)
+                else:
+                    _, _, new, _ = runner.format_until_stable(model)
+            finally:
+                config.formatter.start_line, config.formatter.end_line = start_line, end_line
 
-        if new.text == document.text():
+        if new is None:
             return None
 
-        return [
-            TextEdit(
-                range=Range(
-                    start=Position(line=0, character=0),
-                    end=Position(line=len(document.get_lines()), character=0),
-                ),
-                new_text=new.text,
-            )
-        ]
+        return compute_text_edits(document.get_lines(), new.text) or None
 
     @language_id("robotframework")
     def format_range(
@@ -44,12 +44,12 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
     ) -> Union[Location, List[Location], List[LocationLink], None]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_variable_refs = namespace.variable_references
+        all_variable_refs = namespace.reference_index.variables_at(position)
 
         if all_variable_refs:
             result = []
 
-            for variable, var_refs in all_variable_refs.items():
+            for variable, var_refs in all_variable_refs:
                 check_current_task_canceled()
 
                 found_range = (
@@ -77,11 +77,11 @@ class RobotGotoProtocolPart(RobotLanguageServerProtocolPart):
             if result:
                 return result
 
-        all_kw_refs = namespace.keyword_references
+        all_kw_refs = namespace.reference_index.keywords_at(position)
         if all_kw_refs:
             result = []
 
-            for kw, kw_refs in all_kw_refs.items():
+            for kw, kw_refs in all_kw_refs:
                 check_current_task_canceled()
 
                 found_range = (
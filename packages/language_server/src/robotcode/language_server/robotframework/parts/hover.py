@@ -104,12 +104,12 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart):
     def _hover_default(self, nodes: List[ast.AST], document: TextDocument, position: Position) -> Optional[Hover]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_variable_refs = namespace.variable_references
+        all_variable_refs = namespace.reference_index.variables_at(position)
         if all_variable_refs:
             text = None
             highlight_range = None
 
-            for variable, var_refs in all_variable_refs.items():
+            for variable, var_refs in all_variable_refs:
                 check_current_task_canceled()
 
                 found_range = (
@@ -173,11 +173,11 @@ class RobotHoverProtocolPart(RobotLanguageServerProtocolPart):
                     range=highlight_range,
                 )
 
-        all_kw_refs = namespace.keyword_references
+        all_kw_refs = namespace.reference_index.keywords_at(position)
         if all_kw_refs:
             result: List[Tuple[Range, str]] = []
 
-            for kw, kw_refs in all_kw_refs.items():
+            for kw, kw_refs in all_kw_refs:
                 check_current_task_canceled()
 
                 found_range = (
@@ -1,22 +1,28 @@
 import contextlib
+import hashlib
 import io
 import multiprocessing as mp
 import socket
 import threading
 import traceback
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from os import PathLike
+from pathlib import Path
 from string import Template
 from threading import Thread
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
+from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.core.utils.net import find_free_port
 from robotcode.robot.diagnostics.library_doc import (
-    get_library_doc,
+    ALLOWED_RESOURCE_FILE_EXTENSIONS,
+    LibraryDoc,
     get_robot_library_html_doc_str,
 )
 
@@ -71,9 +77,84 @@ MARKDOWN_TEMPLATE = Template(
 )
 
 
+@dataclass(frozen=True)
+class LibDocPage:
+    lib_doc: LibraryDoc
+    etag: str
+    content: bytes
+
+
+class LibDocPageCache:
+    """Rendered documentation pages, keyed by the cache key of the library and the rendering options.
+
+    A page is only returned for the library doc it was rendered from, the ImportsManager returns a new library doc
+    if the library changed, so the page is rendered again.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._pages: "OrderedDict[Tuple[Any, ...], LibDocPage]" = OrderedDict()
+
+    def get(self, key: Tuple[Any, ...], lib_doc: LibraryDoc) -> Optional[LibDocPage]:
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                return None
+
+            if page.lib_doc is not lib_doc:
+                del self._pages[key]
+                return None
+
+            self._pages.move_to_end(key)
+            return page
+
+    def put(self, key: Tuple[Any, ...], lib_doc: LibraryDoc, content: str) -> LibDocPage:
+        data = bytes(content, "utf-8")
+        page = LibDocPage(lib_doc, f'"{hashlib.sha256(data).hexdigest()[:32]}"', data)
+
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self._max_size:
+                self._pages.popitem(last=False)
+
+        return page
+
+    def invalidate(self, lib_docs: Iterable[LibraryDoc]) -> None:
+        changed = list(lib_docs)
+        sources = {lib_doc.source for lib_doc in changed if lib_doc.source}
+
+        with self._lock:
+            for key in [
+                k
+                for k, page in self._pages.items()
+                if page.lib_doc.source in sources or any(page.lib_doc is lib_doc for lib_doc in changed)
+            ]:
+                del self._pages[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
 class LibDocRequestHandler(SimpleHTTPRequestHandler):
     _logger = LoggingDescriptor()
 
+    server: "DualStackServer"
+
     def log_message(self, format: str, *args: Any) -> None:
         self._logger.info(lambda: f"{self.address_string()} - {format % args}")
 
@@ -98,39 +179,25 @@ class LibDocRequestHandler(SimpleHTTPRequestHandler):
 
         if name:
             try:
-                if type_ in ["md", "markdown"]:
-                    libdoc = get_library_doc(
-                        name,
-                        tuple(args.split("::") if args else ()),
-                        base_dir=basedir if basedir else ".",
-                    )
-
-                    def calc_md() -> str:
-                        tt = str.maketrans({"<": "&lt;", ">": "&gt;"})
-                        return libdoc.to_markdown(add_signature=False, only_doc=False, header_level=0).translate(tt)
+                assert self.server.documentation is not None
 
-                    data = MARKDOWN_TEMPLATE.substitute(content=calc_md(), name=name)
+                page = self.server.documentation.get_documentation_page(name, args, basedir, type_, theme)
 
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
+                if _etag_matches(self.headers.get("If-None-Match"), page.etag):
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", page.etag)
+                    self.send_header("Cache-Control", "no-cache")
                     self.end_headers()
+                    return
 
-                    self.wfile.write(bytes(data, "utf-8"))
-                else:
-                    with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as executor:
-                        result = executor.submit(
-                            get_robot_library_html_doc_str,
-                            name,
-                            args,
-                            base_dir=basedir if basedir else ".",
-                            theme=theme,
-                        ).result(600)
-
-                        self.send_response(200)
-                        self.send_header("Content-type", "text/html")
-                        self.end_headers()
-
-                        self.wfile.write(bytes(result, "utf-8"))
+                self.send_response(200)
+                self.send_header("Content-type", "text/html")
+                self.send_header("Content-Length", str(len(page.content)))
+                self.send_header("ETag", page.etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+
+                self.wfile.write(page.content)
             except (SystemExit, KeyboardInterrupt):
                 raise
             except BaseException as e:
@@ -154,6 +221,8 @@ class LibDocRequestHandler(SimpleHTTPRequestHandler):
 
 
 class DualStackServer(ThreadingHTTPServer):
+    documentation: Optional["HttpServerProtocolPart"] = None
+
     def server_bind(self) -> None:
         # suppress exception when protocol is IPv4
         with contextlib.suppress(Exception):
@@ -175,6 +244,7 @@ class HttpServerProtocolPart(RobotLanguageServerProtocolPart):
         self._documentation_server_started = threading.Event()
         self._port: Optional[int] = None
         self._config: Optional[DocumentationServerConfig] = None
+        self._pages = LibDocPageCache()
 
     @property
     def config(self) -> DocumentationServerConfig:
@@ -192,9 +262,74 @@ class HttpServerProtocolPart(RobotLanguageServerProtocolPart):
         return self._port
 
     def _server_initialized(self, sender: Any) -> None:
+        self.parent.documents_cache.libraries_changed.add(self._on_libraries_changed)
+        self.parent.documents_cache.resources_changed.add(self._on_resources_changed)
+
         if not self.config.start_on_demand:
             self._ensure_server_started()
 
+    def _on_libraries_changed(self, sender: Any, libraries: List[LibraryDoc]) -> None:
+        self._pages.invalidate(libraries)
+
+    def _on_resources_changed(self, sender: Any, resources: List[LibraryDoc]) -> None:
+        self._pages.invalidate(resources)
+
+    def get_documentation_page(
+        self,
+        name: str,
+        args: Optional[str],
+        base_dir: Optional[str],
+        type_: Optional[str],
+        theme: Optional[str],
+    ) -> LibDocPage:
+        """Get the rendered documentation page of a library or resource.
+
+        The library doc is taken from the ImportsManager of the workspace folder of ``base_dir``, a page is only
+        rendered if the library doc changed.
+        """
+        base_dir = str(Path(base_dir if base_dir else ".").absolute())
+        imports_manager = self.parent.documents_cache.get_imports_manager_for_uri(Uri.from_path(base_dir))
+
+        lib_doc: LibraryDoc
+        if Path(name).suffix.lower() in ALLOWED_RESOURCE_FILE_EXTENSIONS:
+            lib_doc, resource_meta = imports_manager.get_resource_doc_for_resource_import_with_meta(name, base_dir)
+            cache_key = resource_meta.source if resource_meta is not None else lib_doc.source
+        else:
+            lib_doc, library_meta = imports_manager.get_libdoc_for_library_import_with_meta(
+                name, tuple(args.split("::") if args else ()), base_dir
+            )
+            try:
+                cache_key = library_meta.cache_key if library_meta is not None else lib_doc.source
+            except ValueError:
+                cache_key = lib_doc.source
+
+        markdown = type_ in ["md", "markdown"]
+        key = (cache_key or name, name, args, "md" if markdown else "html", None if markdown else theme)
+
+        page = self._pages.get(key, lib_doc)
+        if page is not None:
+            return page
+
+        if markdown:
+            tt = str.maketrans({"<": "&lt;", ">": "&gt;"})
+            content = MARKDOWN_TEMPLATE.substitute(
+                content=lib_doc.to_markdown(add_signature=False, only_doc=False, header_level=0).translate(tt),
+                name=name,
+            )
+        else:
+            # Robot Framework's libdoc writer needs its own model of the library, it is built in a separate process
+            # so the import of the library does not affect the language server
+            with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as executor:
+                content = executor.submit(
+                    get_robot_library_html_doc_str,
+                    name,
+                    args,
+                    base_dir=base_dir,
+                    theme=theme,
+                ).result(600)
+
+        return self._pages.put(key, lib_doc, content)
+
     def _ensure_server_started(self) -> None:
         with self._documentation_server_lock:
             if self._documentation_server is None:
@@ -210,6 +345,7 @@ class HttpServerProtocolPart(RobotLanguageServerProtocolPart):
         self._port = find_free_port(self.config.start_port, self.config.end_port)
         self._logger.debug(lambda: f"Start documentation server on port {self._port}")
         with DualStackServer(("127.0.0.1", self._port), LibDocRequestHandler) as server:
+            server.documentation = self
             self._documentation_server = server
             try:
                 self._documentation_server_started.set()
@@ -223,5 +359,6 @@ class HttpServerProtocolPart(RobotLanguageServerProtocolPart):
             if self._documentation_server is not None:
                 self._documentation_server.shutdown()
                 self._documentation_server = None
+                self._pages.clear()
                 self._port = 0
                 self._documentation_server_started.clear()
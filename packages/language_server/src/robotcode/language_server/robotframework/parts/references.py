@@ -173,18 +173,18 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart):
     ) -> Optional[List[Location]]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_variable_refs = namespace.variable_references
+        all_variable_refs = namespace.reference_index.variables_at(position)
         if all_variable_refs:
-            for var, var_refs in all_variable_refs.items():
+            for var, var_refs in all_variable_refs:
                 if var.source == namespace.source and position in var.name_range:
                     return self.find_variable_references(document, var, context.include_declaration)
                 for r in var_refs:
                     if (var.source == namespace.source and position in var.name_range) or position in r.range:
                         return self.find_variable_references(document, var, context.include_declaration)
 
-        all_kw_refs = namespace.keyword_references
+        all_kw_refs = namespace.reference_index.keywords_at(position)
         if all_kw_refs:
-            for kw, kw_refs in all_kw_refs.items():
+            for kw, kw_refs in all_kw_refs:
                 if kw.source == namespace.source and position in kw.name_range:
                     return self.find_keyword_references(document, kw, context.include_declaration)
                 for r in kw_refs:
@@ -156,9 +156,9 @@ class RobotRenameProtocolPart(RobotLanguageServerProtocolPart):
     ) -> Optional[Tuple[VariableDefinition, Range]]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_variable_refs = namespace.variable_references
+        all_variable_refs = namespace.reference_index.variables_at(position)
         if all_variable_refs:
-            for variable, var_refs in all_variable_refs.items():
+            for variable, var_refs in all_variable_refs:
                 check_current_task_canceled()
 
                 found_range = (
@@ -230,9 +230,9 @@ class RobotRenameProtocolPart(RobotLanguageServerProtocolPart):
     ) -> Optional[Tuple[KeywordDoc, Range]]:
         namespace = self.parent.documents_cache.get_namespace(document)
 
-        all_refs = namespace.keyword_references
+        all_refs = namespace.reference_index.keywords_at(position)
         if all_refs:
-            for keyword, kw_refs in all_refs.items():
+            for keyword, kw_refs in all_refs:
                 check_current_task_canceled()
 
                 found_range = (
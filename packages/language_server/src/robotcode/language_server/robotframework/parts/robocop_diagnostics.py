@@ -1,5 +1,8 @@
+import hashlib
 import io
-from typing import TYPE_CHECKING, Any, List, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, cast
 from weakref import WeakKeyDictionary
 
 from robotcode.core.language import language_id
@@ -14,6 +17,7 @@ from robotcode.core.text_document import TextDocument
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.core.utils.version import Version, create_version_from_str
 from robotcode.core.workspace import WorkspaceFolder
+from robotcode.robot.diagnostics.data_cache import CacheSection
 
 from ...common.parts.diagnostics import DiagnosticsCollectType, DiagnosticsResult
 from ..configuration import RoboCopConfig
@@ -25,6 +29,15 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
+@dataclass(frozen=True)
+class RobocopLintMetaData:
+    """Identifies the input of a Robocop run, the cached diagnostics are only valid for the same input."""
+
+    text_hash: str
+    robocop_version: str
+    config_hash: str
+
+
 class RobotRoboCopDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -77,14 +90,88 @@ class RobotRoboCopDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
 
         return None
 
+    def _get_text_hash(self, document: TextDocument) -> str:
+        return hashlib.sha256(document.text().encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _get_lint_meta(self, document: TextDocument, config: Any) -> Optional[RobocopLintMetaData]:
+        # the resolved config of older Robocop versions has no stable hash, their results are not cached
+        config_hash = getattr(config, "hash", None)
+        if not isinstance(config_hash, str):
+            return None
+
+        return RobocopLintMetaData(
+            document.get_cache(self._get_text_hash),
+            str(self.parent.robocop_helper.robocop_version),
+            config_hash,
+        )
+
+    def _read_cached_diagnostics(self, document: TextDocument, meta: RobocopLintMetaData) -> Optional[List[Diagnostic]]:
+        cached = document.get_data(self)
+        if cached is not None and cached[0] == meta:
+            return cast(List[Diagnostic], cached[1])
+
+        source = str(document.uri.to_path())
+        try:
+            entry = self.parent.documents_cache.get_imports_manager(document).data_cache.read_entry(
+                CacheSection.LINT, source, RobocopLintMetaData, list
+            )
+            if entry is None or entry.meta != meta:
+                return None
+
+            result = cast(List[Diagnostic], entry.data)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Failed to read robocop diagnostics cache for {source}: {ex}")
+            return None
+
+        document.set_data(self, (meta, result))
+        return result
+
+    def _save_cached_diagnostics(
+        self, document: TextDocument, meta: RobocopLintMetaData, diagnostics: List[Diagnostic]
+    ) -> None:
+        document.set_data(self, (meta, diagnostics))
+
+        source = str(document.uri.to_path())
+        try:
+            self.parent.documents_cache.get_imports_manager(document).data_cache.save_entry(
+                CacheSection.LINT, source, meta, diagnostics
+            )
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Failed to save robocop diagnostics cache for {source}: {ex}")
+
     @_logger.call
     def collect(self, document: TextDocument, workspace_folder: WorkspaceFolder) -> List[Diagnostic]:
-        from robocop.linter.rules import RuleSeverity
-
         linter = self.get_linter(workspace_folder)
 
         source = document.uri.to_path()
         config = linter.config_manager.get_config_for_source_file(source)
+
+        version = document.version
+        meta = self._get_lint_meta(document, config)
+        if meta is not None:
+            cached = self._read_cached_diagnostics(document, meta)
+            if cached is not None:
+                return cached
+
+        result = self._run_linter(document, linter, source, config)
+
+        # don't cache the result for a text that has changed while linting
+        if meta is not None and document.version == version:
+            self._save_cached_diagnostics(document, meta, result)
+
+        return result
+
+    def _run_linter(
+        self, document: TextDocument, linter: "RobocopLinter", source: Path, config: Any
+    ) -> List[Diagnostic]:
+        from robocop.linter.rules import RuleSeverity
+
         model = self.parent.documents_cache.get_model(document)
 
         if self.parent.robocop_helper.robocop_version >= (8, 0):
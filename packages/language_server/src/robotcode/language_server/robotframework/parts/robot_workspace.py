@@ -1,11 +1,14 @@
 from concurrent.futures import CancelledError
+from dataclasses import dataclass
 from logging import CRITICAL
 from threading import Event
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
+from robotcode.core.concurrent import get_task_scheduler
 from robotcode.core.ignore_spec import DEFAULT_SPEC_RULES, GIT_IGNORE_FILE, ROBOT_IGNORE_FILE, IgnoreSpec, iter_files
 from robotcode.core.language import language_id
 from robotcode.core.uri import Uri
+from robotcode.core.utils.dataclasses import CamelSnakeMixin
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.jsonrpc2.protocol import rpc_method
 from robotcode.language_server.common.parts.diagnostics import (
@@ -26,6 +29,34 @@ if TYPE_CHECKING:
 from .protocol_part import RobotLanguageServerProtocolPart
 
 
+@dataclass(repr=False)
+class CacheStatsInfo(CamelSnakeMixin):
+    folder: str
+    cache: str
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_ratio: float
+
+
+@dataclass(repr=False)
+class TaskLaneInfo(CamelSnakeMixin):
+    lane: str
+    queued: int
+    running: int
+    started: int
+    average_wait_time: float
+    max_wait_time: float
+
+
+@dataclass(repr=False)
+class TaskSchedulerInfo(CamelSnakeMixin):
+    workers: int
+    idle_workers: int
+    lanes: List[TaskLaneInfo]
+
+
 class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -35,6 +66,7 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
         self.parent.diagnostics.load_workspace_documents.add(self.load_workspace_documents)
         self.parent.diagnostics.on_get_diagnostics_mode.add(self.on_get_diagnostics_mode)
         self.parent.diagnostics.on_get_analysis_progress_mode.add(self.on_get_analysis_progress_mode)
+        self.parent.diagnostics.on_get_analysis_parallelism.add(self.on_get_analysis_parallelism)
         self.documents_loaded = Event()
 
     @language_id("robotframework")
@@ -52,6 +84,10 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
         config = self.parent.workspace.get_configuration(AnalysisConfig, uri)
         return config.progress_mode
 
+    def on_get_analysis_parallelism(self, sender: Any, uri: Uri) -> Optional[int]:
+        config = self.parent.workspace.get_configuration(AnalysisConfig, uri)
+        return config.parallelism
+
     def load_workspace_documents(self, sender: Any) -> None:
         with self._logger.measure_time(lambda: "loading workspace documents", context_name="load_workspace_documents"):
             try:
@@ -92,7 +128,8 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
                     ) as progress:
                         for i, f in enumerate(files):
                             try:
-                                self.parent.documents.get_or_open_document(f)
+                                # only the file state is read here, the text is read when the document is analyzed
+                                self.parent.documents.get_or_open_document(f, lazy=True)
 
                                 if config.analysis.progress_mode != AnalysisProgressMode.OFF:
                                     name = f.relative_to(folder.uri.to_path())
@@ -118,6 +155,9 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
                                     level=CRITICAL,
                                     context_name="load_workspace_documents",
                                 )
+
+                    # references of unchanged files are known from the cache before the workspace is analyzed
+                    self.parent.documents_cache.get_project_index_for_workspace_folder(folder)
             finally:
                 if canceled:
                     self._logger.info(lambda: "Workspace loading canceled")
@@ -126,3 +166,44 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
     def robot_cache_clear(self) -> None:
         for folder in self.parent.workspace.workspace_folders:
             self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder).clear_cache()
+
+    @rpc_method(name="robot/cache/stats", threaded=True)
+    def robot_cache_stats(self) -> List[CacheStatsInfo]:
+        result: List[CacheStatsInfo] = []
+
+        for folder in self.parent.workspace.workspace_folders:
+            imports_manager = self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder)
+            for name, stats in imports_manager.file_cache_stats.items():
+                result.append(
+                    CacheStatsInfo(
+                        str(folder.uri),
+                        name,
+                        stats.hits,
+                        stats.misses,
+                        stats.evictions,
+                        stats.expirations,
+                        stats.hit_ratio,
+                    )
+                )
+
+        return result
+
+    @rpc_method(name="robot/tasks/stats")
+    def robot_tasks_stats(self) -> TaskSchedulerInfo:
+        stats = get_task_scheduler().stats
+
+        return TaskSchedulerInfo(
+            stats.workers,
+            stats.idle_workers,
+            [
+                TaskLaneInfo(
+                    priority.name.lower(),
+                    lane.queued,
+                    lane.running,
+                    lane.started,
+                    lane.average_wait_time,
+                    lane.max_wait_time,
+                )
+                for priority, lane in stats.lanes.items()
+            ],
+        )
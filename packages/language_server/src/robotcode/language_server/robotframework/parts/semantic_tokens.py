@@ -1,4 +1,5 @@
 import ast
+import itertools
 import operator
 import re
 from dataclasses import dataclass
@@ -52,6 +53,7 @@ from robotcode.core.lsp.types import (
     SemanticTokens,
     SemanticTokensDelta,
     SemanticTokensDeltaPartialResult,
+    SemanticTokensEdit,
     SemanticTokensPartialResult,
     SemanticTokenTypes,
 )
@@ -2007,6 +2009,41 @@ class SemanticTokenGenerator:
         return SemanticTokens(data=data)
 
 
+def compute_semantic_tokens_edits(previous: List[int], current: List[int]) -> List[SemanticTokensEdit]:
+    """Computes the edits that transform the ``previous`` encoded token data into ``current``.
+
+    Tokens are encoded relative to their predecessor, so an edit in the document only changes the tokens
+    of the edited lines and the first token after them. Everything before and after that is kept and the
+    changed part is replaced with a single edit.
+    """
+    if previous == current:
+        return []
+
+    max_prefix = min(len(previous), len(current))
+    prefix = 0
+    while prefix < max_prefix and previous[prefix] == current[prefix]:
+        prefix += 1
+
+    max_suffix = max_prefix - prefix
+    suffix = 0
+    while suffix < max_suffix and previous[-1 - suffix] == current[-1 - suffix]:
+        suffix += 1
+
+    return [
+        SemanticTokensEdit(
+            start=prefix,
+            delete_count=len(previous) - prefix - suffix,
+            data=current[prefix : len(current) - suffix] or None,
+        )
+    ]
+
+
+@dataclass
+class _SemanticTokensResult:
+    result_id: str
+    data: List[int]
+
+
 class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
     """Main protocol part for semantic token generation.
 
@@ -2020,10 +2057,13 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         parent.semantic_tokens.token_modifiers += list(RobotSemTokenModifiers)
 
         parent.semantic_tokens.collect_full.add(self.collect_full)
+        parent.semantic_tokens.collect_full_delta.add(self.collect_full_delta)
 
         self.parent.on_initialized.add(self._on_initialized)
+        self.parent.documents.did_close.add(self._on_did_close)
 
         self.token_generator = SemanticTokenGenerator()
+        self._result_ids = itertools.count(1)
 
     def _on_initialized(self, sender: Any) -> None:
         self.parent.documents_cache.namespace_invalidated.add(self.namespace_invalidated)
@@ -2079,11 +2119,37 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
             self.parent.semantic_tokens.token_modifiers,
         )
 
+    def _on_did_close(self, sender: Any, document: TextDocument, full_close: bool) -> None:
+        document.remove_data(self)
+
+    @property
+    def _client_supports_delta(self) -> bool:
+        capabilities = self.parent.client_capabilities
+        full = (
+            capabilities.text_document.semantic_tokens.requests.full
+            if capabilities is not None
+            and capabilities.text_document is not None
+            and capabilities.text_document.semantic_tokens is not None
+            else None
+        )
+        return full is not None and not isinstance(full, bool) and bool(full.delta)
+
+    def _remember_result(self, document: TextDocument, result: SemanticTokens) -> SemanticTokens:
+        """Gives ``result`` a result id and keeps it as the base for the next delta request of the document."""
+        result.result_id = str(next(self._result_ids))
+        document.set_data(self, _SemanticTokensResult(result.result_id, result.data))
+        return result
+
     @language_id("robotframework")
     def collect_full(
         self, sender: Any, document: TextDocument, **kwargs: Any
     ) -> Union[SemanticTokens, SemanticTokensPartialResult, None]:
-        return self._collect(document, None)
+        result = self._collect(document, None)
+
+        if isinstance(result, SemanticTokens) and self._client_supports_delta:
+            return self._remember_result(document, result)
+
+        return result
 
     @language_id("robotframework")
     def collect_range(
@@ -2104,4 +2170,18 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         SemanticTokensDeltaPartialResult,
         None,
     ]:
-        return None
+        result = self._collect(document, None)
+        if not isinstance(result, SemanticTokens):
+            return None
+
+        previous: Optional[_SemanticTokensResult] = document.get_data(self)
+
+        self._remember_result(document, result)
+
+        # the client asks for a delta to a result we don't know (anymore), send all tokens
+        if previous is None or previous.result_id != previous_result_id:
+            return result
+
+        return SemanticTokensDelta(
+            edits=compute_semantic_tokens_edits(previous.data, result.data), result_id=result.result_id
+        )
@@ -1,5 +1,7 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
+from robotcode.core.language import language_id
 from robotcode.core.lsp.types import (
     Location,
     SymbolInformation,
@@ -7,7 +9,10 @@ from robotcode.core.lsp.types import (
     SymbolTag,
     WorkspaceSymbol,
 )
+from robotcode.core.text_document import TextDocument
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.robot.diagnostics.namespace import Namespace
+from robotcode.robot.diagnostics.symbol_index import SymbolIndex
 
 from .protocol_part import RobotLanguageServerProtocolPart
 
@@ -15,74 +20,106 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
-def contains_characters_in_order(main_string: str, check_string: str) -> bool:
-    main_iter = iter(main_string.lower())
-    return all(char in main_iter for char in check_string.lower())
-
-
 class RobotWorkspaceSymbolsProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
+    MAX_RESULTS = 1000
+
     def __init__(self, parent: "RobotLanguageServerProtocol") -> None:
         super().__init__(parent)
 
+        self._index: SymbolIndex[WorkspaceSymbol] = SymbolIndex()
+        self._indexed_namespaces: Dict[str, Namespace] = {}
+        self._lock = threading.RLock()
+
+        parent.on_initialized.add(self._on_initialized)
         parent.workspace_symbols.collect.add(self.collect)
 
-    @_logger.call
-    def collect(self, sender: Any, query: str) -> Optional[Union[List[WorkspaceSymbol], List[SymbolInformation], None]]:
-        result: List[WorkspaceSymbol] = []
+    def _on_initialized(self, sender: Any) -> None:
+        self.parent.documents_cache.namespace_initialized.add(self._on_namespace_initialized)
+        self.parent.documents_cache.namespace_invalidated.add(self._on_namespace_invalidated)
+
+    @language_id("robotframework")
+    def _on_namespace_initialized(self, sender: Any, namespace: Namespace) -> None:
+        if namespace.document is not None:
+            self._update_document(namespace.document, namespace)
+
+    @language_id("robotframework")
+    def _on_namespace_invalidated(self, sender: Any, namespace: Namespace) -> None:
+        if namespace.document is not None:
+            with self._lock:
+                if self._indexed_namespaces.get(namespace.document.document_uri) is namespace:
+                    self._remove_document(namespace.document.document_uri)
+
+    def _remove_document(self, uri: str) -> None:
+        self._indexed_namespaces.pop(uri, None)
+        self._index.remove(uri)
+
+    def _update_document(self, document: TextDocument, namespace: Namespace) -> None:
+        symbols = list(self._iter_symbols(document, namespace))
+        with self._lock:
+            self._indexed_namespaces[document.document_uri] = namespace
+            self._index.update(document.document_uri, ((s.name, s) for s in symbols))
+
+    def _iter_symbols(self, document: TextDocument, namespace: Namespace) -> Iterator[WorkspaceSymbol]:
+        container_name = namespace.library_doc.name
+
+        for kw_doc in namespace.keyword_references.keys():
+            if kw_doc.source == namespace.source:
+                yield WorkspaceSymbol(
+                    name=kw_doc.name,
+                    kind=SymbolKind.FUNCTION,
+                    location=Location(
+                        uri=document.document_uri,
+                        range=kw_doc.range,
+                    ),
+                    tags=[SymbolTag.DEPRECATED] if kw_doc.is_deprecated else None,
+                    container_name=container_name,
+                )
+
+        for var in namespace.variable_references.keys():
+            if var.source == namespace.source:
+                yield WorkspaceSymbol(
+                    name=var.name,
+                    kind=SymbolKind.VARIABLE,
+                    location=Location(
+                        uri=document.document_uri,
+                        range=var.range,
+                    ),
+                    container_name=container_name,
+                )
+
+        for test in namespace.testcase_definitions:
+            yield WorkspaceSymbol(
+                name=test.name,
+                kind=SymbolKind.CLASS,
+                location=Location(
+                    uri=document.document_uri,
+                    range=test.range,
+                ),
+                container_name=container_name,
+            )
+
+    def _sync_index(self) -> None:
+        # the index is kept up to date by the namespace events, documents that are removed or whose namespace
+        # was initialized before the events were connected are synchronized here
+        documents = {}
         for document in self.parent.documents.documents:
             if document.language_id == "robotframework":
                 namespace = self.parent.documents_cache.get_only_initialized_namespace(document)
                 if namespace is not None:
-                    container_name = namespace.library_doc.name
-
-                    for kw_doc in [
-                        v
-                        for v in namespace.keyword_references.keys()
-                        if v.source == namespace.source and contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=kw_doc.name,
-                                kind=SymbolKind.FUNCTION,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=kw_doc.range,
-                                ),
-                                tags=[SymbolTag.DEPRECATED] if kw_doc.is_deprecated else None,
-                                container_name=container_name,
-                            )
-                        )
-                    for var in [
-                        v
-                        for v in namespace.variable_references.keys()
-                        if v.source == namespace.source and contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=var.name,
-                                kind=SymbolKind.VARIABLE,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=var.range,
-                                ),
-                                container_name=container_name,
-                            )
-                        )
-
-                    for test in [
-                        v for v in namespace.testcase_definitions if contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=test.name,
-                                kind=SymbolKind.CLASS,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=test.range,
-                                ),
-                                container_name=container_name,
-                            )
-                        )
-        return result
+                    documents[document.document_uri] = (document, namespace)
+
+        with self._lock:
+            for uri in [uri for uri in self._indexed_namespaces if uri not in documents]:
+                self._remove_document(uri)
+
+            for uri, (document, namespace) in documents.items():
+                if self._indexed_namespaces.get(uri) is not namespace:
+                    self._update_document(document, namespace)
+
+    @_logger.call
+    def collect(self, sender: Any, query: str) -> Optional[Union[List[WorkspaceSymbol], List[SymbolInformation], None]]:
+        self._sync_index()
+
+        return self._index.search(query, self.MAX_RESULTS)
@@ -0,0 +1,526 @@
+"""Portable bundles of the analysis cache.
+
+A bundle is a zip archive with a ``manifest.json`` and the serialized meta and
+data of the cache entries, stored once under their SHA-256 in ``objects/``.
+Paths in the manifest are relative to the workspace root or to one of the
+Python installation paths, so a bundle can be imported into a checkout in
+another directory.
+
+Cached entries are validated against the modification time and size of the
+files they were built from, which do not survive a checkout. A bundle therefore
+records the content hash of every file an entry depends on. An entry is only
+imported if all of these files have the same content on this machine, its meta
+is then stamped with the local file states and checked like any cached entry.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import sysconfig
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from robotcode.core.uri import Uri
+from robotcode.core.utils.path import DiskInfo, normalized_path, probe_disk_info
+
+from ..utils import get_robot_version_str
+from .data_cache import CacheSection, SqliteDataCache
+from .imports_manager import (
+    ImportsManager,
+    LibraryMetaData,
+    NamespaceMetaData,
+    RobotFileMeta,
+    _collect_library_file_infos,
+)
+from .library_doc import KeywordStore, LibraryDoc, ResourceDoc, VariablesDoc
+from .namespace import NamespaceData
+
+BUNDLE_FORMAT_VERSION = 1
+
+BUNDLE_SECTIONS = (CacheSection.LIBRARY, CacheSection.VARIABLES, CacheSection.RESOURCE, CacheSection.NAMESPACE)
+
+_SECTION_TYPES: Dict[CacheSection, Tuple[type, type]] = {
+    CacheSection.LIBRARY: (LibraryMetaData, LibraryDoc),
+    CacheSection.VARIABLES: (LibraryMetaData, VariablesDoc),
+    CacheSection.RESOURCE: (RobotFileMeta, ResourceDoc),
+    CacheSection.NAMESPACE: (NamespaceMetaData, NamespaceData),
+}
+
+_MANIFEST_NAME = "manifest.json"
+_OBJECTS_DIR = "objects/"
+
+# fixed timestamp for the archive members, the same cache content always gives the same bundle
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class CacheBundleError(Exception):
+    pass
+
+
+@dataclass
+class BundleSectionStats:
+    section: CacheSection
+    entries: int = 0
+    outdated: int = 0
+    not_portable: int = 0
+    unchanged: int = 0
+
+
+def _base_paths(root_folder: Path) -> Dict[str, str]:
+    """The directories paths in a bundle are relative to, by name."""
+    result = {"root": str(normalized_path(root_folder))}
+
+    paths = sysconfig.get_paths()
+    for name in ("purelib", "platlib", "stdlib", "platstdlib"):
+        path = paths.get(name)
+        if path:
+            result[name] = str(normalized_path(path))
+
+    return result
+
+
+class _PathMapper:
+    def __init__(self, bases: Dict[str, str]) -> None:
+        self._bases = bases
+        # the most specific base wins, e.g. a virtual environment inside the workspace
+        self._by_length = sorted(bases.items(), key=lambda item: len(item[1]), reverse=True)
+
+    def to_portable(self, path: str) -> Optional[str]:
+        for name, base in self._by_length:
+            if path == base:
+                return f"{{{name}}}"
+            if path.startswith(base + os.sep):
+                return f"{{{name}}}/" + path[len(base) + 1 :].replace(os.sep, "/")
+        return None
+
+    def to_local(self, portable: str) -> Optional[str]:
+        name, _, rest = portable[1:].partition("}")
+        base = self._bases.get(name)
+        if base is None:
+            return None
+        return os.path.join(base, *rest[1:].split("/")) if rest else base
+
+    def entry_to_portable(self, entry_name: str) -> Optional[str]:
+        # library and variables entries of modules are keyed by the module name, all others by a path,
+        # namespace entries have a "\n<document type>" suffix
+        head, sep, tail = entry_name.partition("\n")
+        if not os.path.isabs(head):
+            return entry_name
+        portable = self.to_portable(head)
+        return portable + sep + tail if portable is not None else None
+
+    def entry_to_local(self, entry_name: str) -> Optional[str]:
+        if not entry_name.startswith("{"):
+            return entry_name
+        head, sep, tail = entry_name.partition("\n")
+        local = self.to_local(head)
+        return local + sep + tail if local is not None else None
+
+
+_MISSING = object()
+
+
+class _Relocator:
+    """Replaces the base directories of the exporting machine in deserialized cache entries.
+
+    Walks lists, tuples, dicts, sets, keyword stores and dataclass instances and rewrites every
+    path and file URI below one of the replaced directories. Objects are changed in place,
+    containers of hashable objects are rebuilt because the hashes of their items change.
+    """
+
+    def __init__(self, replacements: Dict[str, str]) -> None:
+        self._exact: Dict[str, str] = {}
+        prefixes: Dict[str, str] = {}
+        for old, new in replacements.items():
+            self._exact[old] = new
+            prefixes[old + os.sep] = new + os.sep
+            old_uri, new_uri = str(Uri.from_path(old)), str(Uri.from_path(new))
+            self._exact[old_uri] = new_uri
+            prefixes[old_uri + "/"] = new_uri + "/"
+
+        self._prefixes = prefixes
+        self._pattern = (
+            re.compile("|".join(re.escape(p) for p in sorted(prefixes, key=len, reverse=True))) if prefixes else None
+        )
+
+    def __call__(self, obj: Any) -> Any:
+        if self._pattern is None:
+            return obj
+        return self._walk(obj, {})
+
+    def _string(self, value: str) -> str:
+        exact = self._exact.get(value)
+        if exact is not None:
+            return exact
+
+        assert self._pattern is not None
+        return self._pattern.sub(lambda m: self._prefixes[m.group()], value)
+
+    def _walk(self, obj: Any, memo: Dict[int, Any]) -> Any:
+        t = type(obj)
+        if t is str:
+            return self._string(obj)
+        if t in (int, float, bool, bytes, type(None)):
+            return obj
+
+        key = id(obj)
+        if key in memo:
+            return memo[key]
+
+        if t is list:
+            memo[key] = obj
+            obj[:] = [self._walk(v, memo) for v in obj]
+            return obj
+
+        if t is dict:
+            memo[key] = obj
+            items = [(self._walk(k, memo), self._walk(v, memo)) for k, v in obj.items()]
+            obj.clear()
+            obj.update(items)
+            return obj
+
+        if t is set:
+            memo[key] = obj
+            values = [self._walk(v, memo) for v in obj]
+            obj.clear()
+            obj.update(values)
+            return obj
+
+        if t is frozenset:
+            result: Any = frozenset(self._walk(v, memo) for v in obj)
+        elif isinstance(obj, tuple):
+            values = [self._walk(v, memo) for v in obj]
+            result = t._make(values) if hasattr(t, "_make") else t(values)
+        elif t is KeywordStore:
+            memo[key] = obj
+            obj.source = self._walk(obj.source, memo)
+            for keyword in obj:
+                self._walk(keyword, memo)
+            return obj
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            memo[key] = obj
+            names = [f.name for f in dataclasses.fields(obj)]
+            names.extend(n for n in getattr(obj, "__dict__", ()) if n not in names)
+            for name in names:
+                value = getattr(obj, name, _MISSING)
+                if value is not _MISSING:
+                    object.__setattr__(obj, name, self._walk(value, memo))
+            return obj
+        else:
+            return obj
+
+        memo[key] = result
+        return result
+
+
+def _file_states(meta: Any) -> Optional[Dict[str, DiskInfo]]:
+    """The files a cache entry was built from, `None` if they contradict each other."""
+    if isinstance(meta, LibraryMetaData):
+        return dict(meta.file_infos or {})
+
+    if isinstance(meta, RobotFileMeta):
+        return {meta.source: meta.info}
+
+    if isinstance(meta, NamespaceMetaData):
+        result = {meta.source: meta.source_info}
+        for dependency in meta.dependency_fingerprints.values():
+            states = _file_states(dependency)
+            if states is None:
+                return None
+            for path, info in states.items():
+                if result.setdefault(path, info) != info:
+                    return None
+        return result
+
+    return None
+
+
+def _restamp(meta: Any, states: Dict[str, DiskInfo]) -> Any:
+    if isinstance(meta, LibraryMetaData):
+        return dataclasses.replace(
+            meta, file_infos={p: states[p] for p in meta.file_infos} if meta.file_infos is not None else None
+        )
+
+    if isinstance(meta, RobotFileMeta):
+        return dataclasses.replace(meta, info=states[meta.source])
+
+    if isinstance(meta, NamespaceMetaData):
+        return dataclasses.replace(
+            meta,
+            source_info=states[meta.source],
+            dependency_fingerprints={k: _restamp(v, states) for k, v in meta.dependency_fingerprints.items()},
+        )
+
+    raise TypeError(f"Unsupported cache meta {type(meta).__name__}")
+
+
+def _is_fresh(meta: Any) -> bool:
+    """Checks a meta against the local files the same way a cache lookup does."""
+    if isinstance(meta, LibraryMetaData):
+        if meta.has_errors:
+            return False
+        try:
+            return meta.file_infos == _collect_library_file_infos(meta.origin, meta.submodule_search_locations)
+        except OSError:
+            return False
+
+    if isinstance(meta, RobotFileMeta):
+        return meta == ImportsManager.get_resource_meta(meta.source)
+
+    if isinstance(meta, NamespaceMetaData):
+        return meta.source_info == probe_disk_info(meta.source) and all(
+            _is_fresh(v) for v in meta.dependency_fingerprints.values()
+        )
+
+    return False
+
+
+def _hash_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+    except OSError:
+        return None
+
+
+def _hash_unchanged_file(path: str, info: DiskInfo) -> Optional[str]:
+    """The content hash of a file, `None` if the file does not have the given state before and after reading it."""
+    if probe_disk_info(path) != info:
+        return None
+    digest = _hash_file(path)
+    if digest is None or probe_disk_info(path) != info:
+        return None
+    return digest
+
+
+def _bundle_header(app_version: str) -> Dict[str, Any]:
+    return {
+        "app_version": app_version,
+        "python_version": ".".join(str(v) for v in sys.version_info[:3]),
+        "robot_version": get_robot_version_str(),
+        "platform": sys.platform,
+    }
+
+
+def export_cache_bundle(cache: SqliteDataCache, bundle: Path, root_folder: Path) -> List[BundleSectionStats]:
+    """Writes the portable entries of the cache to a bundle.
+
+    Entries whose files changed since they were cached are skipped as outdated, entries that depend
+    on files outside the workspace and the Python installation are skipped as not portable.
+    """
+    bases = _base_paths(root_folder)
+    mapper = _PathMapper(bases)
+    file_hashes: Dict[Tuple[str, DiskInfo], Optional[str]] = {}
+    written: Dict[str, None] = {}
+    entries: List[Dict[str, Any]] = []
+    result: List[BundleSectionStats] = []
+
+    bundle.parent.mkdir(parents=True, exist_ok=True)
+    tmp = bundle.with_name(bundle.name + ".tmp")
+
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+
+        def add_object(blob: bytes) -> str:
+            digest = hashlib.sha256(blob).hexdigest()
+            if digest not in written:
+                archive.writestr(zipfile.ZipInfo(_OBJECTS_DIR + digest, _ZIP_DATE_TIME), blob, zipfile.ZIP_DEFLATED)
+                written[digest] = None
+            return digest
+
+        for section in BUNDLE_SECTIONS:
+            meta_type, _ = _SECTION_TYPES[section]
+            stats = BundleSectionStats(section)
+            result.append(stats)
+
+            for info in cache.list_entries(section):
+                raw = cache.read_raw_entry(section, info.entry_name)
+                if raw is None or raw[0] is None:
+                    stats.outdated += 1
+                    continue
+
+                meta = pickle.loads(raw[0])
+                states = _file_states(meta) if isinstance(meta, meta_type) else None
+                if states is None:
+                    stats.outdated += 1
+                    continue
+
+                name = mapper.entry_to_portable(info.entry_name)
+                portable_files = {path: mapper.to_portable(path) for path in states}
+                if name is None or None in portable_files.values():
+                    stats.not_portable += 1
+                    continue
+
+                files: Dict[str, str] = {}
+                for path, disk_info in states.items():
+                    key = (path, disk_info)
+                    if key not in file_hashes:
+                        file_hashes[key] = _hash_unchanged_file(path, disk_info)
+                    digest, portable = file_hashes[key], portable_files[path]
+                    if digest is None or portable is None:
+                        break
+                    files[portable] = digest
+
+                if len(files) != len(states):
+                    stats.outdated += 1
+                    continue
+
+                entries.append(
+                    {
+                        "section": section.value,
+                        "name": name,
+                        "meta": add_object(raw[0]),
+                        "data": add_object(raw[1]),
+                        "files": files,
+                    }
+                )
+                stats.entries += 1
+
+        manifest = {
+            "format": BUNDLE_FORMAT_VERSION,
+            **_bundle_header(cache.app_version or ""),
+            "bases": bases,
+            "entries": entries,
+        }
+        archive.writestr(
+            zipfile.ZipInfo(_MANIFEST_NAME, _ZIP_DATE_TIME),
+            json.dumps(manifest, indent=1, sort_keys=True),
+            zipfile.ZIP_DEFLATED,
+        )
+
+    os.replace(tmp, bundle)
+
+    return result
+
+
+def _read_manifest(archive: zipfile.ZipFile, app_version: str) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(archive.read(_MANIFEST_NAME))
+    except (KeyError, ValueError) as e:
+        raise CacheBundleError(f"Not a cache bundle: {e}") from e
+
+    if not isinstance(manifest, dict) or manifest.get("format") != BUNDLE_FORMAT_VERSION:
+        raise CacheBundleError("Unsupported cache bundle format.")
+
+    for key, expected in _bundle_header(app_version).items():
+        if manifest.get(key) != expected:
+            raise CacheBundleError(
+                f"The cache bundle was created for {key.replace('_', ' ')} {manifest.get(key)!r},"
+                f" this environment uses {expected!r}."
+            )
+
+    return manifest
+
+
+def _read_object(archive: zipfile.ZipFile, digest: str) -> bytes:
+    try:
+        blob = archive.read(_OBJECTS_DIR + digest)
+    except KeyError as e:
+        raise CacheBundleError(f"The cache bundle is incomplete: {e}") from e
+
+    if hashlib.sha256(blob).hexdigest() != digest:
+        raise CacheBundleError(f"The cache bundle is corrupt: object {digest} does not match its hash.")
+
+    return blob
+
+
+def _load(blob: bytes, expected_type: type, relocate: Callable[[Any], Any]) -> Any:
+    value = pickle.loads(blob)
+    if not isinstance(value, expected_type):
+        raise CacheBundleError(f"Expected {expected_type.__name__} but got {type(value).__name__}.")
+    return relocate(value)
+
+
+def import_cache_bundle(cache: SqliteDataCache, bundle: Path, root_folder: Path) -> List[BundleSectionStats]:
+    """Imports the entries of a bundle whose files have the same content on this machine.
+
+    Raises `CacheBundleError` if the bundle is invalid or was created for another Python,
+    Robot Framework or RobotCode version.
+    """
+    local_bases = _base_paths(root_folder)
+    mapper = _PathMapper(local_bases)
+    file_states: Dict[str, Optional[Tuple[str, DiskInfo]]] = {}
+    result = {section: BundleSectionStats(section) for section in BUNDLE_SECTIONS}
+
+    def local_states(files: Dict[str, str]) -> Optional[Dict[str, DiskInfo]]:
+        """The local states of the files of an entry, `None` if any file is missing or has another content."""
+        states: Dict[str, DiskInfo] = {}
+        for portable, digest in files.items():
+            path = mapper.to_local(portable)
+            if path is None:
+                return None
+
+            if path not in file_states:
+                info = probe_disk_info(path)
+                local_digest = _hash_unchanged_file(path, info) if info is not None and info.trusted else None
+                file_states[path] = (local_digest, info) if local_digest is not None and info is not None else None
+
+            state = file_states[path]
+            if state is None or state[0] != digest:
+                return None
+            states[path] = state[1]
+
+        return states
+
+    try:
+        with zipfile.ZipFile(bundle) as archive:
+            manifest = _read_manifest(archive, cache.app_version or "")
+
+            relocate = _Relocator(
+                {
+                    old: local_bases[name]
+                    for name, old in manifest.get("bases", {}).items()
+                    if name in local_bases and old != local_bases[name]
+                }
+            )
+
+            for entry in manifest.get("entries", []):
+                try:
+                    section = CacheSection(entry["section"])
+                except ValueError:
+                    continue
+                if section not in result:
+                    continue
+
+                stats = result[section]
+                meta_type, data_type = _SECTION_TYPES[section]
+
+                name = mapper.entry_to_local(entry["name"])
+                states = local_states(entry["files"])
+                if name is None or states is None:
+                    stats.outdated += 1
+                    continue
+
+                meta = _load(_read_object(archive, entry["meta"]), meta_type, relocate)
+                try:
+                    meta = _restamp(meta, states)
+                except KeyError:
+                    stats.outdated += 1
+                    continue
+
+                if not _is_fresh(meta):
+                    stats.outdated += 1
+                    continue
+
+                existing = cache.read_raw_entry(section, name)
+                if existing is not None and existing[0] is not None and pickle.loads(existing[0]) == meta:
+                    stats.unchanged += 1
+                    continue
+
+                data = _load(_read_object(archive, entry["data"]), data_type, relocate)
+                cache.save_entry(section, name, meta, data)
+                stats.entries += 1
+    except (zipfile.BadZipFile, KeyError, TypeError) as e:
+        raise CacheBundleError(f"Not a cache bundle: {e}") from e
+
+    return list(result.values())
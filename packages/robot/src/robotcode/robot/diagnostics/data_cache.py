@@ -3,11 +3,12 @@ import pickle
 import sqlite3
 import sys
 import threading
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from robotcode.core.utils.logging import LoggingDescriptor
 
@@ -30,6 +31,9 @@ class CacheSection(Enum):
     VARIABLES = "variables"
     RESOURCE = "resource"
     NAMESPACE = "namespace"
+    DEPENDENCIES = "dependencies"
+    PROJECT_INDEX = "project_index"
+    LINT = "lint"
 
 
 class CacheEntry(Generic[_M, _D]):
@@ -48,11 +52,13 @@ class CacheEntry(Generic[_M, _D]):
         meta_blob: Optional[bytes],
         meta_type: Union[Type[_M], Tuple[Type[_M], ...]],
         data_type: Union[Type[_D], Tuple[Type[_D], ...]],
+        data_blob: Optional[bytes] = None,
     ) -> None:
         self._cache = cache
         self._section = section
         self._entry_name = entry_name
         self._meta_blob = meta_blob
+        self._data_blob = data_blob
         self._meta_type = meta_type
         self._data_type = data_type
         self._meta_cache: Optional[_M] = None
@@ -60,6 +66,10 @@ class CacheEntry(Generic[_M, _D]):
         self._meta_loaded = False
         self._data_loaded = False
 
+    @property
+    def entry_name(self) -> str:
+        return self._entry_name
+
     @property
     def meta(self) -> Optional[_M]:
         if not self._meta_loaded:
@@ -74,10 +84,15 @@ class CacheEntry(Generic[_M, _D]):
     @property
     def data(self) -> _D:
         if not self._data_loaded:
-            row = self._cache._fetch_data(self._section, self._entry_name)
-            if row is None:
-                raise RuntimeError(f"Cache entry '{self._entry_name}' disappeared from DB")
-            result = pickle.loads(row[0])
+            data_blob, self._data_blob = self._data_blob, None
+            if data_blob is None:
+                row = self._cache._fetch_data(self._section, self._entry_name)
+                if row is None:
+                    raise RuntimeError(f"Cache entry '{self._entry_name}' disappeared from DB")
+                data_blob = row[0]
+            else:
+                self._cache._record_hit(self._section, self._entry_name, len(data_blob))
+            result = pickle.loads(data_blob)
             if not isinstance(result, self._data_type):
                 raise TypeError(f"Expected {self._data_type} but got {type(result)}")
             self._data_cache = result
@@ -89,6 +104,38 @@ class CacheEntry(Generic[_M, _D]):
 
 _TABLE_NAMES = [s.value for s in CacheSection]
 
+# Bumped when the layout of the section tables changes, the tables are recreated then.
+_SCHEMA_VERSION = "2"
+
+# Default size limit of a cache database in megabytes.
+DEFAULT_CACHE_MAX_SIZE = 1024
+
+# Share of the size limit each section may use. DEPENDENCIES entries are never
+# evicted: a namespace entry without its dependencies would hide its document
+# from the dependency graph.
+_SECTION_BUDGET_SHARES: Dict[CacheSection, float] = {
+    CacheSection.LIBRARY: 0.3,
+    CacheSection.VARIABLES: 0.05,
+    CacheSection.RESOURCE: 0.15,
+    CacheSection.NAMESPACE: 0.35,
+    CacheSection.PROJECT_INDEX: 0.1,
+    CacheSection.LINT: 0.05,
+}
+
+# A section that exceeds its budget is shrunk to this fraction of it, so not every
+# new entry triggers another eviction.
+_EVICTION_LOW_WATERMARK = 0.9
+
+# Access times and statistics are collected in memory and written in batches.
+_ACCESS_FLUSH_COUNT = 512
+_ACCESS_FLUSH_INTERVAL = 30.0
+
+# Seconds after opening the cache or after the first write before the budgets are enforced.
+_MAINTENANCE_DELAY = 60.0
+
+# Free pages released per incremental vacuum step, the connection lock is released between steps.
+_VACUUM_STEP_PAGES = 256
+
 CACHE_DIR_NAME = ".robotcode_cache"
 _LOCK_FILE_NAME = "cache.lock"
 _LOCK_LENGTH = 1
@@ -284,15 +331,30 @@ class SqliteDataCache:
     corrupt database (``sqlite3.DatabaseError``, e.g. "database disk image is
     malformed") is detected and rebuilt from scratch instead of propagating to
     callers.
+
+    If ``max_size`` (in bytes) is given, every section gets a share of it as budget.
+    A background maintenance evicts the least recently used entries of sections
+    that exceed their budget and releases the freed pages with an incremental
+    vacuum. Access times and hit statistics are collected in memory and written
+    in batches.
     """
 
     _logger = LoggingDescriptor()
 
-    def __init__(self, cache_dir: Path, app_version: str = "") -> None:
+    def __init__(self, cache_dir: Path, app_version: str = "", max_size: Optional[int] = None) -> None:
         self.cache_dir = cache_dir
         self._app_version = app_version
         self._lock = threading.Lock()
 
+        self.max_size = max_size if max_size else None
+        self._pending_lock = threading.Lock()
+        self._pending_access: Dict[Tuple[CacheSection, str], int] = {}
+        self._pending_stats: Dict[CacheSection, List[int]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._maintenance_timer: Optional[threading.Timer] = None
+        self._closed = False
+
         if not cache_dir.exists():
             cache_dir.mkdir(parents=True)
             (cache_dir / ".gitignore").write_text(
@@ -309,6 +371,8 @@ class SqliteDataCache:
                 raise
             self._rebuild()
 
+        self._schedule_maintenance()
+
     def _open(self, *, in_memory: bool = False) -> None:
         """Open the connection, configure it, and ensure the schema exists."""
         self._conn = sqlite3.connect(":memory:" if in_memory else str(self.db_path), check_same_thread=False)
@@ -320,6 +384,8 @@ class SqliteDataCache:
         # macOS/APFS and can persist a torn page ("database disk image is
         # malformed"); keep mmap only where the unified page cache makes it safe.
         self._conn.execute(f"PRAGMA mmap_size={0 if sys.platform == 'darwin' else 67108864}")
+        # only effective for a new database, existing ones are converted in _ensure_schema
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         self._ensure_schema()
 
     def _purge_db_files(self) -> None:
@@ -371,15 +437,18 @@ class SqliteDataCache:
     def _ensure_schema(self) -> None:
         self._conn.execute("CREATE TABLE IF NOT EXISTS _meta (  key TEXT PRIMARY KEY,  value TEXT NOT NULL)")
 
-        row = self._conn.execute("SELECT value FROM _meta WHERE key = 'app_version'").fetchone()
-        stored_version = row[0] if row else None
+        stored = dict(self._conn.execute("SELECT key, value FROM _meta").fetchall())
 
-        if stored_version != self._app_version:
-            for table in _TABLE_NAMES:
+        recreated = stored.get("app_version") != self._app_version or stored.get("schema_version") != _SCHEMA_VERSION
+        if recreated:
+            for table in [*_TABLE_NAMES, "_stats"]:
                 self._conn.execute(f"DROP TABLE IF EXISTS {table}")
             self._conn.execute(
                 "INSERT OR REPLACE INTO _meta (key, value) VALUES ('app_version', ?)", (self._app_version,)
             )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO _meta (key, value) VALUES ('schema_version', ?)", (_SCHEMA_VERSION,)
+            )
 
         for table in _TABLE_NAMES:
             self._conn.execute(
@@ -387,11 +456,30 @@ class SqliteDataCache:
                 f"  entry_name TEXT PRIMARY KEY,"
                 f"  meta BLOB,"
                 f"  data BLOB NOT NULL,"
+                f"  size INTEGER NOT NULL DEFAULT 0,"
                 f"  created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,"
-                f"  modified_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+                f"  modified_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,"
+                f"  accessed_at INTEGER NOT NULL DEFAULT 0)"
             )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS _stats ("
+            "  section TEXT PRIMARY KEY,"
+            "  lookups INTEGER NOT NULL DEFAULT 0,"
+            "  hits INTEGER NOT NULL DEFAULT 0,"
+            "  bytes_saved INTEGER NOT NULL DEFAULT 0,"
+            "  evictions INTEGER NOT NULL DEFAULT 0,"
+            "  evicted_bytes INTEGER NOT NULL DEFAULT 0)"
+        )
         self._conn.commit()
 
+        if recreated and self._conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # databases created before incremental vacuum was enabled are converted while they are empty
+            try:
+                self._conn.execute("VACUUM")
+            except sqlite3.OperationalError:
+                # another process has the database open, the conversion is retried on the next start
+                pass
+
     def read_entry(
         self,
         section: CacheSection,
@@ -406,18 +494,62 @@ class SqliteDataCache:
             ).fetchone()
         )
 
+        self._record_lookups(section, 1)
+
         if row is None:
             return None
 
         return CacheEntry(self, section, entry_name, row[0], meta_type, data_type)
 
+    def read_section_entries(
+        self,
+        section: CacheSection,
+        meta_type: Union[Type[_M], Tuple[Type[_M], ...]],
+        data_type: Union[Type[_D], Tuple[Type[_D], ...]],
+    ) -> List[CacheEntry[_M, _D]]:
+        """Read all entries of a section at once.
+
+        Meant for sections with small data blobs: in contrast to `read_entry` the data blobs are
+        read together with the meta blobs, but still only deserialized on first `.data` access.
+        """
+        rows = self._run(lambda: self._conn.execute(f"SELECT entry_name, meta, data FROM {section.value}").fetchall())
+        self._record_lookups(section, len(rows))
+
+        return [CacheEntry(self, section, row[0], row[1], meta_type, data_type, row[2]) for row in rows]
+
+    def read_section_data(self, section: CacheSection, data_type: Union[Type[_D], Tuple[Type[_D], ...]]) -> List[_D]:
+        """Read the data of all entries of a section, entries of another type are skipped."""
+        rows = self._run(lambda: self._conn.execute(f"SELECT entry_name, data FROM {section.value}").fetchall())
+        self._record_lookups(section, len(rows))
+
+        result: List[_D] = []
+        for row in rows:
+            self._record_hit(section, row[0], len(row[1]))
+            data = pickle.loads(row[1])
+            if isinstance(data, data_type):
+                result.append(data)
+        return result
+
     def _fetch_data(self, section: CacheSection, entry_name: str) -> Optional[Any]:
-        return self._run(
+        row = self._run(
             lambda: self._conn.execute(
                 f"SELECT data FROM {section.value} WHERE entry_name = ?",
                 (entry_name,),
             ).fetchone()
         )
+        if row is not None:
+            self._record_hit(section, entry_name, len(row[0]))
+        return row
+
+    def read_raw_entry(self, section: CacheSection, entry_name: str) -> Optional[Tuple[Optional[bytes], bytes]]:
+        """Read the serialized meta and data of an entry without deserializing them or counting a lookup."""
+        row = self._run(
+            lambda: self._conn.execute(
+                f"SELECT meta, data FROM {section.value} WHERE entry_name = ?",
+                (entry_name,),
+            ).fetchone()
+        )
+        return (row[0], row[1]) if row is not None else None
 
     def save_entry(
         self,
@@ -429,19 +561,185 @@ class SqliteDataCache:
         meta_blob = pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL) if meta is not None else None
         data_blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
+        size = len(meta_blob or b"") + len(data_blob)
+
         def op() -> None:
             self._conn.execute(
-                f"INSERT INTO {section.value} (entry_name, meta, data)"
-                f" VALUES (?, ?, ?)"
+                f"INSERT INTO {section.value} (entry_name, meta, data, size, accessed_at)"
+                f" VALUES (?, ?, ?, ?, ?)"
                 f" ON CONFLICT(entry_name) DO UPDATE SET"
-                f" meta = excluded.meta, data = excluded.data, modified_at = CURRENT_TIMESTAMP",
-                (entry_name, meta_blob, data_blob),
+                f" meta = excluded.meta, data = excluded.data, size = excluded.size,"
+                f" modified_at = CURRENT_TIMESTAMP, accessed_at = excluded.accessed_at",
+                (entry_name, meta_blob, data_blob, size, time.time_ns()),
             )
             self._conn.commit()
 
         self._run(op)
+        self._schedule_maintenance()
+
+    def remove_entry(self, section: CacheSection, entry_name: str) -> None:
+        def op() -> None:
+            self._conn.execute(f"DELETE FROM {section.value} WHERE entry_name = ?", (entry_name,))
+            self._conn.commit()
+
+        self._run(op)
+
+    def _record_lookups(self, section: CacheSection, count: int) -> None:
+        with self._pending_lock:
+            self._pending_stats.setdefault(section, [0, 0, 0])[0] += count
+
+    def _record_hit(self, section: CacheSection, entry_name: str, data_bytes: int) -> None:
+        with self._pending_lock:
+            stats = self._pending_stats.setdefault(section, [0, 0, 0])
+            stats[1] += 1
+            stats[2] += data_bytes
+            self._pending_access[(section, entry_name)] = time.time_ns()
+            self._pending_count += 1
+
+            flush = not self._closed and (
+                self._pending_count >= _ACCESS_FLUSH_COUNT
+                or time.monotonic() - self._last_flush >= _ACCESS_FLUSH_INTERVAL
+            )
+
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the collected access times and statistics to the database."""
+        with self._pending_lock:
+            access, self._pending_access = self._pending_access, {}
+            stats, self._pending_stats = self._pending_stats, {}
+            self._pending_count = 0
+            self._last_flush = time.monotonic()
+
+        if not access and not stats:
+            return
+
+        def op() -> None:
+            by_section: Dict[CacheSection, List[Tuple[int, str]]] = {}
+            for (section, entry_name), accessed_at in access.items():
+                by_section.setdefault(section, []).append((accessed_at, entry_name))
+
+            for section, rows in by_section.items():
+                self._conn.executemany(f"UPDATE {section.value} SET accessed_at = ? WHERE entry_name = ?", rows)
+
+            self._conn.executemany(
+                "INSERT INTO _stats (section, lookups, hits, bytes_saved) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(section) DO UPDATE SET"
+                " lookups = lookups + excluded.lookups, hits = hits + excluded.hits,"
+                " bytes_saved = bytes_saved + excluded.bytes_saved",
+                [(section.value, *values) for section, values in stats.items()],
+            )
+            self._conn.commit()
+
+        self._run(op)
+
+    def section_budget(self, section: CacheSection) -> Optional[int]:
+        """The maximum size in bytes of the entries of a section, ``None`` if the section is not limited."""
+        share = _SECTION_BUDGET_SHARES.get(section)
+        if self.max_size is None or share is None:
+            return None
+        return int(self.max_size * share)
+
+    def _schedule_maintenance(self) -> None:
+        if self.max_size is None:
+            return
+
+        with self._pending_lock:
+            if self._closed or self._maintenance_timer is not None:
+                return
+
+            self._maintenance_timer = threading.Timer(_MAINTENANCE_DELAY, self._run_maintenance)
+            self._maintenance_timer.daemon = True
+            self._maintenance_timer.start()
+
+    def _run_maintenance(self) -> None:
+        with self._pending_lock:
+            self._maintenance_timer = None
+            if self._closed:
+                return
+
+        try:
+            self.maintain()
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Cache maintenance of {self.db_path} failed: {ex}", context_name="cache")
+
+    def maintain(self) -> int:
+        """Enforce the section budgets and release free pages. Returns the number of evicted entries."""
+        self.flush()
+
+        evicted = 0
+        for section in CacheSection:
+            budget = self.section_budget(section)
+            if budget is not None:
+                evicted += self._evict(section, budget)
+
+        self._incremental_vacuum()
+
+        if evicted:
+            self._logger.debug(lambda: f"Evicted {evicted} entries from {self.db_path}", context_name="cache")
+
+        return evicted
+
+    def _evict(self, section: CacheSection, budget: int) -> int:
+        """Remove the least recently used entries of a section until it fits in its budget."""
+
+        def op() -> int:
+            total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {section.value}").fetchone()[0]
+            if total <= budget:
+                return 0
+
+            to_free = total - int(budget * _EVICTION_LOW_WATERMARK)
+            victims: List[Tuple[str]] = []
+            freed = 0
+            for entry_name, size in self._conn.execute(
+                f"SELECT entry_name, size FROM {section.value} ORDER BY accessed_at, modified_at"
+            ):
+                if freed >= to_free:
+                    break
+                victims.append((entry_name,))
+                freed += size
+
+            self._conn.executemany(f"DELETE FROM {section.value} WHERE entry_name = ?", victims)
+            self._conn.execute(
+                "INSERT INTO _stats (section, evictions, evicted_bytes) VALUES (?, ?, ?)"
+                " ON CONFLICT(section) DO UPDATE SET"
+                " evictions = evictions + excluded.evictions, evicted_bytes = evicted_bytes + excluded.evicted_bytes",
+                (section.value, len(victims), freed),
+            )
+            self._conn.commit()
+            return len(victims)
+
+        return self._run(op)
+
+    def _incremental_vacuum(self) -> None:
+        def step() -> bool:
+            if self._conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return False
+            if not self._conn.execute("PRAGMA freelist_count").fetchone()[0]:
+                return False
+            self._conn.execute(f"PRAGMA incremental_vacuum({_VACUUM_STEP_PAGES})").fetchall()
+            self._conn.commit()
+            return True
+
+        while self._run(step):
+            pass
 
     def close(self) -> None:
+        with self._pending_lock:
+            self._closed = True
+            timer, self._maintenance_timer = self._maintenance_timer, None
+        if timer is not None:
+            timer.cancel()
+
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
         with self._lock:
             self._conn.close()
             fd, self._lock_fd = self._lock_fd, None
@@ -457,22 +755,37 @@ class SqliteDataCache:
         return row[0] if row else None
 
     def get_section_stats(self, section: CacheSection) -> "SectionStats":
+        self.flush()
+
         row = self._run(
             lambda: self._conn.execute(
                 f"SELECT COUNT(*),"
-                f" COALESCE(SUM(LENGTH(meta) + LENGTH(data)), 0),"
+                f" COALESCE(SUM(COALESCE(LENGTH(meta), 0) + LENGTH(data)), 0),"
                 f" MIN(created_at),"
                 f" MAX(modified_at)"
                 f" FROM {section.value}",
             ).fetchone()
         )
         assert row is not None
+        stats_row = self._run(
+            lambda: self._conn.execute(
+                "SELECT lookups, hits, bytes_saved, evictions, evicted_bytes FROM _stats WHERE section = ?",
+                (section.value,),
+            ).fetchone()
+        )
+        lookups, hits, bytes_saved, evictions, evicted_bytes = stats_row or (0, 0, 0, 0, 0)
         return SectionStats(
             section=section,
             entry_count=row[0],
             total_blob_bytes=row[1],
             oldest_created=row[2],
             newest_modified=row[3],
+            lookups=lookups,
+            hits=hits,
+            bytes_saved=bytes_saved,
+            evictions=evictions,
+            evicted_bytes=evicted_bytes,
+            budget=self.section_budget(section),
         )
 
     def list_entries(self, section: CacheSection) -> List["EntryInfo"]:
@@ -522,6 +835,16 @@ class SectionStats:
     total_blob_bytes: int
     oldest_created: Optional[str]
     newest_modified: Optional[str]
+    lookups: int = 0
+    hits: int = 0
+    bytes_saved: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+    budget: Optional[int] = None
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        return min(self.hits / self.lookups, 1.0) if self.lookups else None
 
 
 @dataclass
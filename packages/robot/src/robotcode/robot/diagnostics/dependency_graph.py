@@ -0,0 +1,91 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
+
+from robotcode.core.utils.path import normalized_path
+
+from .data_cache import CacheSection, SqliteDataCache
+from .imports_manager import LibraryMetaData, RobotFileMeta
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentDependencies:
+    """Files a document depends on, directly or through the resources it imports.
+
+    Stored in the DEPENDENCIES cache section, together with the namespace of
+    the document. Built from the dependency metas of the namespace, so it
+    contains the same resource, library and variables files whose freshness
+    is checked before a cached namespace is used.
+    """
+
+    source: str
+    files: FrozenSet[str]
+
+    @classmethod
+    def from_dependency_metas(
+        cls, source: str, dependency_metas: Mapping[str, Optional[Any]]
+    ) -> "DocumentDependencies":
+        files: Set[str] = set()
+
+        for key, meta in dependency_metas.items():
+            if key.startswith("res:"):
+                files.add(key[4:])
+
+            if isinstance(meta, RobotFileMeta):
+                files.add(meta.source)
+            elif isinstance(meta, LibraryMetaData):
+                if meta.origin is not None:
+                    files.add(meta.origin)
+                if meta.file_infos:
+                    files.update(meta.file_infos)
+
+        return cls(str(normalized_path(source)), frozenset(str(normalized_path(f)) for f in files))
+
+
+class DependencyGraph:
+    """Reverse dependency graph of the documents in the analysis cache.
+
+    Maps every resource, library and variables file to the documents that
+    import it, directly or transitively. Only documents whose namespace was
+    stored in the cache are known to the graph.
+    """
+
+    def __init__(self, entries: Iterable[DocumentDependencies] = ()) -> None:
+        self._documents: Set[str] = set()
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+
+        for entry in entries:
+            self._documents.add(entry.source)
+            for file in entry.files:
+                self._dependents[file].add(entry.source)
+
+    @classmethod
+    def load(cls, data_cache: SqliteDataCache) -> "DependencyGraph":
+        return cls(data_cache.read_section_data(CacheSection.DEPENDENCIES, DocumentDependencies))
+
+    def __contains__(self, source: object) -> bool:
+        return isinstance(source, str) and source in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def dependents(self, file: str) -> List[str]:
+        """Documents that import ``file``, directly or transitively."""
+        return sorted(self._dependents.get(file, ()))
+
+    def affected_documents(self, changed_files: Iterable[str]) -> Set[str]:
+        """The changed files and all documents depending on one of them.
+
+        Paths are normalized before the lookup, the result contains normalized paths.
+        """
+        result: Set[str] = set()
+
+        pending = [str(normalized_path(f)) for f in changed_files]
+        while pending:
+            file = pending.pop()
+            if file in result:
+                continue
+            result.add(file)
+            pending.extend(self._dependents.get(file, ()))
+
+        return result
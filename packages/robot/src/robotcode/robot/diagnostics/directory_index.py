@@ -0,0 +1,86 @@
+"""Cached directory listings for the completion of library, resource and variables imports.
+
+Import completion lists the directories of ``sys.path`` and the directory
+of the document on every request. A listing is cached until the
+modification time of its directory changes or a file event for the
+directory is reported, so a request only costs one ``stat`` per directory.
+"""
+
+import os
+import threading
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, NamedTuple, Tuple, Union
+
+
+class DirectoryEntry(NamedTuple):
+    name: str
+    is_dir: bool
+    is_file: bool
+    suffix: str
+    stem: str
+
+
+def _is_dir(entry: "os.DirEntry[str]") -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_file(entry: "os.DirEntry[str]") -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _entry(entry: "os.DirEntry[str]") -> DirectoryEntry:
+    path = PurePath(entry.name)
+    return DirectoryEntry(entry.name, _is_dir(entry), _is_file(entry), path.suffix, path.stem)
+
+
+def list_directory(path: Union[str, "os.PathLike[str]"]) -> Tuple[DirectoryEntry, ...]:
+    """List a directory, an empty tuple is returned if it does not exist or is not readable."""
+    try:
+        with os.scandir(path) as it:
+            return tuple(sorted(_entry(e) for e in it))
+    except OSError:
+        return ()
+
+
+class DirectoryIndex:
+    """Caches directory listings, validated by the modification time of the directory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[int, Tuple[DirectoryEntry, ...]]] = {}
+
+    def list_directory(self, path: Union[str, "os.PathLike[str]"]) -> Tuple[DirectoryEntry, ...]:
+        key = os.fspath(path)
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            self.invalidate([key])
+            return ()
+
+        with self._lock:
+            cached = self._listings.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        result = list_directory(key)
+        with self._lock:
+            self._listings[key] = (mtime, result)
+        return result
+
+    def invalidate(self, paths: Iterable[Union[str, "os.PathLike[str]"]]) -> None:
+        """Forget the listings of the given paths and of the directories containing them."""
+        with self._lock:
+            for path in paths:
+                key = os.fspath(path)
+                self._listings.pop(key, None)
+                self._listings.pop(os.fspath(Path(key).parent), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
@@ -8,6 +8,8 @@ from logging import CRITICAL
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -21,10 +23,11 @@ from robot.parsing.lexer.tokens import Token
 from robotcode.core.documents_manager import DocumentsManager
 from robotcode.core.event import event
 from robotcode.core.filewatcher import FileWatcherManagerBase
+from robotcode.core.lsp.types import Diagnostic
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
-from robotcode.core.utils.path import DiskInfo
+from robotcode.core.utils.path import DiskInfo, probe_disk_info
 from robotcode.core.workspace import Workspace, WorkspaceFolder
 from robotcode.robot.diagnostics.diagnostics_modifier import (
     DiagnosticModifiersConfig,
@@ -36,7 +39,9 @@ from ..config.model import RobotBaseProfile
 from ..utils import RF_VERSION
 from ..utils.stubs import Languages
 from .data_cache import CacheSection
+from .dependency_graph import DependencyGraph, DocumentDependencies
 from .imports_manager import ImportsManager, NamespaceMetaData
+from .incremental_parser import IncrementalParser
 from .library_doc import LibraryDoc
 from .namespace import (
     DocumentType,
@@ -44,7 +49,7 @@ from .namespace import (
     NamespaceBuilder,
     NamespaceData,
 )
-from .project_index import ProjectIndex
+from .project_index import FileReferences, ProjectIndex
 from .workspace_config import (
     AnalysisDiagnosticModifiersConfig,
     AnalysisRobotConfig,
@@ -105,6 +110,8 @@ class DocumentsCacheHelper:
         self._project_indexes_lock = threading.RLock()
         self._project_indexes: weakref.WeakKeyDictionary[WorkspaceFolder, ProjectIndex] = weakref.WeakKeyDictionary()
         self._default_project_index: Optional[ProjectIndex] = None
+        self._incremental_parsers: Dict[DocumentType, IncrementalParser] = {}
+        self._incremental_parsers_lock = threading.RLock()
 
     def get_project_index(self, document: TextDocument) -> ProjectIndex:
         return self.get_project_index_for_uri(document.uri)
@@ -121,9 +128,58 @@ class DocumentsCacheHelper:
 
         with self._project_indexes_lock:
             if folder not in self._project_indexes:
-                self._project_indexes[folder] = ProjectIndex()
+                index = ProjectIndex()
+                if self.analysis_config.cache.cache_namespaces:
+                    self._load_cached_project_index(index, self.get_imports_manager_for_workspace_folder(folder))
+                self._project_indexes[folder] = index
             return self._project_indexes[folder]
 
+    def _load_cached_project_index(self, index: ProjectIndex, imports_manager: ImportsManager) -> None:
+        """Load the persisted references of all files whose cached analysis is still fresh.
+
+        Stale files are skipped, they are merged into the index when they are analyzed again.
+        """
+        try:
+            entries = imports_manager.data_cache.read_section_entries(
+                CacheSection.PROJECT_INDEX, NamespaceMetaData, FileReferences
+            )
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(lambda: f"Failed to read project index cache: {ex}", context_name="cache")
+            return
+
+        # an opened document is analyzed from its buffer, not from the disk state
+        opened = {str(d.uri.to_path()) for d in list(self.documents_manager.documents) if d.version is not None}
+
+        def fresh_files() -> Iterator[Tuple[str, FileReferences]]:
+            for entry in entries:
+                try:
+                    meta = entry.meta
+                    if meta is None or entry.entry_name in opened:
+                        continue
+
+                    if not imports_manager.validate_namespace_meta(meta, probe_disk_info(meta.source)):
+                        continue
+
+                    yield entry.entry_name, entry.data
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as e:
+                    ex = e
+                    self._logger.debug(
+                        lambda: f"Failed to load project index cache entry {entry.entry_name}: {ex}",
+                        context_name="cache",
+                    )
+
+        loaded = index.load_cached_files(list(fresh_files()))
+
+        self._logger.debug(
+            lambda: f"Loaded references of {loaded} of {len(entries)} files from the project index cache",
+            context_name="cache",
+        )
+
     def default_project_index(self) -> ProjectIndex:
         with self._project_indexes_lock:
             if self._default_project_index is None:
@@ -289,20 +345,48 @@ class DocumentsCacheHelper:
 
         return robot.api.get_init_tokens(source, data_only=False, tokenize_variables=tokenize_variables)
 
-    def __get_general_tokens(self, document: TextDocument) -> List[Token]:
+    def __get_tokenizer(self, document_type: DocumentType) -> Callable[..., Any]:
+        if document_type == DocumentType.INIT:
+            return self.__internal_get_init_tokens
+        if document_type == DocumentType.RESOURCE:
+            return self.__internal_get_resource_tokens
+
+        return self.__internal_get_tokens
+
+    def __get_incremental_parser(self, document_type: DocumentType) -> IncrementalParser:
+        with self._incremental_parsers_lock:
+            if document_type not in self._incremental_parsers:
+                tokenize = self.__get_tokenizer(document_type)
+
+                self._incremental_parsers[document_type] = IncrementalParser(
+                    lambda source, lang: tokenize(source, lang=lang),
+                    lambda document, tokens: self.__get_model(document, tokens, document_type),
+                )
+
+            return self._incremental_parsers[document_type]
+
+    def __get_full_tokens(self, document: TextDocument, document_type: DocumentType) -> List[Token]:
         lang = self.get_languages_for_document(document)
         with io.StringIO(document.text()) as content:
-            return [e for e in self.__internal_get_tokens(content, lang=lang)]
+            return [e for e in self.__get_tokenizer(document_type)(content, lang=lang)]
+
+    def __get_tokens(self, document: TextDocument, document_type: DocumentType) -> List[Token]:
+        # only documents opened in an editor have a version and are changed incrementally
+        if document.version is None:
+            return self.__get_full_tokens(document, document_type)
+
+        return self.__get_incremental_parser(document_type).get_tokens(
+            document, self.get_languages_for_document(document)
+        )
+
+    def __get_general_tokens(self, document: TextDocument) -> List[Token]:
+        return self.__get_tokens(document, DocumentType.GENERAL)
 
     def __get_resource_tokens(self, document: TextDocument) -> List[Token]:
-        lang = self.get_languages_for_document(document)
-        with io.StringIO(document.text()) as content:
-            return [e for e in self.__internal_get_resource_tokens(content, lang=lang)]
+        return self.__get_tokens(document, DocumentType.RESOURCE)
 
     def __get_init_tokens(self, document: TextDocument) -> List[Token]:
-        lang = self.get_languages_for_document(document)
-        with io.StringIO(document.text()) as content:
-            return [e for e in self.__internal_get_init_tokens(content, lang=lang)]
+        return self.__get_tokens(document, DocumentType.INIT)
 
     def get_model(self, document: TextDocument) -> ast.AST:
         document_type = self.get_document_type(document)
@@ -325,13 +409,10 @@ class DocumentsCacheHelper:
         subsequent operations.
         """
         document_type = self.get_document_type(document)
+        if document_type not in (DocumentType.INIT, DocumentType.RESOURCE):
+            document_type = DocumentType.GENERAL
 
-        if document_type == DocumentType.INIT:
-            return self.__get_init_model(document)
-        if document_type == DocumentType.RESOURCE:
-            return self.__get_resource_model(document)
-
-        return self.__get_general_model(document)
+        return self.__get_model(document, self.__get_full_tokens(document, document_type), document_type)
 
     def __get_model(
         self,
@@ -356,6 +437,15 @@ class DocumentsCacheHelper:
 
         return cast(ast.AST, model)
 
+    def __get_parsed_model(self, document: TextDocument, document_type: DocumentType) -> ast.AST:
+        # only documents opened in an editor have a version and are changed incrementally
+        if document.version is None:
+            return self.__get_model(document, self.__get_full_tokens(document, document_type), document_type)
+
+        return self.__get_incremental_parser(document_type).get_model(
+            document, self.get_languages_for_document(document)
+        )
+
     def get_general_model(self, document: TextDocument) -> ast.AST:
         if document.version is None:
             return self.__get_general_model(document)
@@ -363,7 +453,7 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_general_model)
 
     def __get_general_model(self, document: TextDocument) -> ast.AST:
-        return self.__get_model(document, self.__get_general_tokens(document), DocumentType.GENERAL)
+        return self.__get_parsed_model(document, DocumentType.GENERAL)
 
     def get_resource_model(self, document: TextDocument) -> ast.AST:
         if document.version is None:
@@ -372,7 +462,7 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_resource_model)
 
     def __get_resource_model(self, document: TextDocument) -> ast.AST:
-        return self.__get_model(document, self.__get_resource_tokens(document), DocumentType.RESOURCE)
+        return self.__get_parsed_model(document, DocumentType.RESOURCE)
 
     def get_init_model(self, document: TextDocument) -> ast.AST:
         if document.version is None:
@@ -381,7 +471,7 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_init_model)
 
     def __get_init_model(self, document: TextDocument) -> ast.AST:
-        return self.__get_model(document, self.__get_init_tokens(document), DocumentType.INIT)
+        return self.__get_parsed_model(document, DocumentType.INIT)
 
     def get_namespace(self, document: TextDocument) -> Namespace:
         document_type = self.get_document_type(document)
@@ -505,6 +595,8 @@ class DocumentsCacheHelper:
             self._save_namespace_to_cache(
                 source, document, document_type, result, imports_manager, disk_info, semantic_model_enabled
             )
+        elif cache_namespaces and document.version is None:
+            self._remove_cached_dependencies(source, imports_manager)
 
         # Update the folder-scoped reference index
         self.get_project_index(document).update_file(result.source, result)
@@ -659,6 +751,7 @@ class DocumentsCacheHelper:
                     lambda: f"Skip caching namespace for {source}: state not trustworthy",
                     context_name="cache",
                 )
+                self._remove_cached_dependencies(source, imports_manager)
                 return
 
             data = namespace.to_data()
@@ -673,6 +766,15 @@ class DocumentsCacheHelper:
                 return
 
             data_cache = imports_manager.data_cache
+            # dependencies first: a namespace entry without dependencies would hide its
+            # document from the dependency graph
+            data_cache.save_entry(
+                CacheSection.DEPENDENCIES,
+                source,
+                None,
+                DocumentDependencies.from_dependency_metas(source, meta.dependency_fingerprints),
+            )
+            data_cache.save_entry(CacheSection.PROJECT_INDEX, source, meta, FileReferences.from_namespace(namespace))
             data_cache.save_entry(CacheSection.NAMESPACE, _namespace_cache_key(source, document_type), meta, data)
         except (SystemExit, KeyboardInterrupt):
             raise
@@ -683,6 +785,70 @@ class DocumentsCacheHelper:
                 context_name="import",
             )
 
+    def _remove_cached_dependencies(self, source: str, imports_manager: ImportsManager) -> None:
+        """Remove the document from the dependency graph.
+
+        Called when the on-disk content was analyzed but the result could not be
+        cached: a cached namespace from an earlier analysis may be outdated
+        now, without its dependencies the document is always analyzed again in
+        a changed-files run.
+        """
+        try:
+            imports_manager.data_cache.remove_entry(CacheSection.DEPENDENCIES, source)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(
+                lambda: f"Failed to remove cached dependencies for {source}: {ex}",
+                context_name="cache",
+            )
+
+    def get_cached_namespace_diagnostics(self, document: TextDocument) -> Optional[List[Diagnostic]]:
+        """Diagnostics of the namespace stored in the disk cache for ``document``, without building it.
+
+        The entry is validated like in `get_namespace`: the source on disk and
+        all dependencies must be unchanged and the configuration must match.
+        Returns ``None`` if there is no usable entry, the document must then be
+        analyzed.
+        """
+        if not self.analysis_config.cache.cache_namespaces or document.version is not None:
+            return None
+
+        source = str(document.uri.to_path())
+        imports_manager = self.get_imports_manager(document)
+
+        try:
+            entry = imports_manager.data_cache.read_entry(
+                CacheSection.NAMESPACE,
+                _namespace_cache_key(source, self.get_document_type(document)),
+                NamespaceMetaData,
+                NamespaceData,
+            )
+            meta = entry.meta if entry is not None else None
+            if (
+                entry is None
+                or meta is None
+                or meta.semantic_model_enabled != self._is_semantic_model_enabled(document)
+                or not imports_manager.validate_namespace_meta(meta, probe_disk_info(source))
+            ):
+                return None
+
+            return entry.data.diagnostics
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            ex = e
+            self._logger.debug(
+                lambda: f"Failed to read cached diagnostics for {source}: {ex}",
+                context_name="cache",
+            )
+            return None
+
+    def get_dependency_graph(self, folder: Optional[WorkspaceFolder]) -> DependencyGraph:
+        """The dependency graph of all documents of ``folder`` stored in the disk cache."""
+        return DependencyGraph.load(self.get_imports_manager_for_workspace_folder(folder).data_cache)
+
     def create_imports_manager(self, root_uri: Uri) -> ImportsManager:
         cache_base_path = self.calc_cache_path(root_uri)
 
@@ -721,6 +887,19 @@ class DocumentsCacheHelper:
                 if analysis_config.load_library_timeout is not None
                 else self.analysis_config.robot.load_library_timeout
             ),
+            library_workers=(
+                analysis_config.library_workers
+                if analysis_config.library_workers is not None
+                else self.analysis_config.robot.library_workers
+            ),
+            library_worker_max_imports=(
+                analysis_config.library_worker_max_imports
+                if analysis_config.library_worker_max_imports is not None
+                else self.analysis_config.robot.library_worker_max_imports
+            ),
+            cache_max_size=(
+                cache_config.max_size if cache_config.max_size is not None else self.analysis_config.cache.max_size
+            ),
         )
 
         result.libraries_changed.add(self._on_libraries_changed)
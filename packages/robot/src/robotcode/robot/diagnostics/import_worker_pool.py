@@ -0,0 +1,374 @@
+import importlib
+import importlib.machinery
+import multiprocessing as mp
+import multiprocessing.util
+import os
+import sys
+import sysconfig
+import threading
+import weakref
+from concurrent.futures import TimeoutError
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from robotcode.core.utils.logging import LoggingDescriptor
+
+DEFAULT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 1) // 2))
+DEFAULT_MAX_IMPORTS_PER_WORKER = 50
+
+# Modules imported once per worker before it accepts work. They are part of the
+# baseline and therefore survive the per-task ``sys.modules`` cleanup.
+PRELOAD_MODULES: Tuple[str, ...] = (
+    "robot.running",
+    "robot.libdocpkg",
+    "robot.libraries.BuiltIn",
+    "robot.libraries.Collections",
+    "robot.libraries.DateTime",
+    "robot.libraries.OperatingSystem",
+    "robot.libraries.Process",
+    "robot.libraries.String",
+    "robot.libraries.XML",
+    "robotcode.robot.diagnostics.library_doc",
+)
+
+_READY = "ready"
+
+_STDLIB_PATHS = tuple({sysconfig.get_path("stdlib"), sysconfig.get_path("platstdlib")})
+
+_pools: "weakref.WeakSet[ImportWorkerPool]" = weakref.WeakSet()
+
+
+def _shutdown_pools() -> None:
+    for pool in list(_pools):
+        pool.shutdown()
+
+
+# multiprocessing joins all non-daemonic children at exit, also when this process is itself a multiprocessing
+# child. Its finalizers with a priority run before that join, otherwise idle workers would block the shutdown.
+multiprocessing.util.Finalize(None, _shutdown_pools, exitpriority=10)
+
+
+@dataclass
+class _WorkerBaseline:
+    modules: Set[str]
+    path: List[str]
+    cwd: str
+    environ: Dict[str, str]
+
+    @classmethod
+    def capture(cls) -> "_WorkerBaseline":
+        return cls(set(sys.modules), list(sys.path), os.getcwd(), dict(os.environ))
+
+    def restore(self) -> bool:
+        """Reset the interpreter to the baseline and report if it could not be fully cleaned.
+
+        Pure python modules imported by a task are simply dropped from ``sys.modules``
+        so the next import reads them fresh from disk. Native extensions outside the
+        standard library cannot be unloaded and baseline modules that disappeared
+        cannot be restored, in both cases the worker is reported as polluted and
+        must be retired.
+        """
+        polluted = not self.modules.issubset(sys.modules)
+
+        for name in [n for n in sys.modules if n not in self.modules]:
+            module = sys.modules.pop(name, None)
+            module_file = getattr(module, "__file__", None)
+            if (
+                module_file
+                and module_file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+                and not module_file.startswith(_STDLIB_PATHS)
+            ):
+                polluted = True
+
+        sys.path[:] = self.path
+
+        try:
+            os.chdir(self.cwd)
+        except OSError:
+            polluted = True
+
+        if os.environ != self.environ:
+            os.environ.clear()
+            os.environ.update(self.environ)
+
+        importlib.invalidate_caches()
+
+        return polluted
+
+
+def _worker_main(conn: Connection, preload: Tuple[str, ...]) -> None:
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            pass
+
+    baseline = _WorkerBaseline.capture()
+
+    try:
+        conn.send(_READY)
+    except (EOFError, OSError):
+        return
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if request is None:
+            break
+
+        # modules needed to unpickle the request belong to the worker, not to the task
+        baseline.modules.update(sys.modules)
+
+        func, args = request
+        try:
+            ok, value = True, func(*args)
+        except BaseException as e:
+            ok, value = False, e
+
+        polluted = baseline.restore() or (not ok and isinstance(value, (SystemExit, KeyboardInterrupt)))
+
+        try:
+            conn.send((ok, value, polluted))
+        except (EOFError, OSError):
+            break
+        except BaseException as e:
+            conn.send((False, RuntimeError(f"Cannot transfer result from worker process: {e}"), polluted))
+
+
+@dataclass
+class ImportWorkerPoolStats:
+    spawned: int = 0
+    reused: int = 0
+    recycled: int = 0
+    killed: int = 0
+
+    def __str__(self) -> str:
+        return f"spawned={self.spawned}, reused={self.reused}, recycled={self.recycled}, killed={self.killed}"
+
+
+class _ImportWorker:
+    def __init__(self, ctx: Any, preload: Tuple[str, ...], generation: int) -> None:
+        self.generation = generation
+        self.imports = 0
+        self.ready = False
+
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, preload),
+            name="robotcode-import-worker",
+        )
+        self.process.start()
+        child_conn.close()
+
+    def _recv(self, timeout: float) -> Any:
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.process.join(1)
+            raise RuntimeError(
+                f"Import worker process terminated unexpectedly (exit code {self.process.exitcode})."
+            ) from e
+
+    def wait_ready(self, timeout: float) -> None:
+        if not self.ready:
+            self._recv(timeout)
+            self.ready = True
+
+    def call(self, func: Callable[..., Any], args: Tuple[Any, ...], timeout: float) -> Tuple[bool, Any, bool]:
+        self.conn.send((func, args))
+        self.imports += 1
+        return self._recv(timeout)  # type: ignore[no-any-return]
+
+    def stop(self, kill: bool = False) -> None:
+        if not kill:
+            try:
+                self.conn.send(None)
+            except (EOFError, OSError):
+                pass
+
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+        if not kill:
+            self.process.join(1)
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(1)
+
+
+class ImportWorkerPool:
+    """Pool of warm, reusable worker processes for library and variables introspection.
+
+    Every worker is spawned with Robot Framework and the common standard libraries
+    already imported. After each task the worker drops all modules the task
+    imported and restores ``sys.path``, the working directory and the environment.
+    Workers are retired when they reached ``max_imports_per_worker``, when a task
+    left state behind that cannot be cleaned up (native extensions, ``SystemExit``,
+    ...) or when `recycle` was called, e.g. because a watched library file changed.
+    Up to ``max_workers`` tasks run concurrently, a retired worker is replaced in
+    the background so that the next task finds a warm one.
+    """
+
+    _logger = LoggingDescriptor()
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_imports_per_worker: Optional[int] = None,
+        preload: Tuple[str, ...] = PRELOAD_MODULES,
+    ) -> None:
+        self.max_workers = max(1, max_workers if max_workers is not None else DEFAULT_MAX_WORKERS)
+        self.max_imports_per_worker = max(
+            1, max_imports_per_worker if max_imports_per_worker is not None else DEFAULT_MAX_IMPORTS_PER_WORKER
+        )
+        self.preload = preload
+        self.stats = ImportWorkerPoolStats()
+
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.RLock()
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._idle: List[_ImportWorker] = []
+        self._busy: Set[_ImportWorker] = set()
+        self._spawning = 0
+        self._generation = 0
+        self._closed = False
+
+        _pools.add(self)
+
+    def _spawn(self) -> _ImportWorker:
+        worker = _ImportWorker(self._ctx, self.preload, self._generation)
+        with self._lock:
+            self.stats.spawned += 1
+        return worker
+
+    def _warm_up(self) -> None:
+        try:
+            worker = self._spawn()
+        except BaseException as e:
+            self._logger.exception(e)
+            worker = None
+
+        with self._lock:
+            self._spawning -= 1
+            if worker is None:
+                return
+            if self._closed or worker.generation != self._generation:
+                worker.stop()
+                return
+            self._idle.append(worker)
+
+    def _schedule_warm_up(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.max_workers - len(self._idle) - len(self._busy) - self._spawning
+            for _ in range(missing):
+                self._spawning += 1
+                threading.Thread(target=self._warm_up, name="ImportWorkerPool.warm_up", daemon=True).start()
+
+    def _acquire(self) -> _ImportWorker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Import worker pool is closed.")
+
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.generation == self._generation and worker.process.is_alive():
+                    self._busy.add(worker)
+                    if worker.imports > 0:
+                        self.stats.reused += 1
+                    return worker
+                worker.stop(kill=not worker.process.is_alive())
+
+        worker = self._spawn()
+        with self._lock:
+            self._busy.add(worker)
+        return worker
+
+    def _release(self, worker: _ImportWorker, polluted: bool) -> None:
+        with self._lock:
+            self._busy.discard(worker)
+
+            if (
+                not self._closed
+                and not polluted
+                and worker.generation == self._generation
+                and worker.imports < self.max_imports_per_worker
+            ):
+                self._idle.append(worker)
+                return
+
+            self.stats.recycled += 1
+
+        self._logger.debug(
+            lambda: f"Retire import worker after {worker.imports} imports (polluted={polluted}), {self.stats}",
+            context_name="import",
+        )
+        worker.stop()
+
+    def _discard(self, worker: _ImportWorker) -> None:
+        with self._lock:
+            self._busy.discard(worker)
+            self.stats.killed += 1
+        worker.stop(kill=True)
+
+    def run(self, func: Callable[..., Any], args: Tuple[Any, ...], timeout: float) -> Any:
+        """Run ``func(*args)`` in a worker process and return its result.
+
+        Raises `concurrent.futures.TimeoutError` if the worker does not answer within
+        ``timeout`` seconds, the worker is killed in that case.
+        """
+        with self._slots:
+            worker = self._acquire()
+            try:
+                worker.wait_ready(timeout)
+                ok, value, polluted = worker.call(func, args, timeout)
+            except BaseException:
+                self._discard(worker)
+                raise
+            finally:
+                self._schedule_warm_up()
+
+            self._release(worker, polluted)
+
+        if not ok:
+            raise value
+        return value
+
+    def recycle(self) -> None:
+        """Retire all current workers, busy workers are retired as soon as their task is done."""
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self.stats.recycled += len(idle)
+
+        for worker in idle:
+            worker.stop()
+
+        if idle:
+            self._schedule_warm_up()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = [*self._idle, *self._busy]
+            self._idle.clear()
+            self._busy.clear()
+
+        for worker in workers:
+            worker.stop()
+
+        self._logger.debug(lambda: f"Import worker pool shut down, {self.stats}", context_name="import")
@@ -1,11 +1,10 @@
 import ast
-import multiprocessing as mp
 import os
 import threading
 import time
 import weakref
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
@@ -23,7 +22,7 @@ from typing import (
 from robot.errors import RobotError
 from robot.libraries import STDLIBS
 from robot.utils.text import split_args_from_name_or_path
-from robotcode.core.concurrent import RLock, run_as_task
+from robotcode.core.concurrent import RLock, TaskPriority, schedule_task
 from robotcode.core.documents_manager import DocumentsManager
 from robotcode.core.event import event
 from robotcode.core.filewatcher import FileWatcherEntry, FileWatcherManagerBase, FileWatcherManagerDummy
@@ -40,8 +39,8 @@ from robotcode.core.lsp.types import (
 )
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
-from robotcode.core.utils.caching import SimpleLRUCache
-from robotcode.core.utils.glob_path import Pattern
+from robotcode.core.utils.caching import CacheStats, SimpleLRUCache
+from robotcode.core.utils.glob_path import PatternSet
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.core.utils.path import (
     DiskInfo,
@@ -55,12 +54,14 @@ from ..__version__ import __version__
 from ..utils import RF_VERSION
 from ..utils.robot_path import find_file_ex
 from ..utils.variables import contains_variable
-from .data_cache import CACHE_DIR_NAME, CacheSection, build_cache_dir
+from .data_cache import CACHE_DIR_NAME, DEFAULT_CACHE_MAX_SIZE, CacheSection, build_cache_dir
 from .data_cache import SqliteDataCache as DefaultDataCache
+from .directory_index import DirectoryIndex
 from .entities import (
     CommandLineVariableDefinition,
     VariableDefinition,
 )
+from .import_worker_pool import ImportWorkerPool, ImportWorkerPoolStats
 from .library_doc import (
     ROBOT_LIBRARY_PACKAGE,
     CompleteResult,
@@ -100,7 +101,6 @@ REST_EXTENSIONS = (".rst", ".rest")
 
 DEFAULT_LOAD_LIBRARY_TIMEOUT: int = 10
 ENV_LOAD_LIBRARY_TIMEOUT_VAR = "ROBOTCODE_LOAD_LIBRARY_TIMEOUT"
-COMPLETE_LIBRARY_IMPORT_TIMEOUT = COMPLETE_RESOURCE_IMPORT_TIMEOUT = COMPLETE_VARIABLES_IMPORT_TIMEOUT = 5
 
 
 @dataclass(frozen=True, slots=True)
@@ -603,14 +603,11 @@ def _collect_library_file_infos(
 
 
 def _matches_any_pattern(
-    patterns: List[Pattern],
+    patterns: PatternSet,
     name: Optional[str],
     origin: Optional[str],
 ) -> bool:
-    return any(
-        (p.matches(name) if name is not None else False) or (p.matches(origin) if origin is not None else False)
-        for p in patterns
-    )
+    return (name is not None and patterns.matches(name)) or (origin is not None and patterns.matches(origin))
 
 
 @dataclass(slots=True)
@@ -668,6 +665,9 @@ class ImportsManager:
         global_library_search_order: List[str],
         cache_base_path: Optional[Path],
         load_library_timeout: Optional[int] = None,
+        library_workers: Optional[int] = None,
+        library_worker_max_imports: Optional[int] = None,
+        cache_max_size: Optional[int] = None,
     ) -> None:
         super().__init__()
 
@@ -689,18 +689,21 @@ class ImportsManager:
         self._logger.trace(lambda: f"use {cache_base_path} as base for caching")
 
         self.cache_path = cache_base_path / CACHE_DIR_NAME
+        if cache_max_size is None:
+            cache_max_size = DEFAULT_CACHE_MAX_SIZE
         self.data_cache = DefaultDataCache(
             build_cache_dir(cache_base_path),
             app_version=__version__,
+            max_size=cache_max_size * 1024 * 1024 if cache_max_size > 0 else None,
         )
         weakref.finalize(self, DefaultDataCache.close, self.data_cache)
 
         self.cmd_variables = variables
         self.cmd_variable_files = variable_files
 
-        self.ignored_libraries_patters = [Pattern(s) for s in ignored_libraries]
-        self.ignored_variables_patters = [Pattern(s) for s in ignored_variables]
-        self.ignore_arguments_for_library_patters = [Pattern(s) for s in ignore_arguments_for_library]
+        self.ignored_libraries_patters = PatternSet(ignored_libraries)
+        self.ignored_variables_patters = PatternSet(ignored_variables)
+        self.ignore_arguments_for_library_patters = PatternSet(ignore_arguments_for_library)
 
         self.global_library_search_order = global_library_search_order
 
@@ -744,13 +747,14 @@ class ImportsManager:
             languages_fingerprint,
         )
 
-        self._library_files_cache = SimpleLRUCache(2048)
-        self._resource_files_cache = SimpleLRUCache(2048)
-        self._variables_files_cache = SimpleLRUCache(2048)
+        self._library_files_cache = SimpleLRUCache(2048, name="library files")
+        self._resource_files_cache = SimpleLRUCache(2048, name="resource files")
+        self._variables_files_cache = SimpleLRUCache(2048, name="variables files")
         self._module_spec_cache: Dict[str, ModuleSpec] = {}
+        self._directory_index = DirectoryIndex()
 
-        self._executor_lock = RLock(default_timeout=120, name="ImportsManager._executor_lock")
-        self._executor: Optional[ProcessPoolExecutor] = None
+        self._worker_pool = ImportWorkerPool(library_workers, library_worker_max_imports)
+        weakref.finalize(self, ImportWorkerPool.shutdown, self._worker_pool)
 
         self._resource_document_changed_timer_lock = RLock(
             default_timeout=120, name="ImportsManager._resource_document_changed_timer_lock"
@@ -802,12 +806,18 @@ class ImportsManager:
             context_name="imports",
         )
 
-    @staticmethod
-    def _shutdown_executor(executor: ProcessPoolExecutor) -> None:
-        try:
-            executor.shutdown(wait=False)
-        except RuntimeError:
-            pass
+    @property
+    def import_worker_stats(self) -> ImportWorkerPoolStats:
+        """Spawn, reuse and recycle counters of the library/variables import worker pool."""
+        return self._worker_pool.stats
+
+    @property
+    def file_cache_stats(self) -> Dict[str, CacheStats]:
+        """Hit, miss and eviction counters of the caches used to find library, resource and variables files."""
+        return {
+            cache.name or "": cache.stats
+            for cache in (self._library_files_cache, self._resource_files_cache, self._variables_files_cache)
+        }
 
     @property
     def diagnostics(self) -> List[Diagnostic]:
@@ -1159,7 +1169,7 @@ class ImportsManager:
 
     @language_id("robotframework")
     def _on_possible_resource_document_modified(self, sender: Any, document: TextDocument) -> None:
-        run_as_task(self.__on_possible_resource_document_modified, sender, document)
+        schedule_task(TaskPriority.BACKGROUND, self.__on_possible_resource_document_modified, sender, document)
 
     def __on_possible_resource_document_modified(self, sender: Any, document: TextDocument) -> None:
         with self._resource_document_changed_timer_lock:
@@ -1222,6 +1232,8 @@ class ImportsManager:
 
         lib_doc: Optional[LibraryDoc]
 
+        self._directory_index.invalidate(Uri(change.uri).to_path() for change in changes)
+
         with self._libaries_lock:
             for l_key, l_entry in self._libaries.items():
                 lib_doc = None
@@ -1253,6 +1265,9 @@ class ImportsManager:
                 if result is not None:
                     variables_changed.append((v_key, result, lib_doc))
 
+        if libraries_changed or variables_changed:
+            self._worker_pool.recycle()
+
         if libraries_changed:
             for l, t, _ in libraries_changed:
                 if t == FileChangeType.DELETED:
@@ -1627,26 +1642,16 @@ class ImportsManager:
 
         return name
 
-    @property
-    def executor(self) -> ProcessPoolExecutor:
-        with self._executor_lock:
-            if self._executor is None:
-                self._executor = ProcessPoolExecutor(mp_context=mp.get_context("spawn"))
-                weakref.finalize(self, ImportsManager._shutdown_executor, self._executor)
-
-        return self._executor
-
     def _run_in_subprocess(self, func: Any, func_args: Tuple[Any, ...], timeout_msg: str) -> Any:
-        """Run a callable in a fresh single-use subprocess and return the result.
+        """Run a callable in a warm worker process of the import worker pool and return the result.
 
-        A fresh process per import is intentional: libraries and variable files
-        can pollute the interpreter (e.g. via sys.modules, global state, native
-        extensions) and cannot be safely re-imported after on-disk changes.
+        Libraries and variable files can pollute the interpreter (e.g. via sys.modules, global
+        state, native extensions) and cannot be safely re-imported after on-disk changes, so
+        the pool cleans up the worker after each import and retires it if that is not possible.
         """
-        executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
         try:
             try:
-                return executor.submit(func, *func_args).result(self.load_library_timeout)
+                return self._worker_pool.run(func, func_args, self.load_library_timeout)
             except TimeoutError as e:
                 raise RuntimeError(
                     f"{timeout_msg} "
@@ -1660,8 +1665,6 @@ class ImportsManager:
         except BaseException as e:
             self._logger.exception(e)
             raise
-        finally:
-            executor.shutdown(wait=True)
 
     def _save_import_cache(
         self,
@@ -2064,14 +2067,14 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> List[CompleteResult]:
-        return self.executor.submit(
-            complete_library_import,
+        return complete_library_import(
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_LIBRARY_IMPORT_TIMEOUT)
+            directory_index=self._directory_index,
+        )
 
     def complete_resource_import(
         self,
@@ -2079,14 +2082,14 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[CompleteResult]]:
-        return self.executor.submit(
-            complete_resource_import,
+        return complete_resource_import(
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_RESOURCE_IMPORT_TIMEOUT)
+            directory_index=self._directory_index,
+        )
 
     def complete_variables_import(
         self,
@@ -2094,14 +2097,14 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[CompleteResult]]:
-        return self.executor.submit(
-            complete_variables_import,
+        return complete_variables_import(
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_VARIABLES_IMPORT_TIMEOUT)
+            directory_index=self._directory_index,
+        )
 
     def resolve_variable(
         self,
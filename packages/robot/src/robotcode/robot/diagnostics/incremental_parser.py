@@ -0,0 +1,342 @@
+"""Incremental tokenizing and parsing of Robot Framework documents.
+
+A document is split into chunks: the implicit comment section, every section
+that contains no tests, tasks or keywords, the header part of test, task and
+keyword sections and every single test, task or keyword. The tokens and model
+nodes of a chunk are reused as long as its text and the text it depends on
+(the settings sections, which Robot Framework lexes first, and its section
+header) do not change, only the edited chunks are lexed and parsed again.
+"""
+
+import ast
+import io
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from robot.parsing.lexer.tokens import Token
+from robot.parsing.model.statements import Statement
+from robotcode.core.text_document import TextDocument
+from robotcode.core.utils.caching import SimpleLRUCache
+
+from ..utils.stubs import Languages
+
+TokenizeFunction = Callable[[io.StringIO, Optional[Languages]], Iterable[Token]]
+BuildModelFunction = Callable[[TextDocument, Iterable[Token]], ast.AST]
+
+_BLOCK_HEADERS = frozenset(
+    t for t in (Token.TESTCASE_HEADER, getattr(Token, "TASK_HEADER", None), Token.KEYWORD_HEADER) if t is not None
+)
+
+# a language configuration changes how the rest of the file is lexed
+_LANGUAGE_CONFIG = re.compile(r"^\s*language\s*:", re.IGNORECASE)
+
+# lines that start something else than a test, task or keyword: indented lines, comments and continuations
+_NO_BLOCK_START = frozenset(" \t#.")
+
+# the settings sections a chunk depends on and the header of its section, if the chunk does not start the section
+_Context = Tuple[str, str]
+
+
+class _Chunk:
+    __slots__ = ("context", "end", "model_parts", "moved_from", "start", "text", "tokens")
+
+    def __init__(self, context: _Context, text: str, start: int, end: int) -> None:
+        self.context = context
+        self.text = text
+        self.start = start
+        self.end = end
+        self.tokens: List[Token] = []
+        self.model_parts: Optional[List[Any]] = None
+        self.moved_from: Optional[_Chunk] = None
+
+
+class _State:
+    __slots__ = ("chunks", "lang_key", "lock")
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.lang_key: Any = None
+        self.chunks: Dict[Tuple[_Context, str], _Chunk] = {}
+
+
+def _lang_key(lang: Optional[Languages]) -> Any:
+    return tuple(type(v) for v in lang) if lang is not None else None
+
+
+def _moved_node(node: Any, tokens: Dict[int, Token]) -> Any:
+    """Copies a model node and replaces its tokens with the moved ones."""
+    result = ast.AST.__new__(type(node))
+    result.__dict__.update(node.__dict__)
+
+    if isinstance(node, Statement):
+        result.tokens = tuple(tokens.get(id(t), t) for t in node.tokens)
+        return result
+
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            setattr(result, field, [_moved_node(v, tokens) for v in value])
+        elif isinstance(value, ast.AST):
+            setattr(result, field, _moved_node(value, tokens))
+
+    return result
+
+
+def _mostly_missing(missing: List[_Chunk], sections: List[List[_Chunk]]) -> bool:
+    return len(missing) > 1 and len(missing) * 2 > sum(len(s) for s in sections)
+
+
+class IncrementalParser:
+    """Tokenizes and parses documents of one document type incrementally.
+
+    `tokenize` is the Robot Framework tokenizer for the document type and
+    `build_model` builds a model from tokens. Documents that can not be split
+    safely, like files in the pipe separated format or files with a language
+    configuration, are always tokenized and parsed completely.
+    """
+
+    def __init__(self, tokenize: TokenizeFunction, build_model: BuildModelFunction) -> None:
+        self._tokenize = tokenize
+        self._build_model = build_model
+        self._header_types = SimpleLRUCache(max_items=256)
+
+    def _get_state(self, document: TextDocument, lang: Optional[Languages]) -> _State:
+        state: Optional[_State] = document.get_data(self)
+        if state is None:
+            state = _State()
+            document.set_data(self, state)
+
+        lang_key = _lang_key(lang)
+        with state.lock:
+            if state.lang_key != lang_key:
+                state.lang_key = lang_key
+                state.chunks = {}
+
+        return state
+
+    def _lex(self, text: str, lang: Optional[Languages]) -> List[Token]:
+        with io.StringIO(text) as content:
+            return list(self._tokenize(content, lang))
+
+    def _get_header_type(self, line: str, lang: Optional[Languages]) -> Optional[str]:
+        def get(line: str, lang_key: Any) -> Optional[str]:
+            tokens = self._lex(line, lang)
+            return tokens[0].type if tokens else None
+
+        return self._header_types.get(get, line.rstrip(), _lang_key(lang))
+
+    def _split(self, lines: List[str], lang: Optional[Languages]) -> Optional[List[Tuple[Optional[str], List[int]]]]:
+        """Returns the sections as header type and the line numbers where a chunk starts.
+
+        The first section is the implicit comment section without a header. Returns `None` if
+        the document can not be split.
+        """
+        result: List[Tuple[Optional[str], List[int]]] = [(None, [0])]
+
+        for i, line in enumerate(lines):
+            first = line[:1]
+            if first == "|":
+                return None
+
+            if first == "*":
+                result.append((self._get_header_type(line, lang), [i]))
+            elif result[-1][0] is None:
+                if _LANGUAGE_CONFIG.match(line):
+                    return None
+            elif result[-1][0] in _BLOCK_HEADERS and first not in _NO_BLOCK_START and not line.isspace():
+                result[-1][1].append(i)
+
+        return result
+
+    def _update(self, document: TextDocument, state: _State, lang: Optional[Languages]) -> Optional[List[List[_Chunk]]]:
+        """Returns the chunks of the document grouped by section, or `None` if the document can not be split."""
+        lines = document.get_lines()
+
+        split = self._split(lines, lang)
+        if split is None:
+            return None
+
+        ends = [starts[0] for _, starts in split[1:]] + [len(lines)]
+
+        # settings sections are lexed before all other sections and are the context of every other section
+        all_settings = "".join(
+            line
+            for (header_type, starts), end in zip(split, ends)
+            if header_type == Token.SETTING_HEADER
+            for line in lines[starts[0] : end]
+        )
+
+        result: List[List[_Chunk]] = []
+        missing: List[_Chunk] = []
+        settings: List[str] = []
+
+        for (header_type, starts), section_end in zip(split, ends):
+            if header_type is None:
+                settings_text = ""
+            elif header_type == Token.SETTING_HEADER:
+                settings_text = "".join(settings)
+                settings.extend(lines[starts[0] : section_end])
+            else:
+                settings_text = all_settings
+
+            section: List[_Chunk] = []
+            for c, (start, end) in enumerate(zip(starts, [*starts[1:], section_end])):
+                if start == end:
+                    continue
+
+                context = (settings_text, lines[starts[0]] if c > 0 else "")
+                text = "".join(lines[start:end])
+
+                chunk = state.chunks.get((context, text))
+                if chunk is None or chunk.start != start:
+                    old_chunk = chunk
+                    chunk = _Chunk(context, text, start, end)
+
+                    if old_chunk is None:
+                        missing.append(chunk)
+                    else:
+                        offset = start - old_chunk.start
+                        chunk.tokens = [
+                            Token(t.type, t.value, t.lineno + offset, t.col_offset, t.error) for t in old_chunk.tokens
+                        ]
+                        if old_chunk.model_parts is not None:
+                            chunk.moved_from = old_chunk
+
+                section.append(chunk)
+
+            if section:
+                result.append(section)
+
+        if _mostly_missing(missing, result):
+            self._lex_document(document, lang, result)
+        else:
+            for chunk in missing:
+                self._lex_chunk(chunk, lang)
+
+        state.chunks = {(chunk.context, chunk.text): chunk for section in result for chunk in section}
+
+        return result
+
+    def _lex_chunk(self, chunk: _Chunk, lang: Optional[Languages]) -> None:
+        # the last settings section can be at the end of the document without a line break
+        context_text = "".join(p if not p or p.endswith("\n") else p + "\n" for p in chunk.context)
+        context_lines = len(context_text.splitlines())
+        offset = chunk.start - context_lines
+
+        tokens = [t for t in self._lex(context_text + chunk.text, lang) if t.lineno > context_lines]
+        if offset:
+            for t in tokens:
+                t.lineno += offset
+
+        chunk.tokens = tokens
+
+    def _lex_document(self, document: TextDocument, lang: Optional[Languages], sections: List[List[_Chunk]]) -> None:
+        """Lexes the whole document at once and distributes the tokens to the chunks that have none."""
+        tokens = iter(self._lex(document.text(), lang))
+        token = next(tokens, None)
+
+        for chunk in (c for s in sections for c in s):
+            chunk_tokens: List[Token] = []
+            while token is not None and token.lineno <= chunk.end:
+                chunk_tokens.append(token)
+                token = next(tokens, None)
+
+            if not chunk.tokens:
+                chunk.tokens = chunk_tokens
+
+    def get_tokens(self, document: TextDocument, lang: Optional[Languages]) -> List[Token]:
+        state = self._get_state(document, lang)
+
+        with state.lock:
+            sections = self._update(document, state, lang)
+            if sections is None:
+                return self._lex(document.text(), lang)
+
+            return [t for s in sections for c in s for t in c.tokens]
+
+    def get_model(self, document: TextDocument, lang: Optional[Languages]) -> ast.AST:
+        state = self._get_state(document, lang)
+
+        with state.lock:
+            sections = self._update(document, state, lang)
+            if sections is None:
+                return self._build_model(document, self._lex(document.text(), lang))
+
+            missing: List[_Chunk] = []
+            for chunk in (c for s in sections for c in s):
+                if chunk.model_parts is None:
+                    if chunk.moved_from is not None and chunk.moved_from.model_parts is not None:
+                        moved = {id(o): n for o, n in zip(chunk.moved_from.tokens, chunk.tokens)}
+                        chunk.model_parts = [_moved_node(p, moved) for p in chunk.moved_from.model_parts]
+                    else:
+                        missing.append(chunk)
+                chunk.moved_from = None
+
+            if _mostly_missing(missing, sections):
+                model = self._build_model(document, [t for s in sections for c in s for t in c.tokens])
+                if self._distribute_model(model, sections):
+                    return model
+
+            for section in sections:
+                for chunk in section:
+                    if chunk.model_parts is None:
+                        self._parse_chunk(document, chunk, section)
+
+            return self._assemble_model(document, sections)
+
+    def _parse_chunk(self, document: TextDocument, chunk: _Chunk, section: List[_Chunk]) -> None:
+        if chunk is section[0]:
+            chunk.model_parts = list(getattr(self._build_model(document, chunk.tokens), "sections"))
+            return
+
+        # the block is parsed together with the section header to be validated as test, task or keyword
+        header_tokens = section[0].tokens
+        header_end = next((i + 1 for i, t in enumerate(header_tokens) if t.type == Token.EOS), len(header_tokens))
+        model: Any = self._build_model(document, [*header_tokens[:header_end], *chunk.tokens])
+        chunk.model_parts = list(model.sections[0].body) if model.sections else []
+
+    def _assemble_model(self, document: TextDocument, sections: List[List[_Chunk]]) -> ast.AST:
+        model_sections: List[Any] = []
+
+        for section in sections:
+            header_parts = section[0].model_parts or []
+            if len(section) == 1:
+                model_sections.extend(header_parts)
+                continue
+
+            header_section = header_parts[-1]
+            model_sections.extend(header_parts[:-1])
+            model_sections.append(
+                type(header_section)(
+                    header_section.header,
+                    [*header_section.body, *(p for c in section[1:] for p in c.model_parts or [])],
+                )
+            )
+
+        model = self._build_model(document, [])
+        setattr(model, "sections", model_sections)
+        return model
+
+    def _distribute_model(self, model: Any, sections: List[List[_Chunk]]) -> bool:
+        """Distributes the sections and blocks of a completely parsed model to the chunks."""
+        if len(model.sections) != len(sections):
+            return False
+
+        for model_section, section in zip(model.sections, sections):
+            if len(section) == 1:
+                section[0].model_parts = [model_section]
+                continue
+
+            parts: List[List[Any]] = [[] for _ in section]
+            i = 0
+            for node in model_section.body:
+                while i + 1 < len(section) and node.lineno > section[i].end:
+                    i += 1
+                parts[i].append(node)
+
+            section[0].model_parts = [type(model_section)(model_section.header, parts[0])]
+            for chunk, chunk_parts in zip(section[1:], parts[1:]):
+                chunk.model_parts = chunk_parts
+
+        return True
@@ -7,11 +7,14 @@ import importlib
 import importlib.util
 import io
 import os
+import pickle
 import pkgutil
 import re
 import sys
 import tempfile
+import threading
 import traceback
+from array import array
 from contextlib import contextmanager
 from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
@@ -80,6 +83,7 @@ from ..utils.markdownformatter import MarkDownFormatter
 from ..utils.match import normalize, normalize_namespace
 from ..utils.robot_patching import patch_variable_not_found
 from ..utils.variables import contains_variable, replace_curdir_in_variable_values, search_variable
+from .directory_index import DirectoryEntry, DirectoryIndex, list_directory
 from .entities import (
     ArgumentDefinition,
     Import,
@@ -464,6 +468,24 @@ def robot_arg_repr(arg: Any) -> Optional[str]:
     return str(robot_arg.default_repr)
 
 
+_CLASS_SLOTS: Dict[type, Tuple[str, ...]] = {}
+_FIELD_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+
+def _class_slots(cls: type) -> Tuple[str, ...]:
+    result = _CLASS_SLOTS.get(cls)
+    if result is None:
+        result = _CLASS_SLOTS[cls] = tuple(slot for c in cls.__mro__ for slot in getattr(c, "__slots__", ()))
+    return result
+
+
+def _field_defaults(cls: type) -> Dict[str, Any]:
+    result = _FIELD_DEFAULTS.get(cls)
+    if result is None:
+        result = _FIELD_DEFAULTS[cls] = {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+    return result
+
+
 @dataclass(slots=True)
 class ArgumentInfo:
     name: str
@@ -480,7 +502,7 @@ class ArgumentInfo:
         if isinstance(state, tuple):
             _, state = state
         if isinstance(state, dict):
-            defaults = {f.name: f.default for f in fields(self) if f.default is not MISSING}
+            defaults = _field_defaults(type(self))
             for slot in self.__slots__:
                 object.__setattr__(self, slot, state.get(slot, defaults.get(slot)))
 
@@ -813,9 +835,8 @@ class KeywordDoc(SourceEntity):
             )
         )
 
-    def _all_slots(self) -> Iterator[str]:
-        for cls in type(self).__mro__:
-            yield from getattr(cls, "__slots__", ())
+    def _all_slots(self) -> Tuple[str, ...]:
+        return _class_slots(type(self))
 
     _EXCLUDED_FROM_STATE = frozenset({"_matcher", "parent", "_hash_value", "_stable_id"})
 
@@ -1120,46 +1141,309 @@ class KeywordError(Exception):
         self.multiple_keywords = multiple_keywords
 
 
-@dataclass(slots=True)
+_ASCII_WHITESPACE = str.maketrans({c: " " for c in map(chr, range(128)) if c.isspace()})
+
+
+def _ascii_head(text: str) -> str:
+    for i, c in enumerate(text):
+        if not c.isascii():
+            return text[:i]
+    return text
+
+
+def _ascii_tail(text: str) -> str:
+    for i in range(len(text) - 1, -1, -1):
+        if not text[i].isascii():
+            return text[i + 1 :]
+    return text
+
+
+def _embedded_name_affixes(name: str) -> Tuple[str, str]:
+    # Robot Framework normalizes the whitespace of the name, escapes the literal text around the
+    # arguments and matches it case insensitive with `\s` for every space.
+    name = " ".join(name.split())
+    match = search_variable(name, "$", ignore_errors=True)
+    if match.start < 0:
+        return "", ""
+
+    prefix = name[: match.start]
+    after = match.after
+    while True:
+        match = search_variable(after, "$", ignore_errors=True)
+        if match.start < 0:
+            break
+        after = match.after
+
+    return _ascii_head(prefix).lower(), _ascii_tail(after).lower()
+
+
+class _EmbeddedKeywordIndex:
+    """Narrows down the keywords with embedded arguments that can match a name.
+
+    Keywords are bucketed by the literal text before their first embedded argument and checked
+    against the literal text after their last one, so only the regexes of keywords whose literal
+    text matches the name have to run. The literal text is compared ASCII only, names with other
+    characters are matched against all keywords.
+    """
+
+    __slots__ = ("_all", "_prefixes", "_suffixes", "_unbound")
+
+    def __init__(self, keywords: Iterable[Tuple[int, str]]) -> None:
+        self._all: List[int] = []
+        self._prefixes: Dict[int, Dict[str, List[Tuple[int, str]]]] = {}
+        self._suffixes: Dict[int, Dict[str, List[int]]] = {}
+        self._unbound: List[int] = []
+
+        for i, name in keywords:
+            self._all.append(i)
+            prefix, suffix = _embedded_name_affixes(name)
+            if prefix:
+                self._prefixes.setdefault(len(prefix), {}).setdefault(prefix, []).append((i, suffix))
+            elif suffix:
+                self._suffixes.setdefault(len(suffix), {}).setdefault(suffix, []).append(i)
+            else:
+                self._unbound.append(i)
+
+    def candidates(self, name: str) -> List[int]:
+        if not self._all or not name.isascii():
+            return self._all
+
+        key = name.lower().translate(_ASCII_WHITESPACE)
+
+        # variables in the name are replaced by placeholders before matching,
+        # so only the text before the first and after the last one is compared
+        has_variables = "{" in key
+        if has_variables:
+            head = key[: max(key.find("{") - 1, 0)]
+            tail = key[key.rfind("}") + 1 :]
+        else:
+            head = tail = key
+
+        result = list(self._unbound)
+
+        for length, prefixes in self._prefixes.items():
+            if length <= len(head):
+                entries: Iterable[Tuple[int, str]] = prefixes.get(head[:length], ())
+            elif has_variables:
+                entries = [e for prefix, bucket in prefixes.items() if prefix.startswith(head) for e in bucket]
+            else:
+                continue
+
+            for i, suffix in entries:
+                if len(suffix) <= len(tail):
+                    if not tail.endswith(suffix) or (not has_variables and length + len(suffix) > len(key)):
+                        continue
+                elif not has_variables or not suffix.endswith(tail):
+                    continue
+                result.append(i)
+
+        for length, suffixes in self._suffixes.items():
+            if length <= len(tail):
+                result.extend(suffixes.get(tail[-length:], ()))
+            elif has_variables:
+                result.extend(i for suffix, bucket in suffixes.items() if suffix.endswith(tail) for i in bucket)
+
+        result.sort()
+        return result
+
+
+_KEYWORD_STORE_FORMAT = 2
+
+
 class KeywordStore:
-    source: Optional[str] = None
-    source_type: Optional[str] = None
-    keywords: List[KeywordDoc] = field(default_factory=list)
-    _index: Optional[Dict[str, List[KeywordDoc]]] = field(default=None, init=False, compare=False, repr=False)
-    _embedded: Optional[List[KeywordDoc]] = field(default=None, init=False, compare=False, repr=False)
+    """The keywords of a library, resource or suite file, indexed by their normalized name.
 
-    def _ensure_index(self) -> Tuple[Dict[str, List[KeywordDoc]], List[KeywordDoc]]:
+    A pickled store keeps every keyword as a separate pickle record behind a name and stable id index.
+    Unpickling the store only restores the index, a keyword record is unpickled from a `memoryview` of
+    the records the first time it is looked up or iterated.
+    """
+
+    __slots__ = (
+        "_embedded",
+        "_index",
+        "_keys",
+        "_keywords",
+        "_lock",
+        "_names",
+        "_offsets",
+        "_parent",
+        "_parent_stable_id",
+        "_pending",
+        "_records",
+        "_stable_id_index",
+        "_stable_ids",
+        "source",
+        "source_type",
+    )
+
+    def __init__(
+        self,
+        source: Optional[str] = None,
+        source_type: Optional[str] = None,
+        keywords: Optional[List[KeywordDoc]] = None,
+    ) -> None:
+        self.source = source
+        self.source_type = source_type
+        self._keywords: List[Optional[KeywordDoc]] = list(keywords) if keywords is not None else []
+        self._names: Optional[List[str]] = None
+        self._keys: Optional[List[Optional[str]]] = None
+        self._records: Optional[memoryview] = None
+        self._offsets: Optional[memoryview] = None
+        self._pending = 0
+        self._lock: Optional[threading.Lock] = None
+        self._parent: Optional[LibraryDoc] = None
+        self._parent_stable_id = ""
+        self._index: Optional[Dict[str, List[int]]] = None
+        self._embedded: Optional[_EmbeddedKeywordIndex] = None
+        self._stable_ids: Optional[List[str]] = None
+        self._stable_id_index: Optional[Dict[str, int]] = None
+
+    @property
+    def keywords(self) -> List[KeywordDoc]:
+        if self._pending:
+            for i in range(len(self._keywords)):
+                self._keyword(i)
+        return cast(List[KeywordDoc], self._keywords)
+
+    def _keyword(self, i: int) -> KeywordDoc:
+        kw = self._keywords[i]
+        if kw is not None:
+            return kw
+
+        assert self._lock is not None
+        with self._lock:
+            kw = self._keywords[i]
+            if kw is None:
+                assert self._records is not None
+                assert self._offsets is not None
+                kw = cast(KeywordDoc, pickle.loads(self._records[self._offsets[i - 1] if i else 0 : self._offsets[i]]))
+                if self._parent is not None:
+                    kw.parent = self._parent
+                    kw._parent_stable_id = self._parent_stable_id
+                self._keywords[i] = kw
+                self._pending -= 1
+                if not self._pending:
+                    self._records = None
+                    self._offsets = None
+        return kw
+
+    def _set_parent(self, parent: LibraryDoc) -> None:
+        self._parent = parent
+        self._parent_stable_id = parent._stable_id
+        for kw in self._keywords:
+            if kw is not None:
+                kw.parent = parent
+                kw._parent_stable_id = parent._stable_id
+
+    def _name(self, i: int) -> str:
+        kw = self._keywords[i]
+        if kw is not None:
+            return kw.name
+        assert self._names is not None
+        return self._names[i]
+
+    def _key(self, i: int) -> Optional[str]:
+        kw = self._keywords[i]
+        if kw is not None:
+            return kw.matcher.normalized_name if kw.matcher.embedded_arguments is None else None
+        assert self._keys is not None
+        return self._keys[i]
+
+    def _stable_id(self, i: int) -> str:
+        kw = self._keywords[i]
+        if kw is not None:
+            return kw.stable_id
+        if self._stable_ids is not None:
+            return self._stable_ids[i]
+        return self._keyword(i).stable_id
+
+    def get_by_stable_id(self, stable_id: str) -> Optional[KeywordDoc]:
+        """Get the keyword with the given stable id, only this keyword is unpickled."""
+        if self._stable_id_index is None:
+            self._stable_id_index = {self._stable_id(i): i for i in range(len(self._keywords))}
+
+        i = self._stable_id_index.get(stable_id)
+        return self._keyword(i) if i is not None else None
+
+    def _ensure_index(self) -> Tuple[Dict[str, List[int]], _EmbeddedKeywordIndex]:
         if self._index is not None:
             return self._index, self._embedded  # type: ignore[return-value]
-        index: Dict[str, List[KeywordDoc]] = {}
-        embedded: List[KeywordDoc] = []
-        for kw in self.keywords:
-            if kw.matcher.embedded_arguments is not None:
-                embedded.append(kw)
+        index: Dict[str, List[int]] = {}
+        embedded: List[int] = []
+        for i in range(len(self._keywords)):
+            key = self._key(i)
+            if key is None:
+                embedded.append(i)
             else:
-                key = kw.matcher.normalized_name
                 bucket = index.get(key)
                 if bucket is None:
-                    index[key] = [kw]
+                    index[key] = [i]
                 else:
-                    bucket.append(kw)
+                    bucket.append(i)
         self._index = index
-        self._embedded = embedded
-        return index, embedded
+        self._embedded = _EmbeddedKeywordIndex((i, self._name(i)) for i in embedded)
+        return index, self._embedded
 
     def __getstate__(self) -> Dict[str, Any]:
+        records = bytearray()
+        offsets = array("Q")
+        for i, kw in enumerate(self._keywords):
+            if kw is None:
+                assert self._records is not None
+                assert self._offsets is not None
+                records += self._records[self._offsets[i - 1] if i else 0 : self._offsets[i]]
+            else:
+                records += pickle.dumps(kw, protocol=pickle.HIGHEST_PROTOCOL)
+            offsets.append(len(records))
+
         return {
+            "format": _KEYWORD_STORE_FORMAT,
             "source": self.source,
             "source_type": self.source_type,
-            "keywords": self.keywords,
+            "names": [self._name(i) for i in range(len(self._keywords))],
+            "keys": [self._key(i) for i in range(len(self._keywords))],
+            "stable_ids": [self._stable_id(i) for i in range(len(self._keywords))],
+            "offsets": offsets.tobytes(),
+            "records": bytes(records),
         }
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         self.source = state.get("source")
         self.source_type = state.get("source_type")
-        self.keywords = state.get("keywords", [])
+        self._parent = None
+        self._parent_stable_id = ""
         self._index = None
         self._embedded = None
+        self._stable_id_index = None
+
+        if state.get("format") in (1, _KEYWORD_STORE_FORMAT):
+            self._names = state["names"]
+            self._keys = state["keys"]
+            self._stable_ids = state.get("stable_ids")
+            self._records = memoryview(state["records"])
+            self._offsets = memoryview(state["offsets"]).cast("Q")
+            self._keywords = [None] * len(state["names"])
+            self._pending = len(self._keywords)
+            self._lock = threading.Lock()
+        else:
+            self._names = None
+            self._keys = None
+            self._stable_ids = None
+            self._records = None
+            self._offsets = None
+            self._keywords = state.get("keywords", [])
+            self._pending = 0
+            self._lock = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, KeywordStore):
+            return NotImplemented
+        return (self.source, self.source_type, self.keywords) == (other.source, other.source_type, other.keywords)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"KeywordStore(source={self.source!r}, source_type={self.source_type!r}, keywords={self.keywords!r})"
 
     def __getitem__(self, key: str) -> KeywordDoc:
         items = list(self.iter_all(key))
@@ -1197,25 +1481,27 @@ class KeywordStore:
         normalized = normalize(_x)
         if index.get(normalized):
             return True
-        return any(kw.matcher.match_string(_x) for kw in embedded)
+        return any(self._keyword(i).matcher.match_string(_x) for i in embedded.candidates(_x))
 
     def __len__(self) -> int:
-        return len(self.keywords)
+        return len(self._keywords)
 
     def __bool__(self) -> bool:
         return len(self) > 0
 
     def items(self) -> AbstractSet[Tuple[str, KeywordDoc]]:
-        return {(v.name, v) for v in self.keywords}
+        return {(v.name, v) for v in self}
 
     def keys(self) -> AbstractSet[str]:
-        return {v.name for v in self.keywords}
+        return {self._name(i) for i in range(len(self._keywords))}
 
     def values(self) -> AbstractSet[KeywordDoc]:
-        return set(self.keywords)
+        return set(self)
 
     def __iter__(self) -> Iterator[KeywordDoc]:
-        return self.keywords.__iter__()
+        if not self._pending:
+            return cast(Iterator[KeywordDoc], iter(self._keywords))
+        return (self._keyword(i) for i in range(len(self._keywords)))
 
     def get(self, key: str, default: Optional[KeywordDoc] = None) -> Optional[KeywordDoc]:
         try:
@@ -1229,8 +1515,10 @@ class KeywordStore:
     def iter_all(self, key: str) -> Iterable[KeywordDoc]:
         index, embedded = self._ensure_index()
         normalized = normalize(key)
-        matches = index.get(normalized, [])
-        embedded_matches = [kw for kw in embedded if kw.matcher.match_string(key)]
+        matches = [self._keyword(i) for i in index.get(normalized, ())]
+        embedded_matches = [
+            kw for kw in (self._keyword(i) for i in embedded.candidates(key)) if kw.matcher.match_string(key)
+        ]
         if embedded_matches:
             return [*embedded_matches, *matches]
         return matches
@@ -1305,13 +1593,11 @@ class LibraryDoc:
         self._keywords = value
         self._update_keywords(self._keywords)
 
-    def _update_keywords(self, keywords: Optional[Iterable[KeywordDoc]]) -> None:
+    def _update_keywords(self, keywords: Optional[KeywordStore]) -> None:
         if not keywords:
             return
 
-        for k in keywords:
-            k.parent = self
-            k._parent_stable_id = self._stable_id
+        keywords._set_parent(self)
 
     def _compute_stable_id(self) -> str:
         h = hashlib.sha256()
@@ -1355,9 +1641,8 @@ class LibraryDoc:
             self._stable_id = self._compute_stable_id()
         return self._stable_id
 
-    def _all_slots(self) -> Iterator[str]:
-        for cls in type(self).__mro__:
-            yield from getattr(cls, "__slots__", ())
+    def _all_slots(self) -> Tuple[str, ...]:
+        return _class_slots(type(self))
 
     _EXCLUDED_FROM_STATE = frozenset({"_source_id", "_hash_value", "_stable_id"})
 
@@ -2879,31 +3164,49 @@ def iter_module_names(name: Optional[str] = None) -> Iterator[str]:
             yield e.name
 
 
+@functools.lru_cache(maxsize=1)
+def _robot_library_module_names() -> Tuple[str, ...]:
+    return tuple(e for e in iter_module_names(ROBOT_LIBRARY_PACKAGE) if e not in DEFAULT_LIBRARIES)
+
+
 NOT_WANTED_DIR_EXTENSIONS = [".dist-info"]
 
 
+def _list_directory(path: Path, directory_index: Optional[DirectoryIndex]) -> Tuple[DirectoryEntry, ...]:
+    return directory_index.list_directory(path) if directory_index is not None else list_directory(path)
+
+
 def iter_modules_from_python_path(
     path: Optional[str] = None,
+    *,
+    working_dir: str = ".",
+    directory_index: Optional[DirectoryIndex] = None,
 ) -> Iterator[CompleteResult]:
     path = path.replace(".", os.sep) if path is not None and not path.startswith((".", "/", os.sep)) else path
 
     if path is None:
-        paths = sys.path
+        paths = [str(Path(working_dir, s)) for s in sys.path]
     else:
-        paths = [str(Path(s, path)) for s in sys.path]
+        paths = [str(Path(working_dir, s, path)) for s in sys.path]
 
     for e in [Path(p) for p in set(paths)]:
-        if e.is_dir():
-            for f in e.iterdir():
-                if not f.name.startswith(("_", ".")) and (
-                    (f.is_file() and f.suffix in ALLOWED_LIBRARY_FILE_EXTENSIONS)
-                    or (f.is_dir() and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
-                ):
-                    if f.is_dir():
-                        yield CompleteResult(f.name, CompleteResultKind.MODULE)
+        for f in _list_directory(e, directory_index):
+            if not f.name.startswith(("_", ".")) and (
+                (f.is_file and f.suffix in ALLOWED_LIBRARY_FILE_EXTENSIONS)
+                or (f.is_dir and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
+            ):
+                if f.is_dir:
+                    yield CompleteResult(f.name, CompleteResultKind.MODULE)
+
+                if f.is_file:
+                    yield CompleteResult(f.stem, CompleteResultKind.MODULE)
+
 
-                    if f.is_file():
-                        yield CompleteResult(f.stem, CompleteResultKind.MODULE)
+def _resolve_completion_dirs(working_dir: str, base_dir: str) -> Tuple[str, str]:
+    # completion runs in the language server process, so relative paths are resolved against working_dir instead of
+    # changing the current directory of the process
+    working_dir = str(Path(working_dir).absolute())
+    return working_dir, str(Path(working_dir, base_dir))
 
 
 def complete_library_import(
@@ -2912,17 +3215,15 @@ def complete_library_import(
     base_dir: str = ".",
     command_line_variables: Optional[Dict[str, Optional[Any]]] = None,
     variables: Optional[Dict[str, Optional[Any]]] = None,
+    *,
+    directory_index: Optional[DirectoryIndex] = None,
 ) -> List[CompleteResult]:
-    _update_env(working_dir)
+    working_dir, base_dir = _resolve_completion_dirs(working_dir, base_dir)
 
     result: List[CompleteResult] = []
 
     if name is None:
-        result += [
-            CompleteResult(e, CompleteResultKind.MODULE_INTERNAL)
-            for e in iter_module_names(ROBOT_LIBRARY_PACKAGE)
-            if e not in DEFAULT_LIBRARIES
-        ]
+        result += [CompleteResult(e, CompleteResultKind.MODULE_INTERNAL) for e in _robot_library_module_names()]
 
     if name is not None and contains_variable(name, "$@&%"):
         robot_variables = resolve_robot_variables(working_dir, base_dir, command_line_variables, variables)
@@ -2932,7 +3233,7 @@ def complete_library_import(
     file_like = is_file_like(name)
 
     if name is None or not file_like:
-        result += list(iter_modules_from_python_path(name))
+        result += list(iter_modules_from_python_path(name, working_dir=working_dir, directory_index=directory_index))
 
     if name is None or file_like:
         name_path = Path(name if name else base_dir)
@@ -2941,49 +3242,50 @@ def complete_library_import(
         else:
             paths = [
                 Path(base_dir, name) if name else Path(base_dir),
-                *((Path(s) for s in sys.path) if not name else []),
-                *((Path(s, name) for s in sys.path) if name and not name.startswith(".") else []),
+                *((Path(working_dir, s) for s in sys.path) if not name else []),
+                *((Path(working_dir, s, name) for s in sys.path) if name and not name.startswith(".") else []),
             ]
 
         for p in paths:
             path = normalized_path(p)
 
-            if path.exists() and path.is_dir():
-                result += [
-                    CompleteResult(
-                        str(f.name),
-                        CompleteResultKind.FILE if f.is_file() else CompleteResultKind.FOLDER,
-                    )
-                    for f in path.iterdir()
-                    if not f.name.startswith(("_", "."))
-                    and (
-                        (f.is_file() and f.suffix in ALLOWED_LIBRARY_FILE_EXTENSIONS)
-                        or (f.is_dir() and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
-                    )
-                ]
+            result += [
+                CompleteResult(
+                    str(f.name),
+                    CompleteResultKind.FILE if f.is_file else CompleteResultKind.FOLDER,
+                )
+                for f in _list_directory(path, directory_index)
+                if not f.name.startswith(("_", "."))
+                and (
+                    (f.is_file and f.suffix in ALLOWED_LIBRARY_FILE_EXTENSIONS)
+                    or (f.is_dir and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
+                )
+            ]
 
     return list(set(result))
 
 
 def iter_resources_from_python_path(
     path: Optional[str] = None,
+    *,
+    working_dir: str = ".",
+    directory_index: Optional[DirectoryIndex] = None,
 ) -> Iterator[CompleteResult]:
     if path is None:
-        paths = sys.path
+        paths = [str(Path(working_dir, s)) for s in sys.path]
     else:
-        paths = [str(Path(s, path)) for s in sys.path]
+        paths = [str(Path(working_dir, s, path)) for s in sys.path]
 
     for e in [Path(p) for p in set(paths)]:
-        if e.is_dir():
-            for f in e.iterdir():
-                if not f.name.startswith(("_", ".")) and (
-                    (f.is_file() and f.suffix in ALLOWED_RESOURCE_FILE_EXTENSIONS)
-                    or (f.is_dir() and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
-                ):
-                    yield CompleteResult(
-                        f.name,
-                        CompleteResultKind.RESOURCE if f.is_file() else CompleteResultKind.FOLDER,
-                    )
+        for f in _list_directory(e, directory_index):
+            if not f.name.startswith(("_", ".")) and (
+                (f.is_file and f.suffix in ALLOWED_RESOURCE_FILE_EXTENSIONS)
+                or (f.is_dir and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
+            ):
+                yield CompleteResult(
+                    f.name,
+                    CompleteResultKind.RESOURCE if f.is_file else CompleteResultKind.FOLDER,
+                )
 
 
 def complete_resource_import(
@@ -2992,8 +3294,10 @@ def complete_resource_import(
     base_dir: str = ".",
     command_line_variables: Optional[Dict[str, Optional[Any]]] = None,
     variables: Optional[Dict[str, Optional[Any]]] = None,
+    *,
+    directory_index: Optional[DirectoryIndex] = None,
 ) -> Optional[List[CompleteResult]]:
-    _update_env(working_dir)
+    working_dir, base_dir = _resolve_completion_dirs(working_dir, base_dir)
 
     result: List[CompleteResult] = []
 
@@ -3003,7 +3307,7 @@ def complete_resource_import(
         name = robot_variables.replace_string(name, ignore_errors=True)
 
     if name is None or (not name.startswith(".") and not name.startswith("/") and not name.startswith(os.sep)):
-        result += list(iter_resources_from_python_path(name))
+        result += list(iter_resources_from_python_path(name, working_dir=working_dir, directory_index=directory_index))
 
     if name is None or name.startswith((".", "/", os.sep)):
         name_path = Path(name if name else base_dir)
@@ -3012,16 +3316,15 @@ def complete_resource_import(
         else:
             path = normalized_path(Path(base_dir, name if name else base_dir))
 
-        if path.exists() and (path.is_dir()):
-            result += [
-                CompleteResult(
-                    str(f.name),
-                    CompleteResultKind.RESOURCE if f.is_file() else CompleteResultKind.FOLDER,
-                )
-                for f in path.iterdir()
-                if not f.name.startswith(("_", "."))
-                and (f.is_dir() or (f.is_file() and f.suffix in ALLOWED_RESOURCE_FILE_EXTENSIONS))
-            ]
+        result += [
+            CompleteResult(
+                str(f.name),
+                CompleteResultKind.RESOURCE if f.is_file else CompleteResultKind.FOLDER,
+            )
+            for f in _list_directory(path, directory_index)
+            if not f.name.startswith(("_", "."))
+            and (f.is_dir or (f.is_file and f.suffix in ALLOWED_RESOURCE_FILE_EXTENSIONS))
+        ]
 
     return list(set(result))
 
@@ -3032,8 +3335,10 @@ def complete_variables_import(
     base_dir: str = ".",
     command_line_variables: Optional[Dict[str, Optional[Any]]] = None,
     variables: Optional[Dict[str, Optional[Any]]] = None,
+    *,
+    directory_index: Optional[DirectoryIndex] = None,
 ) -> Optional[List[CompleteResult]]:
-    _update_env(working_dir)
+    working_dir, base_dir = _resolve_completion_dirs(working_dir, base_dir)
 
     result: List[CompleteResult] = []
 
@@ -3045,7 +3350,7 @@ def complete_variables_import(
     file_like = is_file_like(name)
 
     if name is None or not file_like:
-        result += list(iter_modules_from_python_path(name))
+        result += list(iter_modules_from_python_path(name, working_dir=working_dir, directory_index=directory_index))
 
     if name is None or file_like:
         name_path = Path(name if name else base_dir)
@@ -3054,26 +3359,25 @@ def complete_variables_import(
         else:
             paths = [
                 Path(base_dir, name) if name else Path(base_dir),
-                *((Path(s) for s in sys.path) if not name else []),
-                *((Path(s, name) for s in sys.path) if name and not name.startswith(".") else []),
+                *((Path(working_dir, s) for s in sys.path) if not name else []),
+                *((Path(working_dir, s, name) for s in sys.path) if name and not name.startswith(".") else []),
             ]
 
         for p in paths:
             path = normalized_path(p)
 
-            if path.exists() and path.is_dir():
-                result += [
-                    CompleteResult(
-                        str(f.name),
-                        CompleteResultKind.FILE if f.is_file() else CompleteResultKind.FOLDER,
-                    )
-                    for f in path.iterdir()
-                    if not f.name.startswith(("_", "."))
-                    and (
-                        (f.is_file() and f.suffix in ALLOWED_VARIABLES_FILE_EXTENSIONS)
-                        or (f.is_dir() and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
-                    )
-                ]
+            result += [
+                CompleteResult(
+                    str(f.name),
+                    CompleteResultKind.FILE if f.is_file else CompleteResultKind.FOLDER,
+                )
+                for f in _list_directory(path, directory_index)
+                if not f.name.startswith(("_", "."))
+                and (
+                    (f.is_file and f.suffix in ALLOWED_VARIABLES_FILE_EXTENSIONS)
+                    or (f.is_dir and f.suffix not in NOT_WANTED_DIR_EXTENSIONS)
+                )
+            ]
 
     return list(set(result))
 
@@ -55,6 +55,7 @@ from .library_doc import (
     LibraryDoc,
     ResourceDoc,
 )
+from .reference_index import ReferenceIndex
 from .scope_tree import LocalScope, ScopeTree
 from .variable_scope import VariableScope
 
@@ -217,6 +218,7 @@ class Namespace:
         # Lazy-computed caches
         self._namespaces: Optional[Dict[KeywordMatcher, List[LibraryEntry]]] = None
         self._keywords: Optional[List[KeywordDoc]] = None
+        self._reference_index: Optional[ReferenceIndex] = None
 
         # Subscribe to imports_manager change events
         imports_manager.imports_changed.add(self._on_imports_changed)
@@ -255,6 +257,14 @@ class Namespace:
     def variable_references(self) -> Dict[VariableDefinition, Set[Location]]:
         return self._variable_references
 
+    @property
+    def reference_index(self) -> ReferenceIndex:
+        """Index to find the keywords and variables defined or referenced at a position."""
+        if self._reference_index is None:
+            self._reference_index = ReferenceIndex(self.source, self._keyword_references, self._variable_references)
+
+        return self._reference_index
+
     @property
     def testcase_definitions(self) -> List[TestCaseDefinition]:
         return self._test_case_definitions
@@ -587,31 +597,36 @@ class Namespace:
             scope.add_imported(variables_entry.variables)
 
         # --- Build stable_id → object lookup maps ---
-        kw_by_id: Dict[str, KeywordDoc] = {}
-        var_by_id: Dict[str, VariableDefinition] = {}
+        # Only the referenced keywords are looked up, the keyword stores of cached libraries and resources
+        # unpickle a keyword the first time it is requested, so the other keywords stay unloaded.
+        # Later stores win, the file's own keywords last.
+        keyword_stores = [
+            store
+            for lib_entry in itertools.chain(resolved.libraries.values(), resolved.resources.values())
+            for store in (lib_entry.library_doc.keywords, lib_entry.library_doc.inits)
+        ]
+        keyword_stores.append(library_doc.keywords)
+        keyword_stores.reverse()
 
-        # Keywords from all resolved libraries + resources + file's own
-        for lib_entry in itertools.chain(
-            resolved.libraries.values(),
-            resolved.resources.values(),
-        ):
-            for kw in lib_entry.library_doc.keywords:
-                kw_by_id[kw.stable_id] = kw
-            for kw in lib_entry.library_doc.inits:
-                kw_by_id[kw.stable_id] = kw
+        kw_by_id: Dict[str, KeywordDoc] = {}
+        for sid in data.keyword_references.keys():
+            for store in keyword_stores:
+                found = store.get_by_stable_id(sid)
+                if found is not None:
+                    kw_by_id[sid] = found
+                    break
 
-        for kw in library_doc.keywords:
-            kw_by_id[kw.stable_id] = kw
+        var_by_id: Dict[str, VariableDefinition] = {}
 
         # Variables from scope layers (command_line, own, imported, builtin)
         for var in scope.iter_all():
             var_by_id[var.stable_id] = var
 
-        # Add keyword argument_definitions from all resolved keywords
-        # to var_by_id. This covers ArgumentDefinition and
+        # Add keyword argument_definitions of the file's own and all referenced
+        # keywords to var_by_id. This covers ArgumentDefinition and
         # LibraryArgumentDefinition objects that are created during
         # Phase 3 analysis but aren't part of the file's own scope.
-        for kw in kw_by_id.values():
+        for kw in itertools.chain(kw_by_id.values(), library_doc.keywords):
             if kw.argument_definitions:
                 for arg_var in kw.argument_definitions:
                     var_by_id[arg_var.stable_id] = arg_var
@@ -5,12 +5,16 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
+    Iterable,
+    Iterator,
     Set,
+    Tuple,
     TypeVar,
 )
 
-from robotcode.core.lsp.types import Location
+from robotcode.core.lsp.types import Location, Position, Range
 
 from .entities import LibraryEntry, VariableDefinition
 from .library_doc import KeywordDoc
@@ -21,6 +25,37 @@ if TYPE_CHECKING:
 
 _K = TypeVar("_K")
 
+# uri, start line, start character, end line, end character
+_LocationTuple = Tuple[str, int, int, int, int]
+_CachedLocations = Tuple[_LocationTuple, ...]
+
+
+def _to_location_tuples(locations: Iterable[Location]) -> _CachedLocations:
+    return tuple(
+        (loc.uri, loc.range.start.line, loc.range.start.character, loc.range.end.line, loc.range.end.character)
+        for loc in locations
+    )
+
+
+def _to_locations(cached: Dict[str, _CachedLocations]) -> Iterator[Location]:
+    for locations in cached.values():
+        for uri, start_line, start_character, end_line, end_character in locations:
+            yield Location(uri, Range(Position(start_line, start_character), Position(end_line, end_character)))
+
+
+def namespace_reference_key(entry: LibraryEntry) -> Tuple[Any, ...]:
+    """Persistable key of a LibraryEntry, equal for entries that compare equal."""
+    return (
+        type(entry).__name__,
+        entry.name,
+        entry.import_name,
+        repr(entry.args),
+        entry.alias,
+        entry.import_range,
+        entry.import_source,
+        entry.alias_range,
+    )
+
 
 @dataclass
 class _FileRefs:
@@ -34,12 +69,63 @@ class _FileRefs:
     metadata_references: Dict[str, Set[Location]] = field(default_factory=dict)
 
 
+@dataclass
+class FileReferences:
+    """The references of a single file in a persistable form.
+
+    Keywords and variables are keyed by their stable_id and library entries by
+    `namespace_reference_key`, so the references can be stored in the disk
+    cache and looked up before the referenced objects are loaded again.
+    Locations are stored as plain tuples, which are much cheaper to unpickle
+    than sets of `Location` objects.
+    """
+
+    keyword_references: Dict[str, _CachedLocations] = field(default_factory=dict)
+    variable_references: Dict[str, _CachedLocations] = field(default_factory=dict)
+    namespace_references: Dict[Tuple[Any, ...], _CachedLocations] = field(default_factory=dict)
+    keyword_tag_references: Dict[str, _CachedLocations] = field(default_factory=dict)
+    testcase_tag_references: Dict[str, _CachedLocations] = field(default_factory=dict)
+    metadata_references: Dict[str, _CachedLocations] = field(default_factory=dict)
+
+    @classmethod
+    def from_namespace(cls, namespace: Namespace) -> FileReferences:
+        keyword_references: Dict[str, Set[Location]] = defaultdict(set)
+        for kw, locations in namespace.keyword_references.items():
+            keyword_references[kw.stable_id].update(locations)
+
+        variable_references: Dict[str, Set[Location]] = defaultdict(set)
+        for var, locations in namespace.variable_references.items():
+            variable_references[var.stable_id].update(locations)
+
+        namespace_references: Dict[Tuple[Any, ...], Set[Location]] = defaultdict(set)
+        for entry, locations in namespace.namespace_references.items():
+            namespace_references[namespace_reference_key(entry)].update(locations)
+
+        return cls(
+            keyword_references={k: _to_location_tuples(v) for k, v in keyword_references.items() if v},
+            variable_references={k: _to_location_tuples(v) for k, v in variable_references.items() if v},
+            namespace_references={k: _to_location_tuples(v) for k, v in namespace_references.items() if v},
+            keyword_tag_references={
+                k: _to_location_tuples(v) for k, v in namespace.keyword_tag_references.items() if v
+            },
+            testcase_tag_references={
+                k: _to_location_tuples(v) for k, v in namespace.testcase_tag_references.items() if v
+            },
+            metadata_references={k: _to_location_tuples(v) for k, v in namespace.metadata_references.items() if v},
+        )
+
+
 class ProjectIndex:
     """Workspace-wide inverse reference index.
 
     Incrementally maintained: on file change only the affected file is
     removed and re-inserted. All lookups are O(1).
 
+    Files that are not analyzed yet can be loaded from a persisted snapshot
+    (`load_cached_files`). Their references are kept by stable key until the
+    file is analyzed again and replaced by `update_file`, so lookups are
+    correct right after startup instead of after the first workspace scan.
+
     Thread-safety: An RLock protects all mutation operations (update_file,
     remove_file). Reads use the same lock — since writes are rare (only on
     file changes) and short, they block reads minimally.
@@ -57,6 +143,16 @@ class ProjectIndex:
 
         self._refs_by_file: Dict[str, _FileRefs] = {}
 
+        # key -> file -> locations
+        self._cached_keyword_references: Dict[str, Dict[str, _CachedLocations]] = defaultdict(dict)
+        self._cached_variable_references: Dict[str, Dict[str, _CachedLocations]] = defaultdict(dict)
+        self._cached_namespace_references: Dict[Tuple[Any, ...], Dict[str, _CachedLocations]] = defaultdict(dict)
+        self._cached_keyword_tag_references: Dict[str, Dict[str, _CachedLocations]] = defaultdict(dict)
+        self._cached_testcase_tag_references: Dict[str, Dict[str, _CachedLocations]] = defaultdict(dict)
+        self._cached_metadata_references: Dict[str, Dict[str, _CachedLocations]] = defaultdict(dict)
+
+        self._cached_refs_by_file: Dict[str, FileReferences] = {}
+
     def update_file(self, source: str, namespace: Namespace) -> None:
         """After NamespaceBuilder.build(): update this file's references."""
         with self._lock:
@@ -97,12 +193,39 @@ class ProjectIndex:
 
             self._refs_by_file[source] = file_refs
 
+    def load_cached_files(self, files: Iterable[Tuple[str, FileReferences]]) -> int:
+        """Adds the persisted references of files that are not analyzed yet.
+
+        Files already updated with `update_file` are skipped. Returns the number of loaded files.
+        """
+        count = 0
+        with self._lock:
+            for source, file_refs in files:
+                if source in self._refs_by_file:
+                    continue
+
+                self._remove_cached_file_unlocked(source)
+
+                self._merge_cached_refs(source, file_refs.keyword_references, self._cached_keyword_references)
+                self._merge_cached_refs(source, file_refs.variable_references, self._cached_variable_references)
+                self._merge_cached_refs(source, file_refs.namespace_references, self._cached_namespace_references)
+                self._merge_cached_refs(source, file_refs.keyword_tag_references, self._cached_keyword_tag_references)
+                self._merge_cached_refs(source, file_refs.testcase_tag_references, self._cached_testcase_tag_references)
+                self._merge_cached_refs(source, file_refs.metadata_references, self._cached_metadata_references)
+
+                self._cached_refs_by_file[source] = file_refs
+                count += 1
+
+        return count
+
     def remove_file(self, source: str) -> None:
         """File deleted or invalidated: remove all its references."""
         with self._lock:
             self._remove_file_unlocked(source)
 
     def _remove_file_unlocked(self, source: str) -> None:
+        self._remove_cached_file_unlocked(source)
+
         file_refs = self._refs_by_file.pop(source, None)
         if file_refs is None:
             return
@@ -114,6 +237,36 @@ class ProjectIndex:
         self._subtract_refs(file_refs.testcase_tag_references, self._testcase_tag_references)
         self._subtract_refs(file_refs.metadata_references, self._metadata_references)
 
+    def _remove_cached_file_unlocked(self, source: str) -> None:
+        file_refs = self._cached_refs_by_file.pop(source, None)
+        if file_refs is None:
+            return
+
+        self._subtract_cached_refs(source, file_refs.keyword_references, self._cached_keyword_references)
+        self._subtract_cached_refs(source, file_refs.variable_references, self._cached_variable_references)
+        self._subtract_cached_refs(source, file_refs.namespace_references, self._cached_namespace_references)
+        self._subtract_cached_refs(source, file_refs.keyword_tag_references, self._cached_keyword_tag_references)
+        self._subtract_cached_refs(source, file_refs.testcase_tag_references, self._cached_testcase_tag_references)
+        self._subtract_cached_refs(source, file_refs.metadata_references, self._cached_metadata_references)
+
+    @staticmethod
+    def _merge_cached_refs(
+        source: str, file_refs: Dict[_K, _CachedLocations], global_refs: Dict[_K, Dict[str, _CachedLocations]]
+    ) -> None:
+        for key, locations in file_refs.items():
+            global_refs[key][source] = locations
+
+    @staticmethod
+    def _subtract_cached_refs(
+        source: str, file_refs: Dict[_K, _CachedLocations], global_refs: Dict[_K, Dict[str, _CachedLocations]]
+    ) -> None:
+        for key in file_refs:
+            bucket = global_refs.get(key)
+            if bucket is not None:
+                bucket.pop(source, None)
+                if not bucket:
+                    del global_refs[key]
+
     @staticmethod
     def _merge_refs(
         source_refs: Dict[_K, Set[Location]],
@@ -141,29 +294,50 @@ class ProjectIndex:
     def find_keyword_references(self, kw: KeywordDoc) -> Set[Location]:
         """O(1) lookup instead of O(N) workspace scan."""
         with self._lock:
-            return set(self._keyword_references.get(kw, ()))
+            result = set(self._keyword_references.get(kw, ()))
+            if self._cached_keyword_references:
+                result.update(_to_locations(self._cached_keyword_references.get(kw.stable_id, {})))
+            return result
 
     def find_variable_references(self, var: VariableDefinition) -> Set[Location]:
         """O(1) lookup instead of O(N) workspace scan."""
         with self._lock:
-            return set(self._variable_references.get(var, ()))
+            result = set(self._variable_references.get(var, ()))
+            if self._cached_variable_references:
+                result.update(_to_locations(self._cached_variable_references.get(var.stable_id, {})))
+            return result
 
     def find_namespace_references(self, entry: LibraryEntry) -> Set[Location]:
         """O(1) lookup instead of O(N) workspace scan."""
         with self._lock:
-            return set(self._namespace_references.get(entry, ()))
+            result = set(self._namespace_references.get(entry, ()))
+            if self._cached_namespace_references:
+                result.update(_to_locations(self._cached_namespace_references.get(namespace_reference_key(entry), {})))
+            return result
 
     def find_keyword_tag_references(self, tag: str) -> Set[Location]:
         with self._lock:
-            return set(self._keyword_tag_references.get(tag, ()))
+            result = set(self._keyword_tag_references.get(tag, ()))
+            result.update(_to_locations(self._cached_keyword_tag_references.get(tag, {})))
+            return result
 
     def find_testcase_tag_references(self, tag: str) -> Set[Location]:
         with self._lock:
-            return set(self._testcase_tag_references.get(tag, ()))
+            result = set(self._testcase_tag_references.get(tag, ()))
+            result.update(_to_locations(self._cached_testcase_tag_references.get(tag, {})))
+            return result
 
     def find_metadata_references(self, key: str) -> Set[Location]:
         with self._lock:
-            return set(self._metadata_references.get(key, ()))
+            result = set(self._metadata_references.get(key, ()))
+            result.update(_to_locations(self._cached_metadata_references.get(key, {})))
+            return result
+
+    @property
+    def cached_files(self) -> Set[str]:
+        """The files whose references come from a persisted snapshot and are not analyzed yet."""
+        with self._lock:
+            return set(self._cached_refs_by_file)
 
     @property
     def keyword_references(self) -> Dict[KeywordDoc, Set[Location]]:
@@ -189,3 +363,10 @@ class ProjectIndex:
             self._testcase_tag_references.clear()
             self._metadata_references.clear()
             self._refs_by_file.clear()
+            self._cached_keyword_references.clear()
+            self._cached_variable_references.clear()
+            self._cached_namespace_references.clear()
+            self._cached_keyword_tag_references.clear()
+            self._cached_testcase_tag_references.clear()
+            self._cached_metadata_references.clear()
+            self._cached_refs_by_file.clear()
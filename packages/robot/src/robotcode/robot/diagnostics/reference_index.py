@@ -0,0 +1,81 @@
+"""Position index over the keyword and variable references of a namespace.
+
+Finding the keyword or variable at a position used to scan all references of
+a document on every request. The index buckets the ranges of the definitions
+and references by line, a lookup only checks the ranges on the line of the
+position.
+
+A lookup returns candidates: every definition or reference whose range
+contains the position, including its end. Callers apply their own, possibly
+stricter, range check to the candidates.
+"""
+
+from typing import Dict, Generic, Iterable, List, Set, Tuple, TypeVar
+
+from robotcode.core.lsp.types import Location, Position, Range
+
+from .entities import VariableDefinition
+from .library_doc import KeywordDoc
+
+_T = TypeVar("_T")
+
+
+class _LineIndex(Generic[_T]):
+    __slots__ = ("_lines", "entries")
+
+    def __init__(self, entries: Iterable[Tuple[_T, Set[Location]]]) -> None:
+        self.entries = list(entries)
+        self._lines: Dict[int, List[Tuple[Range, int]]] = {}
+
+    def add(self, r: Range, entry: int) -> None:
+        if r.start.line < 0 or r.end < r.start:
+            return
+
+        for line in range(r.start.line, r.end.line + 1):
+            self._lines.setdefault(line, []).append((r, entry))
+
+    def add_references(self, entry: int) -> None:
+        for ref in self.entries[entry][1]:
+            self.add(ref.range, entry)
+
+    def at(self, position: Position) -> List[Tuple[_T, Set[Location]]]:
+        ranges = self._lines.get(position.line)
+        if not ranges:
+            return []
+
+        found = sorted({entry for r, entry in ranges if r.start <= position <= r.end})
+        return [self.entries[i] for i in found]
+
+
+class ReferenceIndex:
+    """Maps a position in a document to the keywords and variables defined or referenced there.
+
+    The candidates are returned in the order of the references of the namespace.
+    """
+
+    __slots__ = ("_keywords", "_variables")
+
+    def __init__(
+        self,
+        source: str,
+        keyword_references: Dict[KeywordDoc, Set[Location]],
+        variable_references: Dict[VariableDefinition, Set[Location]],
+    ) -> None:
+        self._keywords = _LineIndex(keyword_references.items())
+        for i, (kw, _) in enumerate(self._keywords.entries):
+            if kw.source == source:
+                self._keywords.add(kw.name_range, i)
+                self._keywords.add(kw.range, i)
+            self._keywords.add_references(i)
+
+        self._variables = _LineIndex(variable_references.items())
+        for i, (var, _) in enumerate(self._variables.entries):
+            if var.source == source:
+                self._variables.add(var.name_range, i)
+            self._variables.add_references(i)
+
+    def keywords_at(self, position: Position) -> List[Tuple[KeywordDoc, Set[Location]]]:
+        return self._keywords.at(position)
+
+    def variables_at(self, position: Position) -> List[Tuple[VariableDefinition, Set[Location]]]:
+        return self._variables.at(position)
@@ -0,0 +1,160 @@
+"""Name index for the workspace symbol search.
+
+The symbols of a workspace are grouped by a key, e.g. the document they are
+defined in, and each group is replaced as a whole when it changes. For a
+query the names of the symbols of a group are matched case-insensitively by
+regular expressions over one joined string per match kind, so the cost of a
+query is dominated by the regular expression engine and not by a loop in
+Python. The joined strings are built per group, a change of a group doesn't
+rebuild the strings of the other groups.
+
+Matches are ranked, better kinds first:
+
+1. the name starts with the query, an exact match is the shortest of these
+2. the initials of the words of the name start with the query, e.g. ``ow``
+   for ``Open Workbook`` or ``openWorkbook``
+3. a word of the name starts with the query
+4. the name contains the query
+5. the name contains the characters of the query in order
+
+Within a kind shorter names are ranked first, then the names are sorted
+alphabetically.
+"""
+
+import heapq
+import itertools
+import re
+import threading
+from operator import itemgetter
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+_WORDS = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[^\W_]+")
+_REST = r"[^\n\x00]*\x00(\d+)"
+_WORD_START = "\x01"
+
+
+def split_words(name: str) -> List[str]:
+    """Split a name into its words at separators and camel case humps."""
+    return _WORDS.findall(name)
+
+
+def _clean(name: str) -> str:
+    return name.replace("\n", " ").replace("\x00", " ").replace(_WORD_START, " ")
+
+
+def _patterns(query: str) -> List[Tuple[int, "re.Pattern[str]"]]:
+    # every line of a blob is "\n<name>\x00<position>" and in the words blob every word starts with "\x01", the
+    # patterns start with a literal the regular expression engine can search for, and consume the rest of the line
+    # so each name is found only once
+    q = re.escape(query)
+    subsequence = "".join((f"[^{re.escape(c)}\n\x00]*" if i > 0 else "") + re.escape(c) for i, c in enumerate(query))
+    return [
+        (_Blobs.NAMES, re.compile(rf"\n{q}{_REST}")),
+        (_Blobs.INITIALS, re.compile(rf"\n{q}{_REST}")),
+        (_Blobs.WORDS, re.compile(rf"{_WORD_START}{q}{_REST}")),
+        (_Blobs.NAMES, re.compile(rf"{q}{_REST}")),
+        (_Blobs.NAMES, re.compile(rf"{subsequence}{_REST}")),
+    ]
+
+
+class _Blobs(Generic[_T]):
+    NAMES = 0
+    INITIALS = 1
+    WORDS = 2
+
+    __slots__ = ("blobs", "order", "sort_keys", "values")
+
+    def __init__(self, items: List[Tuple[str, _T]]) -> None:
+        self.values = [v for _, v in items]
+
+        names = [_clean(n) for n, _ in items]
+        words = [split_words(n) for n in names]
+
+        self.blobs = (
+            "".join(f"\n{n.lower()}\x00{i}" for i, n in enumerate(names)),
+            "".join(f"\n{''.join(w[0] for w in ws).lower()}\x00{i}" for i, ws in enumerate(words)),
+            "".join(f"\n{' '.join(_WORD_START + w for w in ws).lower()}\x00{i}" for i, ws in enumerate(words)),
+        )
+
+        self.sort_keys = [(len(n), n.lower(), n) for n in names]
+        self.order = sorted(range(len(names)), key=self.sort_keys.__getitem__)
+
+    def ordered(self) -> Iterator[Tuple[Tuple[int, str, str], _T]]:
+        return ((self.sort_keys[i], self.values[i]) for i in self.order)
+
+
+class SymbolIndex(Generic[_T]):
+    """Ranked fuzzy search over the names of symbols grouped by a key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._groups: Dict[Hashable, List[Tuple[str, _T]]] = {}
+        self._blobs: Dict[Hashable, _Blobs[_T]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._groups.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._groups
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._groups.keys())
+
+    def update(self, key: Hashable, items: Iterable[Tuple[str, _T]]) -> None:
+        """Replace the symbols of the given key."""
+        with self._lock:
+            self._groups[key] = list(items)
+            self._blobs.pop(key, None)
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._groups.pop(key, None)
+            self._blobs.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._groups.clear()
+            self._blobs.clear()
+
+    def _get_blobs(self) -> List[_Blobs[_T]]:
+        with self._lock:
+            result = []
+            for key, items in self._groups.items():
+                blobs = self._blobs.get(key)
+                if blobs is None:
+                    blobs = self._blobs[key] = _Blobs(items)
+                result.append(blobs)
+            return result
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[_T]:
+        """Return the values of the best matching symbols, at most ``limit`` of them."""
+        groups = self._get_blobs()
+        if limit is None:
+            limit = sum(len(g.values) for g in groups)
+
+        query = _clean(query).lower()
+        if not query:
+            ordered = heapq.merge(*(g.ordered() for g in groups), key=itemgetter(0))
+            return [v for _, v in itertools.islice(ordered, limit)]
+
+        result: List[_T] = []
+        seen: List[Set[int]] = [set() for _ in groups]
+        for blob, pattern in _patterns(query):
+            if len(result) >= limit:
+                break
+
+            found: List[Tuple[Tuple[int, str, str], _T]] = []
+            for g, g_seen in zip(groups, seen):
+                indices = set(map(int, pattern.findall(g.blobs[blob]))) - g_seen
+                g_seen |= indices
+                found.extend((g.sort_keys[i], g.values[i]) for i in sorted(indices))
+
+            # the sort is stable, symbols with the same name keep the order of the groups and in the groups
+            result.extend(v for _, v in heapq.nsmallest(limit - len(result), found, key=itemgetter(0)))
+
+        return result
@@ -50,6 +50,8 @@ class CacheConfig(ConfigBase):
     ignored_variables: List[str] = field(default_factory=list)
     ignore_arguments_for_library: List[str] = field(default_factory=list)
     cache_namespaces: bool = True
+    # Maximum size of the cache database in megabytes, 0 disables the limit. If None, the default (1024) is used.
+    max_size: Optional[int] = None
 
 
 @config_section("robotcode.analysis.robot")
@@ -59,6 +61,10 @@ class AnalysisRobotConfig(ConfigBase):
     # Timeout in seconds for loading libraries and variable files during analysis. If None, fallback to env var
     # ROBOTCODE_LOAD_LIBRARY_TIMEOUT or default (10).
     load_library_timeout: Optional[int] = None
+    # Number of warm worker processes used to load libraries and variable files concurrently.
+    library_workers: Optional[int] = None
+    # Number of imports after which a worker process is replaced by a fresh one.
+    library_worker_max_imports: Optional[int] = None
 
 
 @config_section("robotcode.analysis.diagnosticModifiers")
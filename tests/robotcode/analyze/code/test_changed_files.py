@@ -0,0 +1,60 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from robotcode.analyze.code.changed_files import ChangedFilesError, git_changed_files, resolve_changed_files
+from robotcode.core.utils.path import normalized_path
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "a.robot").write_text("a")
+    (tmp_path / "b.robot").write_text("b")
+    (tmp_path / "old.resource").write_text("old")
+    (tmp_path / ".gitignore").write_text("ignored.robot\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_git_changed_files_contains_modified_renamed_and_untracked_files(repo: Path) -> None:
+    (repo / "a.robot").write_text("changed")
+    _git(repo, "mv", "old.resource", "new.resource")
+    (repo / "untracked.robot").write_text("new")
+    (repo / "ignored.robot").write_text("ignored")
+    (repo / "sub").mkdir()
+
+    changed = git_changed_files("HEAD", repo / "sub")
+
+    assert changed == sorted(
+        normalized_path(repo / f) for f in ("a.robot", "new.resource", "old.resource", "untracked.robot")
+    )
+
+
+def test_git_changed_files_raises_on_unknown_revision(repo: Path) -> None:
+    with pytest.raises(ChangedFilesError):
+        git_changed_files("does-not-exist", repo)
+
+
+def test_resolve_changed_files_reads_stdin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.stdin", ["b.robot\n", "\n", "sub/c.resource\n"])
+
+    assert resolve_changed_files(["a.robot", "-"], tmp_path) == [
+        normalized_path(tmp_path / "a.robot"),
+        normalized_path(tmp_path / "b.robot"),
+        normalized_path(tmp_path / "sub/c.resource"),
+    ]
@@ -9,8 +9,11 @@ from robotcode.analyze.code.code_analyzer import (
     CodeAnalyzer,
     DocumentDiagnosticReport,
     FolderDiagnosticReport,
+    _initialize_worker,
+    _WorkerResult,
 )
 from robotcode.core.lsp.types import Diagnostic, DiagnosticSeverity, Position, Range
+from robotcode.plugin import ColoredOutput, CommonConfig
 
 
 @pytest.fixture
@@ -41,7 +44,7 @@ def _build_analyzer(mocker: MockerFixture, root: Path, files: List[Path]) -> Cod
     analyzer: Any = object.__new__(CodeAnalyzer)
     analyzer.app = mocker.Mock()
 
-    def make_doc(path: Path) -> Any:
+    def make_doc(path: Path, lazy: bool = False) -> Any:
         doc = mocker.Mock()
         doc.uri.to_path.return_value = path
         return doc
@@ -260,3 +263,155 @@ class TestRunYields:
         reports = list(analyzer.run())
 
         assert not any(isinstance(r, FolderDiagnosticReport) for r in reports)
+
+
+class _InlineExecutor:
+    """Stands in for the ProcessPoolExecutor and runs the batches in this process."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_InlineExecutor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def map(self, fn: Any, items: Iterable[Any]) -> Iterable[Any]:
+        return map(fn, items)
+
+
+def _build_parallel_analyzer(
+    mocker: MockerFixture, paths: List[Path], results: Dict[str, _WorkerResult], collect_unused: bool
+) -> CodeAnalyzer:
+    documents = []
+    for path in paths:
+        doc = mocker.Mock()
+        doc.uri.to_path.return_value = path
+        documents.append(doc)
+
+    analyzer: Any = _build_run_analyzer(mocker, documents=documents, collect_result=[None])
+    analyzer.app.progressbar.side_effect = lambda items, **kwargs: _passthrough_progressbar(items)
+    analyzer._analysis_config = mocker.Mock()
+    analyzer._robot_profile = mocker.Mock()
+    analyzer._root_folder = Path("/ws")
+    analyzer._collect_unused = collect_unused
+
+    mocker.patch("robotcode.analyze.code.code_analyzer.ProcessPoolExecutor", _InlineExecutor)
+    mocker.patch(
+        "robotcode.analyze.code.code_analyzer._analyze_in_worker",
+        side_effect=lambda batch: [results[p] for p in batch],
+    )
+
+    return cast(CodeAnalyzer, analyzer)
+
+
+class TestRunParallel:
+    def test_reports_keep_document_order(self, mocker: MockerFixture) -> None:
+        paths = [Path(f"/ws/{i}.robot") for i in range(5)]
+        results = {
+            str(p): _WorkerResult([_diag(message=f"a{i}")], [], [_diag(message=f"c{i}")], [])
+            for i, p in enumerate(paths)
+        }
+        analyzer = _build_parallel_analyzer(mocker, paths, results, collect_unused=False)
+
+        doc_reports = [r for r in analyzer.run(jobs=2) if isinstance(r, DocumentDiagnosticReport)]
+
+        assert [r.items[0].message for r in doc_reports] == [*(f"a{i}" for i in range(5)), *(f"c{i}" for i in range(5))]
+        cast(Any, analyzer.diagnostics).analyze_document.assert_not_called()
+
+    def test_worker_errors_route_to_app_error(self, mocker: MockerFixture) -> None:
+        paths = [Path("/ws/a.robot"), Path("/ws/b.robot")]
+        results = {
+            str(paths[0]): _WorkerResult([], ["Error analyzing a: kaboom"], [], []),
+            str(paths[1]): _WorkerResult([], [], [], []),
+        }
+        analyzer = _build_parallel_analyzer(mocker, paths, results, collect_unused=False)
+
+        doc_reports = [r for r in analyzer.run(jobs=2) if isinstance(r, DocumentDiagnosticReport)]
+
+        cast(Any, analyzer.app).error.assert_called_once_with("Error analyzing a: kaboom")
+        assert len(doc_reports) == 2
+
+    def test_collect_unused_appends_project_diagnostics(self, mocker: MockerFixture) -> None:
+        paths = [Path("/ws/a.robot"), Path("/ws/b.robot")]
+        collected = _diag(message="collected")
+        unused = _diag(DiagnosticSeverity.WARNING, message="unused")
+        results = {str(p): _WorkerResult([], [], [collected], []) for p in paths}
+        analyzer = _build_parallel_analyzer(mocker, paths, results, collect_unused=True)
+        cast(Any, analyzer.diagnostics).collect_project_diagnostics.return_value = [[unused]]
+
+        doc_reports = [r for r in analyzer.run(jobs=2) if isinstance(r, DocumentDiagnosticReport)]
+
+        assert [r.items for r in doc_reports] == [[collected, unused], [collected, unused]]
+        # namespaces are loaded in this process to merge the references of all documents
+        assert cast(Any, analyzer.diagnostics).analyze_document.call_count == 2
+
+    def test_collect_unused_without_namespace_cache_runs_serially(self, mocker: MockerFixture) -> None:
+        paths = [Path("/ws/a.robot"), Path("/ws/b.robot")]
+        analyzer = _build_parallel_analyzer(mocker, paths, {}, collect_unused=True)
+        cast(Any, analyzer.analysis_config).cache.cache_namespaces = False
+        worker = mocker.patch("robotcode.analyze.code.code_analyzer._analyze_in_worker")
+
+        doc_reports = [r for r in analyzer.run(jobs=2) if isinstance(r, DocumentDiagnosticReport)]
+
+        worker.assert_not_called()
+        assert len(doc_reports) == 2
+        assert cast(Any, analyzer.diagnostics).analyze_document.call_count == 2
+
+    def test_workers_get_the_application_config(self, mocker: MockerFixture) -> None:
+        code_analyzer = mocker.patch("robotcode.analyze.code.code_analyzer.CodeAnalyzer")
+        config = CommonConfig(verbose=True, colored_output=ColoredOutput.NO)
+
+        _initialize_worker(config, mocker.Mock(), mocker.Mock(), Path("/ws"))
+
+        assert code_analyzer.call_args[0][0].config is config
+
+
+class TestRunChangedFiles:
+    def _analyzer(
+        self, mocker: MockerFixture, paths: List[Path], affected: Any, cached: Dict[Path, Any], collect_unused: bool
+    ) -> CodeAnalyzer:
+        documents = []
+        for path in paths:
+            doc = mocker.Mock()
+            doc.uri.to_path.return_value = path
+            documents.append(doc)
+
+        analyzer: Any = _build_run_analyzer(mocker, documents=documents, analyze_result=[None], collect_result=[None])
+        analyzer._collect_unused = collect_unused
+        analyzer.diagnostics.find_affected_documents.return_value = affected
+        analyzer.diagnostics.load_cached_diagnostics.side_effect = lambda doc: cached[doc.uri.to_path()]
+
+        return cast(CodeAnalyzer, analyzer)
+
+    def test_unaffected_documents_reuse_cached_diagnostics(self, mocker: MockerFixture) -> None:
+        a, b, c = Path("/ws/a.robot"), Path("/ws/b.robot"), Path("/ws/c.robot")
+        d = _diag(message="cached")
+        analyzer = self._analyzer(mocker, [a, b, c], [{a}], {b: [[d]], c: [None]}, collect_unused=False)
+
+        doc_reports = [r for r in analyzer.run(changed_files=[a]) if isinstance(r, DocumentDiagnosticReport)]
+
+        assert [(r.document.uri.to_path(), r.items) for r in doc_reports] == [(b, [d]), (a, []), (c, [])]
+        analyzed = [
+            call.args[0].uri.to_path() for call in cast(Any, analyzer.diagnostics).analyze_document.call_args_list
+        ]
+        assert analyzed == [a, c]
+
+    def test_collect_unused_analyzes_all_documents(self, mocker: MockerFixture) -> None:
+        a, b = Path("/ws/a.robot"), Path("/ws/b.robot")
+        analyzer = self._analyzer(mocker, [a, b], [{a}], {b: [[_diag()]]}, collect_unused=True)
+
+        doc_reports = [r for r in analyzer.run(changed_files=[a]) if isinstance(r, DocumentDiagnosticReport)]
+
+        assert [r.document.uri.to_path() for r in doc_reports] == [a, b]
+        cast(Any, analyzer.diagnostics).load_cached_diagnostics.assert_not_called()
+
+    def test_dependency_error_analyzes_all_documents(self, mocker: MockerFixture) -> None:
+        a, b = Path("/ws/a.robot"), Path("/ws/b.robot")
+        analyzer = self._analyzer(mocker, [a, b], [RuntimeError("kaboom")], {b: [[_diag()]]}, collect_unused=False)
+
+        doc_reports = [r for r in analyzer.run(changed_files=[a]) if isinstance(r, DocumentDiagnosticReport)]
+
+        assert [r.document.uri.to_path() for r in doc_reports] == [a, b]
+        assert "kaboom" in cast(Any, analyzer.app).error.call_args[0][0]
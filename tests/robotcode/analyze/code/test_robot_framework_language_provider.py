@@ -8,7 +8,8 @@ from robotcode.analyze.code.robot_framework_language_provider import RobotFramew
 def _registered_handlers(mocker: MockerFixture, collect_unused: bool) -> Set[str]:
     """
     Instantiate the provider with a mocked DiagnosticsContext and return the
-    names of the methods that ended up registered as document_collectors.
+    names of the methods that ended up registered as document_collectors or
+    project_collectors.
     """
     mocker.patch("robotcode.analyze.code.robot_framework_language_provider.DocumentsCacheHelper")
     mocker.patch.object(RobotFrameworkLanguageProvider, "_update_python_path")
@@ -18,6 +19,7 @@ def _registered_handlers(mocker: MockerFixture, collect_unused: bool) -> Set[str
 
     collectors: List[Any] = []
     ctx.diagnostics.document_collectors.add.side_effect = lambda h: collectors.append(h)
+    ctx.diagnostics.project_collectors.add.side_effect = lambda h: collectors.append(h)
 
     RobotFrameworkLanguageProvider(ctx)
 
@@ -0,0 +1,122 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from robotcode.core.utils.caching import SimpleLRUCache
+
+
+def _identity(v: int) -> int:
+    return v
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = SimpleLRUCache(2)
+
+    cache.get(_identity, 1)
+    cache.get(_identity, 2)
+    cache.get(_identity, 1)
+    cache.get(_identity, 3)
+
+    assert cache.has(1)
+    assert not cache.has(2)
+    assert cache.has(3)
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+
+
+def test_unbounded_cache_never_evicts() -> None:
+    cache = SimpleLRUCache(max_items=None)
+
+    for i in range(1000):
+        cache.get(_identity, i)
+
+    assert len(cache) == 1000
+    assert cache.stats.evictions == 0
+
+
+def test_has_does_not_create_entries() -> None:
+    cache = SimpleLRUCache(2)
+
+    assert not cache.has(1)
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_ttl() -> None:
+    cache = SimpleLRUCache(ttl=0.05)
+
+    cache.get(_identity, 1)
+    assert cache.has(1)
+
+    time.sleep(0.1)
+
+    assert not cache.has(1)
+    assert cache.get(_identity, 1) == 1
+    assert cache.stats.expirations == 1
+    assert cache.stats.misses == 2
+
+
+def test_size_aware_eviction() -> None:
+    cache = SimpleLRUCache(max_items=None, max_size=10, sizeof=len)
+
+    cache.get(lambda v: "x" * v, 4)
+    cache.get(lambda v: "x" * v, 5)
+    cache.get(lambda v: "x" * v, 6)
+
+    assert not cache.has(4)
+    assert cache.has(6)
+    assert cache.size <= 10
+
+    cache.get(lambda v: "x" * v, 20)
+    assert not cache.has(20)
+    assert cache.has(6)
+
+
+def test_value_is_computed_once_for_concurrent_calls() -> None:
+    cache = SimpleLRUCache()
+    calls: List[int] = []
+    barrier = threading.Barrier(4)
+
+    def compute(v: int) -> int:
+        calls.append(v)
+        time.sleep(0.05)
+        return v
+
+    def run(_: int) -> int:
+        barrier.wait()
+        return cache.get(compute, 1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(run, range(4))) == [1, 1, 1, 1]
+
+    assert calls == [1]
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 3
+
+
+def test_exceptions_are_not_cached() -> None:
+    cache = SimpleLRUCache()
+
+    def fail(v: int) -> int:
+        raise ValueError(v)
+
+    with pytest.raises(ValueError, match="1"):
+        cache.get(fail, 1)
+
+    assert not cache.has(1)
+    assert cache.get(_identity, 1) == 1
+
+
+def test_clear_keeps_stats() -> None:
+    cache = SimpleLRUCache()
+
+    cache.get(_identity, 1)
+    cache.get(_identity, 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.stats.hit_ratio == 0.5
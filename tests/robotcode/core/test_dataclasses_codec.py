@@ -0,0 +1,105 @@
+import json
+import math
+from typing import Any
+
+import pytest
+
+from robotcode.core.lsp.types import (
+    CompletionItem,
+    CompletionItemKind,
+    CompletionItemTag,
+    CompletionList,
+    Diagnostic,
+    DiagnosticRelatedInformation,
+    DiagnosticSeverity,
+    Location,
+    MarkupContent,
+    MarkupKind,
+    Position,
+    PublishDiagnosticsParams,
+    Range,
+    SemanticTokens,
+    TextEdit,
+)
+from robotcode.core.utils.dataclasses import as_json, from_dict, from_json
+
+RANGE = Range(Position(1, 2), Position(3, 4))
+
+
+def _completion_list(count: int) -> CompletionList:
+    return CompletionList(
+        is_incomplete=False,
+        items=[
+            CompletionItem(
+                label=f"Keyword {i}",
+                kind=CompletionItemKind.KEYWORD,
+                tags=[CompletionItemTag.DEPRECATED] if i % 5 == 0 else None,
+                detail="detail",
+                documentation=MarkupContent(MarkupKind.MARKDOWN, "documentation " * 10),
+                text_edit=TextEdit(RANGE, f"Keyword {i}"),
+                data={"index": i, "values": [1, 2.5, None, "x"]},
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def _diagnostics(count: int) -> PublishDiagnosticsParams:
+    return PublishDiagnosticsParams(
+        "file:///test.robot",
+        [
+            Diagnostic(
+                RANGE,
+                f"message {i}",
+                DiagnosticSeverity.ERROR,
+                code="KeywordNotFound",
+                source="robotcode",
+                related_information=[DiagnosticRelatedInformation(Location("file:///other.robot", RANGE), "here")],
+            )
+            for i in range(count)
+        ],
+        version=1,
+    )
+
+
+def _semantic_tokens(count: int) -> SemanticTokens:
+    return SemanticTokens(data=list(range(count)), result_id="1")
+
+
+MESSAGES = [_completion_list(50), _diagnostics(50), _semantic_tokens(500)]
+
+
+@pytest.mark.parametrize("message", MESSAGES, ids=lambda m: type(m).__name__)
+def test_lsp_messages_round_trip(message: Any) -> None:
+    s = as_json(message, compact=True)
+
+    assert from_json(s, type(message)) == message
+    assert as_json(from_json(s, type(message)), compact=True) == s
+
+
+def test_none_values_are_omitted_only_for_fields_with_defaults() -> None:
+    assert json.loads(as_json(CompletionItem(label="a"))) == {"label": "a"}
+    assert json.loads(as_json(Position(1, 2))) == {"line": 1, "character": 2}
+
+
+def test_errors_contain_the_path_to_the_invalid_value() -> None:
+    with pytest.raises(TypeError, match=r'Invalid value for "items\.text_edit"'):
+        from_dict(
+            {"isIncomplete": False, "items": [{"label": "a", "textEdit": {"newText": 1}}]},
+            CompletionList,
+        )
+
+
+def test_from_json_handles_values_not_representable_by_all_backends() -> None:
+    assert from_json('{"a": 123456789012345678901234567890}') == {"a": 123456789012345678901234567890}
+    assert math.isnan(from_json('{"a": NaN}')["a"])
+    assert from_json('"\\ud800"') == "\ud800"
+
+
+@pytest.mark.parametrize(
+    "message",
+    [_completion_list(2000), _diagnostics(1000), _semantic_tokens(50000)],
+    ids=lambda m: type(m).__name__,
+)
+def test_large_lsp_messages_roundtrip(message: Any) -> None:
+    assert from_json(as_json(message, compact=True), type(message)) == message
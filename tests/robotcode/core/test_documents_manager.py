@@ -2,9 +2,10 @@ import os
 from pathlib import Path
 from typing import Any, List, Optional
 
+import pytest
 from pytest_mock import MockerFixture
 
-from robotcode.core.documents_manager import DocumentsManager
+from robotcode.core.documents_manager import CantReadDocumentError, DocumentsManager
 from robotcode.core.uri import Uri
 from robotcode.core.utils.path import RACY_MTIME_EPSILON_NS
 
@@ -131,3 +132,38 @@ def test_get_or_open_document_attaches_disk_info(tmp_path: Path) -> None:
     assert document.disk_info is not None
     assert document.disk_info.size == len("content")
     assert document.disk_info.trusted is True
+
+
+def test_lazy_opened_document_reads_text_on_first_access(tmp_path: Path) -> None:
+    file = tmp_path / "a.robot"
+    file.write_text("content")
+    _backdate(file)
+    reader = _FileReader()
+    manager = _make_manager(reader)
+
+    document = manager.get_or_open_document(file, lazy=True)
+
+    assert reader.read_count == 0
+    assert document.disk_info is not None
+    assert document.disk_info.size == len("content")
+
+    assert document.text() == "content"
+    assert reader.read_count == 1
+    assert manager.get_or_open_document(file) is document
+
+    assert document.release_text()
+    file.write_text("changed")
+    assert document.text() == "changed"
+    assert document.disk_info is not None
+    assert document.disk_info.size == len("changed")
+
+
+def test_lazy_opened_document_raises_read_errors_on_access(tmp_path: Path) -> None:
+    file = tmp_path / "a.robot"
+    file.write_text("content")
+    manager = DocumentsManager([])
+
+    document = manager.get_or_open_document(file, lazy=True)
+
+    with pytest.raises(CantReadDocumentError):
+        document.text()
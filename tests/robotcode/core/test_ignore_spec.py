@@ -0,0 +1,104 @@
+import os
+from pathlib import Path, PurePath
+from typing import Any, List
+
+import pytest
+
+from robotcode.core.ignore_spec import IgnoreSpec, iter_files
+from robotcode.core.utils.glob_path import Pattern, PatternSet
+
+RULES = [
+    "*.log",
+    "build/",
+    "/output",
+    "docs/**/*.html",
+    "!docs/keep/*.html",
+    "node_modules/",
+    "!important.log",
+    "tmp*/",
+    "!tmp_keep/",
+    "**/generated",
+]
+
+PATHS = [
+    ("a.log", False),
+    ("important.log", False),
+    ("sub/important.log", False),
+    ("sub/debug.log", False),
+    ("build", True),
+    ("build", False),
+    ("src/build", True),
+    ("output", True),
+    ("src/output", True),
+    ("docs/x/index.html", False),
+    ("docs/keep/index.html", False),
+    ("docs/keep", True),
+    ("node_modules", True),
+    ("src/node_modules/lib/a.robot", False),
+    ("tmp1", True),
+    ("tmp_keep", True),
+    ("tmp_keep/a.robot", False),
+    ("src/generated", True),
+    ("src/generated", False),
+    ("tests/suite.robot", False),
+    (".", True),
+]
+
+
+def _matches_rule_by_rule(spec: IgnoreSpec, path: Path, is_dir: bool) -> bool:
+    for rule in reversed(list(spec.rules)):
+        if rule.matches(PurePath(path), is_dir):
+            return not rule.negation
+    return False
+
+
+@pytest.mark.parametrize(("path", "is_dir"), PATHS)
+def test_spec_matches_like_rule_by_rule(tmp_path: Path, path: str, is_dir: bool) -> None:
+    spec = IgnoreSpec.from_list(RULES, tmp_path) + IgnoreSpec.from_list(["*.robot", "!tests/"], tmp_path / "src")
+    full_path = tmp_path / path
+
+    assert spec.matches(full_path, is_dir=is_dir) == _matches_rule_by_rule(spec, full_path, is_dir)
+    # decisions for directories are cached
+    assert spec.matches(full_path, is_dir=is_dir) == _matches_rule_by_rule(spec, full_path, is_dir)
+
+
+def test_iter_files_does_not_list_ignored_directories(tmp_path: Path, monkeypatch: Any) -> None:
+    for name in ["suite.robot", "node_modules/pkg/a.robot", "lib/b.robot", "lib/build/c.robot"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("")
+    (tmp_path / ".gitignore").write_text("node_modules/\nbuild/\n")
+
+    listed: List[str] = []
+    scandir = os.scandir
+
+    def _scandir(path: Any) -> Any:
+        listed.append(Path(path).relative_to(tmp_path).as_posix())
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+
+    files = sorted(p.relative_to(tmp_path).as_posix() for p in iter_files(tmp_path))
+
+    assert files == [".gitignore", "lib/b.robot", "suite.robot"]
+    assert sorted(listed) == [".", "lib"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["robot.libraries.BuiltIn", "mylib/Keywords.py", "mylib/sub/Keywords.py", "other/Keywords.py", "Collections", ""],
+)
+def test_pattern_set_matches_like_single_patterns(path: str) -> None:
+    patterns = [Pattern(p) for p in ["robot.libraries.*", "**/sub/*.py", "Collections", "mylib/*.py", "dirs/"]]
+    pattern_set = PatternSet(patterns)
+
+    assert pattern_set.matches(path) == any(p.matches(path) for p in patterns)
+    assert pattern_set.matches(path, is_dir=False) == any(p.matches(path) and not p.only_dirs for p in patterns)
+
+
+def test_pattern_set_matches_directory_patterns_only_for_directories() -> None:
+    pattern_set = PatternSet(["output/", "*.log"])
+
+    assert pattern_set.matches("output", is_dir=True)
+    assert not pattern_set.matches("output", is_dir=False)
+    assert pattern_set.matches("run.log", is_dir=False)
+    assert not PatternSet()
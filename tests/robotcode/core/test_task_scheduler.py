@@ -0,0 +1,137 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+from typing import Iterator, List
+
+import pytest
+
+from robotcode.core.concurrent import TaskPriority, TaskScheduler, check_current_task_canceled
+
+
+@pytest.fixture
+def scheduler() -> Iterator[TaskScheduler]:
+    result = TaskScheduler(max_workers=2, starvation_timeout=1.0, idle_timeout=5)
+    try:
+        yield result
+    finally:
+        result.shutdown()
+
+
+def test_tasks_return_results_and_exceptions(scheduler: TaskScheduler) -> None:
+    def fail() -> None:
+        raise ValueError("boom")
+
+    assert scheduler.submit(TaskPriority.INTERACTIVE, lambda a, b: a + b, 1, b=2).result(5) == 3
+    with pytest.raises(ValueError, match="boom"):
+        scheduler.submit(TaskPriority.BACKGROUND, fail).result(5)
+
+
+def test_number_of_workers_is_bounded(scheduler: TaskScheduler) -> None:
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    tasks = [scheduler.submit(TaskPriority.INTERACTIVE, work) for _ in range(10)]
+    for task in tasks:
+        task.result(5)
+
+    assert max_running == 2
+    assert scheduler.stats.workers <= 2
+
+
+def test_higher_priority_lanes_are_started_first(scheduler: TaskScheduler) -> None:
+    started: List[str] = []
+    release = threading.Event()
+
+    blockers = [scheduler.submit(TaskPriority.INTERACTIVE, release.wait, 5) for _ in range(2)]
+    time.sleep(0.1)
+
+    tasks = [
+        scheduler.submit(TaskPriority.BACKGROUND, started.append, "background"),
+        scheduler.submit(TaskPriority.DIAGNOSTICS, started.append, "diagnostics"),
+        scheduler.submit(TaskPriority.INTERACTIVE, started.append, "interactive"),
+    ]
+    release.set()
+    for task in [*blockers, *tasks]:
+        task.result(5)
+
+    assert started == ["interactive", "diagnostics", "background"]
+
+
+def test_lane_limit_leaves_workers_for_interactive_tasks() -> None:
+    scheduler = TaskScheduler(max_workers=2, lane_limits={TaskPriority.BACKGROUND: 1}, starvation_timeout=10)
+    try:
+        release = threading.Event()
+        background = [scheduler.submit(TaskPriority.BACKGROUND, release.wait, 5) for _ in range(2)]
+
+        assert scheduler.submit(TaskPriority.INTERACTIVE, lambda: 1).result(1) == 1
+        assert not background[1].running()
+
+        release.set()
+        for task in background:
+            task.result(5)
+    finally:
+        scheduler.shutdown()
+
+
+def test_waiting_on_queued_tasks_does_not_deadlock(scheduler: TaskScheduler) -> None:
+    def outer() -> int:
+        return scheduler.submit(TaskPriority.INTERACTIVE, lambda: 1).result(5)
+
+    tasks = [scheduler.submit(TaskPriority.INTERACTIVE, outer) for _ in range(2)]
+
+    assert [t.result(10) for t in tasks] == [1, 1]
+
+
+def test_cancel_queued_and_running_tasks(scheduler: TaskScheduler) -> None:
+    release = threading.Event()
+    started = threading.Event()
+
+    def cancelable() -> None:
+        started.set()
+        while True:
+            check_current_task_canceled(0.01)
+
+    running = scheduler.submit(TaskPriority.INTERACTIVE, cancelable)
+    blocker = scheduler.submit(TaskPriority.INTERACTIVE, release.wait, 5)
+    queued = scheduler.submit(TaskPriority.INTERACTIVE, lambda: None)
+
+    assert started.wait(5)
+    assert queued.cancel()
+
+    running.cancel()
+    with pytest.raises(CancelledError):
+        running.result(5)
+
+    release.set()
+    blocker.result(5)
+
+
+def test_stats_report_queue_depth_and_wait_time(scheduler: TaskScheduler) -> None:
+    release = threading.Event()
+
+    blockers = [scheduler.submit(TaskPriority.INTERACTIVE, release.wait, 5) for _ in range(2)]
+    queued = scheduler.submit(TaskPriority.DIAGNOSTICS, lambda: None)
+    time.sleep(0.1)
+
+    stats = scheduler.stats
+    assert stats.lanes[TaskPriority.INTERACTIVE].running == 2
+    assert stats.lanes[TaskPriority.DIAGNOSTICS].queued == 1
+
+    release.set()
+    for task in [*blockers, queued]:
+        task.result(5)
+
+    lane = scheduler.stats.lanes[TaskPriority.DIAGNOSTICS]
+    assert lane.queued == 0
+    assert lane.started == 1
+    assert lane.max_wait_time >= 0.1
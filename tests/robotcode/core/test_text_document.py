@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from robotcode.core.lsp.types import Position, Range
 from robotcode.core.text_document import TextDocument
@@ -90,3 +90,122 @@ def test_clear_clears_disk_info() -> None:
     document.clear()
 
     assert document.disk_info is None
+
+
+def _change(document: TextDocument, start: Position, end: Position, text: str) -> None:
+    document.apply_incremental_change(None, Range(start, end), text)
+
+
+def test_incremental_changes_keep_lines_up_to_date() -> None:
+    document = TextDocument(document_uri="file:///test.robot", text="a\nb\nc\n")
+
+    _change(document, Position(1, 0), Position(1, 1), "x\ny")
+    assert document.get_lines() == ["a\n", "x\n", "y\n", "c\n"]
+
+    _change(document, Position(0, 1), Position(2, 0), "")
+    assert document.get_lines() == ["ay\n", "c\n"]
+
+    _change(document, Position(2, 0), Position(2, 0), "d")
+    assert document.text() == "ay\nc\nd"
+    assert document.get_lines() == ["ay\n", "c\n", "d"]
+
+
+def test_incremental_change_joining_line_breaks() -> None:
+    document = TextDocument(document_uri="file:///test.robot", text="a\rb\nc")
+
+    _change(document, Position(1, 0), Position(1, 1), "")
+
+    assert document.get_lines() == ["a\r\n", "c"]
+    assert document.text() == "a\r\nc"
+
+
+def test_incremental_change_does_not_modify_handed_out_lines() -> None:
+    document = TextDocument(document_uri="file:///test.robot", text="a\nb\n")
+    lines = document.get_lines()
+
+    _change(document, Position(0, 0), Position(0, 1), "x")
+
+    assert lines == ["a\n", "b\n"]
+    assert document.get_lines() == ["x\n", "b\n"]
+
+
+def test_incremental_change_with_multibyte_characters() -> None:
+    document = TextDocument(document_uri="file:///test.robot", text="\U0001f600a\U0001f600b\n")
+
+    assert document.position_to_utf16(Position(0, 3)) == Position(0, 5)
+    assert document.position_from_utf16(Position(0, 5)) == Position(0, 3)
+    assert document.position_from_utf16(Position(0, 1)) == Position(0, 0)
+
+    _change(document, Position(0, 2), Position(0, 3), "x")
+
+    assert document.text() == "\U0001f600x\U0001f600b\n"
+
+
+def test_lazy_document_loads_text_on_first_access() -> None:
+    info = DiskInfo(1, 2)
+    loads = []
+
+    def loader() -> Tuple[str, Optional[DiskInfo]]:
+        loads.append(True)
+        return "first\nsecond\n", info
+
+    document = TextDocument("file:///test.robot", None, disk_info=info, text_loader=loader)
+
+    assert not document.is_text_loaded
+    assert document.disk_info == info
+    assert not loads
+
+    assert document.get_lines() == ["first\n", "second\n"]
+    assert document.text() == "first\nsecond\n"
+    assert len(loads) == 1
+    assert not document.revert(None)
+
+
+def test_released_text_is_read_again() -> None:
+    texts = ["first\n", "second\n"]
+
+    document = TextDocument(
+        "file:///test.robot", None, disk_info=DiskInfo(1, 2), text_loader=lambda: (texts.pop(0), DiskInfo(1, 2))
+    )
+
+    assert document.text() == "first\n"
+    assert document.release_text()
+    assert not document.is_text_loaded
+    assert document.text() == "second\n"
+
+
+def test_changed_or_opened_document_keeps_its_text() -> None:
+    document = TextDocument(
+        "file:///test.robot", None, disk_info=DiskInfo(1, 2), text_loader=lambda: ("first\n", DiskInfo(1, 2))
+    )
+
+    document.opened_in_editor = True
+    assert not document.release_text()
+
+    document.opened_in_editor = False
+    document.apply_full_change(None, "changed\n")
+    assert not document.release_text()
+    assert document.text() == "changed\n"
+
+    assert not _make_document(DiskInfo(1, 2)).release_text()
+
+
+def test_reading_a_changed_file_invalidates_the_cache() -> None:
+    infos = [DiskInfo(1, 2), DiskInfo(3, 4)]
+    document = TextDocument("file:///test.robot", None, disk_info=infos[0], text_loader=lambda: ("text\n", infos[0]))
+
+    def line_count(document: TextDocument) -> int:
+        return len(document.get_lines())
+
+    assert document.get_cache(line_count) == 1
+    assert document.get_cache_value(line_count) == 1
+
+    document.release_text()
+    assert document.text() == "text\n"
+    assert document.get_cache_value(line_count) == 1
+
+    infos[0] = infos[1]
+    document.release_text()
+    assert document.text() == "text\n"
+    assert document.get_cache_value(line_count) is None
+    assert document.disk_info == infos[1]
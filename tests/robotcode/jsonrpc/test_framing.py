@@ -0,0 +1,146 @@
+import json
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pytest
+
+from robotcode.jsonrpc2.protocol import JsonRPCProtocol, JsonRPCProtocolBase
+
+
+class FramingProtocol(JsonRPCProtocolBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bodies: List[Tuple[bytes, str]] = []
+
+    def _handle_body(self, body: bytes, charset: str) -> None:
+        self.bodies.append((body, charset))
+
+
+def _message(body: bytes, content_type: bool = True) -> bytes:
+    header = f"Content-Length: {len(body)}\r\n"
+    if content_type:
+        header += "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n"
+    return (header + "\r\n").encode("ascii") + body
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024])
+def test_messages_split_at_any_position_are_framed(chunk_size: int) -> None:
+    protocol = FramingProtocol()
+    bodies = [b'{"a": 1}', b"", b'{"b": "' + b"x" * 500 + b'"}', b"[]"]
+
+    for chunk in _chunks(b"".join(_message(b) for b in bodies), chunk_size):
+        protocol.data_received(chunk)
+
+    assert [b for b, _ in protocol.bodies] == bodies
+
+
+def test_multiple_messages_in_one_chunk_are_framed() -> None:
+    protocol = FramingProtocol()
+
+    protocol.data_received(_message(b"{}") + _message(b"[]", content_type=False) + _message(b"{}")[:5])
+
+    assert [b for b, _ in protocol.bodies] == [b"{}", b"[]"]
+
+    protocol.data_received(_message(b"{}")[5:])
+
+    assert [b for b, _ in protocol.bodies] == [b"{}", b"[]", b"{}"]
+
+
+def test_charset_and_header_case_are_respected() -> None:
+    protocol = FramingProtocol()
+
+    protocol.data_received(b"content-length: 2\r\nContent-Type: application/json; charset=latin-1\r\n\r\n{}")
+    protocol.data_received(b"Content-Length:2\r\n\r\n[]")
+
+    assert protocol.bodies == [(b"{}", "latin-1"), (b"[]", "utf-8")]
+
+
+def test_headers_without_content_length_are_skipped() -> None:
+    protocol = FramingProtocol()
+
+    protocol.data_received(b"garbage\r\n\r\nContent-Type: text/plain\r\n\r\n" + _message(b"{}"))
+
+    assert protocol.bodies == [(b"{}", "utf-8")]
+
+
+class CountingProtocol(FramingProtocol):
+    def __init__(self) -> None:
+        super().__init__()
+        self.parsed_headers = 0
+
+    def _parse_header(self, header: bytes) -> Tuple[Optional[int], str]:
+        self.parsed_headers += 1
+        return super()._parse_header(header)
+
+
+def test_multi_megabyte_message_in_small_chunks_is_copied_into_one_buffer() -> None:
+    size = 8 * 1024 * 1024
+    chunks = list(_chunks(_message(b'{"data": "' + b"x" * size + b'"}'), 4096))
+    protocol = CountingProtocol()
+
+    protocol.data_received(chunks[0])
+    body_buf = protocol._body_buf
+
+    assert body_buf is not None
+    assert len(body_buf) == size + 12
+
+    for chunk in chunks[1:-1]:
+        protocol.data_received(chunk)
+        # the body is not searched for a header again and the buffer is never reallocated
+        assert protocol._body_buf is body_buf
+        assert not protocol._header_buf
+
+    protocol.data_received(chunks[-1])
+
+    assert protocol.parsed_headers == 1
+    assert protocol._body_buf is None
+    assert len(protocol.bodies) == 1
+    assert len(protocol.bodies[0][0]) == size + 12
+
+
+def test_many_small_messages_in_one_chunk_are_not_buffered() -> None:
+    data = b"".join(_message(b'{"jsonrpc": "2.0", "method": "x"}') for _ in range(20000))
+    protocol = CountingProtocol()
+
+    protocol.data_received(data)
+
+    assert protocol.parsed_headers == 20000
+    assert len(protocol.bodies) == 20000
+    assert protocol._body_buf is None
+    assert not protocol._header_buf
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.writes: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+
+class _Loop:
+    def call_soon_threadsafe(self, callback: Any, *args: Any) -> None:
+        callback(*args)
+
+
+def test_notifications_are_sent_with_one_write() -> None:
+    transport = _Transport()
+    protocol = JsonRPCProtocol()
+    protocol.write_transport = transport  # type: ignore[assignment]
+    protocol._loop = _Loop()  # type: ignore[assignment]
+
+    protocol.send_notifications("test/notify", [{"a": 1}, {"b": 2}])
+
+    assert len(transport.writes) == 1
+
+    received = FramingProtocol()
+    received.data_received(transport.writes[0])
+
+    assert [json.loads(b) for b, _ in received.bodies] == [
+        {"jsonrpc": "2.0", "method": "test/notify", "params": {"a": 1}},
+        {"jsonrpc": "2.0", "method": "test/notify", "params": {"b": 2}},
+    ]
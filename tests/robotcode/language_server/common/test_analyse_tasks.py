@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any, cast
+
+from robotcode.core.concurrent import RLock, check_current_task_canceled, run_as_task
+from robotcode.core.text_document import TextDocument
+from robotcode.language_server.common.parts.diagnostics import DiagnosticsProtocolPart
+
+
+def _diagnostics_part(timeout: float) -> DiagnosticsProtocolPart:
+    part: Any = object.__new__(DiagnosticsProtocolPart)
+    part._current_diagnostics_task_lock = RLock()
+    part._current_diagnostics_tasks = {}
+    part._timed_out_diagnostics_tasks = set()
+    part._diagnostics_task_timeout = timeout
+    return cast(DiagnosticsProtocolPart, part)
+
+
+def _document() -> TextDocument:
+    return TextDocument(document_uri="file:///test.robot", language_id="robotframework", version=None, text="")
+
+
+def test_timed_out_task_is_cancelled_and_keeps_its_slot_until_it_stops() -> None:
+    part = _diagnostics_part(timeout=0)
+    release = threading.Event()
+    cancelled = threading.Event()
+
+    def stuck() -> None:
+        try:
+            while True:
+                check_current_task_canceled(0.01)
+        finally:
+            cancelled.set()
+            release.wait(10)
+
+    task = run_as_task(stuck)
+    part._current_diagnostics_tasks[task] = (_document(), time.monotonic())
+
+    assert part._wait_for_analyse_tasks() == (0, False)
+    assert task.cancelation_requested
+    assert cancelled.wait(10)
+    # the task is still running, so its slot is not free for a new one
+    assert part._wait_for_analyse_tasks() == (0, False)
+    assert len(part._current_diagnostics_tasks) == 1
+
+    release.set()
+    task.exception(10)
+
+    assert part._wait_for_analyse_tasks() == (1, False)
+    assert part._current_diagnostics_tasks == {}
+    assert part._timed_out_diagnostics_tasks == set()
+
+
+def test_running_task_is_not_cancelled_before_the_timeout() -> None:
+    part = _diagnostics_part(timeout=300)
+    release = threading.Event()
+    task = run_as_task(release.wait, 10)
+    part._current_diagnostics_tasks[task] = (_document(), time.monotonic())
+
+    try:
+        assert part._wait_for_analyse_tasks() == (0, False)
+        assert not task.cancelation_requested
+    finally:
+        release.set()
+
+    task.result(10)
+    assert part._wait_for_analyse_tasks() == (1, False)
@@ -0,0 +1,74 @@
+import time
+from typing import List, Set
+
+from robotcode.core.lsp.types import Diagnostic, Position, PublishDiagnosticsParams, Range
+from robotcode.language_server.common.parts.diagnostics import DiagnosticsPublisher
+
+
+def _params(uri: str, *messages: str, version: int = 1) -> PublishDiagnosticsParams:
+    return PublishDiagnosticsParams(
+        uri=uri,
+        version=version,
+        diagnostics=[Diagnostic(Range(Position(0, 0), Position(0, 1)), m) for m in messages],
+    )
+
+
+def test_latest_diagnostics_of_a_document_are_sent_in_one_batch() -> None:
+    sent: List[List[PublishDiagnosticsParams]] = []
+    publisher = DiagnosticsPublisher(sent.append, delay=60)
+
+    publisher.publish(_params("file:///a.robot", "first"))
+    publisher.publish(_params("file:///b.robot", "b"))
+    publisher.publish(_params("file:///a.robot", "first", "second", version=2))
+    publisher.flush()
+
+    assert sent == [[_params("file:///a.robot", "first", "second", version=2), _params("file:///b.robot", "b")]]
+
+    publisher.flush()
+    assert len(sent) == 1
+
+
+def test_unchanged_diagnostics_are_not_sent_again() -> None:
+    sent: List[List[PublishDiagnosticsParams]] = []
+    publisher = DiagnosticsPublisher(sent.append, delay=60)
+
+    publisher.publish(_params("file:///a.robot", "error"))
+    publisher.flush()
+    publisher.publish(_params("file:///a.robot", "error", version=2))
+    publisher.flush()
+
+    assert sent == [[_params("file:///a.robot", "error")]]
+
+    publisher.publish(_params("file:///a.robot", version=3))
+    publisher.flush()
+
+    assert sent[-1] == [_params("file:///a.robot", version=3)]
+
+
+def test_empty_diagnostics_are_not_sent_for_a_document_without_diagnostics() -> None:
+    sent: List[List[PublishDiagnosticsParams]] = []
+    publisher = DiagnosticsPublisher(sent.append, delay=60)
+
+    publisher.publish(_params("file:///a.robot"))
+    publisher.flush()
+
+    assert sent == []
+
+
+def test_pending_diagnostics_are_sent_by_the_timer() -> None:
+    sent: List[List[PublishDiagnosticsParams]] = []
+    publisher = DiagnosticsPublisher(sent.append, delay=0.01)
+
+    for i in range(100):
+        publisher.publish(_params(f"file:///{i % 10}.robot", f"error {i}"))
+
+    def sent_uris() -> Set[str]:
+        return {p.uri for batch in sent for p in batch}
+
+    deadline = time.monotonic() + 10
+    while len(sent_uris()) < 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    publisher.close()
+
+    assert sent_uris() == {f"file:///{i}.robot" for i in range(10)}
@@ -11,14 +11,16 @@ fakes the surrounding protocol wiring, so a regression in the model handling of
 the formatter is caught here.
 """
 
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, List, Optional
 from unittest.mock import MagicMock
+from weakref import WeakKeyDictionary
 
 import pytest
 
-from robotcode.core.lsp.types import FormattingOptions, TextEdit
+from robotcode.core.lsp.types import FormattingOptions, Position, Range, TextEdit
 from robotcode.core.text_document import TextDocument
 from robotcode.core.uri import Uri
 from robotcode.core.utils.version import create_version_from_str
@@ -96,9 +98,17 @@ def _make_formatting_part(root: Path, document: TextDocument) -> RobotFormatting
 
     part = object.__new__(RobotFormattingProtocolPart)
     part._parent = parent  # type: ignore[assignment]
+    part._robocop_formatters = WeakKeyDictionary()
+    part._robocop_formatter_lock = threading.RLock()
     return part
 
 
+def _apply_edits(document: TextDocument, edits: List[TextEdit]) -> None:
+    """Applies the edits like a client: all ranges refer to the document before the edits."""
+    for _, edit in sorted(enumerate(edits), key=lambda e: (e[1].range.start, e[0]), reverse=True):
+        document.apply_incremental_change((document.version or 0) + 1, edit.range, edit.new_text)
+
+
 @pytest.fixture
 def options() -> FormattingOptions:
     return FormattingOptions(tab_size=4, insert_spaces=True)
@@ -128,11 +138,29 @@ def test_repeated_formatting_is_idempotent(tmp_path: Path, options: FormattingOp
     # Reach the formatter's fixed point first (apply the initial reformat, if any).
     edits = format_once()
     if edits:
-        document.apply_full_change((document.version or 0) + 1, edits[0].new_text)
+        _apply_edits(document, edits)
 
     # From the fixed point, formatting must stay a no-op - no oscillation (#612).
     for _ in range(5):
         edits = format_once()
         if edits:
-            document.apply_full_change((document.version or 0) + 1, edits[0].new_text)
+            _apply_edits(document, edits)
         assert edits is None, f"formatting is not idempotent, produced: {edits!r}"
+
+
+def test_formatting_returns_only_the_changed_parts(tmp_path: Path, options: FormattingOptions) -> None:
+    (tmp_path / "robot.toml").write_text("")
+    text = "*** Test Cases ***\nTest\n    Log    1\n    Log        2\n    Log    3\n"
+
+    source = tmp_path / "test.robot"
+    source.write_text(text)
+
+    document = TextDocument(
+        document_uri=str(Uri.from_path(source).normalized()), language_id="robotframework", version=1, text=text
+    )
+    part = _make_formatting_part(tmp_path, document)
+
+    edits = part.format_robocop(document, options)
+
+    assert edits == [TextEdit(range=Range(start=Position(3, 11), end=Position(3, 15)), new_text="")]
+    assert part.format_robocop(document, options, range=Range(Position(0, 0), Position(1, 0))) is None
@@ -0,0 +1,67 @@
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from robotcode.core.lsp.types import Position, Range, TextEdit
+from robotcode.core.text_document import TextDocument
+from robotcode.core.utils.dataclasses import as_json
+from robotcode.language_server.robotframework.parts.formatting import compute_text_edits
+
+
+def _apply(text: str, edits: List[TextEdit]) -> str:
+    document = TextDocument("file:///test.robot", text)
+    # inserts at the same position are inserted in the order of the edits
+    for _, edit in sorted(enumerate(edits), key=lambda e: (e[1].range.start, e[0]), reverse=True):
+        document.apply_incremental_change(None, edit.range, edit.new_text)
+    return document.text()
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("", ""),
+        ("a\n", "a\n"),
+        ("", "a\nb\n"),
+        ("a\nb\n", ""),
+        ("a\nb\nc\n", "a\nx\nc\n"),
+        ("a\nb\nc\n", "a\nc\n"),
+        ("a\nc\n", "a\nb\nc\n"),
+        ("a\nb\nc", "a\nb\nc\n"),
+        ("a\n\n\n\nb\n", "a\n\nb\n\n\n"),
+        ("a\n", "\n  a\n"),
+        ("    Log    \U0001f600        x\n", "    Log    \U0001f600    x\n"),
+        (
+            "*** Test Cases ***\nT\n    Log  1\n\n\n\nT2\n    No Operation",
+            "*** Test Cases ***\nT\n    Log    1\n\nT2\n",
+        ),
+    ],
+)
+def test_edits_change_the_text_to_the_new_text(old: str, new: str) -> None:
+    edits = compute_text_edits(old.splitlines(True), new)
+
+    assert _apply(old, edits) == new
+    assert (edits == []) == (old == new)
+
+
+def test_changed_characters_are_replaced_in_utf16_positions() -> None:
+    edits = compute_text_edits(["a\n", "    \U0001f600        x\n"], "a\n    \U0001f600    x\n")
+
+    assert edits == [TextEdit(range=Range(start=Position(1, 10), end=Position(1, 14)), new_text="")]
+
+
+def test_edits_of_a_big_file_are_smaller_than_the_whole_document() -> None:
+    lines = (Path(__file__).parent / "data" / "tests" / "very_big_file.robot").read_text("utf-8").splitlines(True)
+    new_lines = [*lines, *(line.replace("Testcase ", "Another Testcase ") for line in lines)][:5000]
+    new_text = "".join(new_lines)
+    # a formatter typically fixes the indentation of some lines
+    lines = [re.sub(r"^ {4}", "  ", line) if i % 7 == 0 else line for i, line in enumerate(new_lines)]
+    old_text = "".join(lines)
+
+    full_edit = [TextEdit(range=Range(start=Position(0, 0), end=Position(len(lines), 0)), new_text=new_text)]
+
+    edits = compute_text_edits(lines, new_text)
+
+    assert _apply(old_text, edits) == new_text
+    assert len(as_json(edits, compact=True)) < len(as_json(full_edit, compact=True))
@@ -0,0 +1,79 @@
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from robotcode.language_server.robotframework.parts.http_server import LibDocPageCache
+from robotcode.language_server.robotframework.protocol import RobotLanguageServerProtocol
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
+
+from .conftest import root_path
+
+
+def test_page_is_cached_for_the_same_library_doc() -> None:
+    cache = LibDocPageCache()
+    lib_doc = LibraryDoc(name="Lib", source="/lib.py")
+
+    page = cache.put(("Lib",), lib_doc, "<html/>")
+
+    assert cache.get(("Lib",), lib_doc) is page
+    assert page.content == b"<html/>"
+    assert page.etag.startswith('"')
+    assert page.etag.endswith('"')
+    assert cache.get(("Lib",), LibraryDoc(name="Lib", source="/lib.py")) is None
+    assert len(cache) == 0
+
+
+def test_pages_of_changed_libraries_are_invalidated() -> None:
+    cache = LibDocPageCache()
+    lib = LibraryDoc(name="Lib", source="/lib.py")
+    other = LibraryDoc(name="Other", source="/other.py")
+    cache.put(("Lib", "html"), lib, "lib")
+    cache.put(("Lib", "md"), lib, "lib")
+    cache.put(("Other",), other, "other")
+
+    cache.invalidate([LibraryDoc(name="Lib", source="/lib.py")])
+
+    assert cache.get(("Lib", "html"), lib) is None
+    assert cache.get(("Lib", "md"), lib) is None
+    assert cache.get(("Other",), other) is not None
+
+
+def test_least_recently_used_pages_are_dropped() -> None:
+    cache = LibDocPageCache(max_size=2)
+    docs = [LibraryDoc(name=f"Lib{i}") for i in range(3)]
+    cache.put((0,), docs[0], "0")
+    cache.put((1,), docs[1], "1")
+    cache.get((0,), docs[0])
+    cache.put((2,), docs[2], "2")
+
+    assert cache.get((0,), docs[0]) is not None
+    assert cache.get((1,), docs[1]) is None
+    assert cache.get((2,), docs[2]) is not None
+
+
+@pytest.mark.usefixtures("protocol")
+def test_markdown_page_is_rendered_once(protocol: RobotLanguageServerProtocol) -> None:
+    page = protocol.http_server.get_documentation_page("BuiltIn", None, str(root_path), "md", None)
+
+    assert b"Should Be Equal" in page.content
+    assert protocol.http_server.get_documentation_page("BuiltIn", None, str(root_path), "md", None) is page
+
+
+@pytest.mark.usefixtures("protocol")
+def test_documentation_server_answers_with_not_modified(protocol: RobotLanguageServerProtocol) -> None:
+    params = urllib.parse.urlencode({"name": "Collections", "basedir": str(root_path), "type": "md"})
+    url = f"http://127.0.0.1:{protocol.http_server.port}/?{params}"
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    with opener.open(url, timeout=60) as response:
+        etag = response.headers["ETag"]
+        assert response.status == 200
+        assert b"Append To List" in response.read()
+
+    with pytest.raises(urllib.error.HTTPError) as e:
+        opener.open(urllib.request.Request(url, headers={"If-None-Match": etag}), timeout=60)
+
+    assert e.value.code == 304
+    assert e.value.headers["ETag"] == etag
@@ -0,0 +1,141 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Set
+from unittest.mock import MagicMock
+from weakref import WeakKeyDictionary
+
+import pytest
+
+from robotcode.core.lsp.types import Diagnostic
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.core.utils.version import create_version_from_str
+from robotcode.core.workspace import WorkspaceFolder
+from robotcode.language_server.robotframework.parts.robocop_diagnostics import RobotRoboCopDiagnosticsProtocolPart
+from robotcode.robot.diagnostics.data_cache import CacheSection, SqliteDataCache
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.workspace_config import RobotConfig
+
+robocop = pytest.importorskip("robocop")
+
+ROBOCOP_VERSION = create_version_from_str(robocop.__version__)
+
+pytestmark = pytest.mark.skipif(ROBOCOP_VERSION < (9, 0), reason="Robocop >= 9.0 is required for cached diagnostics")
+
+TEXT = "*** Test Cases ***\nfirst test\n    Log    1\n"
+
+
+def _folder(root: Path) -> WorkspaceFolder:
+    return WorkspaceFolder(name="test", uri=Uri.from_path(root))
+
+
+def _make_part(root: Path, data_cache: SqliteDataCache) -> RobotRoboCopDiagnosticsProtocolPart:
+    from robocop.config.manager import ConfigManager
+
+    workspace = MagicMock()
+    workspace.get_workspace_folder.return_value = _folder(root)
+    workspace.get_configuration.return_value = RobotConfig()
+
+    documents_cache = DocumentsCacheHelper(
+        workspace=workspace,
+        documents_manager=MagicMock(),
+        file_watcher_manager=MagicMock(),
+        robot_profile=None,
+        analysis_config=None,
+    )
+    documents_cache.get_imports_manager = lambda _document: SimpleNamespace(data_cache=data_cache)  # type: ignore
+
+    config_manager = ConfigManager([], root=root, config=root / "robot.toml")
+
+    part = object.__new__(RobotRoboCopDiagnosticsProtocolPart)
+    part._parent = SimpleNamespace(  # type: ignore[assignment]
+        workspace=workspace,
+        robocop_helper=SimpleNamespace(robocop_version=ROBOCOP_VERSION, get_config_manager=lambda _: config_manager),
+        documents_cache=documents_cache,
+    )
+    part.source_name = "robocop"
+    part._robocop_linters = WeakKeyDictionary()
+    return part
+
+
+def _document(root: Path, text: str = TEXT) -> TextDocument:
+    source = root / "test.robot"
+    source.write_text(text)
+    return TextDocument(str(Uri.from_path(source).normalized()), text, language_id="robotframework", version=1)
+
+
+@pytest.fixture
+def data_cache(tmp_path: Path) -> Any:
+    cache = SqliteDataCache(tmp_path / "cache", app_version="1.0")
+    yield cache
+    cache.close()
+
+
+def _rule_names(diagnostics: List[Diagnostic]) -> Set[str]:
+    return {str(d.code).split("-", 1)[1] for d in diagnostics}
+
+
+def _count_runs(part: RobotRoboCopDiagnosticsProtocolPart, runs: List[int]) -> None:
+    run_linter = part._run_linter
+
+    def _run_linter(*args: Any) -> List[Diagnostic]:
+        runs.append(1)
+        return run_linter(*args)
+
+    part._run_linter = _run_linter  # type: ignore[assignment]
+
+
+def test_diagnostics_of_an_unchanged_document_are_cached(tmp_path: Path, data_cache: SqliteDataCache) -> None:
+    (tmp_path / "robot.toml").write_text("")
+    runs: List[int] = []
+    part = _make_part(tmp_path, data_cache)
+    _count_runs(part, runs)
+    document = _document(tmp_path)
+    folder = _folder(tmp_path)
+
+    diagnostics = part.collect(document, folder)
+
+    assert "not-capitalized-test-case-title" in _rule_names(diagnostics)
+    assert part.collect(document, folder) == diagnostics
+    assert len(runs) == 1
+
+    # a new server instance reads the diagnostics from the data cache
+    restarted = _make_part(tmp_path, data_cache)
+    _count_runs(restarted, runs)
+    assert restarted.collect(_document(tmp_path), folder) == diagnostics
+    assert len(runs) == 1
+    assert data_cache.get_section_stats(CacheSection.LINT).entry_count == 1
+
+
+def test_changed_text_is_linted_again(tmp_path: Path, data_cache: SqliteDataCache) -> None:
+    (tmp_path / "robot.toml").write_text("")
+    runs: List[int] = []
+    part = _make_part(tmp_path, data_cache)
+    _count_runs(part, runs)
+    document = _document(tmp_path)
+    folder = _folder(tmp_path)
+
+    part.collect(document, folder)
+    document.apply_full_change(2, TEXT.replace("first test", "First Test"))
+    diagnostics = part.collect(document, folder)
+
+    assert len(runs) == 2
+    assert "not-capitalized-test-case-title" not in _rule_names(diagnostics)
+
+
+def test_changed_config_is_linted_again(tmp_path: Path, data_cache: SqliteDataCache) -> None:
+    (tmp_path / "robot.toml").write_text("")
+    runs: List[int] = []
+    part = _make_part(tmp_path, data_cache)
+    _count_runs(part, runs)
+    folder = _folder(tmp_path)
+
+    part.collect(_document(tmp_path), folder)
+
+    (tmp_path / "robot.toml").write_text('[tool.robocop.lint]\nignore = ["not-capitalized-test-case-title"]\n')
+    reconfigured = _make_part(tmp_path, data_cache)
+    _count_runs(reconfigured, runs)
+    diagnostics = reconfigured.collect(_document(tmp_path), folder)
+
+    assert len(runs) == 2
+    assert "not-capitalized-test-case-title" not in _rule_names(diagnostics)
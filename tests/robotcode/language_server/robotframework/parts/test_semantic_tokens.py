@@ -1,10 +1,13 @@
 import functools
 from pathlib import Path
+from typing import List
 
 import pytest
 import yaml
 
+from robotcode.core.lsp.types import Position, Range, SemanticTokens, SemanticTokensDelta
 from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
 from robotcode.language_server.robotframework.protocol import (
     RobotLanguageServerProtocol,
 )
@@ -38,3 +41,39 @@ def test(
     )
 
     regtest.write(yaml.dump({"result": result}))
+
+
+def _apply_edits(data: List[int], delta: SemanticTokensDelta) -> List[int]:
+    result = list(data)
+    for edit in sorted(delta.edits, key=lambda e: e.start, reverse=True):
+        result[edit.start : edit.start + edit.delete_count] = edit.data or []
+    return result
+
+
+def test_full_delta(protocol: RobotLanguageServerProtocol) -> None:
+    source = base_path / "hover.robot"
+    document = TextDocument(
+        str(Uri.from_path(base_path / "delta.robot").normalized()), source.read_text("utf-8"), "robotframework", 1
+    )
+    part = protocol.robot_semantic_tokens
+
+    first = part.collect_full_delta(part, document, "unknown")
+    assert isinstance(first, SemanticTokens)
+    assert first.result_id is not None
+
+    unchanged = part.collect_full_delta(part, document, first.result_id)
+    assert isinstance(unchanged, SemanticTokensDelta)
+    assert unchanged.edits == []
+
+    line = document.get_lines().index("*** Test Cases ***\n") + 2
+    document.apply_incremental_change(2, Range(Position(line, 0), Position(line, 0)), "    Log    inserted\n")
+
+    delta = part.collect_full_delta(part, document, str(unchanged.result_id))
+    assert isinstance(delta, SemanticTokensDelta)
+    assert delta.result_id not in (first.result_id, unchanged.result_id)
+    assert len(delta.edits) == 1
+
+    full = part.collect_full(part, document)
+    assert isinstance(full, SemanticTokens)
+    assert _apply_edits(first.data, delta) == full.data
+    assert sum(len(e.data or []) for e in delta.edits) < len(full.data) // 10
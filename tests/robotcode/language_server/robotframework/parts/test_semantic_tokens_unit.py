@@ -1,10 +1,11 @@
-from typing import Any
+from typing import Any, List
 
 import pytest
 from robot.parsing import get_model
 from robot.parsing.lexer.tokens import Token
 from robot.parsing.model.statements import KeywordCall, Variable
 
+from robotcode.core.lsp.types import SemanticTokensEdit
 from robotcode.language_server.robotframework.parts.semantic_tokens import (
     ROBOT_NAMED_ARGUMENT,
     ROBOT_OPERATOR,
@@ -17,6 +18,7 @@ from robotcode.language_server.robotframework.parts.semantic_tokens import (
     SemanticTokenGenerator,
     SemanticTokenMapper,
     SemTokenInfo,
+    compute_semantic_tokens_edits,
 )
 from robotcode.robot.diagnostics.library_doc import (
     KeywordArgumentKind,
@@ -1979,5 +1981,46 @@ class TestBddPrefixSemanticTokens:
         assert len(sep_candidates) == 1, "Expected a separator token (space) after BDD prefix"
 
 
+class TestComputeSemanticTokensEdits:
+    """Test cases for the edits of semantic tokens delta results."""
+
+    @staticmethod
+    def _apply(data: List[int], edits: List[SemanticTokensEdit]) -> List[int]:
+        result = list(data)
+        for edit in sorted(edits, key=lambda e: e.start, reverse=True):
+            result[edit.start : edit.start + edit.delete_count] = edit.data or []
+        return result
+
+    @pytest.mark.parametrize(
+        ("previous", "current"),
+        [
+            ([], []),
+            ([0, 0, 3, 1, 0], [0, 0, 3, 1, 0]),
+            ([], [0, 0, 3, 1, 0]),
+            ([0, 0, 3, 1, 0], []),
+            ([0, 0, 3, 1, 0, 1, 4, 3, 2, 0], [0, 0, 3, 1, 0, 2, 4, 3, 2, 0]),
+            ([0, 0, 3, 1, 0, 1, 4, 3, 2, 0], [0, 0, 3, 1, 0, 1, 4, 3, 2, 0, 1, 0, 5, 1, 0]),
+            ([1, 0, 3, 1, 0, 1, 0, 3, 1, 0], [1, 0, 3, 1, 0, 1, 0, 3, 1, 0, 1, 0, 3, 1, 0]),
+            ([1, 0, 3, 1, 0, 1, 0, 3, 1, 0, 1, 0, 3, 1, 0], [1, 0, 3, 1, 0]),
+            ([0, 0, 3, 1, 0], [0, 4, 3, 1, 0]),
+        ],
+    )
+    def test_edits_transform_previous_into_current(self, previous: List[int], current: List[int]) -> None:
+        edits = compute_semantic_tokens_edits(previous, current)
+
+        assert self._apply(previous, edits) == current
+        assert len(edits) == (0 if previous == current else 1)
+
+    def test_edit_only_contains_the_changed_part(self) -> None:
+        previous = [1, 0, 3, 1, 0] * 1000
+        current = [*previous[:2500], 1, 4, 6, 2, 0, *previous[2500:]]
+
+        edits = compute_semantic_tokens_edits(previous, current)
+
+        assert self._apply(previous, edits) == current
+        assert edits[0].delete_count == 0
+        assert len(edits[0].data or []) == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
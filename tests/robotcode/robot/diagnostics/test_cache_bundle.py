@@ -0,0 +1,212 @@
+import json
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+from robotcode.core.lsp.types import Location, Position, Range
+from robotcode.core.uri import Uri
+from robotcode.core.utils.path import probe_disk_info
+from robotcode.robot.diagnostics.cache_bundle import (
+    CacheBundleError,
+    _Relocator,
+    export_cache_bundle,
+    import_cache_bundle,
+)
+from robotcode.robot.diagnostics.data_cache import CacheSection, SqliteDataCache
+from robotcode.robot.diagnostics.imports_manager import (
+    LibraryMetaData,
+    NamespaceMetaData,
+    RobotFileMeta,
+    _collect_library_file_infos,
+)
+from robotcode.robot.diagnostics.library_doc import KeywordDoc, KeywordStore, LibraryDoc, ResourceDoc
+from robotcode.robot.diagnostics.namespace import NamespaceData
+
+_PAST = time.time() - 60
+
+
+def _write(path: Path, text: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    # the cache only trusts file states that are older than the racy mtime window
+    os.utime(path, (_PAST, _PAST))
+    return str(path)
+
+
+def _checkout(root: Path) -> None:
+    _write(root / "lib" / "MyLib.py", "def my_keyword():\n    pass\n")
+    _write(root / "common.resource", "*** Keywords ***\nCommon\n    No Operation\n")
+    _write(root / "suite.robot", "*** Test Cases ***\nT\n    Common\n")
+
+
+def _fill_cache(cache: SqliteDataCache, root: Path) -> None:
+    lib = str(root / "lib" / "MyLib.py")
+    lib_meta = LibraryMetaData(
+        name=None,
+        member_name=None,
+        origin=lib,
+        submodule_search_locations=None,
+        by_path=True,
+        file_infos=_collect_library_file_infos(lib, None),
+    )
+    keyword = KeywordDoc(line_no=1, col_offset=0, end_line_no=2, end_col_offset=8, name="My Keyword", source=lib)
+    lib_doc = LibraryDoc(name="MyLib", source=lib, _keywords=KeywordStore(keywords=[keyword]))
+    cache.save_entry(CacheSection.LIBRARY, lib_meta.cache_key, lib_meta, lib_doc)
+
+    resource = str(root / "common.resource")
+    info = probe_disk_info(resource)
+    assert info is not None
+    resource_meta = RobotFileMeta(resource, info)
+    cache.save_entry(
+        CacheSection.RESOURCE, resource, resource_meta, ResourceDoc(name="common", source=resource, errors=None)
+    )
+
+    suite = str(root / "suite.robot")
+    suite_info = probe_disk_info(suite)
+    assert suite_info is not None
+    namespace_meta = NamespaceMetaData(
+        source=suite,
+        source_info=suite_info,
+        config_fingerprint=(),
+        dependency_fingerprints={f"res:{resource}": resource_meta, "lib:lib/MyLib.py": lib_meta},
+    )
+    cache.save_entry(CacheSection.NAMESPACE, f"{suite}\nrobot", namespace_meta, NamespaceData(source=suite))
+
+
+@pytest.fixture
+def bundle(tmp_path: Path) -> Path:
+    root = tmp_path / "exported"
+    _checkout(root)
+
+    cache = SqliteDataCache(tmp_path / "exported_cache", app_version="1.0")
+    _fill_cache(cache, root)
+    result = tmp_path / "bundle.zip"
+    stats = export_cache_bundle(cache, result, root)
+    cache.close()
+
+    assert {s.section: s.entries for s in stats} == {
+        CacheSection.LIBRARY: 1,
+        CacheSection.VARIABLES: 0,
+        CacheSection.RESOURCE: 1,
+        CacheSection.NAMESPACE: 1,
+    }
+    return result
+
+
+def test_bundle_is_imported_into_another_checkout_directory(tmp_path: Path, bundle: Path) -> None:
+    root = tmp_path / "other" / "checkout"
+    _checkout(root)
+
+    cache = SqliteDataCache(tmp_path / "imported_cache", app_version="1.0")
+    stats = import_cache_bundle(cache, bundle, root)
+
+    assert sum(s.entries for s in stats) == 3
+
+    lib = str(root / "lib" / "MyLib.py")
+    lib_entry = cache.read_entry(CacheSection.LIBRARY, lib, LibraryMetaData, LibraryDoc)
+    assert lib_entry is not None
+    assert lib_entry.meta == LibraryMetaData(None, None, lib, None, True, _collect_library_file_infos(lib, None))
+    assert lib_entry.data.source == lib
+    assert lib_entry.data.keywords["My Keyword"].source == lib
+
+    resource = str(root / "common.resource")
+    resource_entry = cache.read_entry(CacheSection.RESOURCE, resource, RobotFileMeta, ResourceDoc)
+    assert resource_entry is not None
+    assert resource_entry.meta == RobotFileMeta(resource, probe_disk_info(resource))  # type: ignore[arg-type]
+
+    suite = str(root / "suite.robot")
+    namespace_entry = cache.read_entry(CacheSection.NAMESPACE, f"{suite}\nrobot", NamespaceMetaData, NamespaceData)
+    assert namespace_entry is not None
+    assert namespace_entry.meta is not None
+    assert namespace_entry.meta.source_info == probe_disk_info(suite)
+    assert set(namespace_entry.meta.dependency_fingerprints) == {f"res:{resource}", "lib:lib/MyLib.py"}
+    cache.close()
+
+
+def test_entries_of_changed_files_are_not_imported(tmp_path: Path, bundle: Path) -> None:
+    root = tmp_path / "changed"
+    _checkout(root)
+    _write(root / "common.resource", "*** Keywords ***\nCommon\n    Log    changed\n")
+
+    cache = SqliteDataCache(tmp_path / "imported_cache", app_version="1.0")
+    stats = {s.section: s for s in import_cache_bundle(cache, bundle, root)}
+    cache.close()
+
+    assert stats[CacheSection.LIBRARY].entries == 1
+    assert (stats[CacheSection.RESOURCE].entries, stats[CacheSection.RESOURCE].outdated) == (0, 1)
+    assert (stats[CacheSection.NAMESPACE].entries, stats[CacheSection.NAMESPACE].outdated) == (0, 1)
+
+
+def test_importing_twice_keeps_unchanged_entries(tmp_path: Path, bundle: Path) -> None:
+    root = tmp_path / "twice"
+    _checkout(root)
+
+    cache = SqliteDataCache(tmp_path / "imported_cache", app_version="1.0")
+    import_cache_bundle(cache, bundle, root)
+    stats = import_cache_bundle(cache, bundle, root)
+    cache.close()
+
+    assert sum(s.entries for s in stats) == 0
+    assert sum(s.unchanged for s in stats) == 3
+
+
+def test_entries_of_files_outside_the_project_are_not_exported(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    _checkout(root)
+    outside = _write(tmp_path / "elsewhere" / "outside.resource", "*** Keywords ***\n")
+    info = probe_disk_info(outside)
+    assert info is not None
+
+    cache = SqliteDataCache(tmp_path / "cache", app_version="1.0")
+    cache.save_entry(CacheSection.RESOURCE, outside, RobotFileMeta(outside, info), ResourceDoc(source=outside))
+    stats = {s.section: s for s in export_cache_bundle(cache, tmp_path / "bundle.zip", root)}
+    cache.close()
+
+    assert stats[CacheSection.RESOURCE].not_portable == 1
+    assert stats[CacheSection.RESOURCE].entries == 0
+
+
+def test_bundle_of_another_version_is_rejected(tmp_path: Path, bundle: Path) -> None:
+    cache = SqliteDataCache(tmp_path / "imported_cache", app_version="2.0")
+    try:
+        with pytest.raises(CacheBundleError, match="app version"):
+            import_cache_bundle(cache, bundle, tmp_path)
+    finally:
+        cache.close()
+
+
+def test_corrupt_bundle_is_rejected(tmp_path: Path, bundle: Path) -> None:
+    root = tmp_path / "corrupt"
+    _checkout(root)
+
+    corrupt = tmp_path / "corrupt.zip"
+    with zipfile.ZipFile(bundle) as source, zipfile.ZipFile(corrupt, "w") as target:
+        manifest = json.loads(source.read("manifest.json"))
+        for item in source.infolist():
+            target.writestr(item, b"x" if item.filename.startswith("objects/") else source.read(item))
+
+    assert manifest["entries"]
+
+    cache = SqliteDataCache(tmp_path / "imported_cache", app_version="1.0")
+    try:
+        with pytest.raises(CacheBundleError, match="corrupt"):
+            import_cache_bundle(cache, corrupt, root)
+    finally:
+        cache.close()
+
+
+def test_relocator_rewrites_paths_and_uris_in_nested_objects(tmp_path: Path) -> None:
+    old, new = tmp_path / "old", tmp_path / "new"
+    location = Location(str(Uri.from_path(old / "a.robot")), Range(Position(0, 0), Position(0, 1)))
+    references: Set[Location] = {location}
+    value = {str(old / "a.robot"): (references, [f"{old / 'b.robot'}\nrobot", str(tmp_path / "older")])}
+
+    result = _Relocator({str(old): str(new)})(value)
+
+    new_location = Location(str(Uri.from_path(new / "a.robot")), location.range)
+    assert result == {str(new / "a.robot"): ({new_location}, [f"{new / 'b.robot'}\nrobot", str(tmp_path / "older")])}
+    assert new_location in references
@@ -260,6 +260,143 @@ class TestSqliteDataCache:
         assert cache.read_entry(CacheSection.LIBRARY, "a", str, str) is None
         assert cache.read_entry(CacheSection.RESOURCE, "b", str, str) is not None
 
+    def test_remove_entry_removes_only_that_entry(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        cache.save_entry(CacheSection.LIBRARY, "a", None, "x")
+        cache.save_entry(CacheSection.LIBRARY, "b", None, "y")
+
+        cache.remove_entry(CacheSection.LIBRARY, "a")
+        cache.remove_entry(CacheSection.LIBRARY, "missing")
+
+        assert cache.read_entry(CacheSection.LIBRARY, "a", str, str) is None
+        assert cache.read_entry(CacheSection.LIBRARY, "b", str, str) is not None
+
+    def test_read_section_data_skips_other_types(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        cache.save_entry(CacheSection.LIBRARY, "a", None, _SampleData("a", 1))
+        cache.save_entry(CacheSection.LIBRARY, "b", None, "y")
+        cache.save_entry(CacheSection.RESOURCE, "c", None, _SampleData("c", 3))
+
+        assert cache.read_section_data(CacheSection.LIBRARY, _SampleData) == [_SampleData("a", 1)]
+
+    def test_read_section_entries_returns_all_entries(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        cache.save_entry(CacheSection.PROJECT_INDEX, "a", _SampleMeta("a", 1), _SampleData("a", 1))
+        cache.save_entry(CacheSection.PROJECT_INDEX, "b", _SampleMeta("b", 2), _SampleData("b", 2))
+        cache.save_entry(CacheSection.NAMESPACE, "c", _SampleMeta("c", 3), _SampleData("c", 3))
+
+        entries = cache.read_section_entries(CacheSection.PROJECT_INDEX, _SampleMeta, _SampleData)
+        cache.clear_all()
+
+        assert sorted((e.entry_name, e.meta, e.data) for e in entries) == [
+            ("a", _SampleMeta("a", 1), _SampleData("a", 1)),
+            ("b", _SampleMeta("b", 2), _SampleData("b", 2)),
+        ]
+
+
+class TestEviction:
+    def _fill(self, cache: SqliteDataCache, section: CacheSection, count: int, size: int) -> None:
+        for i in range(count):
+            cache.save_entry(section, f"e{i}", None, os.urandom(size))
+
+    def test_sections_are_trimmed_to_their_budget(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache", max_size=1024 * 1024)
+        self._fill(cache, CacheSection.LIBRARY, 40, 20 * 1024)
+
+        evicted = cache.maintain()
+        stats = cache.get_section_stats(CacheSection.LIBRARY)
+        cache.close()
+
+        budget = cache.section_budget(CacheSection.LIBRARY)
+        assert budget is not None
+        assert evicted > 0
+        assert stats.evictions == evicted
+        assert stats.total_blob_bytes <= budget
+
+    def test_recently_used_entries_are_kept(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache", max_size=1024 * 1024)
+        self._fill(cache, CacheSection.LIBRARY, 40, 20 * 1024)
+
+        entry = cache.read_entry(CacheSection.LIBRARY, "e0", type(None), bytes)
+        assert entry is not None
+        _ = entry.data
+
+        cache.maintain()
+        names = {e.entry_name for e in cache.list_entries(CacheSection.LIBRARY)}
+        cache.close()
+
+        assert "e0" in names
+        assert "e1" not in names
+
+    def test_dependencies_are_never_evicted(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache", max_size=64 * 1024)
+        self._fill(cache, CacheSection.DEPENDENCIES, 10, 20 * 1024)
+
+        assert cache.section_budget(CacheSection.DEPENDENCIES) is None
+        assert cache.maintain() == 0
+        assert cache.get_section_stats(CacheSection.DEPENDENCIES).entry_count == 10
+        cache.close()
+
+    def test_unlimited_cache_does_not_evict(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        self._fill(cache, CacheSection.LIBRARY, 10, 20 * 1024)
+
+        assert cache.maintain() == 0
+        assert cache.get_section_stats(CacheSection.LIBRARY).entry_count == 10
+        cache.close()
+
+    def test_statistics_count_lookups_hits_and_saved_bytes(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        cache.save_entry(CacheSection.RESOURCE, "a", _SampleMeta("a", 1), _SampleData("a", 1))
+
+        entry = cache.read_entry(CacheSection.RESOURCE, "a", _SampleMeta, _SampleData)
+        assert entry is not None
+        assert entry.data == _SampleData("a", 1)
+        assert cache.read_entry(CacheSection.RESOURCE, "missing", _SampleMeta, _SampleData) is None
+
+        stats = cache.get_section_stats(CacheSection.RESOURCE)
+        cache.close()
+
+        assert stats.lookups == 2
+        assert stats.hits == 1
+        assert stats.hit_ratio == 0.5
+        assert stats.bytes_saved > 0
+
+    def test_statistics_survive_reopening(self, tmp_path: Path) -> None:
+        cache = SqliteDataCache(tmp_path / "cache")
+        cache.save_entry(CacheSection.RESOURCE, "a", None, "data")
+        entry = cache.read_entry(CacheSection.RESOURCE, "a", str, str)
+        assert entry is not None
+        _ = entry.data
+        cache.close()
+
+        cache = SqliteDataCache(tmp_path / "cache")
+        stats = cache.get_section_stats(CacheSection.RESOURCE)
+        cache.close()
+
+        assert (stats.lookups, stats.hits) == (1, 1)
+
+    def test_old_schema_is_converted(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        conn = sqlite3.connect(cache_dir / "cache.db")
+        conn.execute("CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("INSERT INTO _meta (key, value) VALUES ('app_version', '')")
+        conn.execute(
+            f"CREATE TABLE {CacheSection.LIBRARY.value} (entry_name TEXT PRIMARY KEY, meta BLOB, data BLOB NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        cache = SqliteDataCache(cache_dir, max_size=1024 * 1024)
+        cache.save_entry(CacheSection.LIBRARY, "a", None, "data")
+        auto_vacuum = cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        columns = {row[1] for row in cache._conn.execute(f"PRAGMA table_info({CacheSection.LIBRARY.value})")}
+        cache.close()
+
+        assert auto_vacuum == 2
+        assert {"size", "accessed_at"} <= columns
+
 
 class TestCorruptionRecovery:
     """A corrupt cache.db must be detected and rebuilt, never propagated to callers (issue #614)."""
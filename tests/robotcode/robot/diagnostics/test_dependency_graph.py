@@ -0,0 +1,90 @@
+"""Tests for the reverse dependency graph used by changed-files analysis."""
+
+from pathlib import Path
+
+from robotcode.core.utils.path import DiskInfo
+from robotcode.robot.diagnostics.data_cache import CacheSection, SqliteDataCache
+from robotcode.robot.diagnostics.dependency_graph import DependencyGraph, DocumentDependencies
+from robotcode.robot.diagnostics.imports_manager import LibraryMetaData, RobotFileMeta
+
+_INFO = DiskInfo(mtime_ns=1, size=1)
+
+
+def _deps(source: Path, *files: Path) -> DocumentDependencies:
+    return DocumentDependencies(str(source), frozenset(str(f) for f in files))
+
+
+class TestDocumentDependencies:
+    def test_collects_resource_library_and_variables_files(self, tmp_path: Path) -> None:
+        resource = tmp_path / "common.resource"
+        library = tmp_path / "MyLib.py"
+        package = tmp_path / "mypackage"
+
+        deps = DocumentDependencies.from_dependency_metas(
+            str(tmp_path / "suite.robot"),
+            {
+                f"res:{resource}": RobotFileMeta(str(resource), _INFO),
+                "lib:MyLib": LibraryMetaData("MyLib", None, str(library), None, False, {str(library): _INFO}),
+                "var:mypackage": LibraryMetaData(
+                    "mypackage",
+                    None,
+                    str(package / "__init__.py"),
+                    [str(package)],
+                    False,
+                    {str(package / "__init__.py"): _INFO, str(package / "values.py"): _INFO},
+                ),
+                "lib:Unresolved": None,
+            },
+        )
+
+        assert deps.source == str(tmp_path / "suite.robot")
+        assert deps.files == {
+            str(resource),
+            str(library),
+            str(package / "__init__.py"),
+            str(package / "values.py"),
+        }
+
+
+class TestDependencyGraph:
+    def test_affected_documents_contains_changed_files_and_dependents(self, tmp_path: Path) -> None:
+        common = tmp_path / "common.resource"
+        graph = DependencyGraph(
+            [
+                _deps(tmp_path / "a.robot", common),
+                _deps(tmp_path / "b.robot"),
+                _deps(common),
+            ]
+        )
+
+        assert graph.affected_documents([str(common)]) == {str(common), str(tmp_path / "a.robot")}
+        assert graph.affected_documents([str(tmp_path / "b.robot")]) == {str(tmp_path / "b.robot")}
+
+    def test_affected_documents_follows_transitive_dependents(self, tmp_path: Path) -> None:
+        lib = tmp_path / "MyLib.py"
+        inner = tmp_path / "inner.resource"
+        outer = tmp_path / "outer.resource"
+        graph = DependencyGraph([_deps(inner, lib), _deps(outer, inner), _deps(tmp_path / "suite.robot", outer)])
+
+        assert graph.affected_documents([str(lib)]) == {str(lib), str(inner), str(outer), str(tmp_path / "suite.robot")}
+
+    def test_unknown_files_affect_nothing_else(self, tmp_path: Path) -> None:
+        graph = DependencyGraph([_deps(tmp_path / "a.robot", tmp_path / "common.resource")])
+
+        assert graph.affected_documents([str(tmp_path / "new.resource")]) == {str(tmp_path / "new.resource")}
+        assert str(tmp_path / "a.robot") in graph
+        assert str(tmp_path / "new.robot") not in graph
+
+    def test_load_from_cache(self, tmp_path: Path) -> None:
+        common = tmp_path / "common.resource"
+        cache = SqliteDataCache(tmp_path / "cache")
+        try:
+            cache.save_entry(CacheSection.DEPENDENCIES, "a", None, _deps(tmp_path / "a.robot", common))
+            cache.save_entry(CacheSection.DEPENDENCIES, "b", None, _deps(tmp_path / "b.robot", common))
+
+            graph = DependencyGraph.load(cache)
+        finally:
+            cache.close()
+
+        assert len(graph) == 2
+        assert graph.dependents(str(common)) == sorted([str(tmp_path / "a.robot"), str(tmp_path / "b.robot")])
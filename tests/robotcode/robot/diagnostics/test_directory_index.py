@@ -0,0 +1,129 @@
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from robotcode.robot.diagnostics.directory_index import DirectoryEntry, DirectoryIndex, list_directory
+from robotcode.robot.diagnostics.library_doc import (
+    complete_library_import,
+    complete_resource_import,
+    complete_variables_import,
+)
+
+
+@pytest.fixture
+def scandir_calls(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    calls: List[str] = []
+    scandir = os.scandir
+
+    def _scandir(path: Any) -> Any:
+        calls.append(os.fspath(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    return calls
+
+
+def _touch_dir(path: Path) -> None:
+    # the modification time of a directory may not change within the timer resolution of the file system
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_listing_is_cached_until_the_directory_changes(tmp_path: Path, scandir_calls: List[str]) -> None:
+    (tmp_path / "a.robot").write_text("")
+    (tmp_path / "lib").mkdir()
+    index = DirectoryIndex()
+
+    assert index.list_directory(tmp_path) == (
+        DirectoryEntry("a.robot", False, True, ".robot", "a"),
+        DirectoryEntry("lib", True, False, "", "lib"),
+    )
+    assert index.list_directory(tmp_path) == list_directory(tmp_path)
+    assert scandir_calls == [str(tmp_path), str(tmp_path)]
+
+    (tmp_path / "b.resource").write_text("")
+    _touch_dir(tmp_path)
+
+    assert [e.name for e in index.list_directory(tmp_path)] == ["a.robot", "b.resource", "lib"]
+    assert len(scandir_calls) == 3
+
+
+def test_invalidated_listing_is_read_again(tmp_path: Path, scandir_calls: List[str]) -> None:
+    index = DirectoryIndex()
+    index.list_directory(tmp_path)
+
+    index.invalidate([tmp_path / "new.robot"])
+    index.list_directory(tmp_path)
+
+    assert scandir_calls == [str(tmp_path), str(tmp_path)]
+
+
+def test_missing_directory_has_no_entries(tmp_path: Path) -> None:
+    assert DirectoryIndex().list_directory(tmp_path / "missing") == ()
+    assert list_directory(tmp_path / "missing") == ()
+
+
+@pytest.mark.parametrize(
+    ("complete", "name"),
+    [
+        (complete_library_import, None),
+        (complete_library_import, "robot.libraries"),
+        (complete_library_import, "./"),
+        (complete_resource_import, None),
+        (complete_resource_import, "./"),
+        (complete_variables_import, None),
+        (complete_variables_import, "./sub/"),
+    ],
+)
+def test_completion_with_index_is_the_same_as_without(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, complete: Callable[..., Any], name: str
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    for file in ["a.robot", "b.resource", "lib.py", "vars.yaml", "_private.py", "sub/c.py", "pkg.dist-info/x"]:
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).write_text("")
+
+    index = DirectoryIndex()
+
+    expected = set(complete(name, str(tmp_path), str(tmp_path)))
+    assert set(complete(name, str(tmp_path), str(tmp_path), directory_index=index)) == expected
+    assert set(complete(name, str(tmp_path), str(tmp_path), directory_index=index)) == expected
+
+
+def test_completion_resolves_relative_paths_without_changing_the_current_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    working_dir = tmp_path / "project"
+    (working_dir / "resources").mkdir(parents=True)
+    (working_dir / "resources" / "a.resource").write_text("")
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")
+
+    result = complete_resource_import("./", str(working_dir), "resources", directory_index=DirectoryIndex())
+
+    assert result is not None
+    assert {r.label for r in result} == {"a.resource"}
+    assert Path.cwd() == tmp_path / "elsewhere"
+
+
+def test_library_import_completion_lists_site_packages_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, scandir_calls: List[str]
+) -> None:
+    site_packages = tmp_path / "site-packages"
+    for i in range(500):
+        (site_packages / f"package_{i}").mkdir(parents=True)
+        (site_packages / f"module_{i}.py").write_text("")
+        (site_packages / f"package_{i}-1.0.dist-info").mkdir()
+    monkeypatch.setattr(sys, "path", [str(site_packages), *sys.path])
+    monkeypatch.chdir(tmp_path)
+
+    uncached = complete_library_import(None, str(tmp_path), str(tmp_path))
+    scandir_calls.clear()
+    index = DirectoryIndex()
+
+    assert set(complete_library_import(None, str(tmp_path), str(tmp_path), directory_index=index)) == set(uncached)
+    assert set(complete_library_import(None, str(tmp_path), str(tmp_path), directory_index=index)) == set(uncached)
+    assert scandir_calls.count(str(site_packages)) == 1
@@ -214,3 +214,104 @@ def test_try_load_reads_type_keyed_entry(cache_helper: DocumentsCacheHelper, tmp
     assert result is None
     read_args = imports_manager.data_cache.read_entry.call_args[0]
     assert read_args[1] == _namespace_cache_key(str(source_file), DocumentType.RESOURCE)
+
+
+@pytest.mark.parametrize("fresh", [True, False])
+def test_cached_diagnostics_are_only_used_from_a_fresh_entry(
+    cache_helper: DocumentsCacheHelper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fresh: bool
+) -> None:
+    from robotcode.core.lsp.types import Diagnostic, Position, Range
+    from robotcode.core.utils.path import probe_disk_info
+
+    source_file = tmp_path / "test.robot"
+    source_file.write_text(TEXT)
+    document = _saved_document(tmp_path, probe_disk_info(source_file))
+    diagnostics = [Diagnostic(Range(Position(1, 0), Position(1, 5)), "cached")]
+
+    entry = MagicMock()
+    entry.meta.semantic_model_enabled = False
+    entry.data.diagnostics = diagnostics
+    imports_manager = MagicMock()
+    imports_manager.data_cache.read_entry.return_value = entry
+    imports_manager.validate_namespace_meta.return_value = fresh
+    monkeypatch.setattr(cache_helper, "get_imports_manager", lambda _: imports_manager)
+    monkeypatch.setattr(cache_helper, "_is_semantic_model_enabled", lambda _: False)
+
+    result = cache_helper.get_cached_namespace_diagnostics(document)
+
+    assert result == (diagnostics if fresh else None)
+    imports_manager.validate_namespace_meta.assert_called_once_with(entry.meta, probe_disk_info(source_file))
+
+
+def test_cached_diagnostics_are_not_used_for_opened_documents(
+    cache_helper: DocumentsCacheHelper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    imports_manager = MagicMock()
+    monkeypatch.setattr(cache_helper, "get_imports_manager", lambda _: imports_manager)
+
+    assert cache_helper.get_cached_namespace_diagnostics(_document(tmp_path)) is None
+    imports_manager.data_cache.read_entry.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Persisted project index
+# ---------------------------------------------------------------------------
+
+
+def test_project_index_is_loaded_from_fresh_cache_entries(cache_helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    from robotcode.core.lsp.types import Location, Position, Range
+    from robotcode.core.utils.path import probe_disk_info
+    from robotcode.robot.diagnostics.data_cache import CacheSection, SqliteDataCache
+    from robotcode.robot.diagnostics.imports_manager import NamespaceMetaData
+    from robotcode.robot.diagnostics.project_index import FileReferences, ProjectIndex
+
+    fresh = tmp_path / "fresh.robot"
+    stale = tmp_path / "stale.robot"
+    for path in (fresh, stale):
+        path.write_text(TEXT)
+
+    location = Location("file:///fresh.robot", Range(Position(1, 0), Position(1, 5)))
+    data_cache = SqliteDataCache(tmp_path / "cache")
+    try:
+        for path in (fresh, stale):
+            data_cache.save_entry(
+                CacheSection.PROJECT_INDEX,
+                str(path),
+                NamespaceMetaData(str(path), probe_disk_info(path), None),  # type: ignore[arg-type]
+                FileReferences(testcase_tag_references={"smoke": (("file:///fresh.robot", 1, 0, 1, 5),)}),
+            )
+        stale.write_text(TEXT + "\n")
+
+        imports_manager = MagicMock()
+        imports_manager.data_cache = data_cache
+        imports_manager.validate_namespace_meta.side_effect = lambda meta, info: meta.source_info == info
+        cache_helper.documents_manager.documents = []  # type: ignore[misc]
+
+        index = ProjectIndex()
+        cache_helper._load_cached_project_index(index, imports_manager)
+    finally:
+        data_cache.close()
+
+    assert index.cached_files == {str(fresh)}
+    assert index.find_testcase_tag_references("smoke") == {location}
+
+
+def test_save_namespace_writes_project_index_entry(cache_helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    from robotcode.core.utils.path import DiskInfo
+    from robotcode.robot.diagnostics.data_cache import CacheSection
+    from robotcode.robot.diagnostics.namespace import DocumentType
+    from robotcode.robot.diagnostics.project_index import FileReferences
+
+    disk_info = DiskInfo(100, 17)
+    document = _saved_document(tmp_path, disk_info)
+    imports_manager = MagicMock()
+    source = str(tmp_path / "test.robot")
+
+    cache_helper._save_namespace_to_cache(
+        source, document, DocumentType.GENERAL, MagicMock(), imports_manager, disk_info, False
+    )
+
+    saved = {c[0][0]: c[0][1:] for c in imports_manager.data_cache.save_entry.call_args_list}
+    assert saved[CacheSection.PROJECT_INDEX][0] == source
+    assert saved[CacheSection.PROJECT_INDEX][1] is imports_manager.build_namespace_meta.return_value
+    assert isinstance(saved[CacheSection.PROJECT_INDEX][2], FileReferences)
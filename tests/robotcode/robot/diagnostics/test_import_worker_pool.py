@@ -0,0 +1,118 @@
+"""Tests for the ImportWorkerPool used to load libraries and variables files."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Iterator
+
+import pytest
+
+from robotcode.robot.diagnostics.import_worker_pool import ImportWorkerPool
+
+
+def _import_and_report(module_name: str) -> bool:
+    import importlib
+
+    importlib.import_module(module_name)
+    return module_name in sys.modules
+
+
+def _is_imported(module_name: str) -> bool:
+    return module_name in sys.modules
+
+
+def _change_state() -> int:
+    os.environ["ROBOTCODE_TEST_POOL_VAR"] = "1"
+    sys.path.insert(0, "/does/not/exist")
+    return os.getpid()
+
+
+def _read_state() -> bool:
+    return "ROBOTCODE_TEST_POOL_VAR" not in os.environ and "/does/not/exist" not in sys.path
+
+
+def _raise_value_error() -> None:
+    raise ValueError("boom")
+
+
+def _exit() -> None:
+    sys.exit(1)
+
+
+def _sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+@pytest.fixture
+def pool() -> Iterator[ImportWorkerPool]:
+    result = ImportWorkerPool(max_workers=2, max_imports_per_worker=3, preload=())
+    try:
+        yield result
+    finally:
+        result.shutdown()
+
+
+def test_worker_is_reused_and_cleaned_up(pool: ImportWorkerPool) -> None:
+    assert pool.run(_import_and_report, ("xml.dom.minidom",), 30)
+    assert not pool.run(_is_imported, ("xml.dom.minidom",), 30)
+
+    assert pool.stats.spawned >= 1
+    assert pool.stats.reused >= 1
+
+
+def test_environment_and_sys_path_are_restored(pool: ImportWorkerPool) -> None:
+    pool.run(_change_state, (), 30)
+
+    assert pool.run(_read_state, (), 30)
+
+
+def test_exceptions_are_reraised(pool: ImportWorkerPool) -> None:
+    with pytest.raises(ValueError, match="boom"):
+        pool.run(_raise_value_error, (), 30)
+
+    assert pool.stats.recycled == 0
+
+
+def test_worker_is_retired_after_max_imports() -> None:
+    single = ImportWorkerPool(max_workers=1, max_imports_per_worker=2, preload=())
+    try:
+        pids = [single.run(os.getpid, (), 30) for _ in range(4)]
+    finally:
+        single.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+    assert single.stats.recycled >= 1
+
+
+def test_worker_is_retired_on_system_exit(pool: ImportWorkerPool) -> None:
+    with pytest.raises(SystemExit):
+        pool.run(_exit, (), 30)
+
+    assert pool.stats.recycled == 1
+
+
+def test_recycle_retires_idle_workers(pool: ImportWorkerPool) -> None:
+    pid = pool.run(os.getpid, (), 30)
+
+    pool.recycle()
+
+    assert pool.run(os.getpid, (), 30) != pid
+
+
+def test_timeout_kills_worker(pool: ImportWorkerPool) -> None:
+    with pytest.raises(TimeoutError):
+        pool.run(_sleep, (30,), 1)
+
+    assert pool.stats.killed == 1
+    assert isinstance(pool.run(os.getpid, (), 30), int)
+
+
+def test_imports_run_concurrently(pool: ImportWorkerPool) -> None:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pids = set(executor.map(lambda _: pool.run(_sleep, (1,), 30), range(2)))
+
+    assert len(pids) == 2
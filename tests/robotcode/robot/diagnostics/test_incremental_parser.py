@@ -0,0 +1,163 @@
+"""Tests for the incremental tokenizing and parsing of opened documents.
+
+The tokens and models built from the reused chunks of a changed document must
+be the same as the ones of a completely parsed document.
+"""
+
+from pathlib import Path
+from typing import Any, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from robot.parsing.model.blocks import File
+from robot.parsing.model.statements import Statement
+
+from robotcode.core.lsp.types import Position, Range
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+
+TEXT = """\
+*** Settings ***
+Library    Collections
+
+*** Test Cases ***
+First
+    Log    first
+    FOR    ${i}    IN RANGE    3
+        Log    ${i}
+    END
+
+# comment
+Second
+    [Tags]    a
+    Log    second
+
+*** Keywords ***
+My Keyword
+    Log    keyword
+"""
+
+
+@pytest.fixture
+def cache_helper() -> DocumentsCacheHelper:
+    workspace = MagicMock()
+    workspace.get_workspace_folder.return_value = None
+    return DocumentsCacheHelper(
+        workspace=workspace,
+        documents_manager=MagicMock(),
+        file_watcher_manager=MagicMock(),
+        robot_profile=None,
+        analysis_config=None,
+    )
+
+
+def _document(tmp_path: Path, text: str = TEXT, version: Any = 1) -> TextDocument:
+    return TextDocument(
+        document_uri=str(Uri.from_path(tmp_path / "test.robot").normalized()),
+        language_id="robotframework",
+        version=version,
+        text=text,
+    )
+
+
+def _change(document: TextDocument, start: Position, end: Position, text: str) -> None:
+    document.apply_incremental_change((document.version or 0) + 1, Range(start, end), text)
+
+
+def _dump(node: Any) -> Any:
+    if isinstance(node, Statement):
+        return (
+            type(node).__name__,
+            [(t.type, t.value, t.lineno, t.col_offset, t.error) for t in node.tokens],
+            node.errors,
+        )
+
+    return (
+        type(node).__name__,
+        getattr(node, "errors", ()),
+        [
+            [_dump(v) for v in value] if isinstance(value, list) else _dump(value) if value is not None else None
+            for value in (getattr(node, f) for f in node._fields)
+        ],
+    )
+
+
+def _assert_same_as_full_parse(cache_helper: DocumentsCacheHelper, document: TextDocument) -> None:
+    full = _document(Path(document.uri.to_path()).parent, document.text(), version=None)
+
+    assert [(t.type, t.value, t.lineno, t.col_offset) for t in cache_helper.get_tokens(document)] == [
+        (t.type, t.value, t.lineno, t.col_offset) for t in cache_helper.get_tokens(full)
+    ]
+    assert _dump(cache_helper.get_model(document)) == _dump(cache_helper.get_model(full))
+
+
+def _blocks(model: Any) -> List[Any]:
+    return [b for s in cast(File, model).sections for b in s.body if not isinstance(b, Statement)]
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "text"),
+    [
+        (Position(5, 11), Position(5, 16), "changed"),
+        (Position(5, 16), Position(5, 16), "\n    Log    new line"),
+        (Position(11, 0), Position(11, 0), "Inserted\n    No Operation\n"),
+        (Position(12, 0), Position(14, 0), ""),
+        (Position(0, 0), Position(0, 0), "Comment before\n"),
+        (Position(3, 4), Position(3, 14), "Tasks"),
+        (Position(17, 18), Position(17, 18), "\n*** Settings ***\nTest Template    Log\n"),
+    ],
+)
+def test_changed_document_is_parsed_like_a_new_one(
+    cache_helper: DocumentsCacheHelper, tmp_path: Path, start: Position, end: Position, text: str
+) -> None:
+    document = _document(tmp_path)
+    cache_helper.get_model(document)
+
+    _change(document, start, end, text)
+
+    _assert_same_as_full_parse(cache_helper, document)
+
+
+def test_unchanged_blocks_are_reused(cache_helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    document = _document(tmp_path)
+    first, second, keyword = _blocks(cache_helper.get_model(document))
+
+    _change(document, Position(5, 11), Position(5, 16), "changed")
+
+    changed_first, changed_second, changed_keyword = _blocks(cache_helper.get_model(document))
+    assert changed_first is not first
+    assert changed_second is second
+    assert changed_keyword is keyword
+
+
+def test_moved_blocks_get_new_line_numbers(cache_helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    document = _document(tmp_path)
+    _, second, _ = _blocks(cache_helper.get_model(document))
+
+    _change(document, Position(5, 16), Position(5, 16), "\n    Log    new line")
+
+    _, moved_second, _ = _blocks(cache_helper.get_model(document))
+    assert moved_second is not second
+    assert moved_second.lineno == second.lineno + 1
+    assert second.lineno == 12
+    _assert_same_as_full_parse(cache_helper, document)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Language: German\n\n*** Test Cases ***\nFirst\n    Log    a\n",
+        "| *** Test Cases *** |\n| First | Log | a |\n",
+    ],
+    ids=["language", "pipes"],
+)
+def test_documents_that_can_not_be_split_are_parsed_completely(
+    cache_helper: DocumentsCacheHelper, tmp_path: Path, text: str
+) -> None:
+    document = _document(tmp_path, text)
+    cache_helper.get_model(document)
+
+    _change(document, Position(1, 0), Position(1, 0), "\n")
+
+    _assert_same_as_full_parse(cache_helper, document)
@@ -0,0 +1,152 @@
+import pickle
+
+import pytest
+
+from robotcode.robot.diagnostics.library_doc import (
+    KeywordDoc,
+    KeywordStore,
+    LibraryDoc,
+    get_library_doc,
+)
+
+
+def _keyword(name: str, line_no: int) -> KeywordDoc:
+    return KeywordDoc(line_no=line_no, col_offset=0, end_line_no=line_no, end_col_offset=0, name=name, source="lib.py")
+
+
+@pytest.fixture
+def store() -> KeywordStore:
+    return KeywordStore(
+        source="lib.py",
+        source_type="LIBRARY",
+        keywords=[_keyword("Do Something", 1), _keyword("Say ${word}", 2), _keyword("Do Other", 3)],
+    )
+
+
+def test_unpickled_store_only_loads_looked_up_keywords(store: KeywordStore) -> None:
+    loaded = pickle.loads(pickle.dumps(store))
+
+    assert len(loaded) == 3
+    assert loaded.keys() == {"Do Something", "Say ${word}", "Do Other"}
+    assert loaded._pending == 3
+
+    # keywords with embedded arguments are loaded to match them against the name
+    assert loaded["do_something"].line_no == 1
+    assert loaded["Say hello"].line_no == 2
+    assert "Do Other" in loaded
+    assert loaded._pending == 1
+
+    assert [kw.line_no for kw in loaded] == [1, 2, 3]
+    assert loaded._pending == 0
+    assert loaded == store
+
+
+def test_repickled_partially_loaded_store_keeps_all_keywords(store: KeywordStore) -> None:
+    loaded = pickle.loads(pickle.dumps(store))
+    assert loaded.get("Do Other") is not None
+
+    assert pickle.loads(pickle.dumps(loaded)) == store
+
+
+def test_lazily_loaded_keywords_get_their_parent(store: KeywordStore) -> None:
+    doc = pickle.loads(pickle.dumps(LibraryDoc(name="lib", _keywords=store)))
+
+    assert doc.keywords["Do Something"].parent is doc
+    assert all(kw.parent is doc for kw in doc.keywords)
+
+
+def test_keyword_is_found_by_stable_id_without_loading_the_others(store: KeywordStore) -> None:
+    loaded = pickle.loads(pickle.dumps(store))
+
+    found = loaded.get_by_stable_id(store["Do Other"].stable_id)
+
+    assert found is not None
+    assert found.line_no == 3
+    assert loaded._pending == 2
+    assert loaded.get_by_stable_id("unknown") is None
+
+
+def test_store_pickled_with_keyword_list_is_loaded(store: KeywordStore) -> None:
+    loaded = KeywordStore.__new__(KeywordStore)
+    loaded.__setstate__({"source": store.source, "source_type": store.source_type, "keywords": list(store)})
+
+    assert loaded == store
+    assert loaded["Say hello"].line_no == 2
+
+
+def test_unpickled_library_store_loads_only_the_looked_up_keyword() -> None:
+    store = get_library_doc("BuiltIn").keywords
+    name = "Should Be Equal"
+
+    loaded: KeywordStore = pickle.loads(pickle.dumps(store, protocol=pickle.HIGHEST_PROTOCOL))
+
+    assert loaded.get(name) == store.get(name)
+    assert loaded._pending == len(store) - 1
+    assert loaded.keywords == store.keywords
+
+
+EMBEDDED_NAMES = [
+    'the user "${name}" is logged in',
+    'the user "${name}" is logged out',
+    "the user ${name} has ${count:\\d+} items",
+    "${user} opens the page",
+    "${user} opens ${page}",
+    "${a} and ${b}",
+    "Select ${item} from the   list",
+    "Ä ${x} ümlaut",
+    "Größe ist ${x}",
+    "a${x}a",
+    "Do Something",
+]
+
+LOOKUP_NAMES = [
+    'the user "admin" is logged in',
+    'The User "admin" Is Logged Out',
+    'the\tuser  "admin" is logged in',
+    'the user "${name}" is logged in',
+    "the user ${x} is logged in",
+    "the user bob has 12 items",
+    "the user bob has many items",
+    "alice opens the page",
+    "alice opens settings",
+    "${user} opens the page",
+    "x and y",
+    "select one from the list",
+    "SELECT one FROM THE\u00a0LIST",
+    "ä y ümlaut",
+    "Ä y Ümlaut",
+    "größe ist 3",
+    "GRÖSSE ist 3",
+    "a",
+    "aa",
+    "aba",
+    "do something",
+    "unknown keyword",
+    "",
+]
+
+
+@pytest.mark.parametrize("name", LOOKUP_NAMES)
+def test_embedded_index_matches_like_a_linear_scan(name: str) -> None:
+    keywords = [_keyword(n, i) for i, n in enumerate(EMBEDDED_NAMES, 1)]
+    store = KeywordStore(keywords=keywords)
+
+    embedded = [kw for kw in keywords if kw.is_embedded and kw.matcher.match_string(name)]
+    exact = [kw for kw in keywords if not kw.is_embedded and kw.matcher.match_string(name)]
+
+    assert [kw.line_no for kw in store.get_all(name)] == [kw.line_no for kw in [*embedded, *exact]]
+    assert (name in store) == bool(embedded or exact)
+
+
+def test_embedded_index_finds_the_keyword_among_many() -> None:
+    keywords = [
+        _keyword(f'the user "${{name}}" {verb} the {thing} number {i}', i)
+        for verb in ("opens", "closes", "edits")
+        for thing in ("page", "dialog")
+        for i in range(100)
+    ]
+    store = KeywordStore(keywords=keywords)
+
+    for i in range(100):
+        name = f'the user "admin" edits the dialog number {i}'
+        assert store.get_all(name) == [kw for kw in keywords if kw.matcher.match_string(name)]
@@ -1,4 +1,5 @@
-from typing import Dict, Set
+import pickle
+from typing import Any, Dict, Set
 
 from pytest_mock import MockerFixture
 
@@ -10,7 +11,7 @@ from robotcode.robot.diagnostics.entities import (
 )
 from robotcode.robot.diagnostics.library_doc import KeywordDoc, LibraryDoc
 from robotcode.robot.diagnostics.namespace import Namespace
-from robotcode.robot.diagnostics.project_index import ProjectIndex
+from robotcode.robot.diagnostics.project_index import FileReferences, ProjectIndex
 
 
 def _loc(uri: str, line: int, col: int = 0, end_col: int = 5) -> Location:
@@ -402,3 +403,86 @@ class TestProjectIndexClearAndReuse:
         idx.update_file("/b.robot", _ns(mocker, keyword_references={kw: {loc2}}))
 
         assert idx.find_keyword_references(kw) == {loc2}
+
+
+class TestProjectIndexCachedFiles:
+    def _cached(self, mocker: MockerFixture, **kwargs: Any) -> FileReferences:
+        return pickle.loads(pickle.dumps(FileReferences.from_namespace(_ns(mocker, **kwargs))))
+
+    def test_cached_references_are_found_by_equal_objects(self, mocker: MockerFixture) -> None:
+        idx = ProjectIndex()
+        kw_loc = _loc("file:///a.robot", 10)
+        var_loc = _loc("file:///a.robot", 11)
+        ns_loc = _loc("file:///a.robot", 2)
+        tag_loc = _loc("file:///a.robot", 3)
+
+        loaded = idx.load_cached_files(
+            [
+                (
+                    "/a.robot",
+                    self._cached(
+                        mocker,
+                        keyword_references={_kw("Login"): {kw_loc}},
+                        variable_references={_var("${HOST}"): {var_loc}},
+                        namespace_references={_lib_entry("Browser"): {ns_loc}},
+                        keyword_tag_references={"smoke": {tag_loc}},
+                    ),
+                )
+            ]
+        )
+
+        assert loaded == 1
+        assert idx.cached_files == {"/a.robot"}
+        assert idx.find_keyword_references(_kw("Login")) == {kw_loc}
+        assert idx.find_variable_references(_var("${HOST}")) == {var_loc}
+        assert idx.find_namespace_references(_lib_entry("Browser")) == {ns_loc}
+        assert idx.find_keyword_tag_references("smoke") == {tag_loc}
+        assert idx.find_keyword_references(_kw("Logout")) == set()
+
+    def test_cached_and_analyzed_files_are_combined(self, mocker: MockerFixture) -> None:
+        idx = ProjectIndex()
+        kw = _kw("Login")
+        loc_a = _loc("file:///a.robot", 10)
+        loc_b = _loc("file:///b.robot", 20)
+
+        idx.update_file("/a.robot", _ns(mocker, keyword_references={kw: {loc_a}}))
+        idx.load_cached_files([("/b.robot", self._cached(mocker, keyword_references={kw: {loc_b}}))])
+
+        assert idx.find_keyword_references(kw) == {loc_a, loc_b}
+
+    def test_update_file_replaces_cached_references(self, mocker: MockerFixture) -> None:
+        idx = ProjectIndex()
+        kw = _kw("Login")
+        old_loc = _loc("file:///a.robot", 10)
+        new_loc = _loc("file:///a.robot", 12)
+
+        idx.load_cached_files([("/a.robot", self._cached(mocker, keyword_references={kw: {old_loc}}))])
+        idx.update_file("/a.robot", _ns(mocker, keyword_references={kw: {new_loc}}))
+
+        assert idx.find_keyword_references(kw) == {new_loc}
+        assert idx.cached_files == set()
+
+    def test_analyzed_files_are_not_loaded_from_cache(self, mocker: MockerFixture) -> None:
+        idx = ProjectIndex()
+        kw = _kw("Login")
+        loc = _loc("file:///a.robot", 10)
+
+        idx.update_file("/a.robot", _ns(mocker, keyword_references={kw: {loc}}))
+        loaded = idx.load_cached_files(
+            [("/a.robot", self._cached(mocker, keyword_references={kw: {_loc("file:///a.robot", 99)}}))]
+        )
+
+        assert loaded == 0
+        assert idx.find_keyword_references(kw) == {loc}
+
+    def test_remove_file_removes_cached_references(self, mocker: MockerFixture) -> None:
+        idx = ProjectIndex()
+        kw = _kw("Login")
+
+        idx.load_cached_files(
+            [("/a.robot", self._cached(mocker, keyword_references={kw: {_loc("file:///a.robot", 1)}}))]
+        )
+        idx.remove_file("/a.robot")
+
+        assert idx.find_keyword_references(kw) == set()
+        assert idx.cached_files == set()
@@ -0,0 +1,91 @@
+from typing import Dict, List, Set, TypeVar
+
+from robotcode.core.lsp.types import Location, Position, Range
+from robotcode.robot.diagnostics.entities import VariableDefinition
+from robotcode.robot.diagnostics.library_doc import KeywordDoc
+from robotcode.robot.diagnostics.reference_index import ReferenceIndex
+
+SOURCE = "/test.robot"
+URI = "file:///test.robot"
+
+_T = TypeVar("_T")
+
+
+def _loc(line: int, col: int, end_col: int, end_line: int = -1) -> Location:
+    return Location(URI, Range(Position(line, col), Position(line if end_line < 0 else end_line, end_col)))
+
+
+def _kw(name: str, line: int, source: str = SOURCE) -> KeywordDoc:
+    return KeywordDoc(name=name, line_no=line, col_offset=0, end_line_no=line, end_col_offset=len(name), source=source)
+
+
+def _var(name: str, line: int, source: str = SOURCE) -> VariableDefinition:
+    return VariableDefinition(
+        name=name,
+        name_token=None,
+        line_no=line,
+        col_offset=4,
+        end_line_no=line,
+        end_col_offset=4 + len(name),
+        source=source,
+    )
+
+
+def _linear_scan(references: Dict[_T, Set[Location]], position: Position, *ranges: str) -> List[_T]:
+    return [
+        target
+        for target, refs in references.items()
+        if (getattr(target, "source") == SOURCE and any(position in getattr(target, r) for r in ranges))
+        or any(position in ref.range for ref in refs)
+    ]
+
+
+def test_index_finds_the_same_candidates_as_a_linear_scan() -> None:
+    keyword_references = {
+        _kw("First", 1): {_loc(5, 4, 9), _loc(6, 8, 13)},
+        _kw("Second", 2): {_loc(5, 9, 15)},
+        _kw("Library Keyword", 10, source="/lib.py"): {_loc(6, 4, 19), _loc(7, 4, 12, end_line=8)},
+        _kw("Unused", 3): set(),
+    }
+    variable_references = {
+        _var("${a}", 1): {_loc(5, 11, 15), _loc(6, 4, 8)},
+        _var("${b}", 2, source="/vars.py"): {_loc(5, 11, 15), _loc(7, 2, 6)},
+        _var("${c}", 3): set(),
+    }
+    index = ReferenceIndex(SOURCE, keyword_references, variable_references)
+
+    for line in range(11):
+        for character in range(25):
+            position = Position(line, character)
+
+            assert [kw for kw, _ in index.keywords_at(position)] == _linear_scan(
+                keyword_references, position, "name_range", "range"
+            ), position
+            assert [var for var, _ in index.variables_at(position)] == _linear_scan(
+                variable_references, position, "name_range"
+            ), position
+
+
+def test_index_returns_the_references_of_the_candidates() -> None:
+    a = _var("${a}", 1)
+    index = ReferenceIndex(SOURCE, {}, {a: {_loc(5, 11, 15)}})
+
+    assert index.variables_at(Position(5, 12)) == [(a, {_loc(5, 11, 15)})]
+    assert index.variables_at(Position(0, 5)) == [(a, {_loc(5, 11, 15)})]
+    assert index.variables_at(Position(4, 12)) == []
+    assert index.keywords_at(Position(5, 12)) == []
+
+
+def test_index_of_many_references_finds_the_same_candidates_as_a_linear_scan() -> None:
+    keyword_references = {
+        _kw(f"Keyword {i}", i): {_loc(1000 + i * 10 + j, 4, 14) for j in range(10)} for i in range(500)
+    }
+    variable_references = {
+        _var(f"${{var_{i}}}", i): {_loc(1000 + i * 10 + j, 18, 28) for j in range(10)} for i in range(500)
+    }
+    index = ReferenceIndex(SOURCE, keyword_references, variable_references)
+
+    for position in [Position(1000 + i * 10 + 5, 20) for i in range(0, 500, 5)]:
+        assert [var for var, _ in index.variables_at(position)] == _linear_scan(
+            variable_references, position, "name_range"
+        )
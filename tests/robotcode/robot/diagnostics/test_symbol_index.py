@@ -0,0 +1,120 @@
+import random
+from typing import List
+
+import pytest
+
+from robotcode.robot.diagnostics.symbol_index import SymbolIndex, split_words
+
+NAMES = [
+    "Open Workbook",
+    "openWorkbook",
+    "Close Workbook",
+    "${workbook}",
+    "Log",
+    "Log Many",
+    "Should Be Equal As Strings",
+    "as",
+    "Not Again Sir",
+]
+
+
+def contains_characters_in_order(main_string: str, check_string: str) -> bool:
+    main_iter = iter(main_string.lower())
+    return all(char in main_iter for char in check_string.lower())
+
+
+def _index(names: List[str]) -> SymbolIndex[str]:
+    index: SymbolIndex[str] = SymbolIndex()
+    index.update("test", ((n, n) for n in names))
+    return index
+
+
+@pytest.mark.parametrize(
+    ("name", "words"),
+    [
+        ("Open Workbook", ["Open", "Workbook"]),
+        ("openWorkbook", ["open", "Workbook"]),
+        ("HTTPRequest", ["HTTP", "Request"]),
+        ("${my_var}", ["my", "var"]),
+        ("Keyword 2", ["Keyword", "2"]),
+    ],
+)
+def test_split_words(name: str, words: List[str]) -> None:
+    assert split_words(name) == words
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("log", ["Log", "Log Many"]),
+        ("LOG M", ["Log Many"]),
+        ("ow", ["openWorkbook", "Open Workbook", "Close Workbook"]),
+        ("work", ["${workbook}", "openWorkbook", "Open Workbook", "Close Workbook"]),
+        ("as", ["as", "Should Be Equal As Strings", "Not Again Sir"]),
+        ("xyz", []),
+    ],
+)
+def test_matches_are_ranked(query: str, expected: List[str]) -> None:
+    assert _index(NAMES).search(query) == expected
+
+
+@pytest.mark.parametrize("query", ["", "a", "as", "ob", "wb", "open w", "sbe", "[", "$"])
+def test_matches_are_the_names_containing_the_characters_of_the_query_in_order(query: str) -> None:
+    assert sorted(_index(NAMES).search(query)) == sorted(n for n in NAMES if contains_characters_in_order(n, query))
+
+
+def test_result_is_limited_to_the_best_matches() -> None:
+    index = _index(NAMES)
+
+    assert index.search("ow", limit=2) == ["openWorkbook", "Open Workbook"]
+    assert index.search("", limit=2) == ["as", "Log"]
+
+
+def test_groups_are_replaced_and_removed() -> None:
+    index: SymbolIndex[str] = SymbolIndex()
+    index.update("a", [("First", "a1"), ("Second", "a2")])
+    index.update("b", [("First", "b1")])
+
+    assert sorted(index.search("first")) == ["a1", "b1"]
+
+    index.update("a", [("Third", "a3")])
+    assert index.search("first") == ["b1"]
+    assert index.search("third") == ["a3"]
+
+    index.remove("b")
+    assert index.search("first") == []
+    assert "b" not in index
+    assert len(index) == 1
+
+
+def test_matches_of_all_groups_are_ranked_together() -> None:
+    index: SymbolIndex[str] = SymbolIndex()
+    index.update("a", [("Log Many", "Log Many"), ("Open Workbook", "Open Workbook")])
+    index.update("b", [("Log", "Log"), ("openWorkbook", "openWorkbook")])
+
+    assert index.search("log") == ["Log", "Log Many"]
+    assert index.search("ow", limit=2) == ["openWorkbook", "Open Workbook"]
+    assert index.search("") == ["Log", "Log Many", "openWorkbook", "Open Workbook"]
+
+
+def test_update_only_rebuilds_the_changed_group() -> None:
+    index: SymbolIndex[str] = SymbolIndex()
+    index.update("a", [("First", "a1")])
+    index.update("b", [("Second", "b1")])
+    index.search("first")
+    blobs_of_b = index._blobs["b"]
+
+    index.update("a", [("Third", "a3")])
+
+    assert index.search("third") == ["a3"]
+    assert index._blobs["b"] is blobs_of_b
+
+
+def test_many_names_match_like_the_characters_in_order() -> None:
+    rnd = random.Random(0)
+    words = ["Open", "Close", "Get", "Set", "Should", "Be", "Equal", "Wait", "Until", "Element", "Page", "Contains"]
+    names = [f"{' '.join(rnd.choice(words) for _ in range(rnd.randint(2, 5)))} {i}" for i in range(10_000)]
+    index = _index(names)
+
+    for query in ["open", "sbe", "wait until", "gpc", "elem", "xyz"]:
+        assert sorted(index.search(query)) == sorted(n for n in names if contains_characters_in_order(n, query))